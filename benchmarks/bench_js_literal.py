@@ -0,0 +1,91 @@
+"""Benchmark parse_js_literal against the regex cleaner it replaced.
+
+There are no captured Play Store pages in the repository, so the payloads
+are built from the formatted examples in output/: each example is nested
+into a ds:5-shaped array and wrapped in an AF_initDataCallback literal.
+
+Run from the repository root:
+
+    python benchmarks/bench_js_literal.py
+"""
+
+import os
+import re
+import sys
+import json
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from gplay_scraper.utils.js_literal import parse_js_literal
+
+
+def legacy_clean_json_string(json_str):
+    """The eleven-pass regex cleaner used before parse_js_literal."""
+    json_str = re.sub(r',\s*sideChannel:\s*\{\}', '', json_str)
+    json_str = re.sub(r'([{,]\s*)([a-zA-Z_$][a-zA-Z0-9_$]*)\s*:', r'\1"\2":', json_str)
+    json_str = re.sub(r'\bfunction\s*\([^)]*\)\s*\{[^}]*\}', 'null', json_str)
+    json_str = re.sub(r'\bundefined\b', 'null', json_str)
+    json_str = re.sub(r":\s*'([^']*)'", r': "\1"', json_str)
+    json_str = re.sub(r'(\])\s*(\[)', r'\1,\2', json_str)
+    json_str = re.sub(r'(\})\s*(\{)', r'\1,\2', json_str)
+    json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
+    json_str = re.sub(r',,+', ',', json_str)
+    json_str = re.sub(r':\s*\$([0-9.]+)', r': "$\1"', json_str)
+    json_str = re.sub(r'"version"\s*:\s*([0-9.]+)(?=\s*[,}])', r'"version": "\1"', json_str)
+    return json_str
+
+
+def _as_arrays(value):
+    """Turn example objects into nested arrays, the way Play Store ships them."""
+    if isinstance(value, dict):
+        return [_as_arrays(item) for item in value.values()]
+    if isinstance(value, list):
+        return [_as_arrays(item) for item in value]
+    return value
+
+
+def _legacy_decodes(payload):
+    try:
+        json.loads(legacy_clean_json_string(payload))
+        return True
+    except ValueError:
+        return False
+
+
+def build_payloads():
+    examples = []
+    for name in sorted(os.listdir(os.path.join(ROOT, "output"))):
+        if name.endswith(".json"):
+            with open(os.path.join(ROOT, "output", name), encoding="utf-8") as f:
+                examples.append((name[:-5], _as_arrays(json.load(f))))
+    payloads = {}
+    for name, data in examples:
+        payloads[name] = "{key: 'ds:5', hash: '13', data:" + json.dumps(data, ensure_ascii=False) + ", sideChannel: {}}"
+    # A page-sized payload with JavaScript-only values deep inside the data,
+    # from the examples whose strings the regex passes leave intact
+    data = [data for name, data in examples if _legacy_decodes(payloads[name])] * 20
+    javascript = json.dumps(data, ensure_ascii=False).replace("null", "undefined", 50)
+    payloads["page_with_undefined"] = "{key: 'ds:5', hash: '13', data:" + javascript + ", sideChannel: {}}"
+    return payloads
+
+
+def main():
+    for name, payload in build_payloads().items():
+        number = max(1, 200000 // len(payload))
+        single = min(timeit.repeat(lambda: parse_js_literal(payload), number=number, repeat=5)) / number
+        try:
+            expected = json.loads(legacy_clean_json_string(payload))
+        except ValueError:
+            # The regex passes also rewrite string contents, e.g. "Fast, secure: ..."
+            print(f"{name:24} {len(payload) / 1024:8.1f} KB  regex   failed     single pass {single * 1e3:8.3f} ms")
+            continue
+        assert parse_js_literal(payload) == expected, name
+        legacy = min(timeit.repeat(lambda: json.loads(legacy_clean_json_string(payload)), number=number, repeat=5)) / number
+        print(f"{name:24} {len(payload) / 1024:8.1f} KB  regex {legacy * 1e3:8.3f} ms  "
+              f"single pass {single * 1e3:8.3f} ms  x{legacy / single:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark the JSON libraries on review pages and print_all output.
+
+There are no captured responses in the repository, so the review page is
+built from output/reviews_example.json: each review is turned into the
+nested arrays batchexecute ships, repeated to a full 200-review page and
+doubly encoded like a real response.
+
+The decode column times each library's own loads on the page. It is why
+JsonCodec decodes with the standard library only: orjson is within
+1.0-1.3x of json here. The print_all column times JsonCodec.dumps, where
+orjson is 5-7x faster.
+
+Run from the repository root (install orjson to see the gain):
+
+    python benchmarks/bench_json_codec.py
+"""
+
+import os
+import sys
+import json
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from gplay_scraper.utils import json_codec
+from gplay_scraper.utils.json_codec import JsonCodec
+
+
+def _as_arrays(value):
+    """Turn example objects into nested arrays, the way Play Store ships them."""
+    if isinstance(value, dict):
+        return [_as_arrays(item) for item in value.values()]
+    if isinstance(value, list):
+        return [_as_arrays(item) for item in value]
+    return value
+
+
+def build_review_page(count=200):
+    with open(os.path.join(ROOT, "output", "reviews_example.json"), encoding="utf-8") as f:
+        reviews = json.load(f)
+    reviews = (reviews * (count // len(reviews) + 1))[:count]
+    payload = json.dumps([[_as_arrays(review) for review in reviews], [None, "token"]], ensure_ascii=False)
+    return ")]}'\n\n" + json.dumps([["wrb.fr", "oCPfdb", payload, None, None, None, "generic"]]), reviews
+
+
+def main():
+    page, reviews = build_review_page()
+    print(f"review page: {len(page) / 1024:.1f} KB, print_all output: {len(json.dumps(reviews, indent=2)) / 1024:.1f} KB")
+    baseline = {}
+    for name in json_codec._BACKENDS[::-1]:
+        if json_codec._import(name) is None:
+            print(f"{name:10} not installed")
+            continue
+        codec = JsonCodec(name)
+        loads = json_codec._import(name).loads
+        decode = lambda: loads(loads(page[5:])[0][2])
+        encode = lambda: codec.dumps(reviews, indent=2)
+        timings = {}
+        for label, func in (("decode", decode), ("print_all", encode)):
+            timings[label] = min(timeit.repeat(func, number=20, repeat=5)) / 20
+        baseline = baseline or timings
+        print(f"{name:10} decode {timings['decode'] * 1e3:7.3f} ms (x{baseline['decode'] / timings['decode']:4.1f})  "
+              f"print_all {timings['print_all'] * 1e3:7.3f} ms (x{baseline['print_all'] / timings['print_all']:4.1f})")
+
+
+if __name__ == "__main__":
+    main()
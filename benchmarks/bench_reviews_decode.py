@@ -0,0 +1,95 @@
+"""Benchmark decoding one reviews page: legacy pipeline vs decode-once pages.
+
+The legacy pipeline is kept here as it was: the scraper compiled a regex
+and decoded the envelope and the payload string to find the next token,
+then the parser matched the regex again and decoded the envelope once and
+the payload twice. The current pipeline decodes each once, in the scraper,
+and hands the structured page to the parser.
+
+Review pages are built from output/reviews_example.json in the array layout
+extract_review_data reads, repeated to a full batch. Run from the
+repository root:
+
+    python benchmarks/bench_reviews_decode.py
+"""
+
+import os
+import re
+import sys
+import json
+import timeit
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from gplay_scraper.config import Config
+from gplay_scraper.core.gplay_parser import ReviewsParser
+from gplay_scraper.utils.json_codec import json_loads
+
+
+def _raw_review(review):
+    """Lay an example review out the way batchexecute ships it."""
+    raw = [None] * 11
+    raw[0] = review["reviewId"]
+    raw[1] = [review["userName"], [None, 2, None, [None, None, review["userImage"]]]]
+    raw[2] = review["score"]
+    raw[4] = review["content"]
+    raw[5] = [int(datetime.fromisoformat(review["at"]).timestamp()), 0]
+    raw[6] = review["thumbsUpCount"]
+    raw[10] = review["appVersion"]
+    return raw
+
+
+def build_review_page(count=Config.DEFAULT_REVIEWS_BATCH_SIZE):
+    with open(os.path.join(ROOT, "output", "reviews_example.json"), encoding="utf-8") as f:
+        reviews = json.load(f)
+    reviews = (reviews * (count // len(reviews) + 1))[:count]
+    payload = json.dumps([[_raw_review(review) for review in reviews], [None, "next-page-token"], None], ensure_ascii=False)
+    return ")]}'\n\n" + json.dumps([["wrb.fr", "oCPfdb", payload, None, None, None, "generic"]])
+
+
+def legacy_page(parser, response):
+    """Token extraction and parsing as the scraper and parser used to do them."""
+    matches = re.compile(r"\)]}'\n\n([\s\S]+)").findall(response)
+    data = json_loads(matches[0])
+    token = json_loads(data[0][2])[-2][-1]
+
+    matches = re.compile(r"\)]}'\n\n([\s\S]+)").findall(response)
+    data = json_loads(matches[0])
+    reviews_data = json_loads(data[0][2])
+    json_loads(data[0][2])[-2][-1]
+    reviews = [parser.extract_review_data(raw) for raw in reviews_data[0]]
+    return reviews, token
+
+
+def current_page(parser, response):
+    page = parser.decode_reviews_page(response)
+    return parser.parse_reviews_page(page), page["token"]
+
+
+def main():
+    parser = ReviewsParser()
+    response = build_review_page()
+    assert legacy_page(parser, response) == current_page(parser, response)
+    print(f"reviews page: {len(response) / 1024:.1f} KB, {Config.DEFAULT_REVIEWS_BATCH_SIZE} reviews")
+
+    runs = (
+        ("page (decode + extract)", {
+            "legacy": lambda: legacy_page(parser, response),
+            "current": lambda: current_page(parser, response),
+        }),
+        ("JSON decoding alone", {
+            "legacy": lambda: [json_loads(json_loads(response[6:])[0][2]) for _ in range(3)],
+            "current": lambda: parser.decode_reviews_page(response),
+        }),
+    )
+    for label, funcs in runs:
+        print(label)
+        timings = {name: min(timeit.repeat(func, number=50, repeat=5)) / 50 for name, func in funcs.items()}
+        for name, seconds in timings.items():
+            print(f"  {name:8} {seconds * 1e3:7.3f} ms/page  (x{timings['legacy'] / seconds:4.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,9 +14,26 @@ import logging
 
 # Import main scraper class
 from .app import GPlayScraper
+from .async_app import AsyncGPlayScraper
 
 # Import all method classes
 from .core.gplay_methods import AppMethods, SearchMethods, ReviewsMethods, DeveloperMethods, SimilarMethods, ListMethods, SuggestMethods
+from .core.gplay_async_methods import AsyncAppMethods, AsyncSearchMethods, AsyncReviewsMethods, AsyncDeveloperMethods, AsyncSimilarMethods, AsyncListMethods, AsyncSuggestMethods
+from .core.reviews_stream import ReviewsStream, AsyncReviewsStream
+from .models.review_batch import ReviewBatch
+
+# Import rate limiting and retries
+from .utils.rate_limiter import RateLimiter, AdaptiveRateLimiter, TokenBucket
+from .utils.retry_policy import RetryPolicy, RetryBudget
+
+# Import response caches
+from .utils.cache import ResponseCache, MemoryCache, NegativeCache
+from .utils.disk_cache import SQLiteCache
+from .utils.shared_cache import RedisCache, CacheServer
+
+# Import result memo and JSON output helpers
+from .utils.memo import ResultMemo
+from .utils.json_codec import JsonCodec, set_json_backend
 
 # Import configuration
 from .config import Config
@@ -28,6 +45,7 @@ from .exceptions import (
     AppNotFoundError,
     RateLimitError,
     NetworkError,
+    HttpStatusError,
     DataParsingError,
 )
 
@@ -40,6 +58,7 @@ __version__ = "1.0.5"
 # Public API exports
 __all__ = [
     "GPlayScraper",
+    "AsyncGPlayScraper",
     "AppMethods",
     "SearchMethods",
     "ReviewsMethods",
@@ -47,11 +66,36 @@ __all__ = [
     "SimilarMethods",
     "ListMethods",
     "SuggestMethods",
+    "AsyncAppMethods",
+    "AsyncSearchMethods",
+    "AsyncReviewsMethods",
+    "AsyncDeveloperMethods",
+    "AsyncSimilarMethods",
+    "AsyncListMethods",
+    "AsyncSuggestMethods",
+    "ReviewsStream",
+    "AsyncReviewsStream",
+    "ReviewBatch",
+    "RateLimiter",
+    "AdaptiveRateLimiter",
+    "TokenBucket",
+    "RetryPolicy",
+    "RetryBudget",
+    "ResponseCache",
+    "MemoryCache",
+    "NegativeCache",
+    "SQLiteCache",
+    "RedisCache",
+    "CacheServer",
+    "ResultMemo",
+    "JsonCodec",
+    "set_json_backend",
     "Config",
     "GPlayScraperError",
     "InvalidAppIdError",
     "AppNotFoundError",
     "RateLimitError",
     "NetworkError",
+    "HttpStatusError",
     "DataParsingError",
 ]
\ No newline at end of file
@@ -5,8 +5,15 @@ and provides 42 functions for interacting with Google Play Store data.
 """
 
 from .core.gplay_methods import AppMethods, SearchMethods, ReviewsMethods, DeveloperMethods, SimilarMethods, ListMethods, SuggestMethods
+from .core.reviews_stream import ReviewsStream
+from .models.review_batch import ReviewBatch
 from .config import Config
-from typing import Any, List, Dict
+from .utils.http_client import HttpClient
+from .utils.rate_limiter import RateLimiter
+from .utils.retry_policy import RetryPolicy
+from .utils.cache import ResponseCache, NegativeCache
+from .utils.memo import ResultMemo
+from typing import Any, List, Dict, Optional
 
 
 class GPlayScraper:
@@ -22,23 +29,69 @@ class GPlayScraper:
     - Suggest Methods: Get search suggestions
     
     Args:
-        http_client: HTTP client to use (requests, curl_cffi, tls_client, httpx, urllib3, cloudscraper, aiohttp)
+        http_client: HTTP client to use (requests, curl_cffi, tls_client, httpx, urllib3, cloudscraper, aiohttp, auto)
+        pool_size: Maximum keep-alive connections per HTTP session
+        rate_limiter: Optional RateLimiter shared by all method types
+        retry_policy: Optional RetryPolicy shared by all method types
+        cache: Optional ResponseCache shared by all method types
+        negative_cache: Optional NegativeCache for apps, developers and clusters that do not exist
+        stale_while_revalidate: Serve expired cached pages at once and refresh them in the background
     """
     
-    def __init__(self, http_client: str = None):
+    def __init__(self, http_client: str = None, pool_size: int = None, rate_limiter: RateLimiter = None,
+                 retry_policy: RetryPolicy = None, cache: ResponseCache = None, negative_cache: NegativeCache = None,
+                 stale_while_revalidate: bool = None):
         """Initialize GPlayScraper with all method types.
         
+        All method types share one HttpClient, so they share one connection
+        pool, one rate limit budget and one client fallback state.
+        
         Args:
             http_client: Optional HTTP client name. Defaults to 'requests' with automatic fallback.
-        """
-        # Initialize all 7 method types
-        self.app_methods = AppMethods(http_client)
-        self.search_methods = SearchMethods(http_client)
-        self.reviews_methods = ReviewsMethods(http_client)
-        self.developer_methods = DeveloperMethods(http_client)
-        self.similar_methods = SimilarMethods(http_client)
-        self.list_methods = ListMethods(http_client)
-        self.suggest_methods = SuggestMethods(http_client)
+                         'auto' picks the fastest healthy client per endpoint.
+            pool_size: Optional maximum keep-alive connections per session (default: 10)
+            rate_limiter: Optional RateLimiter with custom rate, burst and keying.
+                          Defaults to 1 request/second per endpoint family.
+            retry_policy: Optional RetryPolicy with custom backoff and retry budget
+            cache: Optional response cache, e.g. MemoryCache(); repeated calls for the
+                   same page within its endpoint TTL skip the network
+            negative_cache: Optional NegativeCache(); a confirmed 404 is answered from
+                            memory for its TTL instead of being retried on every client
+            stale_while_revalidate: Optional flag; with a cache, pages expired less than
+                                    Config.CACHE_MAX_STALE ago are returned at once while one
+                                    background refresh fetches a new copy
+        """
+        self.http_client = HttpClient(client_type=http_client, pool_size=pool_size, rate_limiter=rate_limiter,
+                                      retry_policy=retry_policy, cache=cache, negative_cache=negative_cache,
+                                      stale_while_revalidate=stale_while_revalidate)
+        
+        # Parsed results reused by the get_*/print_* accessors; clear with self.memo.clear()
+        self.memo = ResultMemo()
+        
+        # Initialize all 7 method types on the shared transport
+        self.app_methods = AppMethods(self.http_client, self.memo)
+        self.search_methods = SearchMethods(self.http_client, self.memo)
+        self.reviews_methods = ReviewsMethods(self.http_client, self.memo)
+        self.developer_methods = DeveloperMethods(self.http_client, self.memo)
+        self.similar_methods = SimilarMethods(self.http_client, self.memo)
+        self.list_methods = ListMethods(self.http_client, self.memo)
+        self.suggest_methods = SuggestMethods(self.http_client, self.memo)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Close the pooled HTTP sessions shared by all method types.
+        
+        Example:
+            with GPlayScraper() as scraper:
+                scraper.app_analyze('com.whatsapp')
+        """
+        self.http_client.close()
 
     # ==================== App Methods ====================
     
@@ -220,6 +273,42 @@ class GPlayScraper:
         """
         return self.reviews_methods.reviews_analyze(app_id, count, lang, country, sort)
 
+    def reviews_iter(self, app_id: str, count: Optional[int] = None, lang: str = Config.DEFAULT_LANGUAGE,
+                     country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                     token: str = None, pages: bool = False, columnar: bool = False) -> ReviewsStream:
+        """Stream reviews as each batch arrives, with bounded memory.
+        
+        Args:
+            app_id: Google Play app ID
+            count: Maximum number of reviews to fetch (default: all)
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+            token: Continuation token (stream.token) from an earlier run, to resume it
+            pages: Yield one {'reviews': [...], 'token': ...} dict per page instead of single reviews
+            columnar: Yield one ReviewBatch of NumPy columns per page (requires numpy)
+            
+        Returns:
+            ReviewsStream iterator; its token attribute is the resume point
+        """
+        return self.reviews_methods.reviews_iter(app_id, count, lang, country, sort, token, pages, columnar)
+
+    def reviews_batch(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                      country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> ReviewBatch:
+        """Get user reviews as NumPy columns, for analytics (requires numpy).
+        
+        Args:
+            app_id: Google Play app ID
+            count: Number of reviews to fetch
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+        
+        Returns:
+            ReviewBatch; use to_pandas() or to_arrow() to export it
+        """
+        return self.reviews_methods.reviews_batch(app_id, count, lang, country, sort)
+
     def reviews_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_REVIEWS_COUNT, 
                          lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Any]:
         """Get single field from reviews.
@@ -0,0 +1,212 @@
+"""AsyncGPlayScraper class providing awaitable access to all 7 scraping types.
+
+This module contains the asyncio counterpart of GPlayScraper. All method types
+share one AsyncHttpClient, so thousands of lookups can run concurrently on a
+single event loop over one pooled session.
+"""
+
+from .core.gplay_async_methods import (
+    AsyncAppMethods, AsyncSearchMethods, AsyncReviewsMethods, AsyncDeveloperMethods,
+    AsyncSimilarMethods, AsyncListMethods, AsyncSuggestMethods,
+)
+from .core.reviews_stream import AsyncReviewsStream
+from .models.review_batch import ReviewBatch
+from .config import Config
+from .utils.async_http_client import AsyncHttpClient
+from .utils.rate_limiter import RateLimiter
+from .utils.retry_policy import RetryPolicy
+from .utils.cache import ResponseCache, NegativeCache
+from typing import List, Dict, Optional
+
+
+class AsyncGPlayScraper:
+    """Asyncio scraper providing awaitable analyze methods for all 7 method types.
+
+    Args:
+        http_client: Async HTTP client to use (aiohttp, httpx)
+        pool_size: Maximum keep-alive connections in the shared session
+        rate_limit_delay: Delay between request starts in seconds (0 disables)
+        rate_limiter: Optional RateLimiter, e.g. shared with a GPlayScraper
+        retry_policy: Optional RetryPolicy, e.g. to share one retry budget
+        cache: Optional ResponseCache, e.g. shared with a GPlayScraper
+        negative_cache: Optional NegativeCache, e.g. shared with a GPlayScraper
+        stale_while_revalidate: Serve expired cached pages at once and refresh them in the background
+
+    Example:
+        async with AsyncGPlayScraper(rate_limit_delay=0) as scraper:
+            apps = await asyncio.gather(*(scraper.app_analyze(app_id) for app_id in app_ids))
+    """
+
+    def __init__(self, http_client: str = None, pool_size: int = None, rate_limit_delay: float = None,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None, cache: ResponseCache = None,
+                 negative_cache: NegativeCache = None, stale_while_revalidate: bool = None):
+        """Initialize AsyncGPlayScraper with all method types on one AsyncHttpClient.
+
+        Args:
+            http_client: Optional async HTTP client name. Defaults to 'aiohttp' with fallback to 'httpx'.
+            pool_size: Optional maximum keep-alive connections (default: 100)
+            rate_limit_delay: Optional delay between request starts in seconds (default: 1.0)
+            rate_limiter: Optional RateLimiter; overrides rate_limit_delay when given
+            retry_policy: Optional RetryPolicy with custom backoff and retry budget
+            cache: Optional response cache, e.g. MemoryCache()
+            negative_cache: Optional NegativeCache() for confirmed 404s
+            stale_while_revalidate: Optional flag (default: Config.STALE_WHILE_REVALIDATE)
+        """
+        self.http_client = AsyncHttpClient(rate_limit_delay, http_client, pool_size, rate_limiter, retry_policy, cache,
+                                           negative_cache, stale_while_revalidate)
+
+        self.app_methods = AsyncAppMethods(self.http_client)
+        self.search_methods = AsyncSearchMethods(self.http_client)
+        self.reviews_methods = AsyncReviewsMethods(self.http_client)
+        self.developer_methods = AsyncDeveloperMethods(self.http_client)
+        self.similar_methods = AsyncSimilarMethods(self.http_client)
+        self.list_methods = AsyncListMethods(self.http_client)
+        self.suggest_methods = AsyncSuggestMethods(self.http_client)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
+
+    async def close(self) -> None:
+        """Close the pooled async HTTP session shared by all method types."""
+        await self.http_client.close()
+
+    async def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict:
+        """Get complete app data with all 65+ fields.
+
+        Args:
+            app_id: Google Play app ID
+            lang: Language code
+            country: Country code
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+
+        Returns:
+            Dictionary with all app data
+        """
+        return await self.app_methods.app_analyze(app_id, lang, country, assets)
+
+    async def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Search for apps and get complete results.
+
+        Args:
+            query: Search query string
+            count: Number of results to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of dictionaries containing app data
+        """
+        return await self.search_methods.search_analyze(query, count, lang, country)
+
+    async def reviews_analyze(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                              country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Dict]:
+        """Get user reviews for an app.
+
+        Args:
+            app_id: Google Play app ID
+            count: Number of reviews to fetch
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+
+        Returns:
+            List of review dictionaries
+        """
+        return await self.reviews_methods.reviews_analyze(app_id, count, lang, country, sort)
+
+    def reviews_iter(self, app_id: str, count: Optional[int] = None, lang: str = Config.DEFAULT_LANGUAGE,
+                     country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                     token: str = None, pages: bool = False, columnar: bool = False) -> AsyncReviewsStream:
+        """Stream reviews as each batch arrives, with bounded memory (use with async for).
+
+        Args:
+            app_id: Google Play app ID
+            count: Maximum number of reviews to fetch (default: all)
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+            token: Continuation token (stream.token) from an earlier run, to resume it
+            pages: Yield one {'reviews': [...], 'token': ...} dict per page instead of single reviews
+            columnar: Yield one ReviewBatch of NumPy columns per page (requires numpy)
+
+        Returns:
+            AsyncReviewsStream async iterator; its token attribute is the resume point
+        """
+        return self.reviews_methods.reviews_iter(app_id, count, lang, country, sort, token, pages, columnar)
+
+    async def reviews_batch(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                      country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> ReviewBatch:
+        """Get user reviews as NumPy columns, for analytics (requires numpy).
+
+        Args:
+            app_id: Google Play app ID
+            count: Number of reviews to fetch
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+
+        Returns:
+            ReviewBatch; use to_pandas() or to_arrow() to export it
+        """
+        return await self.reviews_methods.reviews_batch(app_id, count, lang, country, sort)
+
+    async def developer_analyze(self, dev_id: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get all apps from a developer.
+
+        Args:
+            dev_id: Developer ID (numeric or string)
+            count: Number of apps to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of app dictionaries
+        """
+        return await self.developer_methods.developer_analyze(dev_id, count, lang, country)
+
+    async def similar_analyze(self, app_id: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get similar/competitor apps.
+
+        Args:
+            app_id: Google Play app ID
+            count: Number of similar apps to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of similar app dictionaries
+        """
+        return await self.similar_methods.similar_analyze(app_id, count, lang, country)
+
+    async def list_analyze(self, collection: str = Config.DEFAULT_LIST_COLLECTION, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get top charts (top free, top paid, top grossing).
+
+        Args:
+            collection: Collection type (TOP_FREE, TOP_PAID, TOP_GROSSING)
+            category: App category
+            count: Number of apps to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of app dictionaries from top charts
+        """
+        return await self.list_methods.list_analyze(collection, category, count, lang, country)
+
+    async def suggest_analyze(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[str]:
+        """Get search suggestions for a term.
+
+        Args:
+            term: Search term
+            count: Number of suggestions to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of suggestion strings
+        """
+        return await self.suggest_methods.suggest_analyze(term, count, lang, country)
@@ -12,7 +12,97 @@ class Config:
     # HTTP request settings
     DEFAULT_TIMEOUT = 30  # Request timeout in seconds
     RATE_LIMIT_DELAY = 1.0  # Delay between requests in seconds
-    DEFAULT_RETRY_COUNT = 3  # Number of retries for failed requests
+    RATE_LIMIT_BURST = 1  # Requests allowed back to back per token bucket
+    RATE_LIMIT_KEY = "endpoint"  # Token bucket key: endpoint (html vs batchexecute), host, global
+    THROTTLE_STATUS_CODES = (429, 503)  # Status codes treated as "slow down" signals
+    
+    # Adaptive (AIMD) rate control settings
+    ADAPTIVE_RATE_LIMIT = False  # Use AdaptiveRateLimiter by default instead of a fixed rate
+    AIMD_MIN_RATE = 0.2  # Lowest requests per second per bucket
+    AIMD_MAX_RATE = 50.0  # Highest requests per second per bucket
+    AIMD_INCREASE = 0.5  # Requests per second added per second of healthy traffic
+    AIMD_DECREASE = 0.5  # Multiplier applied to rate and concurrency on throttling
+    AIMD_LATENCY_TARGET = 3.0  # Response time in seconds treated as congestion
+    AIMD_COOLDOWN = 1.0  # Minimum seconds between two decreases
+    AIMD_MAX_CONCURRENCY = 64  # Highest in-flight requests per bucket
+    
+    # Circuit breaker settings (per HTTP client library)
+    BREAKER_FAILURE_THRESHOLD = 0.5  # Error rate that opens a breaker
+    BREAKER_MIN_REQUESTS = 3  # Outcomes needed in the window before a breaker can open
+    BREAKER_WINDOW = 60.0  # Sliding error-rate window in seconds
+    BREAKER_RESET_TIMEOUT = 30.0  # Seconds before an open breaker lets a probe through
+    
+    # Automatic client selection (client_type="auto")
+    AUTO_CLIENT_EXPLORATION = 0.3  # UCB exploration weight; higher tries slower clients more often
+    AUTO_CLIENT_DISCOUNT = 0.98  # Per-outcome decay so rankings follow changes in blocking
+    AUTO_CLIENT_LATENCY_SCALE = 1.0  # Seconds; a success this slow scores 0.5
+    
+    # Retry policy settings
+    DEFAULT_RETRY_COUNT = 3  # Total attempts per request, including the first (as the decorators always counted it)
+    RETRY_BASE_DELAY = 0.5  # Backoff base in seconds (full jitter up to base * 2**retry)
+    RETRY_MAX_DELAY = 30.0  # Backoff cap in seconds
+    RETRY_BUDGET_RATIO = 0.2  # Retries allowed per live request
+    RETRY_BUDGET_BURST = 10  # Retry tokens that can be saved up
+    RETRY_BUDGET_MIN_RATE = 0.1  # Retry tokens added per second regardless of traffic
+    
+    # Request coalescing
+    SINGLE_FLIGHT = True  # Coalesce identical concurrent requests into one fetch
+    
+    # Response cache (used when a cache is passed to HttpClient/GPlayScraper)
+    CACHE_MAX_BYTES = 64 * 1024 * 1024  # Memory cap for MemoryCache
+    CACHE_TTLS = {  # Seconds a response may be reused, per endpoint; missing or 0 disables caching
+        "app": 6 * 3600,
+        "developer": 6 * 3600,
+        "cluster": 6 * 3600,
+        "search": 3600,
+        "search_page": 3600,
+        "list": 3600,
+        "reviews": 3600,
+        "reviews_newest": 300,
+        "suggest": 3 * 86400,
+    }
+    # Stale-while-revalidate: expired entries are served at once and refreshed in the background
+    STALE_WHILE_REVALIDATE = False  # Default for HttpClient(stale_while_revalidate=...)
+    CACHE_MAX_STALE = {  # Seconds past expiry an entry may still be served, per endpoint; missing or 0 disables
+        "app": 86400,
+        "developer": 86400,
+        "cluster": 86400,
+    }
+    REFRESH_WORKERS = 4  # Threads running background refreshes in HttpClient
+    DISK_CACHE_PATH = "~/.cache/gplay_scraper/responses.sqlite3"  # SQLiteCache database file
+    DISK_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Cap on compressed bytes stored on disk
+    DISK_CACHE_COMPRESSION = "auto"  # Options: auto (zstd if installed, else zlib), zstd, zlib
+    DISK_CACHE_LEVEL = 6  # Compression level
+    DISK_CACHE_BUSY_TIMEOUT = 30.0  # Seconds to wait for another process's write lock
+    DISK_CACHE_TOUCH_BATCH = 256  # Read hits whose recency is written in one batch
+    SHARED_CACHE_URL = "redis://127.0.0.1:6379/0"  # RedisCache server, redis:// or unix:// URL
+    SHARED_CACHE_PREFIX = "gplay:"  # Prefix for every RedisCache key
+    SHARED_CACHE_TIMEOUT = 1.0  # Socket timeout for RedisCache commands
+    CACHE_FILL_LOCK_TTL = 30.0  # With a shared cache, seconds other processes wait for the one fetching a page
+    CACHE_FILL_POLL = 0.05  # Seconds between cache checks while another process fetches
+    
+    # Negative cache for confirmed 404s (used when a NegativeCache is passed to HttpClient/GPlayScraper)
+    NEGATIVE_CACHE_TTL = 12 * 3600  # Seconds a not-found answer is trusted
+    NEGATIVE_CACHE_MAX_ENTRIES = 100000  # Oldest entries are dropped beyond this
+    NEGATIVE_CACHE_ENDPOINTS = ("app", "developer", "cluster")  # Endpoints whose 404s are cached
+    
+    # Memo of parsed results read by the get_field/get_fields/print_* accessors
+    RESULT_MEMO_TTL = 300  # Seconds an analyze result is reused by accessors; 0 disables
+    RESULT_MEMO_MAX_ENTRIES = 256  # Results kept per memo, least recently used dropped first
+    
+    # JSON library used to encode printed output (responses are always decoded with json)
+    JSON_BACKEND = "auto"  # Options: auto (orjson if installed, else json), orjson, json
+    LAZY_APP_DATA = False  # Opt in for memory-bound jobs: reads ds:5 fields from the page text, far less memory but ~3x the parse CPU
+    
+    # Hedged requests (a second copy is sent when the first is slower than usual)
+    HEDGE_REQUESTS = False  # Enable hedging for HEDGE_ENDPOINTS
+    HEDGE_ENDPOINTS = ("app", "developer")  # Endpoints whose requests may be hedged
+    HEDGE_QUANTILE = 0.95  # Hedge once a request is slower than this latency quantile
+    HEDGE_WINDOW = 200  # Recent latencies kept per endpoint
+    HEDGE_MIN_SAMPLES = 20  # Latencies needed before an endpoint is hedged
+    HEDGE_MIN_DELAY = 0.05  # Never hedge sooner than this many seconds
+    HTTP_POOL_SIZE = 10  # Max keep-alive connections per HTTP client session
+    ASYNC_POOL_SIZE = 100  # Max keep-alive connections per async HTTP client session
     
     # User agent strings for HTTP requests
     USER_AGENTS = [
@@ -34,7 +124,9 @@ class Config:
     DEFAULT_LANGUAGE = "en"  # Default language code
     DEFAULT_COUNTRY = ""  # Default country code
     DEFAULT_REVIEWS_SORT = "NEWEST"  # Options: NEWEST, RELEVANT, RATING
-    DEFAULT_HTTP_CLIENT = "requests"  # Options: requests, httpx, curl-cffi, tls-client, aiohttp, urllib3, cloudscraper
+    DEFAULT_HTTP_CLIENT = "requests"  # Options: requests, httpx, curl-cffi, tls-client, aiohttp, urllib3, cloudscraper, auto
+    DEFAULT_ASYNC_HTTP_CLIENT = "aiohttp"  # Options: aiohttp, httpx, auto
+    ASYNC_HTTP_CLIENTS = ["aiohttp", "httpx"]  # Async client fallback order
     
     # Default collection and category for list methods
     DEFAULT_LIST_COLLECTION = "TOP_FREE"  # Options: TOP_FREE, TOP_PAID, TOP_GROSSING
@@ -78,6 +170,7 @@ class Config:
         "HTTP_CLIENT_NOT_AVAILABLE": "{client} not available",
         "HTTP_ERROR": "HTTP {status_code} Error",
         "NO_HTTP_CLIENT": "No HTTP client libraries found",
+        "ALL_CLIENTS_UNAVAILABLE": "All HTTP clients are unavailable or have open circuit breakers",
         "CLIENT_FAILED_TRYING_NEXT": "{client_type} failed, trying next client: {error}",
         "UNKNOWN_CLIENT_TYPE": "Unknown client type: {client_type}",
         "APP_NOT_FOUND": "App not found: {app_id}",
@@ -90,7 +183,8 @@ class Config:
         "NO_DS3_DATA": "No data found in dataset",
         "DS3_NOT_FOUND": "Could not find data",
         "DS3_JSON_PARSE_FAILED": "Failed to parse JSON: {error}",
-        "SEARCH_PAGINATION_FAILED": "Failed to fetch paginated search results: {error}"
+        "SEARCH_PAGINATION_FAILED": "Failed to fetch paginated search results: {error}",
+        "PACKAGE_REQUIRED": "{package} is required for {feature} (pip install {package})"
     }
     
     @classmethod
@@ -1,5 +1,7 @@
 """Core module containing all 7 method classes for Google Play Store scraping."""
 
 from .gplay_methods import AppMethods, SearchMethods, ReviewsMethods, DeveloperMethods, SimilarMethods, ListMethods, SuggestMethods
+from .gplay_async_methods import AsyncAppMethods, AsyncSearchMethods, AsyncReviewsMethods, AsyncDeveloperMethods, AsyncSimilarMethods, AsyncListMethods, AsyncSuggestMethods
 
-__all__ = ['AppMethods', 'SearchMethods', 'ReviewsMethods', 'DeveloperMethods', 'SimilarMethods', 'ListMethods', 'SuggestMethods']
\ No newline at end of file
+__all__ = ['AppMethods', 'SearchMethods', 'ReviewsMethods', 'DeveloperMethods', 'SimilarMethods', 'ListMethods', 'SuggestMethods',
+           'AsyncAppMethods', 'AsyncSearchMethods', 'AsyncReviewsMethods', 'AsyncDeveloperMethods', 'AsyncSimilarMethods', 'AsyncListMethods', 'AsyncSuggestMethods']
\ No newline at end of file
@@ -0,0 +1,343 @@
+"""Async method classes for all 7 scraping types.
+
+Each class mirrors its synchronous counterpart in gplay_methods with an
+awaitable analyze() coroutine. Scraping goes through the async scrapers;
+parsing and formatting reuse the synchronous parsers unchanged.
+"""
+
+from typing import List, Dict, Optional, Union
+import logging
+from .gplay_async_scraper import (
+    AsyncAppScraper, AsyncSearchScraper, AsyncReviewsScraper, AsyncDeveloperScraper,
+    AsyncSimilarScraper, AsyncListScraper, AsyncSuggestScraper,
+)
+from .gplay_parser import AppParser, SearchParser, ReviewsParser, DeveloperParser, SimilarParser, ListParser, SuggestParser
+from .reviews_stream import AsyncReviewsStream
+from ..models.review_batch import ReviewBatch
+from ..config import Config
+from ..utils.async_http_client import AsyncHttpClient
+from ..exceptions import InvalidAppIdError
+from ..utils.error_handling import comprehensive_error_handler
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAppMethods:
+    """Async methods for extracting app details with 65+ fields."""
+    def __init__(self, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncAppMethods with scraper and parser.
+
+        Args:
+            http_client: Optional async HTTP client name or shared AsyncHttpClient instance
+        """
+        self.scraper = AsyncAppScraper(http_client=http_client)
+        self.parser = AppParser()
+
+    @comprehensive_error_handler()
+    async def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict:
+        """Get complete app data with all 65+ fields.
+
+        Args:
+            app_id: Google Play app ID
+            lang: Language code
+            country: Country code
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+
+        Returns:
+            Dictionary with all app data or None if app not found after retries
+
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        dataset = await self.scraper.scrape_play_store_data(app_id, lang, country)
+        app_details = self.parser.extract_app_details(dataset, app_id, assets)
+
+        missing_rating_fields = self.parser.find_missing_rating_fields(app_details)
+        if missing_rating_fields:
+            try:
+                country_code = self.parser.fallback_country(app_details)
+                if country_code:
+                    fallback_dataset = await self.scraper.fetch_fallback_data(app_id, gl=country_code)
+                else:
+                    fallback_dataset = await self.scraper.fetch_fallback_data(app_id, no_locale=True)
+                self.parser.merge_fallback_data(app_details, fallback_dataset, missing_rating_fields)
+            except Exception:
+                pass
+
+        return self.parser.format_app_data(self.parser.finalize_app_data(app_details))
+
+
+class AsyncSearchMethods:
+    """Async methods for searching apps by keyword."""
+    def __init__(self, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncSearchMethods with scraper and parser.
+
+        Args:
+            http_client: Optional async HTTP client name or shared AsyncHttpClient instance
+        """
+        self.scraper = AsyncSearchScraper(http_client=http_client)
+        self.parser = SearchParser()
+
+    @comprehensive_error_handler(return_empty=True)
+    async def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Search for apps and get complete results with pagination support.
+
+        Args:
+            query: Search query string
+            count: Number of results to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of dictionaries containing app data
+
+        Raises:
+            InvalidAppIdError: If query is invalid
+        """
+        if not query or not isinstance(query, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_QUERY"])
+
+        dataset = await self.scraper.scrape_play_store_data(query, count, lang, country)
+        raw_results = self.parser.parse_search_results(dataset, count)
+        return [self.parser.format_search_result(result) for result in raw_results]
+
+
+class AsyncReviewsMethods:
+    """Async methods for extracting user reviews and ratings."""
+    def __init__(self, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncReviewsMethods with scraper and parser.
+
+        Args:
+            http_client: Optional async HTTP client name or shared AsyncHttpClient instance
+        """
+        self.scraper = AsyncReviewsScraper(http_client=http_client)
+        self.parser = ReviewsParser()
+
+    @comprehensive_error_handler(return_empty=True)
+    async def reviews_analyze(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                              country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Dict]:
+        """Get user reviews for an app.
+
+        Args:
+            app_id: Google Play app ID
+            count: Number of reviews to fetch
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+
+        Returns:
+            List of review dictionaries
+
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        if count <= 0:
+            return []
+
+        try:
+            dataset = await self.scraper.scrape_reviews_data(app_id, count, lang, country, sort)
+            reviews_data = self.parser.parse_multiple_responses(dataset)
+        except Exception as e:
+            logger.error(Config.ERROR_MESSAGES["REVIEWS_SCRAPE_FAILED"].format(app_id=app_id, error=e))
+            raise
+
+        return self.parser.format_reviews_data(reviews_data)
+
+    def reviews_iter(self, app_id: str, count: Optional[int] = None, lang: str = Config.DEFAULT_LANGUAGE,
+                     country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                     token: str = None, pages: bool = False, columnar: bool = False) -> AsyncReviewsStream:
+        """Stream reviews page by page with bounded memory (use with async for).
+
+        Args:
+            app_id: Google Play app ID
+            count: Maximum number of reviews to fetch, or None for all
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+            token: Continuation token from an earlier stream, to resume it
+            pages: Yield one {'reviews': [...], 'token': ...} dict per page instead of single reviews
+            columnar: Yield one ReviewBatch of NumPy columns per page (requires numpy)
+
+        Returns:
+            AsyncReviewsStream yielding review dictionaries (or pages)
+
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        page_iter = self.scraper.iter_review_pages(app_id, count, lang, country, sort, token)
+        return AsyncReviewsStream(page_iter, self.parser, token, pages, columnar)
+
+    async def reviews_batch(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                      country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> ReviewBatch:
+        """Get user reviews for an app as NumPy columns.
+
+        Built straight from the decoded pages, without per-review dicts or
+        per-row timestamp formatting. Requires numpy; a failed fetch gives
+        an empty batch, as reviews_analyze gives an empty list.
+
+        Args:
+            app_id: Google Play app ID
+            count: Number of reviews to fetch
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+
+        Returns:
+            ReviewBatch with score, thumbsUpCount, at and appVersion columns
+
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+            ImportError: If numpy is not installed
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        if count <= 0:
+            return ReviewBatch.from_pages([])
+
+        dataset = await self.scraper.scrape_reviews_data(app_id, count, lang, country, sort)
+        return ReviewBatch.from_pages((dataset or {}).get("pages", []))
+
+
+class AsyncDeveloperMethods:
+    """Async methods for getting all apps from a developer."""
+    def __init__(self, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncDeveloperMethods with scraper and parser.
+
+        Args:
+            http_client: Optional async HTTP client name or shared AsyncHttpClient instance
+        """
+        self.scraper = AsyncDeveloperScraper(http_client=http_client)
+        self.parser = DeveloperParser()
+
+    @comprehensive_error_handler(return_empty=True)
+    async def developer_analyze(self, dev_id: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get all apps from a developer.
+
+        Args:
+            dev_id: Developer ID (numeric or string)
+            count: Number of apps to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of app dictionaries
+
+        Raises:
+            InvalidAppIdError: If dev_id is invalid
+        """
+        if not dev_id or not isinstance(dev_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_DEV_ID"])
+
+        dataset = await self.scraper.scrape_play_store_data(dev_id, lang, country)
+        apps_data = self.parser.parse_developer_data(dataset, dev_id)
+        return self.parser.format_developer_data(apps_data)[:count]
+
+
+class AsyncSimilarMethods:
+    """Async methods for finding similar/competitor apps."""
+    def __init__(self, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncSimilarMethods with scraper and parser.
+
+        Args:
+            http_client: Optional async HTTP client name or shared AsyncHttpClient instance
+        """
+        self.scraper = AsyncSimilarScraper(http_client=http_client)
+        self.parser = SimilarParser()
+
+    @comprehensive_error_handler(return_empty=True)
+    async def similar_analyze(self, app_id: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get similar/competitor apps.
+
+        Args:
+            app_id: Google Play app ID
+            count: Number of similar apps to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of similar app dictionaries
+
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        dataset = await self.scraper.scrape_play_store_data(app_id, lang, country)
+        apps_data = self.parser.parse_similar_data(dataset)
+        return self.parser.format_similar_data(apps_data)[:count]
+
+
+class AsyncListMethods:
+    """Async methods for getting top charts (free, paid, grossing)."""
+    def __init__(self, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncListMethods with scraper and parser.
+
+        Args:
+            http_client: Optional async HTTP client name or shared AsyncHttpClient instance
+        """
+        self.scraper = AsyncListScraper(http_client=http_client)
+        self.parser = ListParser()
+
+    @comprehensive_error_handler(return_empty=True)
+    async def list_analyze(self, collection: str = Config.DEFAULT_LIST_COLLECTION, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get top charts (top free, top paid, top grossing).
+
+        Args:
+            collection: Collection type (TOP_FREE, TOP_PAID, TOP_GROSSING)
+            category: App category
+            count: Number of apps to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of app dictionaries from top charts
+        """
+        dataset = await self.scraper.scrape_play_store_data(collection, category, count, lang, country)
+        apps_data = self.parser.parse_list_data(dataset, count)
+        return self.parser.format_list_data(apps_data)
+
+
+class AsyncSuggestMethods:
+    """Async methods for getting search suggestions and autocomplete."""
+    def __init__(self, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncSuggestMethods with scraper and parser.
+
+        Args:
+            http_client: Optional async HTTP client name or shared AsyncHttpClient instance
+        """
+        self.scraper = AsyncSuggestScraper(http_client=http_client)
+        self.parser = SuggestParser()
+
+    @comprehensive_error_handler(return_empty=True)
+    async def suggest_analyze(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[str]:
+        """Get search suggestions for a term.
+
+        Args:
+            term: Search term
+            count: Number of suggestions to return
+            lang: Language code
+            country: Country code
+
+        Returns:
+            List of suggestion strings
+
+        Raises:
+            InvalidAppIdError: If term is invalid
+        """
+        if not term or not isinstance(term, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_QUERY"])
+
+        dataset = await self.scraper.scrape_suggestions(term, lang, country)
+        suggestions = self.parser.parse_suggestions(dataset)
+        return self.parser.format_suggestions(suggestions[:count])
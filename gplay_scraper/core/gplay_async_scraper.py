@@ -0,0 +1,305 @@
+"""Asyncio scrapers for all 7 scraping types.
+
+Each class subclasses its synchronous counterpart in gplay_scraper so the
+pure extraction helpers (find_init_data, pagination, token and cluster
+parsing) are shared; only the methods that touch the network are awaitable.
+"""
+
+import json
+import logging
+from typing import AsyncIterator, Dict, Optional, Union
+from ..utils.async_http_client import AsyncHttpClient
+from ..config import Config
+from ..exceptions import DataParsingError, InvalidAppIdError
+from ..utils.error_handling import handle_network_errors, handle_parsing_errors, validate_inputs
+from ..utils.constants import SORT_NAMES, CLUSTER_NAMES
+from .gplay_parser import SearchParser, ReviewsParser
+from .gplay_scraper import (
+    find_init_data, AppScraper, SearchScraper, ReviewsScraper, DeveloperScraper,
+    SimilarScraper, ListScraper, SuggestScraper,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _async_client(rate_limit_delay: float, http_client: Union[str, AsyncHttpClient]) -> AsyncHttpClient:
+    """Reuse a shared AsyncHttpClient or create one from a client name."""
+    return http_client if isinstance(http_client, AsyncHttpClient) else AsyncHttpClient(rate_limit_delay, http_client)
+
+
+class AsyncAppScraper(AppScraper):
+    """Asyncio scraper for fetching app details from Google Play Store."""
+
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncAppScraper with async HTTP client.
+
+        Args:
+            rate_limit_delay: Delay between requests in seconds (default: 1.0)
+            http_client: Async HTTP client to use (aiohttp, httpx), or a shared AsyncHttpClient instance
+        """
+        self.http_client = _async_client(rate_limit_delay, http_client)
+
+    async def fetch_playstore_page(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch app page HTML from Google Play Store."""
+        return await self.http_client.fetch_app_page(app_id, lang, country)
+
+    async def fetch_fallback_data(self, app_id: str, gl: str = None, no_locale: bool = False) -> Dict:
+        """Fetch app data with specific country or without locale parameters.
+
+        Args:
+            app_id: Google Play app ID
+            gl: Country code for fallback request
+            no_locale: If True, fetch without hl and gl parameters
+
+        Returns:
+            Dictionary containing ds:5 dataset from fallback request
+        """
+        if gl and not no_locale:
+            html_content = await self.http_client.fetch_app_page(app_id, lang=Config.DEFAULT_LANGUAGE, country=gl)
+        else:
+            html_content = await self.http_client.fetch_app_page_no_locale(app_id)
+
+        ds5_data = find_init_data(html_content, "ds:5")
+
+        return {"ds:5": ds5_data} if ds5_data else None
+
+    @validate_inputs()
+    @handle_network_errors()
+    @handle_parsing_errors()
+    async def scrape_play_store_data(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict:
+        """Extract dataset from app page HTML.
+
+        Raises:
+            DataParsingError: If dataset not found
+        """
+        html_content = await self.fetch_playstore_page(app_id, lang, country)
+
+        ds5_data = find_init_data(html_content, "ds:5")
+
+        if not ds5_data:
+            raise DataParsingError(Config.ERROR_MESSAGES["DS5_NOT_FOUND"])
+
+        return {"ds:5": ds5_data, "fallback_needed": False}
+
+
+class AsyncSearchScraper(SearchScraper):
+    """Asyncio scraper for fetching search results with pagination."""
+
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncSearchScraper with async HTTP client and parser.
+
+        Args:
+            rate_limit_delay: Delay between requests in seconds
+            http_client: Async HTTP client name, or a shared AsyncHttpClient instance
+        """
+        self.http_client = _async_client(rate_limit_delay, http_client)
+        self.parser = SearchParser()
+
+    async def fetch_playstore_search(self, query: str, count: int, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch search page HTML from Google Play Store.
+
+        Raises:
+            InvalidAppIdError: If query is invalid
+        """
+        if not query or not isinstance(query, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_QUERY"])
+
+        if count <= 0:
+            return ""
+
+        return await self.http_client.fetch_search_page(query=query, lang=lang, country=country)
+
+    @validate_inputs()
+    @handle_network_errors()
+    @handle_parsing_errors()
+    async def scrape_play_store_data(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict:
+        """Scrape search results with automatic pagination support."""
+        html_content = await self.fetch_playstore_search(query, count, lang, country)
+
+        dataset = self.parser.parse_html_content(html_content)
+
+        if count <= Config.DEFAULT_SEARCH_COUNT // 5:
+            return dataset
+
+        token = self.parser.extract_pagination_token(dataset)
+
+        all_results = []
+        initial_results = self._get_nested_value(dataset.get("ds:1", []), [0, 1, 0, 0, 0], [])
+        all_results.extend(initial_results)
+
+        while len(all_results) < count and token:
+            needed = min(Config.DEFAULT_REVIEWS_BATCH_SIZE * 2, count - len(all_results))
+            try:
+                response_text = await self.http_client.fetch_search_page(token=token, needed=needed, lang=lang, country=country)
+                page = self._parse_pagination_response(response_text)
+                if page is None:
+                    break
+                paginated_results, token = page
+                all_results.extend(paginated_results)
+            except (json.JSONDecodeError, IndexError, KeyError, Exception):
+                break
+        if "ds:1" in dataset:
+            dataset["ds:1"][0][1][0][0][0] = all_results[:count]
+
+        return dataset
+
+
+class AsyncReviewsScraper(ReviewsScraper):
+    """Asyncio scraper for fetching user reviews in batches."""
+
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncReviewsScraper with async HTTP client and parser.
+
+        Args:
+            rate_limit_delay: Delay between requests in seconds
+            http_client: Async HTTP client name, or a shared AsyncHttpClient instance
+        """
+        self.http_client = _async_client(rate_limit_delay, http_client)
+        self.parser = ReviewsParser()
+
+    async def fetch_reviews_batch(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY,
+                                  sort: int = Config.DEFAULT_REVIEWS_SORT, batch_count: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, token: str = None) -> str:
+        """Fetch single batch of reviews from API."""
+        sort_value = SORT_NAMES.get(sort, sort) if isinstance(sort, str) else sort
+        return await self.http_client.fetch_reviews_batch(app_id, lang, country, sort_value, batch_count, token)
+
+    @validate_inputs()
+    @handle_network_errors()
+    @handle_parsing_errors()
+    async def scrape_reviews_data(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                                  country: str = Config.DEFAULT_COUNTRY, sort: int = Config.DEFAULT_REVIEWS_SORT) -> Dict:
+        """Scrape multiple batches of reviews, decoding each response once."""
+        return {"pages": [page async for page in self.iter_review_pages(app_id, count, lang, country, sort)]}
+
+    async def iter_review_pages(self, app_id: str, count: Optional[int] = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                                country: str = Config.DEFAULT_COUNTRY, sort: int = Config.DEFAULT_REVIEWS_SORT, token: str = None) -> AsyncIterator[Dict]:
+        """Fetch and decode review batches one at a time (see ReviewsScraper.iter_review_pages)."""
+        fetched = 0
+        batch_size = Config.DEFAULT_REVIEWS_BATCH_SIZE
+
+        while count is None or fetched < count:
+            fetch_count = batch_size if count is None else min(batch_size, count - fetched)
+
+            response = await self.fetch_reviews_batch(app_id, lang, country, sort, fetch_count, token)
+
+            if not response:
+                return
+
+            page = self.parser.decode_reviews_page(response)
+            yield page
+            fetched += fetch_count
+
+            token = page["token"]
+            if not token or not page["reviews"]:
+                return
+
+
+class AsyncDeveloperScraper(DeveloperScraper):
+    """Asyncio scraper for fetching developer portfolios."""
+
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncDeveloperScraper with async HTTP client.
+
+        Args:
+            rate_limit_delay: Delay between requests in seconds
+            http_client: Async HTTP client name, or a shared AsyncHttpClient instance
+        """
+        self.http_client = _async_client(rate_limit_delay, http_client)
+
+    async def fetch_developer_page(self, dev_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch developer page HTML from Google Play Store."""
+        return await self.http_client.fetch_developer_page(dev_id, lang, country)
+
+    @validate_inputs()
+    @handle_network_errors()
+    @handle_parsing_errors()
+    async def scrape_play_store_data(self, dev_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict:
+        """Extract dataset from developer page HTML.
+
+        Raises:
+            DataParsingError: If dataset not found
+        """
+        html_content = await self.fetch_developer_page(dev_id, lang, country)
+
+        ds3_data = find_init_data(html_content, "ds:3")
+
+        if not ds3_data:
+            raise DataParsingError(Config.ERROR_MESSAGES["DS3_NOT_FOUND"])
+
+        return {"ds:3": ds3_data, "dev_id": dev_id}
+
+
+class AsyncSimilarScraper(SimilarScraper):
+    """Asyncio scraper for fetching similar apps."""
+
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncSimilarScraper with async HTTP client.
+
+        Args:
+            rate_limit_delay: Delay between requests in seconds
+            http_client: Async HTTP client name, or a shared AsyncHttpClient instance
+        """
+        self.http_client = _async_client(rate_limit_delay, http_client)
+
+    async def fetch_similar_page(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch app page HTML to extract similar apps cluster URL."""
+        return await self.http_client.fetch_app_page(app_id, lang, country)
+
+    @validate_inputs()
+    @handle_network_errors()
+    @handle_parsing_errors()
+    async def scrape_play_store_data(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict:
+        """Extract similar apps dataset from cluster page."""
+        html_content = await self.fetch_similar_page(app_id, lang, country)
+
+        cluster_url = self._extract_cluster_url(html_content)
+        if not cluster_url:
+            return {"ds:3": None}
+
+        cluster_html = await self.http_client.fetch_cluster_page(cluster_url, lang, country)
+        return self._extract_cluster_dataset(cluster_html)
+
+
+class AsyncListScraper(ListScraper):
+    """Asyncio scraper for fetching top charts."""
+
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncListScraper with async HTTP client.
+
+        Args:
+            rate_limit_delay: Delay between requests in seconds
+            http_client: Async HTTP client name, or a shared AsyncHttpClient instance
+        """
+        self.http_client = _async_client(rate_limit_delay, http_client)
+
+    @handle_network_errors()
+    @handle_parsing_errors()
+    async def scrape_play_store_data(self, collection: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict:
+        """Scrape top charts data from Google Play Store."""
+        cluster = CLUSTER_NAMES.get(collection, collection)
+        response_text = await self.http_client.fetch_list_page(cluster, category, count, lang, country)
+        return self._parse_list_response(response_text)
+
+
+class AsyncSuggestScraper(SuggestScraper):
+    """Asyncio scraper for fetching search suggestions."""
+
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, AsyncHttpClient] = None):
+        """Initialize AsyncSuggestScraper with async HTTP client.
+
+        Args:
+            rate_limit_delay: Delay between requests in seconds
+            http_client: Async HTTP client name, or a shared AsyncHttpClient instance
+        """
+        self.http_client = _async_client(rate_limit_delay, http_client)
+
+    @validate_inputs()
+    @handle_network_errors()
+    @handle_parsing_errors()
+    async def scrape_suggestions(self, term: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict:
+        """Scrape search suggestions from Google Play Store."""
+        if not term:
+            return {"suggestions": []}
+
+        response_text = await self.http_client.fetch_suggest_page(term, lang, country)
+        return self._parse_suggest_response(response_text)
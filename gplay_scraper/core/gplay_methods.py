@@ -7,14 +7,21 @@ This module contains 7 method classes, each providing 6 functions (except Sugges
 - print_field(): Print single field
 - print_fields(): Print multiple fields
 - print_all(): Print all data as JSON
+
+The get_*, print_* and nested variants read analyze results through a
+ResultMemo, so calling several of them for the same arguments scrapes once.
 """
 
-import json
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Optional, Union
 import logging
 from .gplay_scraper import AppScraper, SearchScraper, ReviewsScraper, DeveloperScraper, SimilarScraper, ListScraper, SuggestScraper
 from .gplay_parser import AppParser, SearchParser, ReviewsParser, DeveloperParser, SimilarParser, ListParser, SuggestParser
+from .reviews_stream import ReviewsStream
+from ..models.review_batch import ReviewBatch
 from ..config import Config
+from ..utils.http_client import HttpClient
+from ..utils.memo import ResultMemo
+from ..utils.json_codec import json_dumps
 from ..exceptions import InvalidAppIdError, AppNotFoundError
 from ..utils.error_handling import comprehensive_error_handler, safe_print 
 
@@ -24,19 +31,42 @@ if not logging.getLogger().handlers:
 logger = logging.getLogger(__name__)
 
 
-class AppMethods:
+class _MemoizedMethods:
+    """Base class giving method classes a memo of their analyze results."""
+
+    def _memoized(self, analyze, *args):
+        """Return analyze(*args) from the result memo, running it on a miss."""
+        return self.memo.get_or_compute((analyze.__name__,) + args, lambda: analyze(*args))
+
+    def _memoized_fields(self, analyze, fields: List[str], *args):
+        """Return analyze(*args) limited to fields, reusing any memoized result that covers them.
+        
+        A memoized full result, or a memoized subset holding every requested
+        field, is returned as is. On a miss, analyze runs with the field list
+        as its last argument, so only the specs and metrics those fields need
+        are computed.
+        """
+        covering = self.memo.get_covering((analyze.__name__,) + args, fields)
+        if covering is not None:
+            return covering
+        return self._memoized(analyze, *args, tuple(fields))
+
+
+class AppMethods(_MemoizedMethods):
     """Methods for extracting app details with 65+ fields."""
-    def __init__(self, http_client: str = None):
+    def __init__(self, http_client: Union[str, HttpClient] = None, memo: ResultMemo = None):
         """Initialize AppMethods with scraper and parser.
         
         Args:
-            http_client: Optional HTTP client name
+            http_client: Optional HTTP client name or shared HttpClient instance
+            memo: Optional ResultMemo shared with other method classes (default: a new one)
         """
         self.scraper = AppScraper(http_client=http_client)
         self.parser = AppParser()
+        self.memo = memo if memo is not None else ResultMemo()
 
     @comprehensive_error_handler()
-    def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict:
+    def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None, fields: List[str] = None) -> Dict:
         """Get complete app data with all 65+ fields.
         
         Args:
@@ -44,6 +74,7 @@ class AppMethods:
             lang: Language code
             country: Country code
             assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            fields: Only extract these fields (default: all)
             
         Returns:
             Dictionary with all app data or None if app not found after retries
@@ -55,8 +86,8 @@ class AppMethods:
             raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
         
         dataset = self.scraper.scrape_play_store_data(app_id, lang, country)
-        app_details = self.parser.parse_app_data(dataset, app_id, self.scraper, assets)
-        return self.parser.format_app_data(app_details)
+        app_details = self.parser.parse_app_data(dataset, app_id, self.scraper, assets, fields)
+        return self.parser.format_app_data(app_details, fields)
 
     @comprehensive_error_handler()
     def app_get_field(self, app_id: str, field: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Any:
@@ -72,7 +103,7 @@ class AppMethods:
         Returns:
             Value of the requested field
         """
-        return self.app_analyze(app_id, lang, country, assets).get(field)
+        return self._memoized_fields(self.app_analyze, [field], app_id, lang, country, assets).get(field)
 
     @comprehensive_error_handler()
     def app_get_fields(self, app_id: str, fields: List[str], lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict[str, Any]:
@@ -88,7 +119,7 @@ class AppMethods:
         Returns:
             Dictionary with requested fields and values
         """
-        data = self.app_analyze(app_id, lang, country, assets)
+        data = self._memoized_fields(self.app_analyze, fields, app_id, lang, country, assets)
         return {field: data.get(field) for field in fields}
 
     @safe_print()
@@ -136,26 +167,28 @@ class AppMethods:
             country: Country code
             assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
         """
-        data = self.app_analyze(app_id, lang, country, assets)
+        data = self._memoized(self.app_analyze, app_id, lang, country, assets)
         try:
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+            print(json_dumps(data, indent=2, ensure_ascii=False))
         except UnicodeEncodeError:
-            print(json.dumps(data, indent=2, ensure_ascii=True))
+            print(json_dumps(data, indent=2, ensure_ascii=True))
 
 
-class SearchMethods:
+class SearchMethods(_MemoizedMethods):
     """Methods for searching apps by keyword."""
-    def __init__(self, http_client: str = None):
+    def __init__(self, http_client: Union[str, HttpClient] = None, memo: ResultMemo = None):
         """Initialize SearchMethods with scraper and parser.
         
         Args:
-            http_client: Optional HTTP client name
+            http_client: Optional HTTP client name or shared HttpClient instance
+            memo: Optional ResultMemo shared with other method classes (default: a new one)
         """
         self.scraper = SearchScraper(http_client=http_client)
         self.parser = SearchParser()
+        self.memo = memo if memo is not None else ResultMemo()
 
     @comprehensive_error_handler(return_empty=True)
-    def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+    def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: List[str] = None) -> List[Dict]:
         """Search for apps and get complete results with pagination support.
         
         Args:
@@ -163,6 +196,7 @@ class SearchMethods:
             count: Number of results to return
             lang: Language code
             country: Country code
+            fields: Only extract these fields (default: all)
             
         Returns:
             List of dictionaries containing app data
@@ -174,8 +208,8 @@ class SearchMethods:
             raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_QUERY"])
         
         dataset = self.scraper.scrape_play_store_data(query, count, lang, country)
-        raw_results = self.parser.parse_search_results(dataset, count)
-        return [self.parser.format_search_result(result) for result in raw_results]
+        raw_results = self.parser.parse_search_results(dataset, count, fields)
+        return [self.parser.format_search_result(result, fields) for result in raw_results]
 
     @comprehensive_error_handler(return_empty=True)
     def search_get_field(self, query: str, field: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
@@ -191,7 +225,7 @@ class SearchMethods:
         Returns:
             List of field values from all results
         """
-        results = self.search_analyze(query, count, lang, country)
+        results = self._memoized_fields(self.search_analyze, [field], query, count, lang, country)
         return [app.get(field) for app in results]
 
     @comprehensive_error_handler(return_empty=True)
@@ -208,7 +242,7 @@ class SearchMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        results = self.search_analyze(query, count, lang, country)
+        results = self._memoized_fields(self.search_analyze, fields, query, count, lang, country)
         return [{field: app.get(field) for field in fields} for app in results]
 
     @safe_print()
@@ -259,24 +293,26 @@ class SearchMethods:
             lang: Language code
             country: Country code
         """
-        results = self.search_analyze(query, count, lang, country)
+        results = self._memoized(self.search_analyze, query, count, lang, country)
         for i, result in enumerate(results):
             try:
-                print(json.dumps(result, indent=2, ensure_ascii=False))
+                print(json_dumps(result, indent=2, ensure_ascii=False))
             except UnicodeEncodeError:
-                print(json.dumps(result, indent=2, ensure_ascii=True))
+                print(json_dumps(result, indent=2, ensure_ascii=True))
 
 
-class ReviewsMethods:
+class ReviewsMethods(_MemoizedMethods):
     """Methods for extracting user reviews and ratings."""
-    def __init__(self, http_client: str = None):
+    def __init__(self, http_client: Union[str, HttpClient] = None, memo: ResultMemo = None):
         """Initialize ReviewsMethods with scraper and parser.
         
         Args:
-            http_client: Optional HTTP client name
+            http_client: Optional HTTP client name or shared HttpClient instance
+            memo: Optional ResultMemo shared with other method classes (default: a new one)
         """
         self.scraper = ReviewsScraper(http_client=http_client)
         self.parser = ReviewsParser()
+        self.memo = memo if memo is not None else ResultMemo()
 
     @comprehensive_error_handler(return_empty=True)
     def reviews_analyze(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE, 
@@ -311,6 +347,68 @@ class ReviewsMethods:
 
         return self.parser.format_reviews_data(reviews_data)
 
+    def reviews_iter(self, app_id: str, count: Optional[int] = None, lang: str = Config.DEFAULT_LANGUAGE,
+                     country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                     token: str = None, pages: bool = False, columnar: bool = False) -> ReviewsStream:
+        """Stream reviews page by page with bounded memory.
+        
+        Batches are fetched as the stream is consumed and only the current
+        page is held, so memory does not grow with count. Network errors are
+        raised from the iteration; stream.token is then still a valid resume point.
+        
+        Args:
+            app_id: Google Play app ID
+            count: Maximum number of reviews to fetch, or None for all
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+            token: Continuation token from an earlier stream, to resume it
+            pages: Yield one {'reviews': [...], 'token': ...} dict per page instead of single reviews
+            columnar: Yield one ReviewBatch of NumPy columns per page (requires numpy)
+            
+        Returns:
+            ReviewsStream yielding review dictionaries (or pages)
+            
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+        
+        page_iter = self.scraper.iter_review_pages(app_id, count, lang, country, sort, token)
+        return ReviewsStream(page_iter, self.parser, token, pages, columnar)
+
+    def reviews_batch(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                      country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> ReviewBatch:
+        """Get user reviews for an app as NumPy columns.
+        
+        Built straight from the decoded pages, without per-review dicts or
+        per-row timestamp formatting. Requires numpy; a failed fetch gives
+        an empty batch, as reviews_analyze gives an empty list.
+        
+        Args:
+            app_id: Google Play app ID
+            count: Number of reviews to fetch
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+        
+        Returns:
+            ReviewBatch with score, thumbsUpCount, at and appVersion columns
+        
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+            ImportError: If numpy is not installed
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+        
+        if count <= 0:
+            return ReviewBatch.from_pages([])
+        
+        dataset = self.scraper.scrape_reviews_data(app_id, count, lang, country, sort)
+        return ReviewBatch.from_pages((dataset or {}).get("pages", []))
+
     @comprehensive_error_handler(return_empty=True)
     def reviews_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_REVIEWS_COUNT, 
                          lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Any]:
@@ -327,7 +425,7 @@ class ReviewsMethods:
         Returns:
             List of field values from all reviews
         """
-        reviews_data = self.reviews_analyze(app_id, count, lang, country, sort)
+        reviews_data = self._memoized(self.reviews_analyze, app_id, count, lang, country, sort)
         return [review.get(field) for review in reviews_data]
 
     @comprehensive_error_handler(return_empty=True)
@@ -346,7 +444,7 @@ class ReviewsMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        reviews_data = self.reviews_analyze(app_id, count, lang, country, sort)
+        reviews_data = self._memoized(self.reviews_analyze, app_id, count, lang, country, sort)
         return [{field: review.get(field) for field in fields} for review in reviews_data]
 
     @safe_print()
@@ -402,26 +500,28 @@ class ReviewsMethods:
             country: Country code
             sort: Sort order
         """
-        reviews_data = self.reviews_analyze(app_id, count, lang, country, sort)
+        reviews_data = self._memoized(self.reviews_analyze, app_id, count, lang, country, sort)
         try:
-            print(json.dumps(reviews_data, indent=2, ensure_ascii=False))
+            print(json_dumps(reviews_data, indent=2, ensure_ascii=False))
         except UnicodeEncodeError:
-            print(json.dumps(reviews_data, indent=2, ensure_ascii=True))
+            print(json_dumps(reviews_data, indent=2, ensure_ascii=True))
 
 
-class DeveloperMethods:
+class DeveloperMethods(_MemoizedMethods):
     """Methods for getting all apps from a developer."""
-    def __init__(self, http_client: str = None):
+    def __init__(self, http_client: Union[str, HttpClient] = None, memo: ResultMemo = None):
         """Initialize DeveloperMethods with scraper and parser.
         
         Args:
-            http_client: Optional HTTP client name
+            http_client: Optional HTTP client name or shared HttpClient instance
+            memo: Optional ResultMemo shared with other method classes (default: a new one)
         """
         self.scraper = DeveloperScraper(http_client=http_client)
         self.parser = DeveloperParser()
+        self.memo = memo if memo is not None else ResultMemo()
 
     @comprehensive_error_handler(return_empty=True)
-    def developer_analyze(self, dev_id: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+    def developer_analyze(self, dev_id: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: List[str] = None) -> List[Dict]:
         """Get all apps from a developer.
         
         Args:
@@ -429,6 +529,7 @@ class DeveloperMethods:
             count: Number of apps to return
             lang: Language code
             country: Country code
+            fields: Only extract these fields (default: all)
             
         Returns:
             List of app dictionaries
@@ -440,8 +541,8 @@ class DeveloperMethods:
             raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_DEV_ID"])
             
         dataset = self.scraper.scrape_play_store_data(dev_id, lang, country)
-        apps_data = self.parser.parse_developer_data(dataset, dev_id)
-        return self.parser.format_developer_data(apps_data)[:count]
+        apps_data = self.parser.parse_developer_data(dataset, dev_id, fields)
+        return self.parser.format_developer_data(apps_data, fields)[:count]
 
     @comprehensive_error_handler(return_empty=True)
     def developer_get_field(self, dev_id: str, field: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
@@ -457,7 +558,7 @@ class DeveloperMethods:
         Returns:
             List of field values from all apps
         """
-        results = self.developer_analyze(dev_id, count, lang, country)
+        results = self._memoized_fields(self.developer_analyze, [field], dev_id, count, lang, country)
         return [app.get(field) for app in results]
 
     @comprehensive_error_handler(return_empty=True)
@@ -474,7 +575,7 @@ class DeveloperMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        results = self.developer_analyze(dev_id, count, lang, country)
+        results = self._memoized_fields(self.developer_analyze, fields, dev_id, count, lang, country)
         return [{field: app.get(field) for field in fields} for app in results]
 
     @safe_print()
@@ -525,26 +626,28 @@ class DeveloperMethods:
             lang: Language code
             country: Country code
         """
-        results = self.developer_analyze(dev_id, count, lang, country)
+        results = self._memoized(self.developer_analyze, dev_id, count, lang, country)
         try:
-            print(json.dumps(results, indent=2, ensure_ascii=False))
+            print(json_dumps(results, indent=2, ensure_ascii=False))
         except UnicodeEncodeError:
-            print(json.dumps(results, indent=2, ensure_ascii=True))
+            print(json_dumps(results, indent=2, ensure_ascii=True))
 
 
-class SimilarMethods:
+class SimilarMethods(_MemoizedMethods):
     """Methods for finding similar/competitor apps."""
-    def __init__(self, http_client: str = None):
+    def __init__(self, http_client: Union[str, HttpClient] = None, memo: ResultMemo = None):
         """Initialize SimilarMethods with scraper and parser.
         
         Args:
-            http_client: Optional HTTP client name
+            http_client: Optional HTTP client name or shared HttpClient instance
+            memo: Optional ResultMemo shared with other method classes (default: a new one)
         """
         self.scraper = SimilarScraper(http_client=http_client)
         self.parser = SimilarParser()
+        self.memo = memo if memo is not None else ResultMemo()
 
     @comprehensive_error_handler(return_empty=True)
-    def similar_analyze(self, app_id: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+    def similar_analyze(self, app_id: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: List[str] = None) -> List[Dict]:
         """Get similar/competitor apps.
         
         Args:
@@ -552,6 +655,7 @@ class SimilarMethods:
             count: Number of similar apps to return
             lang: Language code
             country: Country code
+            fields: Only extract these fields (default: all)
             
         Returns:
             List of similar app dictionaries
@@ -563,8 +667,8 @@ class SimilarMethods:
             raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
             
         dataset = self.scraper.scrape_play_store_data(app_id, lang, country)
-        apps_data = self.parser.parse_similar_data(dataset)
-        return self.parser.format_similar_data(apps_data)[:count]
+        apps_data = self.parser.parse_similar_data(dataset, fields)
+        return self.parser.format_similar_data(apps_data, fields)[:count]
 
     @comprehensive_error_handler(return_empty=True)
     def similar_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
@@ -580,7 +684,7 @@ class SimilarMethods:
         Returns:
             List of field values from all similar apps
         """
-        results = self.similar_analyze(app_id, count, lang, country)
+        results = self._memoized_fields(self.similar_analyze, [field], app_id, count, lang, country)
         return [app.get(field) for app in results]
 
     @comprehensive_error_handler(return_empty=True)
@@ -597,7 +701,7 @@ class SimilarMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        results = self.similar_analyze(app_id, count, lang, country)
+        results = self._memoized_fields(self.similar_analyze, fields, app_id, count, lang, country)
         return [{field: app.get(field) for field in fields} for app in results]
 
     @safe_print()
@@ -648,26 +752,28 @@ class SimilarMethods:
             lang: Language code
             country: Country code
         """
-        results = self.similar_analyze(app_id, count, lang, country)
+        results = self._memoized(self.similar_analyze, app_id, count, lang, country)
         try:
-            print(json.dumps(results, indent=2, ensure_ascii=False))
+            print(json_dumps(results, indent=2, ensure_ascii=False))
         except UnicodeEncodeError:
-            print(json.dumps(results, indent=2, ensure_ascii=True))
+            print(json_dumps(results, indent=2, ensure_ascii=True))
 
 
-class ListMethods:
+class ListMethods(_MemoizedMethods):
     """Methods for getting top charts (free, paid, grossing)."""
-    def __init__(self, http_client: str = None):
+    def __init__(self, http_client: Union[str, HttpClient] = None, memo: ResultMemo = None):
         """Initialize ListMethods with scraper and parser.
         
         Args:
-            http_client: Optional HTTP client name
+            http_client: Optional HTTP client name or shared HttpClient instance
+            memo: Optional ResultMemo shared with other method classes (default: a new one)
         """
         self.scraper = ListScraper(http_client=http_client)
         self.parser = ListParser()
+        self.memo = memo if memo is not None else ResultMemo()
 
     @comprehensive_error_handler(return_empty=True)
-    def list_analyze(self, collection: str = Config.DEFAULT_LIST_COLLECTION, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+    def list_analyze(self, collection: str = Config.DEFAULT_LIST_COLLECTION, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: List[str] = None) -> List[Dict]:
         """Get top charts (top free, top paid, top grossing).
         
         Args:
@@ -676,13 +782,14 @@ class ListMethods:
             count: Number of apps to return
             lang: Language code
             country: Country code
+            fields: Only extract these fields (default: all)
             
         Returns:
             List of app dictionaries from top charts
         """
         dataset = self.scraper.scrape_play_store_data(collection, category, count, lang, country)
-        apps_data = self.parser.parse_list_data(dataset, count)
-        return self.parser.format_list_data(apps_data)
+        apps_data = self.parser.parse_list_data(dataset, count, fields)
+        return self.parser.format_list_data(apps_data, fields)
 
     @comprehensive_error_handler(return_empty=True)
     def list_get_field(self, collection: str, field: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
@@ -699,7 +806,7 @@ class ListMethods:
         Returns:
             List of field values from all apps
         """
-        results = self.list_analyze(collection, category, count, lang, country)
+        results = self._memoized_fields(self.list_analyze, [field], collection, category, count, lang, country)
         return [app.get(field) for app in results]
 
     @comprehensive_error_handler(return_empty=True)
@@ -717,7 +824,7 @@ class ListMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        results = self.list_analyze(collection, category, count, lang, country)
+        results = self._memoized_fields(self.list_analyze, fields, collection, category, count, lang, country)
         return [{field: app.get(field) for field in fields} for app in results]
 
     @safe_print()
@@ -771,23 +878,25 @@ class ListMethods:
             lang: Language code
             country: Country code
         """
-        results = self.list_analyze(collection, category, count, lang, country)
+        results = self._memoized(self.list_analyze, collection, category, count, lang, country)
         try:
-            print(json.dumps(results, indent=2, ensure_ascii=False))
+            print(json_dumps(results, indent=2, ensure_ascii=False))
         except UnicodeEncodeError:
-            print(json.dumps(results, indent=2, ensure_ascii=True))
+            print(json_dumps(results, indent=2, ensure_ascii=True))
 
 
-class SuggestMethods:
+class SuggestMethods(_MemoizedMethods):
     """Methods for getting search suggestions and autocomplete."""
-    def __init__(self, http_client: str = None):
+    def __init__(self, http_client: Union[str, HttpClient] = None, memo: ResultMemo = None):
         """Initialize SuggestMethods with scraper and parser.
         
         Args:
-            http_client: Optional HTTP client name
+            http_client: Optional HTTP client name or shared HttpClient instance
+            memo: Optional ResultMemo shared with other method classes (default: a new one)
         """
         self.scraper = SuggestScraper(http_client=http_client)
         self.parser = SuggestParser()
+        self.memo = memo if memo is not None else ResultMemo()
 
     @comprehensive_error_handler(return_empty=True)
     def suggest_analyze(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[str]:
@@ -831,10 +940,10 @@ class SuggestMethods:
         if not term or not isinstance(term, str):
             raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_QUERY"])
         
-        first_level = self.suggest_analyze(term, count, lang, country)
+        first_level = self._memoized(self.suggest_analyze, term, count, lang, country)
         results = {}
         for suggestion in first_level:
-            second_level = self.suggest_analyze(suggestion, count, lang, country)
+            second_level = self._memoized(self.suggest_analyze, suggestion, count, lang, country)
             results[suggestion] = second_level
         return results
 
@@ -848,11 +957,11 @@ class SuggestMethods:
             lang: Language code
             country: Country code
         """
-        suggestions = self.suggest_analyze(term, count, lang, country)
+        suggestions = self._memoized(self.suggest_analyze, term, count, lang, country)
         try:
-            print(json.dumps(suggestions, indent=2, ensure_ascii=False))
+            print(json_dumps(suggestions, indent=2, ensure_ascii=False))
         except UnicodeEncodeError:
-            print(json.dumps(suggestions, indent=2, ensure_ascii=True))
+            print(json_dumps(suggestions, indent=2, ensure_ascii=True))
 
     @safe_print()
     def suggest_print_nested(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> None:
@@ -866,6 +975,6 @@ class SuggestMethods:
         """
         nested = self.suggest_nested(term, count, lang, country)
         try:
-            print(json.dumps(nested, indent=2, ensure_ascii=False))
+            print(json_dumps(nested, indent=2, ensure_ascii=False))
         except UnicodeEncodeError:
-            print(json.dumps(nested, indent=2, ensure_ascii=True))
\ No newline at end of file
+            print(json_dumps(nested, indent=2, ensure_ascii=True))
\ No newline at end of file
@@ -4,27 +4,107 @@ This module contains 7 parser classes that handle JSON/HTML parsing and
 data formatting for all scraping methods.
 """
 
-import json
-import re
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Tuple
-from ..models.element_specs import ElementSpecs, nested_lookup, format_image_url
-from ..utils.helpers import clean_json_string, alternative_json_clean, calculate_app_age, calculate_daily_installs, calculate_monthly_installs, tamp_to_date, get_publisher_country
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from ..models.element_specs import ExtractionPlan, extraction_plan, nested_lookup, format_image_url
+from ..utils.helpers import alternative_json_clean, calculate_app_age, calculate_daily_installs, calculate_monthly_installs, tamp_to_date, get_publisher_country
 from ..config import Config
 from ..exceptions import DataParsingError
 from ..utils.error_handling import handle_parsing_errors
+from ..utils.js_literal import parse_js_literal
+from ..utils.lazy_json import LazyJson
+from ..utils.json_codec import json_loads
+from ..utils.init_data import InitDataIndex
 from ..utils.helpers import pho_count, add_count
 
+_XSSI_PREFIX = ")]}'\n\n"  # Prefix of batchexecute responses
+
+def _spec_fields(fields: Optional[Iterable[str]], renamed: Dict[str, str] = None, required: Tuple[str, ...] = ()) -> Optional[set]:
+    """Map requested output fields to the ElementSpecs fields that produce them.
+    
+    Args:
+        fields: Requested output field names, or None for all
+        renamed: Output name -> spec name, where they differ
+        required: Spec fields the parser itself reads (e.g. title for filtering)
+        
+    Returns:
+        Set of spec field names, or None for all
+    """
+    if fields is None:
+        return None
+    renamed = renamed or {}
+    return {renamed.get(field, field) for field in fields}.union(required)
+
+
+def _project(formatted: Dict[str, Any], fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Keep only the requested output fields, in the order asked."""
+    if fields is None:
+        return formatted
+    return {field: formatted.get(field) for field in fields}
+
+
 class AppParser:
     """Parser for extracting and formatting app data."""
+    
+    # Output fields that are not a single ElementSpecs.App field, and the spec fields they read
+    DERIVED_FIELDS = {
+        "appId": (),
+        "appUrl": (),
+        "appAgeDays": ("released",),
+        "lastUpdated": ("updated",),
+        "dailyInstalls": ("installs", "released"),
+        "minDailyInstalls": ("minInstalls", "released"),
+        "realDailyInstalls": ("realInstalls", "released"),
+        "monthlyInstalls": ("installs", "released"),
+        "minMonthlyInstalls": ("minInstalls", "released"),
+        "realMonthlyInstalls": ("realInstalls", "released"),
+        "maxAndroidApi": ("maxandroidapi",),
+        "minAndroidApi": ("minandroidapi",),
+        "publisherCountry": ("developerPhone", "developerAddress"),
+    }
+    RATING_FIELDS = ("released", "score", "ratings", "reviews", "histogram")
+    
+    # Install metrics: output field, calculator, install count field
+    INSTALL_METRICS = (
+        ("dailyInstalls", calculate_daily_installs, "installs"),
+        ("minDailyInstalls", calculate_daily_installs, "minInstalls"),
+        ("realDailyInstalls", calculate_daily_installs, "realInstalls"),
+        ("monthlyInstalls", calculate_monthly_installs, "installs"),
+        ("minMonthlyInstalls", calculate_monthly_installs, "minInstalls"),
+        ("realMonthlyInstalls", calculate_monthly_installs, "realInstalls"),
+    )
+
+    def source_fields(self, fields: Optional[Iterable[str]]) -> Optional[set]:
+        """Map requested output fields to the ElementSpecs.App fields they need.
+        
+        Args:
+            fields: Output field names (as returned by format_app_data), or None for all
+            
+        Returns:
+            Set of spec field names, or None for all
+        """
+        if fields is None:
+            return None
+        sources = set()
+        for field in fields:
+            sources.update(self.DERIVED_FIELDS.get(field, (field,)))
+        if sources.intersection(self.RATING_FIELDS):
+            # The fallback request is localized from the developer's phone or address
+            sources.update(("developerPhone", "developerAddress"))
+        return sources
+
     @handle_parsing_errors()
-    def parse_app_data(self, dataset: Dict, app_id: str, scraper=None, assets: str = None) -> Dict[str, Any]:
+    def parse_app_data(self, dataset: Dict, app_id: str, scraper=None, assets: str = None, fields: Iterable[str] = None) -> Dict[str, Any]:
         """Parse raw app data from dataset with fallback for missing release date.
         
         Args:
             dataset: Raw dataset from scraper
             app_id: Google Play app ID
             scraper: AppScraper instance for fallback requests
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            fields: Output fields wanted (default: all); only the specs and
+                metrics they need run, and the fallback request is made only
+                for requested rating fields
             
         Returns:
             Dictionary with parsed app details
@@ -32,81 +112,165 @@ class AppParser:
         Raises:
             DataParsingError: If parsing fails
         """
+        sources = self.source_fields(fields)
+        app_details = self.extract_app_details(dataset, app_id, assets, sources)
+        
+        missing_rating_fields = self.find_missing_rating_fields(app_details, sources)
+        if missing_rating_fields and scraper:
+            try:
+                country_code = self.fallback_country(app_details)
+                if country_code:
+                    fallback_dataset = scraper.fetch_fallback_data(app_id, gl=country_code)
+                else:
+                    fallback_dataset = scraper.fetch_fallback_data(app_id, no_locale=True)
+                self.merge_fallback_data(app_details, fallback_dataset, missing_rating_fields)
+            except:
+                pass
+        
+        return self.finalize_app_data(app_details, fields)
+
+    def extract_app_details(self, dataset: Dict, app_id: str, assets: str = None, fields: Iterable[str] = None) -> Dict[str, Any]:
+        """Decode the ds:5 dataset and extract App fields.
+        
+        Args:
+            dataset: Raw dataset from scraper
+            app_id: Google Play app ID
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            fields: ElementSpecs.App fields to extract (default: all)
+            
+        Returns:
+            Dictionary with extracted app details (before fallback and metrics)
+            
+        Raises:
+            DataParsingError: If dataset is empty or cannot be decoded
+        """
         ds5_data = dataset.get("ds:5", "")
         if not ds5_data:
             raise DataParsingError(Config.ERROR_MESSAGES["NO_DS5_DATA"])
         
-        json_str_cleaned = clean_json_string(ds5_data)
-        try:
-            data = json.loads(json_str_cleaned)
-        except json.JSONDecodeError as e:
+        app_details = None
+        if Config.LAZY_APP_DATA:
             try:
-                alternative_cleaned = alternative_json_clean(ds5_data)
-                data = json.loads(alternative_cleaned)
-            except Exception:
-                raise DataParsingError(Config.ERROR_MESSAGES["JSON_PARSE_FAILED"].format(error=str(e)))
-
-        app_details = {}
-        for key, spec in ElementSpecs.App.items():
-            value = spec.extract_content(data.get("data", data))
-            if key in ["icon", "headerImage", "videoImage"] and value:
-                app_details[key] = format_image_url(value, assets)
-            elif key == "screenshots" and value:
-                app_details[key] = [format_image_url(url, assets) for url in value if url]
-            else:
-                app_details[key] = value
+                # Read only the paths the specs need, straight from the literal text
+                app_details = self.extract_fields(LazyJson(ds5_data), fields)
+            except ValueError:
+                # Text the lazy reader cannot follow: decode the whole literal
+                pass
+        if app_details is None:
+            try:
+                data = parse_js_literal(ds5_data)
+            except ValueError as e:
+                try:
+                    alternative_cleaned = alternative_json_clean(ds5_data)
+                    data = json_loads(alternative_cleaned)
+                except Exception:
+                    raise DataParsingError(Config.ERROR_MESSAGES["JSON_PARSE_FAILED"].format(error=str(e)))
+            app_details = self.extract_fields(data, fields)
+
+        for key in ["icon", "headerImage", "videoImage"]:
+            if app_details.get(key):
+                app_details[key] = format_image_url(app_details[key], assets)
+        if app_details.get("screenshots"):
+            app_details["screenshots"] = [format_image_url(url, assets) for url in app_details["screenshots"] if url]
 
         app_details['appId'] = app_id
         app_details['url'] = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}"
-        app_details['publisherCountry'] = get_publisher_country(app_details.get('developerPhone'), app_details.get('developerAddress'))
-        
+        return app_details
 
+    def extract_fields(self, data: Any, fields: Iterable[str] = None) -> Dict[str, Any]:
+        """Extract App fields from a decoded ds:5 literal or a LazyJson view of it.
+        
+        Args:
+            data: Decoded literal, or LazyJson over the literal text
+            fields: Names of ElementSpecs.App fields to extract (default: all)
+            
+        Returns:
+            Dictionary of raw field values (image URLs not yet sized)
+            
+        Raises:
+            ValueError: If a LazyJson view meets text it cannot read
+        """
+        return extraction_plan("App", fields).extract(data.get("data", data))
 
-        rating_fields = ["released", "score", "ratings", "reviews", "histogram"]
+    def find_missing_rating_fields(self, app_details: Dict[str, Any], fields: Iterable[str] = None) -> List[str]:
+        """List rating fields that are empty and need a fallback request.
+        
+        Args:
+            app_details: Extracted app details
+            fields: ElementSpecs.App fields that were extracted (default: all)
+            
+        Returns:
+            List of missing field names
+        """
         missing_rating_fields = []
-        for key in rating_fields:
+        for key in self.RATING_FIELDS:
+            if fields is not None and key not in fields:
+                continue
             value = app_details.get(key)
             if key == "histogram":
                 if not value or (isinstance(value, list) and all(x == 0 for x in value)):
                     missing_rating_fields.append(key)
             elif not value:
                 missing_rating_fields.append(key)
+        return missing_rating_fields
+
+    def fallback_country(self, app_details: Dict[str, Any]) -> Optional[str]:
+        """Guess the developer's country for the fallback request.
         
-        if missing_rating_fields and scraper:
+        Args:
+            app_details: Extracted app details
+            
+        Returns:
+            Country code from developer phone or address, or None
+        """
+        country_code = None
+        phone = app_details.get("developerPhone")
+        if phone:
+            country_code = pho_count(phone)
+        
+        if not country_code:
+            address = app_details.get("developerAddress")
+            if address:
+                country_code = add_count(address)
+        return country_code
+
+    def merge_fallback_data(self, app_details: Dict[str, Any], fallback_dataset: Optional[Dict], missing_rating_fields: List[str]) -> None:
+        """Fill missing rating fields in place from a fallback dataset.
+        
+        Args:
+            app_details: Extracted app details to update
+            fallback_dataset: Dataset returned by fetch_fallback_data, or None
+            missing_rating_fields: Fields to fill
+        """
+        if fallback_dataset and fallback_dataset.get("ds:5"):
             try:
-                country_code = None
-                phone = app_details.get("developerPhone")
-                if phone:
-                    country_code = pho_count(phone)
-                
-                if not country_code:
-                    address = app_details.get("developerAddress")
-                    if address:
-                        country_code = add_count(address)
-                
-                if country_code:
-                    fallback_dataset = scraper.fetch_fallback_data(app_id, gl=country_code)
-                    suffix = f"fallback_{country_code}"
-                else:
-                    fallback_dataset = scraper.fetch_fallback_data(app_id, no_locale=True)
-                    suffix = "fallback_no_locale"
-                
-                if fallback_dataset and fallback_dataset.get("ds:5"):
-                    fallback_cleaned = clean_json_string(fallback_dataset["ds:5"])
+                literal = fallback_dataset["ds:5"]
+                fallback_values = None
+                if Config.LAZY_APP_DATA:
                     try:
-                        fallback_data = json.loads(fallback_cleaned)
-                        
-                        for field in missing_rating_fields:
-                            if field in ElementSpecs.App:
-                                spec = ElementSpecs.App[field]
-                                fallback_value = spec.extract_content(fallback_data.get("data", fallback_data))
-                                if fallback_value:
-                                    app_details[field] = fallback_value
-                    except:
+                        fallback_values = self.extract_fields(LazyJson(literal), missing_rating_fields)
+                    except ValueError:
                         pass
+                if fallback_values is None:
+                    fallback_values = self.extract_fields(parse_js_literal(literal), missing_rating_fields)
+                
+                for field, fallback_value in fallback_values.items():
+                    if fallback_value:
+                        app_details[field] = fallback_value
             except:
                 pass
 
+    def finalize_app_data(self, app_details: Dict[str, Any], fields: Iterable[str] = None) -> Dict[str, Any]:
+        """Apply numeric defaults and compute the requested derived fields.
+        
+        Args:
+            app_details: App details after fallback merge
+            fields: Output fields wanted (default: all); app age, install
+                metrics and publisher country are computed only when asked for
+            
+        Returns:
+            Dictionary with parsed app details
+        """
         if not app_details.get("score"):
             app_details["score"] = 0
         if not app_details.get("ratings"):
@@ -118,37 +282,31 @@ class AppParser:
         if not app_details.get("minInstalls"):
             app_details["minInstalls"] = 0
 
+        wanted = None if fields is None else set(fields)
         current_date = datetime.now(timezone.utc)
         release_date_str = app_details.get("released")
-        if release_date_str:
-            app_details["appAge"] = calculate_app_age(release_date_str, current_date)
-            app_details["dailyInstalls"] = calculate_daily_installs(app_details.get("installs"), release_date_str, current_date)
-            app_details["minDailyInstalls"] = calculate_daily_installs(app_details.get("minInstalls"), release_date_str, current_date)
-            app_details["realDailyInstalls"] = calculate_daily_installs(app_details.get("realInstalls"), release_date_str, current_date)
-            app_details["monthlyInstalls"] = calculate_monthly_installs(app_details.get("installs"), release_date_str, current_date)
-            app_details["minMonthlyInstalls"] = calculate_monthly_installs(app_details.get("minInstalls"), release_date_str, current_date)
-            app_details["realMonthlyInstalls"] = calculate_monthly_installs(app_details.get("realInstalls"), release_date_str, current_date)
-        else:
-            metric_keys = [
-                "appAge", "dailyInstalls", "minDailyInstalls", "realDailyInstalls",
-                "monthlyInstalls", "minMonthlyInstalls", "realMonthlyInstalls"
-            ]
-            for key in metric_keys:
-                app_details[key] = 0
+        if wanted is None or "appAgeDays" in wanted:
+            app_details["appAge"] = calculate_app_age(release_date_str, current_date) if release_date_str else 0
+        for key, calculate, installs_key in self.INSTALL_METRICS:
+            if wanted is None or key in wanted:
+                app_details[key] = calculate(app_details.get(installs_key), release_date_str, current_date) if release_date_str else 0
+        if wanted is None or "publisherCountry" in wanted:
+            app_details["publisherCountry"] = get_publisher_country(app_details.get("developerPhone"), app_details.get("developerAddress"))
 
         return app_details
 
     @handle_parsing_errors()
-    def format_app_data(self, details: dict) -> dict:
+    def format_app_data(self, details: dict, fields: Iterable[str] = None) -> dict:
         """Format parsed app data into final structure.
         
         Args:
             details: Parsed app details
+            fields: Output fields to keep, in order (default: all)
             
         Returns:
-            Formatted dictionary with all app fields
+            Formatted dictionary with all (or the requested) app fields
         """
-        return {
+        return _project({
             "appId": details.get("appId"),
             "title": details.get("title"),
             "summary": details.get("summary"),
@@ -206,19 +364,23 @@ class AppParser:
             "publisherCountry": details.get("publisherCountry"),
             "privacyPolicy": details.get("privacyPolicy"),
             "appUrl": details.get("url"),
-        }
+        }, fields)
 
 
 class SearchParser:
     """Parser for extracting and formatting search results."""
     
+    # Output names that differ from their ElementSpecs.Search field
+    RENAMED_FIELDS = {"description": "summary"}
+    
     @handle_parsing_errors(return_empty=True)
-    def parse_search_results(self, dataset: Dict, count: int) -> List[Dict]:
+    def parse_search_results(self, dataset: Dict, count: int, fields: Iterable[str] = None) -> List[Dict]:
         """Parse search results from dataset.
         
         Args:
             dataset: Raw dataset from scraper
             count: Maximum number of results to parse
+            fields: Output fields wanted (default: all); only their specs run
             
         Returns:
             List of parsed search result dictionaries
@@ -232,43 +394,43 @@ class SearchParser:
             return []
         
         results = []
+        plan = extraction_plan("Search", _spec_fields(fields, self.RENAMED_FIELDS))
         n_apps = min(len(search_data), count)
         for i in range(n_apps):
-            app = self.extract_search_result(search_data[i])
+            app = self.extract_search_result(search_data[i], plan)
             if app:
                 results.append(app)
         
         return results[:count]
 
     @handle_parsing_errors()
-    def extract_search_result(self, data) -> Dict:
+    def extract_search_result(self, data, plan: ExtractionPlan = None) -> Dict:
         """Extract single search result from raw data.
         
         Args:
             data: Raw search result data
+            plan: Extraction plan for a field subset (default: all Search fields)
             
         Returns:
             Dictionary with extracted search result or None if extraction fails
         """
         try:
-            result = {}
-            for key, spec in ElementSpecs.Search.items():
-                result[key] = spec.extract_content(data)
-            return result
+            return (plan or extraction_plan("Search")).extract(data)
         except Exception:
             return None
 
     @handle_parsing_errors()
-    def format_search_result(self, result: dict) -> dict:
+    def format_search_result(self, result: dict, fields: Iterable[str] = None) -> dict:
         """Format parsed search result into final structure.
         
         Args:
             result: Parsed search result
+            fields: Output fields to keep, in order (default: all)
             
         Returns:
             Formatted dictionary with search result fields
         """
-        return {
+        return _project({
             "appId": result.get("appId"),
             "title": result.get("title"),
             "description": result.get("summary"),
@@ -280,7 +442,7 @@ class SearchParser:
             "price": result.get("price"),
             "free": result.get("free"),
             "url": result.get("url"),
-        }
+        }, fields)
     
     @handle_parsing_errors()
     def extract_pagination_token(self, dataset: Dict) -> str:
@@ -317,24 +479,7 @@ class SearchParser:
         Raises:
             DataParsingError: If no datasets found
         """
-        script_regex = re.compile(r"AF_initDataCallback[\s\S]*?</script")
-        key_regex = re.compile(r"(ds:.*?)'")
-        value_regex = re.compile(r"data:([\s\S]*?), sideChannel: \{\}\}\);</")
-        
-        matches = script_regex.findall(html_content)
-        dataset = {}
-        
-        for match in matches:
-            key_match = key_regex.findall(match)
-            value_match = value_regex.findall(match)
-            
-            if key_match and value_match:
-                key = key_match[0]
-                try:
-                    value = json.loads(value_match[0])
-                    dataset[key] = value
-                except json.JSONDecodeError:
-                    continue
+        dataset = InitDataIndex(html_content).datasets()
         
         if not dataset:
             raise DataParsingError("No search data found in HTML")
@@ -345,45 +490,72 @@ class SearchParser:
 class ReviewsParser:
     """Parser for extracting and formatting user reviews."""
     
-    @handle_parsing_errors(return_empty=True)
-    def parse_reviews_response(self, content: str) -> Tuple[List[Dict], Optional[str]]:
-        """Parse reviews from API response content.
+    def decode_reviews_page(self, content: str) -> Dict[str, Any]:
+        """Decode one batchexecute reviews response into a structured page.
+        
+        The envelope and the payload string inside it are each decoded once;
+        the scraper reads the next token from the page and the parser reads
+        the reviews from it, so neither has to decode the response again.
         
         Args:
             content: Raw API response content
             
         Returns:
-            Tuple of (list of review dictionaries, next page token)
+            Dictionary with 'reviews' (raw review arrays), 'token' (next page
+            token, or None on the last page or if decoding fails) and 'failed'
+            (True if the response could not be decoded, so a missing token
+            does not mean the last page)
         """
-        regex = re.compile(r"\)]}'\n\n([\s\S]+)")
-        matches = regex.findall(content)
-        
-        if not matches:
-            return [], None
+        start = content.find(_XSSI_PREFIX) if content else -1
+        if start < 0:
+            return {"reviews": [], "token": None, "failed": True}
+        try:
+            payload = json_loads(json_loads(content[start + len(_XSSI_PREFIX):])[0][2])
+        except (ValueError, IndexError, KeyError, TypeError):
+            return {"reviews": [], "token": None, "failed": True}
         
+        token = None
         try:
-            data = json.loads(matches[0])
-            reviews_data = json.loads(data[0][2])
-            
-            next_token = None
-            try:
-                next_token = json.loads(data[0][2])[-2][-1]
-            except:
-                pass
-            
-            if not reviews_data or len(reviews_data) == 0 or len(reviews_data[0]) == 0:
-                return [], None
-            
-            reviews = []
-            for review_raw in reviews_data[0]:
-                review = self.extract_review_data(review_raw)
-                if review:
-                    reviews.append(review)
+            token = payload[-2][-1]
+        except (IndexError, KeyError, TypeError):
+            pass
+        if not isinstance(token, str) or not token:
+            token = None
+        
+        reviews_raw = payload[0] if payload and isinstance(payload[0], list) else []
+        return {"reviews": reviews_raw, "token": token, "failed": False}
+
+    @handle_parsing_errors(return_empty=True)
+    def parse_reviews_page(self, page: Dict[str, Any]) -> List[Dict]:
+        """Extract reviews from a page returned by decode_reviews_page.
+        
+        Args:
+            page: Decoded reviews page
             
-            return reviews, next_token
+        Returns:
+            List of review dictionaries
+        """
+        reviews = []
+        for review_raw in page.get("reviews") or []:
+            review = self.extract_review_data(review_raw)
+            if review:
+                reviews.append(review)
+        return reviews
+
+    @handle_parsing_errors(return_empty=True)
+    def parse_reviews_response(self, content: str) -> Tuple[List[Dict], Optional[str]]:
+        """Parse reviews from API response content.
+        
+        Args:
+            content: Raw API response content
             
-        except (json.JSONDecodeError, IndexError, KeyError):
+        Returns:
+            Tuple of (list of review dictionaries, next page token)
+        """
+        page = self.decode_reviews_page(content)
+        if not page["reviews"]:
             return [], None
+        return self.parse_reviews_page(page), page["token"]
 
     @handle_parsing_errors()
     def extract_review_data(self, review_raw) -> Optional[Dict]:
@@ -420,15 +592,17 @@ class ReviewsParser:
         """Parse multiple review responses.
         
         Args:
-            dataset: Dataset containing multiple review responses
+            dataset: Dataset with decoded 'pages' (or raw 'reviews' response strings)
             
         Returns:
             List of all parsed reviews
         """
-        responses = dataset.get("reviews", [])
         all_reviews = []
+        for page in dataset.get("pages", []):
+            all_reviews.extend(self.parse_reviews_page(page))
         
-        for response in responses:
+        # Raw response strings, as returned by older scrapers
+        for response in dataset.get("reviews", []):
             reviews, _ = self.parse_reviews_response(response)
             all_reviews.extend(reviews)
         
@@ -466,12 +640,13 @@ class DeveloperParser:
     """Parser for extracting and formatting developer apps."""
     
     @handle_parsing_errors(return_empty=True)
-    def parse_developer_data(self, dataset: Dict, dev_id: str) -> List[Dict]:
+    def parse_developer_data(self, dataset: Dict, dev_id: str, fields: Iterable[str] = None) -> List[Dict]:
         """Parse developer apps from dataset.
         
         Args:
             dataset: Raw dataset from scraper
             dev_id: Developer ID (numeric or string)
+            fields: Output fields wanted (default: all); only their specs run
             
         Returns:
             List of parsed app dictionaries
@@ -483,13 +658,12 @@ class DeveloperParser:
         if not ds3_data:
             raise DataParsingError(Config.ERROR_MESSAGES["NO_DS3_DATA"])
         
-        json_str_cleaned = clean_json_string(ds3_data)
         try:
-            data = json.loads(json_str_cleaned)
-        except json.JSONDecodeError as e:
+            data = parse_js_literal(ds3_data)
+        except ValueError as e:
             try:
                 alternative_cleaned = alternative_json_clean(ds3_data)
-                data = json.loads(alternative_cleaned)
+                data = json_loads(alternative_cleaned)
             except Exception:
                 raise DataParsingError(Config.ERROR_MESSAGES["DS3_JSON_PARSE_FAILED"].format(error=str(e)))
 
@@ -505,10 +679,9 @@ class DeveloperParser:
             return []
         
         apps = []
+        plan = extraction_plan("Developer", _spec_fields(fields, required=("title",)))
         for app_data in apps_data:
-            app_details = {}
-            for key, spec in ElementSpecs.Developer.items():
-                app_details[key] = spec.extract_content(app_data)
+            app_details = plan.extract(app_data)
             
             if app_details.get("title"):
                 apps.append(app_details)
@@ -516,11 +689,12 @@ class DeveloperParser:
         return apps
 
     @handle_parsing_errors(return_empty=True)
-    def format_developer_data(self, apps_data: List[Dict]) -> List[Dict]:
+    def format_developer_data(self, apps_data: List[Dict], fields: Iterable[str] = None) -> List[Dict]:
         """Format parsed developer apps into final structure.
         
         Args:
             apps_data: List of parsed apps
+            fields: Output fields to keep, in order (default: all)
             
         Returns:
             List of formatted app dictionaries
@@ -541,7 +715,7 @@ class DeveloperParser:
                 "free": app.get("free"),
                 "url": app.get("url"),
             }
-            formatted_apps.append(formatted_app)
+            formatted_apps.append(_project(formatted_app, fields))
         
         return formatted_apps
 
@@ -550,11 +724,12 @@ class SimilarParser:
     """Parser for extracting and formatting similar apps."""
     
     @handle_parsing_errors(return_empty=True)
-    def parse_similar_data(self, dataset: Dict) -> List[Dict]:
+    def parse_similar_data(self, dataset: Dict, fields: Iterable[str] = None) -> List[Dict]:
         """Parse similar apps from dataset.
         
         Args:
             dataset: Raw dataset from scraper
+            fields: Output fields wanted (default: all); only their specs run
             
         Returns:
             List of parsed similar app dictionaries
@@ -563,13 +738,12 @@ class SimilarParser:
         if not ds3_data:
             return []
         
-        json_str_cleaned = clean_json_string(ds3_data)
         try:
-            data = json.loads(json_str_cleaned)
-        except json.JSONDecodeError as e:
+            data = parse_js_literal(ds3_data)
+        except ValueError as e:
             try:
                 alternative_cleaned = alternative_json_clean(ds3_data)
-                data = json.loads(alternative_cleaned)
+                data = json_loads(alternative_cleaned)
             except Exception:
                 return []
 
@@ -578,10 +752,9 @@ class SimilarParser:
             return []
         
         apps = []
+        plan = extraction_plan("Similar", _spec_fields(fields, required=("title",)))
         for app_data in apps_data:
-            app_details = {}
-            for key, spec in ElementSpecs.Similar.items():
-                app_details[key] = spec.extract_content(app_data)
+            app_details = plan.extract(app_data)
             
             if app_details.get("title"):
                 apps.append(app_details)
@@ -589,11 +762,12 @@ class SimilarParser:
         return apps
 
     @handle_parsing_errors(return_empty=True)
-    def format_similar_data(self, apps_data: List[Dict]) -> List[Dict]:
+    def format_similar_data(self, apps_data: List[Dict], fields: Iterable[str] = None) -> List[Dict]:
         """Format parsed similar apps into final structure.
         
         Args:
             apps_data: List of parsed apps
+            fields: Output fields to keep, in order (default: all)
             
         Returns:
             List of formatted app dictionaries
@@ -614,7 +788,7 @@ class SimilarParser:
                 "free": app.get("free"),
                 "url": app.get("url"),
             }
-            formatted_apps.append(formatted_app)
+            formatted_apps.append(_project(formatted_app, fields))
         
         return formatted_apps
 
@@ -623,12 +797,13 @@ class ListParser:
     """Parser for extracting and formatting top chart apps."""
     
     @handle_parsing_errors(return_empty=True)
-    def parse_list_data(self, dataset: Dict, count: int) -> List[Dict]:
+    def parse_list_data(self, dataset: Dict, count: int, fields: Iterable[str] = None) -> List[Dict]:
         """Parse top chart apps from dataset.
         
         Args:
             dataset: Raw dataset from scraper
             count: Maximum number of apps to parse
+            fields: Output fields wanted (default: all); only their specs run
             
         Returns:
             List of parsed app dictionaries
@@ -642,10 +817,9 @@ class ListParser:
             return []
         
         apps = []
+        plan = extraction_plan("List", _spec_fields(fields, required=("title",)))
         for app_data in apps_data[:count]:
-            app_details = {}
-            for key, spec in ElementSpecs.List.items():
-                app_details[key] = spec.extract_content(app_data)
+            app_details = plan.extract(app_data)
             
             if app_details.get("title"):
                 apps.append(app_details)
@@ -653,11 +827,12 @@ class ListParser:
         return apps
 
     @handle_parsing_errors(return_empty=True)
-    def format_list_data(self, apps_data: List[Dict]) -> List[Dict]:
+    def format_list_data(self, apps_data: List[Dict], fields: Iterable[str] = None) -> List[Dict]:
         """Format parsed list apps into final structure.
         
         Args:
             apps_data: List of parsed apps
+            fields: Output fields to keep, in order (default: all)
             
         Returns:
             List of formatted app dictionaries
@@ -681,7 +856,7 @@ class ListParser:
                 "free": app.get("free"),
                 "url": app.get("url"),
             }
-            formatted_apps.append(formatted_app)
+            formatted_apps.append(_project(formatted_app, fields))
         
         return formatted_apps
 
@@ -1,14 +1,16 @@
 import json
 import re
 import logging
-from typing import Dict
+from typing import Dict, Iterator, Optional, Union
 from ..utils.http_client import HttpClient
 from ..config import Config
 from ..exceptions import DataParsingError, InvalidAppIdError, AppNotFoundError
 from ..utils.error_handling import handle_network_errors, handle_parsing_errors, validate_inputs
 from urllib.parse import quote
-from .gplay_parser import SearchParser
+from .gplay_parser import SearchParser, ReviewsParser
 from ..utils.constants import SORT_NAMES, CLUSTER_NAMES
+from ..utils.init_data import find_init_data
+from ..utils.json_codec import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -27,14 +29,14 @@ class AppScraper:
         - Automatic retry with different parameters
     """
     
-    def __init__(self, rate_limit_delay: float = None, http_client: str = None):
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, HttpClient] = None):
         """Initialize AppScraper with HTTP client.
         
         Args:
             rate_limit_delay: Delay between requests in seconds (default: 1.0)
-            http_client: HTTP client to use (requests, curl_cffi, etc.)
+            http_client: HTTP client to use (requests, curl_cffi, etc.), or a shared HttpClient instance
         """
-        self.http_client = HttpClient(rate_limit_delay, http_client)
+        self.http_client = http_client if isinstance(http_client, HttpClient) else HttpClient(rate_limit_delay, http_client)
 
     def fetch_playstore_page(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch app page HTML from Google Play Store.
@@ -67,16 +69,7 @@ class AppScraper:
         else:
             html_content = self.http_client.fetch_app_page_no_locale(app_id)
         
-        ds_match = re.search(r'AF_initDataCallback\s*\(\s*({\s*key:\s*["\']ds:5["\'][\s\S]*?})\s*\)\s*;', html_content, re.DOTALL)
-        if ds_match:
-            ds5_data = ds_match.group(1)
-        else:
-            all_callbacks = re.findall(r'AF_initDataCallback\s*\(\s*({[\s\S]*?})\s*\)\s*;', html_content, re.DOTALL)
-            ds5_data = ""
-            for callback in all_callbacks:
-                if "'ds:5'" in callback or '"ds:5"' in callback:
-                    ds5_data = callback
-                    break
+        ds5_data = find_init_data(html_content, "ds:5")
         
         return {"ds:5": ds5_data} if ds5_data else None
 
@@ -100,16 +93,7 @@ class AppScraper:
         """
         html_content = self.fetch_playstore_page(app_id, lang, country)
         
-        ds_match = re.search(r'AF_initDataCallback\s*\(\s*({\s*key:\s*["\']ds:5["\'][\s\S]*?})\s*\)\s*;', html_content, re.DOTALL)
-        if ds_match:
-            ds5_data = ds_match.group(1)
-        else:
-            all_callbacks = re.findall(r'AF_initDataCallback\s*\(\s*({[\s\S]*?})\s*\)\s*;', html_content, re.DOTALL)
-            ds5_data = ""
-            for callback in all_callbacks:
-                if "'ds:5'" in callback or '"ds:5"' in callback:
-                    ds5_data = callback
-                    break
+        ds5_data = find_init_data(html_content, "ds:5")
         
         if not ds5_data:
             raise DataParsingError(Config.ERROR_MESSAGES["DS5_NOT_FOUND"])
@@ -130,14 +114,14 @@ class SearchScraper:
         - Configurable result limits
     """
     
-    def __init__(self, rate_limit_delay: float = None, http_client: str = None):
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, HttpClient] = None):
         """Initialize SearchScraper with HTTP client and parser.
         
         Args:
             rate_limit_delay: Delay between requests in seconds
-            http_client: HTTP client to use for requests
+            http_client: HTTP client to use for requests, or a shared HttpClient instance
         """
-        self.http_client = HttpClient(rate_limit_delay, http_client)
+        self.http_client = http_client if isinstance(http_client, HttpClient) else HttpClient(rate_limit_delay, http_client)
         self.parser = SearchParser()
 
     def fetch_playstore_search(self, query: str, count: int, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
@@ -198,14 +182,11 @@ class SearchScraper:
             needed = min(Config.DEFAULT_REVIEWS_BATCH_SIZE * 2, count - len(all_results))
             try:
                 response_text = self.http_client.fetch_search_page(token=token, needed=needed, lang=lang, country=country)
-                data = json.loads(response_text[5:])
-                parsed_data = json.loads(data[0][2])
-                if parsed_data:
-                    paginated_results = self._get_nested_value(parsed_data, [0, 0, 0], [])
-                    all_results.extend(paginated_results)
-                    token = self._get_nested_value(parsed_data, [0, 0, 7, 1])
-                else:
+                page = self._parse_pagination_response(response_text)
+                if page is None:
                     break
+                paginated_results, token = page
+                all_results.extend(paginated_results)
             except (json.JSONDecodeError, IndexError, KeyError, Exception):
                 break
         if "ds:1" in dataset:
@@ -213,6 +194,23 @@ class SearchScraper:
         
         return dataset
 
+    def _parse_pagination_response(self, response_text: str):
+        """Parse one paginated search API response.
+        
+        Args:
+            response_text: Raw batchexecute response
+            
+        Returns:
+            Tuple of (results, next token), or None if the page is empty
+        """
+        data = json_loads(response_text[5:])
+        parsed_data = json_loads(data[0][2])
+        if not parsed_data:
+            return None
+        results = self._get_nested_value(parsed_data, [0, 0, 0], [])
+        token = self._get_nested_value(parsed_data, [0, 0, 7, 1])
+        return results, token
+
     def _get_nested_value(self, data, path, default=None):
         """Safely get nested value from data structure.
         
@@ -245,14 +243,15 @@ class ReviewsScraper:
         - Configurable batch sizes
     """
     
-    def __init__(self, rate_limit_delay: float = None, http_client: str = None):
-        """Initialize ReviewsScraper with HTTP client.
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, HttpClient] = None):
+        """Initialize ReviewsScraper with HTTP client and parser.
         
         Args:
             rate_limit_delay: Delay between requests in seconds
-            http_client: HTTP client to use for API requests
+            http_client: HTTP client to use for API requests, or a shared HttpClient instance
         """
-        self.http_client = HttpClient(rate_limit_delay, http_client)
+        self.http_client = http_client if isinstance(http_client, HttpClient) else HttpClient(rate_limit_delay, http_client)
+        self.parser = ReviewsParser()
 
     def fetch_reviews_batch(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, 
                            sort: int = Config.DEFAULT_REVIEWS_SORT, batch_count: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, token: str = None) -> str:
@@ -287,35 +286,49 @@ class ReviewsScraper:
             sort: Sort order
             
         Returns:
-            Dictionary containing all review responses
+            Dictionary with the decoded review 'pages'
+        """
+        return {"pages": list(self.iter_review_pages(app_id, count, lang, country, sort))}
+
+    def iter_review_pages(self, app_id: str, count: Optional[int] = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                          country: str = Config.DEFAULT_COUNTRY, sort: int = Config.DEFAULT_REVIEWS_SORT, token: str = None) -> Iterator[Dict]:
+        """Fetch and decode review batches one at a time.
+        
+        Each response is decoded as soon as it arrives and the next batch is
+        requested only when the caller asks for it, so no more than one page
+        is held here however many reviews are fetched. Network errors are
+        raised to the caller.
+        
+        Args:
+            app_id: Google Play app ID
+            count: Total number of reviews to fetch, or None for all
+            lang: Language code
+            country: Country code
+            sort: Sort order
+            token: Continuation token to start from (default: first page)
+            
+        Yields:
+            Decoded pages: {'reviews': raw review arrays, 'token': token of the following page}
         """
-        all_responses = []
-        token = None
+        fetched = 0
         batch_size = Config.DEFAULT_REVIEWS_BATCH_SIZE
         
-        while len(all_responses) * batch_size < count:
-            remaining = count - (len(all_responses) * batch_size)
-            fetch_count = min(batch_size, remaining)
+        while count is None or fetched < count:
+            fetch_count = batch_size if count is None else min(batch_size, count - fetched)
             
             response = self.fetch_reviews_batch(app_id, lang, country, sort, fetch_count, token)
             
             if not response:
-                break
-                
-            all_responses.append(response)
+                return
             
-            try:
-                regex = re.compile(r"\)]}'\n\n([\s\S]+)")
-                matches = regex.findall(response)
-                if matches:
-                    data = json.loads(matches[0])
-                    token = json.loads(data[0][2])[-2][-1]
-                    if not token or isinstance(token, list):
-                        break
-            except (json.JSONDecodeError, IndexError, KeyError):
-                break
-        
-        return {"reviews": all_responses}
+            # Decode once; the parser reads the reviews from the same page
+            page = self.parser.decode_reviews_page(response)
+            yield page
+            fetched += fetch_count
+            
+            token = page["token"]
+            if not token or not page["reviews"]:
+                return
 
 
 class DeveloperScraper:
@@ -331,14 +344,14 @@ class DeveloperScraper:
         - Developer metadata collection
     """
     
-    def __init__(self, rate_limit_delay: float = None, http_client: str = None):
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, HttpClient] = None):
         """Initialize DeveloperScraper with HTTP client.
         
         Args:
             rate_limit_delay: Delay between requests in seconds
-            http_client: HTTP client to use for requests
+            http_client: HTTP client to use for requests, or a shared HttpClient instance
         """
-        self.http_client = HttpClient(rate_limit_delay, http_client)
+        self.http_client = http_client if isinstance(http_client, HttpClient) else HttpClient(rate_limit_delay, http_client)
 
     def fetch_developer_page(self, dev_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch developer page HTML from Google Play Store.
@@ -372,16 +385,7 @@ class DeveloperScraper:
         """
         html_content = self.fetch_developer_page(dev_id, lang, country)
         
-        ds_match = re.search(r'AF_initDataCallback\s*\(\s*({\s*key:\s*["\']ds:3["\'][\s\S]*?})\s*\)\s*;', html_content, re.DOTALL)
-        if ds_match:
-            ds3_data = ds_match.group(1)
-        else:
-            all_callbacks = re.findall(r'AF_initDataCallback\s*\(\s*({[\s\S]*?})\s*\)\s*;', html_content, re.DOTALL)
-            ds3_data = ""
-            for callback in all_callbacks:
-                if "'ds:3'" in callback or '"ds:3"' in callback:
-                    ds3_data = callback
-                    break
+        ds3_data = find_init_data(html_content, "ds:3")
         
         if not ds3_data:
             raise DataParsingError(Config.ERROR_MESSAGES["DS3_NOT_FOUND"])
@@ -402,14 +406,14 @@ class SimilarScraper:
         - Competitive analysis data
     """
     
-    def __init__(self, rate_limit_delay: float = None, http_client: str = None):
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, HttpClient] = None):
         """Initialize SimilarScraper with HTTP client.
         
         Args:
             rate_limit_delay: Delay between requests in seconds
-            http_client: HTTP client to use for requests
+            http_client: HTTP client to use for requests, or a shared HttpClient instance
         """
-        self.http_client = HttpClient(rate_limit_delay, http_client)
+        self.http_client = http_client if isinstance(http_client, HttpClient) else HttpClient(rate_limit_delay, http_client)
 
     def fetch_similar_page(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch app page HTML to extract similar apps cluster URL.
@@ -443,6 +447,22 @@ class SimilarScraper:
         """
         html_content = self.fetch_similar_page(app_id, lang, country)
         
+        cluster_url = self._extract_cluster_url(html_content)
+        if not cluster_url:
+            return {"ds:3": None}
+        
+        cluster_html = self.http_client.fetch_cluster_page(cluster_url, lang, country)
+        return self._extract_cluster_dataset(cluster_html)
+
+    def _extract_cluster_url(self, html_content: str) -> str:
+        """Find the similar apps cluster URL in an app page.
+        
+        Args:
+            html_content: HTML content of app page
+            
+        Returns:
+            Cluster URL path, or None if the page has no similar apps cluster
+        """
         pattern1 = r'&quot;(/store/apps/collection/cluster\?gsr=[^&]+)&quot;'
         matches1 = re.findall(pattern1, html_content)
         pattern2 = r'"(/store/apps/collection/cluster\?gsr=[^"]+)"'
@@ -450,21 +470,23 @@ class SimilarScraper:
         all_matches = list(set(matches1 + matches2))
         
         if not all_matches:
-            return {"ds:3": None}
+            return None
         
-        cluster_url = all_matches[0].replace('&amp;', '&')
-        cluster_html = self.http_client.fetch_cluster_page(cluster_url, lang, country)
+        return all_matches[0].replace('&amp;', '&')
+
+    def _extract_cluster_dataset(self, cluster_html: str) -> Dict:
+        """Extract ds:3 dataset from cluster page HTML.
         
-        ds_match = re.search(r'AF_initDataCallback\s*\(\s*({\s*key:\s*["\']ds:3["\'][\s\S]*?})\s*\)\s*;', cluster_html, re.DOTALL)
-        if ds_match:
-            ds3_data = ds_match.group(1)
-        else:
-            all_callbacks = re.findall(r'AF_initDataCallback\s*\(\s*({[\s\S]*?})\s*\)\s*;', cluster_html, re.DOTALL)
-            ds3_data = ""
-            for callback in all_callbacks:
-                if "'ds:3'" in callback or '"ds:3"' in callback:
-                    ds3_data = callback
-                    break
+        Args:
+            cluster_html: HTML content of cluster page
+            
+        Returns:
+            Dictionary containing ds:3 dataset
+            
+        Raises:
+            DataParsingError: If dataset not found
+        """
+        ds3_data = find_init_data(cluster_html, "ds:3")
         
         if not ds3_data:
             raise DataParsingError(Config.ERROR_MESSAGES["DS3_NOT_FOUND"])
@@ -485,14 +507,14 @@ class ListScraper:
         - Regional chart variations
     """
     
-    def __init__(self, rate_limit_delay: float = None, http_client: str = None):
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, HttpClient] = None):
         """Initialize ListScraper with HTTP client.
         
         Args:
             rate_limit_delay: Delay between requests in seconds
-            http_client: HTTP client to use for API requests
+            http_client: HTTP client to use for API requests, or a shared HttpClient instance
         """
-        self.http_client = HttpClient(rate_limit_delay, http_client)
+        self.http_client = http_client if isinstance(http_client, HttpClient) else HttpClient(rate_limit_delay, http_client)
 
     @handle_network_errors()
     @handle_parsing_errors()
@@ -514,11 +536,24 @@ class ListScraper:
         """
         cluster = CLUSTER_NAMES.get(collection, collection)
         response_text = self.http_client.fetch_list_page(cluster, category, count, lang, country)
+        return self._parse_list_response(response_text)
+
+    def _parse_list_response(self, response_text: str) -> Dict:
+        """Decode top charts API response.
         
+        Args:
+            response_text: Raw batchexecute response
+            
+        Returns:
+            Dictionary containing collection data
+            
+        Raises:
+            DataParsingError: If JSON parsing fails
+        """
         try:
             lines = response_text.strip().split('\n')
-            data = json.loads(lines[2])
-            collection_data = json.loads(data[0][2])
+            data = json_loads(lines[2])
+            collection_data = json_loads(data[0][2])
             return {"collection_data": collection_data}
         except (json.JSONDecodeError, IndexError, KeyError) as e:
             raise DataParsingError(Config.ERROR_MESSAGES["JSON_PARSE_FAILED"].format(error=str(e)))
@@ -537,14 +572,14 @@ class SuggestScraper:
         - Popular search term discovery
     """
     
-    def __init__(self, rate_limit_delay: float = None, http_client: str = None):
+    def __init__(self, rate_limit_delay: float = None, http_client: Union[str, HttpClient] = None):
         """Initialize SuggestScraper with HTTP client.
         
         Args:
             rate_limit_delay: Delay between requests in seconds
-            http_client: HTTP client to use for API requests
+            http_client: HTTP client to use for API requests, or a shared HttpClient instance
         """
-        self.http_client = HttpClient(rate_limit_delay, http_client)
+        self.http_client = http_client if isinstance(http_client, HttpClient) else HttpClient(rate_limit_delay, http_client)
 
     @validate_inputs()
     @handle_network_errors()
@@ -567,10 +602,23 @@ class SuggestScraper:
             return {"suggestions": []}
         
         response_text = self.http_client.fetch_suggest_page(term, lang, country)
+        return self._parse_suggest_response(response_text)
+
+    def _parse_suggest_response(self, response_text: str) -> Dict:
+        """Decode search suggestions API response.
         
+        Args:
+            response_text: Raw batchexecute response
+            
+        Returns:
+            Dictionary containing list of suggestions
+            
+        Raises:
+            DataParsingError: If JSON parsing fails
+        """
         try:
-            input_data = json.loads(response_text[5:])
-            data = json.loads(input_data[0][2])
+            input_data = json_loads(response_text[5:])
+            data = json_loads(input_data[0][2])
             
             if data is None:
                 return {"suggestions": []}
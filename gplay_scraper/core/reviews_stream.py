@@ -0,0 +1,150 @@
+"""Streaming review iterators with resumable continuation tokens.
+
+reviews_analyze collects every page before returning, so its memory grows
+with count. ReviewsStream and AsyncReviewsStream fetch one batchexecute
+page at a time, as the caller consumes it, and keep only that page:
+
+    stream = scraper.reviews_iter("com.whatsapp", count=None)
+    for review in stream:
+        store(review)
+        checkpoint(stream.token)
+
+    # Later, continue where the checkpoint left off
+    for review in scraper.reviews_iter("com.whatsapp", count=None, token=saved):
+        ...
+
+`token` always points at the first page not yet fully consumed, so
+resuming from it never skips reviews; a run stopped in the middle of a
+page re-reads the rest of that page. A response that cannot be decoded
+ends the stream with `exhausted` False and `token` still at that page, so
+the run can be resumed instead of mistaken for the end of the reviews. With columnar=True each page is
+yielded as a ReviewBatch of NumPy columns instead.
+"""
+
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from .gplay_parser import ReviewsParser
+from ..models.review_batch import ReviewBatch
+
+
+def _page_reviews(parser: ReviewsParser, page: Dict[str, Any]) -> list:
+    return parser.format_reviews_data(parser.parse_reviews_page(page))
+
+
+class ReviewsStream:
+    """Iterator over an app's reviews that fetches one page at a time.
+
+    Attributes:
+        token: Continuation token to resume from; the starting token until
+            the first page is consumed, None once the last one is
+        exhausted: True once the last page has been consumed; False if the
+            stream stopped on a response that could not be decoded
+        pages: Number of pages fetched so far
+    """
+
+    def __init__(self, pages: Iterator[Dict[str, Any]], parser: ReviewsParser, token: Optional[str] = None, yield_pages: bool = False,
+                 columnar: bool = False):
+        """Wrap a page iterator from ReviewsScraper.iter_review_pages.
+
+        Args:
+            pages: Decoded pages, fetched lazily
+            parser: Parser that turns pages into review dictionaries
+            token: Token the pages start from
+            yield_pages: Yield {'reviews': [...], 'token': ...} per page instead of single reviews
+            columnar: Yield one ReviewBatch per page (takes precedence over yield_pages)
+        """
+        self.token = token
+        self.exhausted = False
+        self.pages = 0
+        self._items = self._generate(pages, parser, yield_pages, columnar)
+
+    def _generate(self, pages: Iterator[Dict[str, Any]], parser: ReviewsParser, yield_pages: bool, columnar: bool) -> Iterator:
+        failed = False
+        for page in pages:
+            self.pages += 1
+            if page.get("failed"):
+                # Keep the token of the page that failed, so resuming fetches it again
+                failed = True
+                continue
+            if columnar:
+                self.token = page["token"]
+                yield ReviewBatch.from_pages([page])
+                continue
+            reviews = _page_reviews(parser, page)
+            if yield_pages:
+                self.token = page["token"]
+                yield {"reviews": reviews, "token": page["token"]}
+            else:
+                yield from reviews
+                self.token = page["token"]
+        self.exhausted = not failed and self.token is None
+
+    def __iter__(self) -> "ReviewsStream":
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stop fetching; token keeps the resume point."""
+        self._items.close()
+
+
+class AsyncReviewsStream:
+    """Async iterator over an app's reviews that fetches one page at a time.
+
+    Attributes:
+        token: Continuation token to resume from; the starting token until
+            the first page is consumed, None once the last one is
+        exhausted: True once the last page has been consumed; False if the
+            stream stopped on a response that could not be decoded
+        pages: Number of pages fetched so far
+    """
+
+    def __init__(self, pages: AsyncIterator[Dict[str, Any]], parser: ReviewsParser, token: Optional[str] = None, yield_pages: bool = False,
+                 columnar: bool = False):
+        """Wrap a page iterator from AsyncReviewsScraper.iter_review_pages.
+
+        Args:
+            pages: Decoded pages, fetched lazily
+            parser: Parser that turns pages into review dictionaries
+            token: Token the pages start from
+            yield_pages: Yield {'reviews': [...], 'token': ...} per page instead of single reviews
+            columnar: Yield one ReviewBatch per page (takes precedence over yield_pages)
+        """
+        self.token = token
+        self.exhausted = False
+        self.pages = 0
+        self._items = self._generate(pages, parser, yield_pages, columnar)
+
+    async def _generate(self, pages: AsyncIterator[Dict[str, Any]], parser: ReviewsParser, yield_pages: bool, columnar: bool) -> AsyncIterator:
+        failed = False
+        async for page in pages:
+            self.pages += 1
+            if page.get("failed"):
+                # Keep the token of the page that failed, so resuming fetches it again
+                failed = True
+                continue
+            if columnar:
+                self.token = page["token"]
+                yield ReviewBatch.from_pages([page])
+                continue
+            reviews = _page_reviews(parser, page)
+            if yield_pages:
+                self.token = page["token"]
+                yield {"reviews": reviews, "token": page["token"]}
+            else:
+                for review in reviews:
+                    yield review
+                self.token = page["token"]
+        self.exhausted = not failed and self.token is None
+
+    def __aiter__(self) -> "AsyncReviewsStream":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self._items.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop fetching; token keeps the resume point."""
+        await self._items.aclose()
@@ -15,13 +15,28 @@ class InvalidAppIdError(GPlayScraperError):
 
 
 class AppNotFoundError(GPlayScraperError):
-    """Raised when an app, developer, or resource is not found (404 error)."""
-    pass
+    """Raised when an app, developer, or resource is not found (404 error).
+    
+    Attributes:
+        confirmed: True if the 404 is recorded in the negative cache, so
+                   retrying on another HTTP client is pointless
+    """
+    def __init__(self, message: str = "", confirmed: bool = False):
+        super().__init__(message)
+        self.confirmed = confirmed
 
 
 class RateLimitError(GPlayScraperError):
-    """Raised when rate limiting is triggered by Google Play Store."""
-    pass
+    """Raised when rate limiting is triggered by Google Play Store.
+    
+    Attributes:
+        status_code: HTTP status that signalled throttling (429 or 503), if known
+        retry_after: Seconds the server asked us to wait (Retry-After header), if given
+    """
+    def __init__(self, message: str = "", status_code: int = None, retry_after: float = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
 
 
 class NetworkError(GPlayScraperError):
@@ -29,6 +44,20 @@ class NetworkError(GPlayScraperError):
     pass
 
 
+class HttpStatusError(NetworkError):
+    """Raised when the server answers with an HTTP error status.
+    
+    The HTTP client itself worked, so this does not count against its
+    circuit breaker.
+    
+    Attributes:
+        status_code: HTTP status code
+    """
+    def __init__(self, message: str = "", status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class DataParsingError(GPlayScraperError):
     """Raised when parsing JSON or HTML data fails."""
     pass
\ No newline at end of file
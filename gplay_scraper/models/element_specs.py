@@ -4,10 +4,11 @@ This module defines ElementSpec class and ElementSpecs for all 7 method types.
 Each spec defines how to extract specific fields from raw JSON data.
 """
 
-from typing import Any, Callable, List, Optional, Dict, Union
+from typing import Any, Callable, Iterable, List, Optional, Dict, Union
 import html
 from datetime import datetime
 from ..utils.helpers import unescape_text
+from ..utils.lazy_json import LazyJson, materialize
 from ..config import Config
 
 
@@ -110,6 +111,8 @@ def nested_lookup(obj: Any, key_list: List) -> Any:
     
     Traverses complex nested data structures (mix of dicts and lists) following
     a path of keys/indices. Returns None if any step in the path fails.
+    On a LazyJson view only the containers along the path are scanned, and a
+    container at the end of the path is returned as a view.
     
     Args:
         obj: Object to navigate (dict, list, or any nested structure)
@@ -236,7 +239,8 @@ class ElementSpec:
             None  # or fallback_value if specified
         """
         try:
-            result = nested_lookup(source, self.data_map)
+            # Only the value at the end of the path is decoded when source is a LazyJson view
+            result = materialize(nested_lookup(source, self.data_map))
             
             if self.post_processor is not None:
                 try:
@@ -288,9 +292,9 @@ class ElementSpecs:
         "title": ElementSpec("raw", [1, 2, 0, 0]),
         "description": ElementSpec(
             "raw",
-            [1, 2],
+            [1, 2, 72, 0],
             lambda s: (lambda desc_text: unescape_text(desc_text) if desc_text else None)(
-                nested_lookup(s, [72, 0, 0]) or nested_lookup(s, [72, 0, 1])
+                nested_lookup(s, [0]) or nested_lookup(s, [1])
             ),
         ),
         "summary": ElementSpec("raw", [1, 2, 73, 0, 1], unescape_text),
@@ -429,4 +433,134 @@ class ElementSpecs:
         "scoreText": ElementSpec("raw", [0, 4, 0]),
         "score": ElementSpec("raw", [0, 4, 1]),
         "url": ElementSpec("raw", [0, 10, 4, 2], lambda path: f"https://play.google.com{path}" if path else None),
-    }
\ No newline at end of file
+    }
+
+class ExtractionPlan:
+    """ElementSpecs compiled into one pass over a path trie.
+    
+    Calling extract_content for every spec walks each path from the root, so
+    the 50 App paths re-read data[1][2] 50 times, and every call re-inspects
+    the post-processor and fallback chain. A plan is built once per spec set:
+    
+        1. Every path of every spec, fallbacks included, goes into a trie whose
+           nodes are flattened, parents first, into (parent, key, slot) steps;
+           a shared prefix such as [1, 2] is looked up once per extraction
+        2. Fields that are a bare path read their slot directly; the others
+           keep their fallback chain as a flat tuple of
+           (slot, post_processor, takes_assets, assets) steps
+        3. extract() runs the lookups in one loop, then builds the fields
+    
+    Results are identical to calling extract_content on each spec.
+    
+    Attributes:
+        fields: Field names extracted, in spec order
+        
+    Example:
+        >>> plan = extraction_plan("Search")
+        >>> result = plan.extract(item)   # same as {k: s.extract_content(item) for ...}
+    """
+    
+    def __init__(self, specs: Dict[str, ElementSpec], fields: Iterable[str] = None):
+        """Compile a set of specs.
+        
+        Args:
+            specs: Field name to ElementSpec mapping, e.g. ElementSpecs.App
+            fields: Optional subset of field names to compile (default: all)
+        """
+        wanted = None if fields is None else set(fields)
+        slots = {(): 0}
+        lookups = []
+        leaves = set()
+        self._fields = []
+        for name, spec in specs.items():
+            if wanted is not None and name not in wanted:
+                continue
+            steps = []
+            while isinstance(spec, ElementSpec):
+                path = tuple(spec.data_map)
+                for depth in range(1, len(path) + 1):
+                    if path[:depth] not in slots:
+                        slots[path[:depth]] = len(slots)
+                        lookups.append((slots[path[:depth - 1]], path[depth - 1], slots[path[:depth]]))
+                processor = spec.post_processor
+                takes_assets = processor is not None and 'image' in getattr(processor, '__name__', '')
+                steps.append((slots[path], processor, takes_assets, spec.assets))
+                leaves.add(slots[path])
+                spec = spec.fallback_value
+            if len(steps) == 1 and steps[0][1] is None:
+                # A bare path: its value is the field, unless it is None and there is a default
+                self._fields.append((name, steps[0][0], None, spec))
+            else:
+                self._fields.append((name, None, tuple(steps), spec))
+        self.fields = [field[0] for field in self._fields]
+        self._size = len(slots)
+        self._lookups = tuple(lookups)
+        self._leaves = tuple(sorted(leaves))
+    
+    def extract(self, source: Any, assets: str = None) -> Dict[str, Any]:
+        """Extract every compiled field from source.
+        
+        Args:
+            source: Source dictionary/list, or a LazyJson view
+            assets: Override asset size for image post-processors
+            
+        Returns:
+            Dictionary of field values, in spec order
+        """
+        values = [None] * self._size
+        values[0] = source
+        for parent, key, slot in self._lookups:
+            value = values[parent]
+            if value is not None:
+                try:
+                    values[slot] = value[key]
+                except (IndexError, KeyError, TypeError):
+                    pass
+        if isinstance(source, LazyJson):
+            # Only the values at the end of the paths are decoded
+            for slot in self._leaves:
+                values[slot] = materialize(values[slot])
+        result = {}
+        for name, slot, steps, default in self._fields:
+            if steps is None:
+                value = values[slot]
+            else:
+                for slot, processor, takes_assets, spec_assets in steps:
+                    value = values[slot]
+                    if processor is not None:
+                        try:
+                            value = processor(value, assets or spec_assets) if takes_assets else processor(value)
+                        except Exception:
+                            pass
+                    if value is not None:
+                        break
+            result[name] = default if value is None and default is not None else value
+        return result
+
+
+_plans = {}
+_MAX_PLANS = 256  # Distinct field selections kept compiled
+
+
+def extraction_plan(kind: str, fields: Iterable[str] = None) -> ExtractionPlan:
+    """Return the compiled plan for ElementSpecs.<kind>, built on first use.
+    
+    Args:
+        kind: Spec set name: App, Search, Review, Developer, Similar or List
+        fields: Optional subset of field names (default: all)
+        
+    Returns:
+        Cached ExtractionPlan
+    """
+    specs = getattr(ElementSpecs, kind)
+    key = (kind, None if fields is None else frozenset(field for field in fields if field in specs))
+    plan = _plans.get(key)
+    if plan is None:
+        if len(_plans) >= _MAX_PLANS:
+            _plans.clear()
+        plan = _plans[key] = ExtractionPlan(specs, key[1])
+    return plan
+
+
+for _kind in ("App", "Search", "Review", "Developer", "Similar", "List"):
+    extraction_plan(_kind)
@@ -0,0 +1,257 @@
+"""Columnar review batches backed by NumPy arrays.
+
+reviews_analyze builds one dict per review and formats every timestamp
+with datetime.fromtimestamp(...).isoformat(), and analytics code then
+turns those rows back into columns. ReviewBatch is built straight from the
+decoded batchexecute pages instead, one column at a time:
+
+- score (int8), thumbsUpCount (int64) and at (int64 epoch seconds) are
+  NumPy arrays; `datetimes` views `at` as datetime64[s] without copying,
+  and a missing time is NaT.
+- appVersion is stored as categorical codes (int32, -1 when missing) into
+  the list of distinct versions, so repeated version strings are kept once.
+- reviewId, userName, userImage and content are object arrays.
+
+to_pandas() and to_arrow() hand the numeric arrays over without copying
+when pandas or pyarrow is installed. NumPy itself is required
+(pip install gplay-scraper[columnar]). Timestamps are UTC; the row output
+of reviews_analyze uses local time.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..config import Config
+
+_MISSING_TIME = -(2 ** 63)  # NaT once viewed as datetime64
+
+
+def _require(package: str, feature: str):
+    """Import an optional package, raising ImportError with install advice."""
+    try:
+        return __import__(package)
+    except ImportError:
+        raise ImportError(Config.ERROR_MESSAGES["PACKAGE_REQUIRED"].format(package=package, feature=feature)) from None
+
+
+class ReviewBatch:
+    """Reviews stored column by column.
+
+    Attributes:
+        review_id: Review IDs (object array)
+        user_name: Reviewer names (object array)
+        user_image: Reviewer avatar URLs (object array)
+        content: Review texts (object array)
+        score: Star ratings, 0 when missing (int8 array)
+        thumbs_up_count: Helpful votes (int64 array)
+        at: Review times in epoch seconds, NaT sentinel when missing (int64 array)
+        app_version_codes: Index into app_versions, -1 when missing (int32 array)
+        app_versions: Distinct app version strings
+        token: Continuation token of the page after this batch, if any
+    """
+
+    COLUMNS = ("reviewId", "userName", "userImage", "score", "content", "thumbsUpCount", "appVersion", "at")
+
+    def __init__(self, review_id, user_name, user_image, content, score, thumbs_up_count, at,
+                 app_version_codes, app_versions: List[str], token: Optional[str] = None):
+        """Wrap prebuilt columns; use from_pages or concat to build a batch."""
+        self.review_id = review_id
+        self.user_name = user_name
+        self.user_image = user_image
+        self.content = content
+        self.score = score
+        self.thumbs_up_count = thumbs_up_count
+        self.at = at
+        self.app_version_codes = app_version_codes
+        self.app_versions = app_versions
+        self.token = token
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Dict[str, Any]], token: Optional[str] = None) -> "ReviewBatch":
+        """Build a batch from pages returned by ReviewsParser.decode_reviews_page.
+
+        Raw review arrays are read in the layout ReviewsParser.extract_review_data
+        uses; malformed entries are skipped, as they are there.
+
+        Args:
+            pages: Decoded reviews pages
+            token: Continuation token to record (default: the last page's token)
+
+        Returns:
+            ReviewBatch with one row per review
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        np = _require("numpy", "columnar reviews")
+        review_ids, user_names, user_images, contents = [], [], [], []
+        scores, thumbs, times, codes = [], [], [], []
+        versions = []
+        version_codes = {None: -1}
+        last_token = None
+        for page in pages:
+            last_token = page.get("token")
+            for raw in page.get("reviews") or []:
+                try:
+                    size = len(raw)
+                    user = raw[1] if size > 1 else None
+                    user_name = user[0] if user else None
+                    user_image = None
+                    if user and len(user) > 1 and user[1]:
+                        try:
+                            user_image = user[1][3][2]
+                        except (IndexError, KeyError, TypeError):
+                            pass
+                    stamp = raw[5] if size > 5 else None
+                    at = stamp[0] if stamp and stamp[0] is not None else _MISSING_TIME
+                    version = raw[10] if size > 10 else None
+                    code = version_codes.get(version)
+                    if code is None:
+                        code = version_codes[version] = len(versions)
+                        versions.append(version)
+                    row = (raw[0] if size > 0 else None, raw[2] if size > 2 else None,
+                           raw[4] if size > 4 else None, raw[6] if size > 6 else None)
+                except (IndexError, KeyError, TypeError):
+                    continue
+                review_ids.append(row[0])
+                user_names.append(user_name)
+                user_images.append(user_image)
+                contents.append(row[2])
+                scores.append(row[1] or 0)
+                thumbs.append(row[3] or 0)
+                times.append(at)
+                codes.append(code)
+
+        return cls(
+            np.array(review_ids, dtype=object),
+            np.array(user_names, dtype=object),
+            np.array(user_images, dtype=object),
+            np.array(contents, dtype=object),
+            np.array(scores, dtype=np.int8),
+            np.array(thumbs, dtype=np.int64),
+            np.array(times, dtype=np.int64),
+            np.array(codes, dtype=np.int32),
+            versions,
+            last_token if token is None else token,
+        )
+
+    @classmethod
+    def concat(cls, batches: Iterable["ReviewBatch"]) -> "ReviewBatch":
+        """Join batches into one, merging their app version categories.
+
+        Args:
+            batches: Batches to join, in order
+
+        Returns:
+            ReviewBatch holding every row; token is the last batch's token
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        np = _require("numpy", "columnar reviews")
+        batches = list(batches)
+        if not batches:
+            return cls.from_pages([])
+        versions = []
+        version_codes = {}
+        codes = []
+        for batch in batches:
+            for version in batch.app_versions:
+                if version not in version_codes:
+                    version_codes[version] = len(versions)
+                    versions.append(version)
+            # The trailing -1 maps missing versions (code -1) to -1 again
+            remap = np.array([version_codes[version] for version in batch.app_versions] + [-1], dtype=np.int32)
+            codes.append(remap[batch.app_version_codes])
+        join = lambda name: np.concatenate([getattr(batch, name) for batch in batches])
+        return cls(join("review_id"), join("user_name"), join("user_image"), join("content"),
+                   join("score"), join("thumbs_up_count"), join("at"), np.concatenate(codes), versions, batches[-1].token)
+
+    def __len__(self) -> int:
+        return len(self.review_id)
+
+    def __repr__(self) -> str:
+        return f"<ReviewBatch {len(self)} reviews, {len(self.app_versions)} app versions>"
+
+    @property
+    def datetimes(self):
+        """Review times as datetime64[s] (a view of `at`, NaT when missing)."""
+        return self.at.view("datetime64[s]")
+
+    @property
+    def app_version(self):
+        """App versions as an object array (None when missing)."""
+        np = _require("numpy", "columnar reviews")
+        return np.array(self.app_versions + [None], dtype=object)[self.app_version_codes]
+
+    def at_iso(self):
+        """Review times as ISO 8601 UTC strings ('NaT' when missing), converted in one call."""
+        np = _require("numpy", "columnar reviews")
+        return np.datetime_as_string(self.datetimes, unit="s")
+
+    def __getitem__(self, field: str):
+        """Return a column by its reviews_analyze field name."""
+        columns = {
+            "reviewId": lambda: self.review_id,
+            "userName": lambda: self.user_name,
+            "userImage": lambda: self.user_image,
+            "score": lambda: self.score,
+            "content": lambda: self.content,
+            "thumbsUpCount": lambda: self.thumbs_up_count,
+            "appVersion": lambda: self.app_version,
+            "at": lambda: self.datetimes,
+        }
+        if field not in columns:
+            raise KeyError(field)
+        return columns[field]()
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return rows in the reviews_analyze layout (times as UTC ISO strings)."""
+        at = [None if stamp == "NaT" else stamp for stamp in self.at_iso().tolist()]
+        columns = [self.review_id.tolist(), self.user_name.tolist(), self.user_image.tolist(), self.score.tolist(),
+                   self.content.tolist(), self.thumbs_up_count.tolist(), self.app_version.tolist(), at]
+        return [dict(zip(self.COLUMNS, row)) for row in zip(*columns)]
+
+    def to_pandas(self):
+        """Return a pandas DataFrame; numeric columns share memory with the batch.
+
+        appVersion becomes a pandas Categorical and at a datetime64[s] column.
+
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        pd = _require("pandas", "ReviewBatch.to_pandas")
+        return pd.DataFrame({
+            "reviewId": self.review_id,
+            "userName": self.user_name,
+            "userImage": self.user_image,
+            "score": self.score,
+            "content": self.content,
+            "thumbsUpCount": self.thumbs_up_count,
+            "appVersion": pd.Categorical.from_codes(self.app_version_codes, categories=self.app_versions),
+            "at": self.datetimes,
+        }, copy=False)
+
+    def to_arrow(self):
+        """Return a pyarrow Table; numeric columns share memory with the batch.
+
+        appVersion becomes a dictionary column and at a timestamp('s') column.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        _require("pyarrow", "ReviewBatch.to_arrow")
+        import pyarrow as pa
+        missing_version = self.app_version_codes < 0
+        return pa.table({
+            "reviewId": pa.array(self.review_id, pa.string()),
+            "userName": pa.array(self.user_name, pa.string()),
+            "userImage": pa.array(self.user_image, pa.string()),
+            "score": pa.array(self.score),
+            "content": pa.array(self.content, pa.string()),
+            "thumbsUpCount": pa.array(self.thumbs_up_count),
+            "appVersion": pa.DictionaryArray.from_arrays(
+                pa.array(self.app_version_codes, mask=missing_version if missing_version.any() else None),
+                pa.array(self.app_versions, pa.string()),
+            ),
+            "at": pa.array(self.datetimes, from_pandas=True),
+        })
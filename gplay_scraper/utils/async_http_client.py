@@ -0,0 +1,663 @@
+"""Native asyncio HTTP client for Google Play Store requests.
+
+This module provides an awaitable counterpart to HttpClient built on the
+async APIs of:
+- aiohttp
+- httpx
+
+Requests are described by the same builders as the synchronous client
+(see request_builder), so both clients hit identical URLs with identical
+headers and bodies.
+"""
+
+import time
+import asyncio
+import secrets
+import logging
+from typing import Optional, Tuple
+
+from ..config import Config
+from ..exceptions import AppNotFoundError, NetworkError, RateLimitError, HttpStatusError
+from .request_builder import (
+    PlayRequest, build_app_page_request, build_app_page_no_locale_request, build_search_request,
+    build_reviews_request, build_developer_request, build_cluster_request, build_list_request,
+    build_suggest_request, is_not_found_error, check_response_status,
+)
+from .rate_limiter import RateLimiter, default_rate_limiter
+from .retry_policy import RetryPolicy
+from .cache import ResponseCache, NegativeCache, cache_key, cache_ttl, cache_max_stale, fill_lock_key
+from .single_flight import AsyncSingleFlight
+from .hedging import LatencyTracker
+from .circuit_breaker import ClientHealth, ClientUnavailableError
+from .client_selector import ClientSelector
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse:
+    """Minimal response object shared by all async client libraries."""
+    def __init__(self, text: str, status_code: int, headers=None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class AsyncHttpClient:
+    """Asyncio HTTP client with automatic fallback between aiohttp and httpx.
+
+    Every fetch_* method is a coroutine, so many requests can be in flight on
+    one event loop without threads. Each library gets one pooled keep-alive
+    session, created lazily inside the running loop and reused afterwards.
+
+    Supported Clients:
+        - aiohttp: Default, fastest asyncio client
+        - httpx: httpx.AsyncClient
+
+    Sessions:
+        Sessions are bound to the event loop they were created on. Call
+        await close() (or use the client as an async context manager) before
+        the loop shuts down to release pooled connections.
+    """
+    def __init__(self, rate_limit_delay: float = None, client_type: str = None, pool_size: int = None,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None, cache: ResponseCache = None,
+                 negative_cache: NegativeCache = None, stale_while_revalidate: bool = None):
+        """Initialize async HTTP client with specified or default client type.
+
+        Args:
+            rate_limit_delay: Delay between requests in seconds (default: 1.0, 0 disables)
+            client_type: Async HTTP client to use - 'aiohttp' or 'httpx' (default: 'aiohttp'),
+                         or 'auto' to pick the best client per endpoint with a bandit
+            pool_size: Maximum keep-alive connections per session (default: 100)
+            rate_limiter: Optional RateLimiter (or any object with acquire_async(request)).
+                          May be shared with a synchronous HttpClient.
+            retry_policy: Optional RetryPolicy for transport retries (default: Config retry settings)
+            cache: Optional ResponseCache for response bodies, e.g. MemoryCache() (default: no caching)
+            negative_cache: Optional NegativeCache remembering confirmed 404s (default: none)
+            stale_while_revalidate: Serve expired cache entries within Config.CACHE_MAX_STALE at once
+                                    and refresh them in a background task (default: Config.STALE_WHILE_REVALIDATE)
+
+        Raises:
+            ImportError: If no async HTTP client library is installed
+        """
+        self.headers = Config.get_headers()
+        self.timeout = Config.DEFAULT_TIMEOUT
+        self.rate_limit_delay = Config.RATE_LIMIT_DELAY if rate_limit_delay is None else rate_limit_delay
+        self.rate_limiter = rate_limiter or default_rate_limiter(self.rate_limit_delay)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.negative_cache = negative_cache
+        self.stale_while_revalidate = Config.STALE_WHILE_REVALIDATE if stale_while_revalidate is None else stale_while_revalidate
+        self._refresh_tasks = {}
+        # Identical concurrent requests share one fetch
+        self.single_flight = AsyncSingleFlight() if Config.SINGLE_FLIGHT else None
+        # Latency quantiles per endpoint decide when a slow request is hedged
+        self.latency = LatencyTracker()
+        self.pool_size = pool_size or Config.ASYNC_POOL_SIZE
+        self.available_clients = list(Config.ASYNC_HTTP_CLIENTS)
+        self.client_type = client_type if client_type in self.available_clients else Config.DEFAULT_ASYNC_HTTP_CLIENT
+        self.current_client_index = self.available_clients.index(self.client_type)
+        self.health = ClientHealth(self.available_clients)
+        # "auto" ranks clients per endpoint by measured success and latency
+        self.selector = ClientSelector(self.available_clients) if client_type == "auto" else None
+        self._sessions = {}
+        self._check_available()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
+
+    def _check_available(self):
+        """Make sure at least one async client library can be imported.
+
+        Falls back to the next library in ASYNC_HTTP_CLIENTS when the
+        requested one is not installed.
+
+        Raises:
+            ImportError: If no async HTTP client library is installed
+        """
+        for client_type in [self.client_type] + self.available_clients:
+            try:
+                __import__(client_type)
+                self.client_type = client_type
+                return
+            except ImportError:
+                continue
+        raise ImportError(Config.ERROR_MESSAGES["NO_HTTP_CLIENT"])
+
+    def _create_session(self, client_type: str):
+        """Create a keep-alive session sized to pool_size for an async library.
+
+        Args:
+            client_type: Async HTTP client name (aiohttp or httpx)
+
+        Returns:
+            Session object bound to the running event loop
+
+        Raises:
+            ImportError: If the client library is not installed
+        """
+        if client_type == "aiohttp":
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+        if client_type == "httpx":
+            import httpx
+            limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+            return httpx.AsyncClient(timeout=self.timeout, limits=limits)
+
+        raise Exception(Config.ERROR_MESSAGES["UNKNOWN_CLIENT_TYPE"].format(client_type=client_type))
+
+    def _get_session(self, client_type: str):
+        """Return the pooled session for an async library, creating it on first use.
+
+        Args:
+            client_type: Async HTTP client name (aiohttp or httpx)
+
+        Returns:
+            Long-lived session object for the client library
+        """
+        session = self._sessions.get(client_type)
+        if session is None:
+            session = self._create_session(client_type)
+            self._sessions[client_type] = session
+        return session
+
+    async def close(self):
+        """Close all pooled sessions and release their connections.
+
+        Safe to call more than once. Sessions are recreated on demand if the
+        client is used again after closing.
+        """
+        tasks = list(self._refresh_tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        sessions = self._sessions
+        self._sessions = {}
+
+        for client_type, session in sessions.items():
+            try:
+                if client_type == "httpx":
+                    await session.aclose()
+                else:
+                    await session.close()
+            except Exception as e:
+                logger.debug(f"Error closing {client_type} session: {e}")
+
+    async def fetch_app_page(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch app details page from Google Play Store.
+
+        Args:
+            app_id: Google Play app ID
+            lang: Language code
+            country: Country code
+
+        Returns:
+            HTML content of app page
+        """
+        return await self._fetch(build_app_page_request(app_id, lang, country))
+
+    async def fetch_app_page_no_locale(self, app_id: str) -> str:
+        """Fetch app page without hl/gl parameters for fallback data.
+
+        Args:
+            app_id: Google Play app ID
+
+        Returns:
+            HTML content of app page, or empty string on failure
+        """
+        try:
+            return await self._fetch(build_app_page_no_locale_request(app_id))
+        except Exception as e:
+            logger.error(f"Fallback fetch failed for {app_id}: {e}")
+            return ""
+
+    async def fetch_search_page(self, query: str = None, token: str = None, needed: int = None, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch search results from Google Play Store (initial or paginated).
+
+        Args:
+            query: Search query string (for initial search)
+            token: Pagination token (for paginated search)
+            needed: Number of results needed (for pagination)
+            lang: Language code
+            country: Country code
+
+        Returns:
+            HTML content (initial) or raw API response (pagination)
+        """
+        return await self._fetch(build_search_request(query, token, needed, lang, country))
+
+    async def fetch_reviews_batch(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY,
+                                  sort: int = Config.DEFAULT_REVIEWS_SORT, batch_count: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, token: str = None) -> str:
+        """Fetch single batch of reviews from Google Play Store API.
+
+        Args:
+            app_id: Google Play app ID
+            lang: Language code
+            country: Country code
+            sort: Sort order (1=RELEVANT, 2=NEWEST, 3=RATING)
+            batch_count: Number of reviews per batch
+            token: Pagination token for next batch
+
+        Returns:
+            Raw API response text
+        """
+        return await self._fetch(build_reviews_request(app_id, lang, country, sort, batch_count, token))
+
+    async def fetch_developer_page(self, dev_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch developer portfolio page from Google Play Store.
+
+        Args:
+            dev_id: Developer ID (numeric or string)
+            lang: Language code
+            country: Country code
+
+        Returns:
+            HTML content of developer page
+        """
+        return await self._fetch(build_developer_request(dev_id, lang, country))
+
+    async def fetch_cluster_page(self, cluster_url: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch cluster page (similar apps collection) from Google Play Store.
+
+        Args:
+            cluster_url: Cluster URL path
+            lang: Language code
+            country: Country code
+
+        Returns:
+            HTML content of cluster page
+        """
+        return await self._fetch(build_cluster_request(cluster_url, lang, country))
+
+    async def fetch_list_page(self, collection: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch top charts list page from Google Play Store.
+
+        Args:
+            collection: Collection type (topselling_free, topselling_paid, topgrossing)
+            category: App category
+            count: Number of apps to fetch
+            lang: Language code
+            country: Country code
+
+        Returns:
+            Raw API response text
+        """
+        return await self._fetch(build_list_request(collection, category, count, lang, country))
+
+    async def fetch_suggest_page(self, term: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
+        """Fetch search suggestions from Google Play Store.
+
+        Args:
+            term: Search term for suggestions
+            lang: Language code
+            country: Country code
+
+        Returns:
+            Raw API response text
+        """
+        return await self._fetch(build_suggest_request(term, lang, country))
+
+    async def _fetch(self, request: PlayRequest) -> str:
+        """Send a PlayRequest through the response cache and single-flight.
+
+        Fresh cached responses are returned without a network call, and
+        so are 404s remembered by the negative cache. In stale-while-revalidate
+        mode an expired entry within its max staleness is returned as well,
+        and one background task per request replaces it.
+        Coroutines asking for the same method, URL and body at the same time
+        wait for one fetch instead of each sending their own.
+
+        Args:
+            request: Request description from request_builder
+
+        Returns:
+            Response body text
+
+        Raises:
+            AppNotFoundError: If the server answers 404 and the request maps 404s
+            RateLimitError: If the server answers 429/503
+            NetworkError: If every URL fails
+        """
+        if self.negative_cache is not None:
+            message = self.negative_cache.get(request)
+            if message is not None:
+                raise AppNotFoundError(message, confirmed=True)
+        ttl = cache_ttl(request) if self.cache is not None else 0
+        max_stale = cache_max_stale(request) if ttl and self.stale_while_revalidate else 0
+        if max_stale:
+            entry = await self._cache_call("get_stale", cache_key(request), max_stale)
+            if entry is not None:
+                if entry[1] > 0 and request.key not in self._refresh_tasks:
+                    task = asyncio.ensure_future(self._refresh(request, ttl))
+                    self._refresh_tasks[request.key] = task
+                    task.add_done_callback(lambda _: self._refresh_tasks.pop(request.key, None))
+                return entry[0]
+        elif ttl:
+            cached = await self._cache_call("get", cache_key(request))
+            if cached is not None:
+                return cached
+        return await self._fetch_shared(request, ttl)
+
+    async def _cache_call(self, method: str, *args):
+        """Call a cache method, in a worker thread when the backend may block.
+
+        Blocking backends wait on sockets or on database locks held by other
+        processes; called on the event loop, they would stall every coroutine.
+        """
+        call = getattr(self.cache, method)
+        if not self.cache.blocking:
+            return call(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, call, *args)
+
+    async def _fetch_shared(self, request: PlayRequest, ttl: float) -> str:
+        """Fetch and store a request, sharing the fetch with identical concurrent requests."""
+        if self.single_flight is None:
+            return await self._fetch_and_store(request, ttl)
+        return await self.single_flight.do(request.key, lambda: self._fetch_and_store(request, ttl))
+
+    async def _refresh(self, request: PlayRequest, ttl: float) -> None:
+        """Replace a stale cache entry; failures keep serving the stale copy."""
+        try:
+            await self._fetch_shared(request, ttl)
+        except AppNotFoundError:
+            # The resource is gone, stop serving its old page
+            await self._cache_call("delete", cache_key(request))
+        except Exception as e:
+            logger.warning(f"Background refresh of {request.endpoint} failed, serving stale data: {e}")
+
+    async def _fetch_and_store(self, request: PlayRequest, ttl: float) -> str:
+        """Fetch a request and store the response in the cache for ttl seconds.
+
+        With a shared cache only the process holding the fill lock fetches;
+        the others wait for its response to appear in the cache. The lock
+        holds a random token and is released only if it still holds it, so
+        a fetch outliving the lock TTL never frees another process's lock.
+        """
+        token = None
+        if ttl and self.cache.shared:
+            text, token = await self._wait_for_fill(request)
+            if text is not None:
+                return text
+        try:
+            text = await self._fetch_with_retry(request)
+            if ttl:
+                await self._cache_call("set", cache_key(request), text, ttl)
+        except AppNotFoundError as e:
+            if self.negative_cache is not None and self.negative_cache.add(request, str(e)):
+                e.confirmed = True
+            raise
+        finally:
+            if token is not None:
+                await self._cache_call("delete_if", fill_lock_key(cache_key(request)), token)
+        return text
+
+    async def _wait_for_fill(self, request: PlayRequest) -> Tuple[Optional[str], Optional[str]]:
+        """Take the shared cache fill lock, or wait for the process holding it.
+
+        Gives up waiting after Config.CACHE_FILL_LOCK_TTL, e.g. when the
+        cache server is unreachable, and lets the caller fetch without it.
+
+        Returns:
+            (response stored by another process or None,
+             this process's lock token if it holds the lock, else None)
+        """
+        key = cache_key(request)
+        deadline = time.monotonic() + Config.CACHE_FILL_LOCK_TTL
+        token = secrets.token_hex(16)
+        while not await self._cache_call("add", fill_lock_key(key), token, Config.CACHE_FILL_LOCK_TTL):
+            if time.monotonic() >= deadline:
+                return None, None
+            await asyncio.sleep(Config.CACHE_FILL_POLL)
+            text = await self._cache_call("get", key)
+            if text is not None:
+                return text, None
+        return None, token
+
+    async def _fetch_with_retry(self, request: PlayRequest) -> str:
+        """Send a PlayRequest, retrying transient failures under the retry policy.
+
+        Backoff sleeps use asyncio.sleep, so other requests keep running.
+
+        Args:
+            request: Request description from request_builder
+
+        Returns:
+            Response body text
+
+        Raises:
+            AppNotFoundError: If the server answers 404 and the request maps 404s
+            RateLimitError: If the server answers 429/503
+            NetworkError: If every URL fails
+        """
+        self.retry_policy.start()
+        attempt = 0
+        while True:
+            await self.rate_limit(request)
+            try:
+                return await self._send_hedged(request)
+            except Exception as e:
+                delay = self.retry_policy.next_delay(attempt, e)
+                if delay is None:
+                    raise
+                logger.warning(f"Retry {attempt + 1} for {request.endpoint} in {delay:.2f}s: {e}")
+            finally:
+                self.rate_limiter.release(request)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_hedged(self, request: PlayRequest) -> str:
+        """Send a request, hedging it if it is slower than usual for its endpoint.
+
+        With Config.HEDGE_REQUESTS enabled, a request to Config.HEDGE_ENDPOINTS
+        that has not answered within its endpoint's latency quantile gets a
+        second copy if a rate limiter token is free at once and the retry
+        budget allows it. The first successful answer wins and the other task is cancelled.
+
+        Args:
+            request: Request description from request_builder
+
+        Returns:
+            Response body text
+        """
+        delay = None
+        if Config.HEDGE_REQUESTS and request.endpoint in Config.HEDGE_ENDPOINTS:
+            delay = self.latency.hedge_delay(request.endpoint)
+        if delay is None:
+            return await self._send(request)
+
+        primary = asyncio.ensure_future(self._send(request))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            # The primary holds the concurrency slot, so the hedge only takes a free token
+            if done or not self.retry_policy.budget.withdraw() or not self.rate_limiter.try_acquire(request):
+                return await primary
+
+            logger.info(f"Hedging {request.endpoint} request after {delay:.2f}s")
+            hedge = asyncio.ensure_future(self._send(request))
+            tasks.add(hedge)
+
+            pending = set(tasks)
+            first_error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _send(self, request: PlayRequest) -> str:
+        """Try each URL of a request and report the outcome to the rate limiter.
+
+        Args:
+            request: Request description from request_builder
+
+        Returns:
+            Response body text
+
+        Raises:
+            AppNotFoundError: If the server answers 404 and the request maps 404s
+            RateLimitError: If the server answers 429/503
+            NetworkError: If every URL fails
+        """
+        headers = {**self.headers, **request.headers}
+        first_error = None
+
+        for url in request.urls:
+            started = time.monotonic()
+            try:
+                response = await self._make_request(request.method, url, endpoint=request.endpoint, data=request.data, headers=headers)
+                latency = time.monotonic() - started
+                self.rate_limiter.record(request, response.status_code, latency)
+                self.latency.record(request.endpoint, latency)
+                return response.text
+            except RateLimitError as e:
+                self.rate_limiter.record(request, e.status_code, time.monotonic() - started, e.retry_after)
+                raise
+            except Exception as e:
+                if request.not_found and is_not_found_error(e):
+                    raise AppNotFoundError(request.not_found)
+                first_error = first_error or e
+                if not isinstance(e, HttpStatusError):
+                    break
+
+        logger.error(request.failure_message(first_error))
+        raise NetworkError(request.failure_message(first_error)) from first_error
+
+    async def _make_request(self, method: str, url: str, endpoint: str = None, **kwargs) -> AsyncResponse:
+        """Make HTTP request with automatic fallback to the other async client.
+
+        Args:
+            method: HTTP method (GET or POST)
+            url: Request URL
+            endpoint: Endpoint name used by 'auto' client selection
+            **kwargs: Additional request parameters (data, headers)
+
+        Returns:
+            AsyncResponse with text and status_code
+
+        Raises:
+            Exception: If all async clients fail to make the request
+        """
+        selector = self.selector if endpoint else None
+        if selector is not None:
+            clients_to_try = selector.order(endpoint, [c for c in self.available_clients if self.health.is_usable(c)])
+        else:
+            clients_to_try = [self.client_type] + [c for c in self.available_clients if c != self.client_type]
+        last_error = None
+
+        for client_type in clients_to_try:
+            breaker = self.health.breaker(client_type)
+            if not breaker.allow():
+                continue
+            started = time.monotonic()
+            try:
+                response = await self._try_request_with_client(client_type, method, url, **kwargs)
+                breaker.record_success()
+                if selector is not None:
+                    selector.record(endpoint, client_type, True, time.monotonic() - started)
+                return response
+            except (RateLimitError, HttpStatusError) as e:
+                breaker.record_success()
+                if selector is not None and e.status_code != 404:
+                    selector.record(endpoint, client_type, False)
+                raise
+            except ClientUnavailableError as e:
+                breaker.mark_unavailable()
+                last_error = last_error or e
+            except Exception as e:
+                breaker.record_failure()
+                if selector is not None:
+                    selector.record(endpoint, client_type, False)
+                last_error = e
+                logger.warning(Config.ERROR_MESSAGES["CLIENT_FAILED_TRYING_NEXT"].format(client_type=client_type, error=e))
+
+        if last_error is None:
+            raise NetworkError(Config.ERROR_MESSAGES["ALL_CLIENTS_UNAVAILABLE"])
+
+        raise last_error
+
+    async def _try_request_with_client(self, client_type: str, method: str, url: str, **kwargs) -> AsyncResponse:
+        """Attempt request with a specific async HTTP client.
+
+        Args:
+            client_type: Async HTTP client name (aiohttp or httpx)
+            method: HTTP method (GET or POST)
+            url: Request URL
+            **kwargs: Additional request parameters (data, headers)
+
+        Returns:
+            AsyncResponse with text and status_code
+
+        Raises:
+            Exception: If client unavailable or request fails
+        """
+        headers = kwargs.get('headers', self.headers)
+
+        try:
+            session = self._get_session(client_type)
+        except ImportError:
+            raise ClientUnavailableError(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client=client_type))
+
+        if client_type == "aiohttp":
+            if method == "GET":
+                request = session.get(url, headers=headers)
+            else:
+                request = session.post(url, data=kwargs.get('data'), headers=headers)
+            async with request as response:
+                check_response_status(response.status, response.headers)
+                return AsyncResponse(await response.text(), response.status, response.headers)
+
+        if client_type == "httpx":
+            if method == "GET":
+                response = await session.get(url, headers=headers)
+            else:
+                response = await session.post(url, content=kwargs.get('data'), headers=headers)
+            check_response_status(response.status_code, response.headers)
+            return AsyncResponse(response.text, response.status_code, response.headers)
+
+        raise Exception(Config.ERROR_MESSAGES["UNKNOWN_CLIENT_TYPE"].format(client_type=client_type))
+
+    def _try_next_client(self):
+        """Switch to the next async HTTP client for retry.
+
+        Returns:
+            True if a usable client was selected, False if every client is
+            unavailable or has an open circuit breaker
+
+        Note:
+            Called automatically by error handling decorators when retries are needed
+        """
+        for _ in range(len(self.available_clients)):
+            self.current_client_index = (self.current_client_index + 1) % len(self.available_clients)
+            next_client = self.available_clients[self.current_client_index]
+            if self.health.is_usable(next_client):
+                self.client_type = next_client
+                logger.info(f"Switching to async HTTP client: {self.client_type}")
+                return True
+        logger.warning(Config.ERROR_MESSAGES["ALL_CLIENTS_UNAVAILABLE"])
+        return False
+
+    async def rate_limit(self, request: PlayRequest = None):
+        """Wait for the rate limiter to admit a request without blocking the loop.
+
+        Args:
+            request: PlayRequest about to be sent; without one, only a token
+                     from the 'global' bucket is taken, never a concurrency slot
+        """
+        if request is None:
+            await self.rate_limiter.acquire_token_async()
+            return
+        await self.rate_limiter.acquire_async(request)
@@ -0,0 +1,368 @@
+"""Response caches for the HTTP transport.
+
+HttpClient and AsyncHttpClient accept a `cache` that stores raw response
+bodies. Entries are keyed on the request method, URL and body. The URL
+carries the hl/gl parameters, so lang and country are part of the key.
+Each endpoint has its own time-to-live, set in Config.CACHE_TTLS.
+
+Expired entries are kept for the largest bound in Config.CACHE_MAX_STALE,
+so a client in stale-while-revalidate mode can serve them while it fetches
+a fresh copy in the background.
+
+ResponseCache defines the interface every backend implements. MemoryCache
+is an in-process LRU cache bounded by memory size. NegativeCache remembers
+confirmed 404s for apps, developers and clusters, so dead IDs do not cost
+a network round trip every time they are asked for.
+"""
+
+import sys
+import time
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..config import Config
+
+
+def cache_key(request) -> str:
+    """Return the cache key of a PlayRequest.
+
+    Args:
+        request: PlayRequest from request_builder
+
+    Returns:
+        Hex digest of method, first URL and body
+    """
+    method, url, data = request.key
+    return hashlib.sha1(f"{method}\n{url}\n{data or ''}".encode("utf-8")).hexdigest()
+
+
+def cache_ttl(request) -> float:
+    """Return how long a response to this request may be cached.
+
+    Args:
+        request: PlayRequest from request_builder
+
+    Returns:
+        Time-to-live in seconds; 0 means do not cache
+    """
+    return Config.CACHE_TTLS.get(request.cache_class, 0)
+
+
+def fill_lock_key(key: str) -> str:
+    """Return the key of the fill lock guarding a cache entry in a shared cache."""
+    return "fill:" + key
+
+
+def cache_max_stale(request) -> float:
+    """Return how long past expiry a cached response to this request may be served.
+
+    Args:
+        request: PlayRequest from request_builder
+
+    Returns:
+        Maximum staleness in seconds; 0 means never serve expired entries
+    """
+    return Config.CACHE_MAX_STALE.get(request.cache_class, 0)
+
+
+def stale_retention() -> float:
+    """Return how long backends keep expired entries around for stale serving."""
+    return max(Config.CACHE_MAX_STALE.values(), default=0)
+
+
+class ResponseCache(ABC):
+    """Interface for response cache backends.
+
+    Backends store text values under string keys with a time-to-live and
+    must be safe to use from several threads. They implement get, set,
+    delete, clear and stats; the other methods have generic defaults.
+
+    Attributes:
+        shared: True if several processes see the same entries. The HTTP
+                clients then take a fill lock with add() before fetching, so
+                only one process downloads a missing page.
+        blocking: True if calls may wait on I/O or on locks held by other
+                  processes. AsyncHttpClient then runs them in a worker
+                  thread instead of on the event loop.
+    """
+
+    shared = False
+    blocking = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing or expired."""
+
+    def get_stale(self, key: str, max_stale: float) -> Optional[Tuple[str, float]]:
+        """Return a value that is fresh or expired at most max_stale seconds ago.
+
+        Backends that drop expired entries only return fresh values.
+
+        Returns:
+            (value, seconds past expiry, 0 if fresh), or None
+        """
+        value = self.get(key)
+        return None if value is None else (value, 0.0)
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        """Store value only if key is absent or expired.
+
+        Returns:
+            True if the value was stored
+        """
+        if self.get(key) is not None:
+            return False
+        self.set(key, value, ttl)
+        return True
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+
+    def delete_if(self, key: str, value: str) -> bool:
+        """Remove key only if it still holds value.
+
+        The HTTP clients release their fill lock with this, so a lock that
+        expired and was taken by another process is left alone.
+
+        Returns:
+            True if the key was removed
+        """
+        if self.get(key) != value:
+            return False
+        self.delete(key)
+        return True
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def stats(self) -> Dict:
+        """Return hit, miss and size counters."""
+
+
+class MemoryCache(ResponseCache):
+    """Thread-safe in-memory LRU cache capped by total value size.
+
+    Attributes:
+        max_bytes: Memory cap for stored values in bytes
+    """
+
+    blocking = False
+
+    def __init__(self, max_bytes: int = None):
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory cap for stored values (default: Config.CACHE_MAX_BYTES)
+        """
+        self.max_bytes = max_bytes or Config.CACHE_MAX_BYTES
+        self._entries = OrderedDict()  # key -> (expires_at, value, size)
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            now = time.monotonic()
+            if entry[0] <= now:
+                # Expired entries stay for stale serving until LRU eviction or the retention bound
+                if entry[0] + stale_retention() <= now:
+                    self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def get_stale(self, key: str, max_stale: float) -> Optional[Tuple[str, float]]:
+        """Return (value, seconds past expiry) if the entry expired at most max_stale seconds ago."""
+        with self._lock:
+            entry = self._entries.get(key)
+            staleness = time.monotonic() - entry[0] if entry is not None else 0.0
+            if entry is None or staleness > max_stale:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            if staleness > 0:
+                self._stale_hits += 1
+            return entry[1], max(staleness, 0.0)
+
+    def _store(self, key: str, value: str, ttl: float, size: int) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting least recently used entries."""
+        size = sys.getsizeof(value)
+        if size > self.max_bytes or ttl <= 0:
+            return
+        with self._lock:
+            self._store(key, value, ttl, size)
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        """Atomically store value only if key is absent or expired."""
+        size = sys.getsizeof(value)
+        if size > self.max_bytes or ttl <= 0:
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            self._store(key, value, ttl, size)
+            return True
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def delete_if(self, key: str, value: str) -> bool:
+        """Atomically remove key only if it holds value and has not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic() or entry[1] != value:
+                return False
+            self._remove(key)
+            return True
+
+    def keys(self) -> List[str]:
+        """Return the keys of unexpired entries, least recently used first."""
+        with self._lock:
+            now = time.monotonic()
+            return [key for key, entry in self._entries.items() if entry[0] > now]
+
+    def clear(self) -> None:
+        """Remove every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        """Return hit, miss, eviction and size counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "stale_hits": self._stale_hits,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class NegativeCache:
+    """Thread-safe cache of confirmed not-found answers.
+
+    Entries are keyed like response cache entries (method, URL, body), so an
+    app missing in one country does not hide it in another. Each entry also
+    records its endpoint and resource ID so it can be invalidated, e.g. when
+    an app is known to be published again.
+    """
+
+    def __init__(self, ttl: float = None, max_entries: int = None):
+        """Initialize an empty negative cache.
+
+        Args:
+            ttl: Seconds a 404 is trusted (default: Config.NEGATIVE_CACHE_TTL)
+            max_entries: Entry cap, oldest dropped first (default: Config.NEGATIVE_CACHE_MAX_ENTRIES)
+        """
+        self.ttl = ttl or Config.NEGATIVE_CACHE_TTL
+        self.max_entries = max_entries or Config.NEGATIVE_CACHE_MAX_ENTRIES
+        self._entries = OrderedDict()  # key -> (expires_at, message, endpoint, resource)
+        self._hits = 0
+        self._lock = threading.Lock()
+
+    def get(self, request) -> Optional[str]:
+        """Return the not-found message cached for a request, or None.
+
+        Args:
+            request: PlayRequest from request_builder
+        """
+        if request.endpoint not in Config.NEGATIVE_CACHE_ENDPOINTS:
+            return None
+        key = cache_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._hits += 1
+            return entry[1]
+
+    def add(self, request, message: str) -> bool:
+        """Remember that a request was answered with 404.
+
+        Args:
+            request: PlayRequest from request_builder
+            message: AppNotFoundError message to replay
+
+        Returns:
+            True if the endpoint is negatively cached and the entry was stored
+        """
+        if request.endpoint not in Config.NEGATIVE_CACHE_ENDPOINTS:
+            return False
+        key = cache_key(request)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, message, request.endpoint, request.resource)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, resource: str = None, endpoint: str = None) -> int:
+        """Forget cached 404s.
+
+        Args:
+            resource: App ID, developer ID or cluster URL to forget; None matches all
+            endpoint: Limit to one endpoint ('app', 'developer', 'cluster'); None matches all
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [
+                key for key, (_, _, entry_endpoint, entry_resource) in self._entries.items()
+                if (resource is None or entry_resource == resource) and (endpoint is None or entry_endpoint == endpoint)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict:
+        """Return the number of short-circuited requests and cached 404s."""
+        with self._lock:
+            return {"hits": self._hits, "entries": len(self._entries)}
@@ -0,0 +1,186 @@
+"""Circuit breakers and health memory for the HTTP client fallback chain.
+
+Each HTTP library gets a CircuitBreaker that watches its recent error rate:
+
+- closed: requests flow; failures are counted in a sliding time window
+- open: the error rate crossed the threshold, requests are skipped at once
+- half_open: after the reset timeout one probe request is let through;
+  success closes the breaker, failure opens it again
+
+Libraries that cannot be imported are marked unavailable and never tried
+again. Only transport failures (connection errors, timeouts, TLS errors)
+count against a client; an HTTP status from the server means the client
+itself worked.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, List
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class ClientUnavailableError(Exception):
+    """Raised by the transport when a client library is not installed."""
+    pass
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for one HTTP client library.
+
+    Attributes:
+        name: Client library name
+        state: One of 'closed', 'open', 'half_open', 'unavailable'
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    UNAVAILABLE = "unavailable"
+
+    def __init__(self, name: str, failure_threshold: float = None, min_requests: int = None,
+                 window: float = None, reset_timeout: float = None):
+        """Initialize a closed breaker.
+
+        Args:
+            name: Client library name
+            failure_threshold: Error rate in the window that opens the breaker (default: Config.BREAKER_FAILURE_THRESHOLD)
+            min_requests: Outcomes needed in the window before it can open (default: Config.BREAKER_MIN_REQUESTS)
+            window: Sliding window length in seconds (default: Config.BREAKER_WINDOW)
+            reset_timeout: Seconds an open breaker waits before a probe (default: Config.BREAKER_RESET_TIMEOUT)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or Config.BREAKER_FAILURE_THRESHOLD
+        self.min_requests = min_requests or Config.BREAKER_MIN_REQUESTS
+        self.window = window or Config.BREAKER_WINDOW
+        self.reset_timeout = reset_timeout or Config.BREAKER_RESET_TIMEOUT
+        self._state = self.CLOSED
+        self._outcomes = deque()
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open breakers to half_open once the timeout passed."""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            self._outcomes.popleft()
+
+    def _open(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        logger.warning(f"Circuit breaker for {self.name} opened")
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent through this client.
+
+        In half_open state only one probe is admitted at a time.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a request the client completed (any HTTP status)."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                logger.info(f"Circuit breaker for {self.name} closed")
+                self._state = self.CLOSED
+                self._outcomes.clear()
+            elif self._state == self.CLOSED:
+                self._outcomes.append((now, True))
+                self._prune(now)
+
+    def record_failure(self) -> None:
+        """Record a transport failure and open the breaker if the error rate is too high."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+                return
+            if self._state != self.CLOSED:
+                return
+            self._outcomes.append((now, False))
+            self._prune(now)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if len(self._outcomes) >= self.min_requests and failures / len(self._outcomes) >= self.failure_threshold:
+                self._open(now)
+
+    def mark_unavailable(self) -> None:
+        """Permanently skip this client (library not installed)."""
+        with self._lock:
+            if self._state != self.UNAVAILABLE:
+                logger.info(f"HTTP client {self.name} unavailable, skipping it from now on")
+            self._state = self.UNAVAILABLE
+
+    def snapshot(self) -> Dict:
+        """Return state and windowed error rate for monitoring."""
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            self._prune(now)
+            total = len(self._outcomes)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return {"state": self._state, "requests": total, "error_rate": failures / total if total else 0.0}
+
+
+class ClientHealth:
+    """Registry of circuit breakers, one per HTTP client library.
+
+    Shared by HttpClient._make_request, HttpClient._try_next_client and the
+    error handling decorators so they agree on which clients are usable.
+    """
+
+    def __init__(self, clients: List[str], **breaker_options):
+        """Initialize one closed breaker per client.
+
+        Args:
+            clients: Client library names in fallback order
+            **breaker_options: Options passed to every CircuitBreaker
+        """
+        self.clients = list(clients)
+        self._breakers = {name: CircuitBreaker(name, **breaker_options) for name in self.clients}
+
+    def breaker(self, client_type: str) -> CircuitBreaker:
+        """Return the breaker for a client library."""
+        breaker = self._breakers.get(client_type)
+        if breaker is None:
+            breaker = self._breakers.setdefault(client_type, CircuitBreaker(client_type))
+        return breaker
+
+    def is_usable(self, client_type: str) -> bool:
+        """Return True if the client is not unavailable and its breaker is not open.
+
+        Unlike CircuitBreaker.allow this does not claim the half-open probe.
+        """
+        return self.breaker(client_type).state in (CircuitBreaker.CLOSED, CircuitBreaker.HALF_OPEN)
+
+    def any_usable(self) -> bool:
+        """Return True if at least one client can currently take requests."""
+        return any(self.is_usable(name) for name in self.clients)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return the state of every breaker for monitoring."""
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
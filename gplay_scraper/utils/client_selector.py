@@ -0,0 +1,146 @@
+"""Bandit selection of the best HTTP client library per endpoint.
+
+With client_type="auto" the transport does not use a fixed client order.
+For every endpoint (app, search, reviews, list, suggest, ...) it records
+how each client library performed and ranks the libraries with a
+discounted UCB1 policy:
+
+- a success scores 1 / (1 + latency / AUTO_CLIENT_LATENCY_SCALE), a
+  failure or block scores 0
+- older outcomes decay by AUTO_CLIENT_DISCOUNT, so the ranking follows
+  changes in blocking instead of being stuck on early results
+- clients never tried on an endpoint are tried first, and the UCB bonus
+  keeps sending some traffic to the others
+
+The best-ranked client takes the request; the rest of the ranking is the
+fallback order.
+"""
+
+import math
+import threading
+from typing import Dict, List
+
+from ..config import Config
+
+
+class _Arm:
+    """Discounted outcome totals of one client on one endpoint."""
+
+    __slots__ = ("pulls", "reward", "successes", "latency", "timed")
+
+    def __init__(self):
+        self.pulls = 0.0
+        self.reward = 0.0
+        self.successes = 0.0
+        self.latency = 0.0
+        self.timed = 0.0
+
+    def decay(self, discount: float) -> None:
+        self.pulls *= discount
+        self.reward *= discount
+        self.successes *= discount
+        self.latency *= discount
+        self.timed *= discount
+
+
+class ClientSelector:
+    """Thread-safe per-endpoint bandit over HTTP client libraries.
+
+    Attributes:
+        clients: Client library names in default fallback order
+    """
+
+    def __init__(self, clients: List[str], exploration: float = None, discount: float = None,
+                 latency_scale: float = None):
+        """Initialize the selector with no observations.
+
+        Args:
+            clients: Client library names in default fallback order
+            exploration: UCB exploration weight (default: Config.AUTO_CLIENT_EXPLORATION)
+            discount: Decay applied per outcome, between 0 and 1 (default: Config.AUTO_CLIENT_DISCOUNT)
+            latency_scale: Latency in seconds at which a success scores 0.5 (default: Config.AUTO_CLIENT_LATENCY_SCALE)
+        """
+        self.clients = list(clients)
+        self.exploration = Config.AUTO_CLIENT_EXPLORATION if exploration is None else exploration
+        self.discount = discount or Config.AUTO_CLIENT_DISCOUNT
+        self.latency_scale = latency_scale or Config.AUTO_CLIENT_LATENCY_SCALE
+        self._arms: Dict[str, Dict[str, _Arm]] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint_arms(self, endpoint: str) -> Dict[str, _Arm]:
+        arms = self._arms.get(endpoint)
+        if arms is None:
+            arms = self._arms[endpoint] = {}
+        return arms
+
+    def order(self, endpoint: str, candidates: List[str] = None) -> List[str]:
+        """Rank clients for a request, best first.
+
+        Args:
+            endpoint: Endpoint name from PlayRequest.endpoint
+            candidates: Clients allowed for this request (default: all clients)
+
+        Returns:
+            Client names, untried ones first, then by descending UCB score
+        """
+        candidates = self.clients if candidates is None else candidates
+        with self._lock:
+            arms = self._endpoint_arms(endpoint)
+            total = sum(arms[name].pulls for name in candidates if name in arms)
+            untried = []
+            scored = []
+            for name in candidates:
+                arm = arms.get(name)
+                if arm is None or arm.pulls < 1e-9:
+                    untried.append(name)
+                    continue
+                bonus = self.exploration * math.sqrt(2 * math.log(max(total, 1.0)) / arm.pulls)
+                scored.append((arm.reward / arm.pulls + bonus, name))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return untried + [name for _, name in scored]
+
+    def record(self, endpoint: str, client_type: str, ok: bool, latency: float = None) -> None:
+        """Record the outcome of one attempt.
+
+        Args:
+            endpoint: Endpoint name from PlayRequest.endpoint
+            client_type: Client library that made the attempt
+            ok: True if the server served the request, False on transport errors or blocks
+            latency: Attempt duration in seconds, used for successes
+        """
+        with self._lock:
+            arms = self._endpoint_arms(endpoint)
+            for arm in arms.values():
+                arm.decay(self.discount)
+            arm = arms.get(client_type)
+            if arm is None:
+                arm = arms[client_type] = _Arm()
+            arm.pulls += 1
+            if ok:
+                arm.successes += 1
+                if latency is not None:
+                    arm.reward += 1.0 / (1.0 + latency / self.latency_scale)
+                    arm.latency += latency
+                    arm.timed += 1
+                else:
+                    arm.reward += 1.0
+
+    def stats(self) -> Dict[str, Dict[str, Dict]]:
+        """Return discounted success rate, latency and score per endpoint and client.
+
+        Returns:
+            Mapping of endpoint to client name to statistics
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    name: {
+                        "weight": arm.pulls,
+                        "success_rate": arm.successes / arm.pulls if arm.pulls else 0.0,
+                        "latency": arm.latency / arm.timed if arm.timed else None,
+                        "score": arm.reward / arm.pulls if arm.pulls else 0.0,
+                    }
+                    for name, arm in arms.items()
+                }
+                for endpoint, arms in self._arms.items()
+            }
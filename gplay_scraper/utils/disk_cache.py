@@ -0,0 +1,332 @@
+"""Persistent response cache backed by SQLite.
+
+SQLiteCache stores compressed response bodies in one SQLite file, so cached
+pages survive restarts and are shared by every worker process that opens
+the same path. It implements the same ResponseCache interface as
+MemoryCache and plugs into HttpClient, AsyncHttpClient and the scrapers
+through their `cache` argument.
+
+- Bodies are compressed with zstd when the optional `zstandard` package is
+  installed, and with zlib (gzip's deflate) otherwise. Each row records its
+  codec, so files written with either one stay readable.
+- Expiry uses wall-clock time, so every process agrees on it. Expired
+  rows are kept for stale-while-revalidate serving until they pass the
+  Config.CACHE_MAX_STALE retention or are evicted.
+- When the stored size exceeds max_bytes, the least recently read entries
+  are evicted. Read times are batched in memory and written with the next
+  write, or once Config.DISK_CACHE_TOUCH_BATCH hits accumulate if the
+  write lock is free, so a cache hit never waits on another process.
+- The database runs in WAL mode with a busy timeout, and writes use
+  immediate transactions, so several processes can read and write at once.
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from ..config import Config
+from .cache import ResponseCache, stale_retention
+
+logger = logging.getLogger(__name__)
+
+
+def _zstd():
+    """Return the zstandard module, or None when it is not installed."""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+class SQLiteCache(ResponseCache):
+    """Multi-process safe SQLite response cache with compressed bodies.
+
+    Attributes:
+        path: Database file path
+        max_bytes: Cap on the total compressed size of stored bodies
+        codec: Compression used for new entries ('zstd' or 'zlib')
+    """
+
+    shared = True
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            codec TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = None, compression: str = None):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Database file path (default: Config.DISK_CACHE_PATH)
+            max_bytes: Cap on stored compressed bytes (default: Config.DISK_CACHE_MAX_BYTES)
+            compression: 'zstd', 'zlib' or 'auto' to prefer zstd when installed
+                         (default: Config.DISK_CACHE_COMPRESSION)
+        """
+        self.path = os.path.expanduser(path or Config.DISK_CACHE_PATH)
+        self.max_bytes = max_bytes or Config.DISK_CACHE_MAX_BYTES
+        compression = compression or Config.DISK_CACHE_COMPRESSION
+        self._zstd = _zstd()
+        if compression == "zstd" and self._zstd is None:
+            logger.warning("zstandard not installed, compressing disk cache with zlib")
+        self.codec = "zstd" if compression in ("zstd", "auto") and self._zstd is not None else "zlib"
+        self._local = threading.local()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._touched = {}  # key -> last read time not yet written to accessed_at
+        self._stats_lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Set up the schema on a connection of its own, so none is open when a pre-fork server forks
+        conn = self._open()
+        try:
+            with conn:
+                conn.execute(self._SCHEMA)
+                conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        finally:
+            conn.close()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=Config.DISK_CACHE_BUSY_TIMEOUT, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection in this process, opening it on first use.
+
+        SQLite connections must not be used across fork(), so a child process
+        opens its own instead of reusing one inherited from its parent.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = self._open()
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _compress(self, value: str) -> bytes:
+        data = value.encode("utf-8")
+        if self.codec == "zstd":
+            return self._zstd.ZstdCompressor(level=Config.DISK_CACHE_LEVEL).compress(data)
+        return zlib.compress(data, min(Config.DISK_CACHE_LEVEL, 9))
+
+    def _decompress(self, body: bytes, codec: str) -> str:
+        if codec == "zstd":
+            if self._zstd is None:
+                raise ValueError("entry compressed with zstd but zstandard is not installed")
+            return self._zstd.ZstdDecompressor().decompress(body).decode("utf-8")
+        return zlib.decompress(body).decode("utf-8")
+
+    def _count(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing, expired or unreadable."""
+        entry = self._read(key, 0.0)
+        return None if entry is None else entry[0]
+
+    def get_stale(self, key: str, max_stale: float) -> Optional[Tuple[str, float]]:
+        """Return (value, seconds past expiry) if the entry expired at most max_stale seconds ago."""
+        return self._read(key, max_stale)
+
+    def _read(self, key: str, max_stale: float) -> Optional[Tuple[str, float]]:
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute("SELECT body, codec, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or now - row[2] > max_stale or (max_stale == 0 and row[2] <= now):
+            self._count(False)
+            return None
+        try:
+            value = self._decompress(row[0], row[1])
+        except Exception as e:
+            logger.debug(f"Unreadable disk cache entry {key}: {e}")
+            self._count(False)
+            return None
+        with self._stats_lock:
+            self._touched[key] = now
+            flush = len(self._touched) >= Config.DISK_CACHE_TOUCH_BATCH
+        if flush:
+            self._flush_touches(conn)
+        self._count(True)
+        return value, max(now - row[2], 0.0)
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting old entries over the size cap."""
+        self._write(key, value, ttl, replace=True)
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        """Atomically store value only if key is absent or expired, across processes."""
+        return self._write(key, value, ttl, replace=False)
+
+    def _write(self, key: str, value: str, ttl: float, replace: bool) -> bool:
+        if ttl <= 0:
+            return False
+        body = self._compress(value)
+        if len(body) > self.max_bytes:
+            return False
+        now = time.time()
+        conn = self._connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:
+            # A cache write must never fail the request that produced the value
+            logger.warning(f"Disk cache busy, skipping write: {e}")
+            return False
+        touched = {}
+        try:
+            if not replace:
+                row = conn.execute("SELECT expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[0] > now:
+                    conn.execute("COMMIT")
+                    return False
+            touched = self._take_touches()
+            self._apply_touches(conn, touched)
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, codec, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, self.codec, len(body), now + ttl, now),
+            )
+            self._evict(conn, now)
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            # Locked, full or corrupt database: the fetched value is still returned to the caller
+            self._rollback(conn, touched)
+            logger.warning(f"Disk cache write failed, skipping: {e}")
+            return False
+        except BaseException:
+            self._rollback(conn, touched)
+            raise
+        return True
+
+    def _rollback(self, conn: sqlite3.Connection, touched: Dict[str, float]) -> None:
+        """Roll back the open write transaction and keep its read times for the next write."""
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        if touched:
+            with self._stats_lock:
+                for key, accessed_at in touched.items():
+                    if self._touched.get(key, 0.0) < accessed_at:
+                        self._touched[key] = accessed_at
+
+    def _take_touches(self) -> Dict[str, float]:
+        """Remove and return the batched read times."""
+        with self._stats_lock:
+            touched, self._touched = self._touched, {}
+        return touched
+
+    @staticmethod
+    def _apply_touches(conn: sqlite3.Connection, touched: Dict[str, float]) -> None:
+        """Write read times taken with _take_touches; the caller holds a write transaction."""
+        if touched:
+            conn.executemany(
+                "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in touched.items()],
+            )
+
+    def _flush_touches(self, conn: sqlite3.Connection) -> None:
+        """Write batched read times if the write lock is free right now."""
+        conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError:
+            # Another process is writing; the times wait for the next write
+            return
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {int(Config.DISK_CACHE_BUSY_TIMEOUT * 1000)}")
+        touched = self._take_touches()
+        try:
+            self._apply_touches(conn, touched)
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            self._rollback(conn, touched)
+            logger.debug(f"Disk cache recency update skipped: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop entries past stale retention, then least recently read ones until under max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now - stale_retention(),)).rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall() if total > self.max_bytes else []
+        victims = []
+        for victim, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((victim,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        with self._stats_lock:
+            self._evictions += evicted + len(victims)
+
+    def delete(self, key: str) -> None:
+        """Remove key if present; a busy database is logged instead of raised."""
+        try:
+            self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.OperationalError as e:
+            # Called from the HTTP clients' finally blocks, so it must not replace their result or error
+            logger.warning(f"Disk cache busy, skipping delete: {e}")
+
+    def delete_if(self, key: str, value: str) -> bool:
+        """Atomically remove key only if it holds value and has not expired, across processes."""
+        # Compression is deterministic, so the owner's value compresses to the stored body
+        try:
+            cursor = self._connection().execute(
+                "DELETE FROM responses WHERE key = ? AND body = ? AND codec = ? AND expires_at > ?",
+                (key, self._compress(value), self.codec, time.time()),
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Disk cache busy, skipping delete: {e}")
+            return False
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Remove every entry; counters are kept. A busy database is logged instead of raised."""
+        try:
+            self._connection().execute("DELETE FROM responses")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Disk cache busy, skipping clear: {e}")
+
+    def stats(self) -> Dict:
+        """Return hit, miss and eviction counters of this process and the size of the shared file."""
+        entries, size = self._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "codec": self.codec,
+            }
+
+    def close(self) -> None:
+        """Write pending read times if possible and close this thread's connection; it is reopened on next use."""
+        conn = getattr(self._local, "conn", None)
+        # A connection inherited through fork() belongs to the parent and is left alone
+        if conn is not None and self._local.pid == os.getpid():
+            if self._touched:
+                self._flush_touches(conn)
+            conn.close()
+        self._local.conn = None
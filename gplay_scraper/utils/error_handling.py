@@ -1,23 +1,42 @@
 """Unified error handling decorators for all gplay_scraper methods."""
 
 import time
+import asyncio
 import logging
-import json
+from .json_codec import json_dumps
 from functools import wraps
 from ..config import Config
 from ..exceptions import AppNotFoundError, NetworkError, DataParsingError, RateLimitError, InvalidAppIdError
+from .retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
-def retry_on_not_found(max_retries=Config.DEFAULT_RETRY_COUNT, delay=1.0):
-    """Decorator to retry methods on AppNotFoundError with all HTTP clients.
+# Used by decorated objects that have no HTTP client of their own
+_default_retry_policy = RetryPolicy()
+
+
+def _retry_policy(obj) -> RetryPolicy:
+    """Return the RetryPolicy of obj.scraper.http_client, or the module default.
+
+    Sharing the transport's policy means decorator retries draw on the same
+    retry budget as transport retries.
+    """
+    http_client = getattr(getattr(obj, 'scraper', None), 'http_client', None)
+    return getattr(http_client, 'retry_policy', None) or _default_retry_policy
+
+
+def retry_on_not_found(max_retries=Config.DEFAULT_RETRY_COUNT, delay=None):
+    """Decorator to retry methods on AppNotFoundError.
     
-    This decorator implements automatic retry logic when apps are not found,
-    cycling through different HTTP clients to overcome potential blocking.
+    This decorator implements automatic retry logic when apps are not found.
+    Delays come from the HTTP client's RetryPolicy (jittered exponential
+    backoff) and every retry is charged to its retry budget. The shared HTTP
+    client is not switched: a 404 is the server's answer, not a client
+    failure, and other threads may have requests in flight on it.
     
     Args:
-        max_retries: Maximum number of retry attempts (default: 3)
-        delay: Delay in seconds between retries (default: 1.0)
+        max_retries: Maximum number of attempts (default: 3)
+        delay: Optional backoff base in seconds (default: the policy's base delay)
         
     Returns:
         Decorated function with retry logic
@@ -31,21 +50,25 @@ def retry_on_not_found(max_retries=Config.DEFAULT_RETRY_COUNT, delay=1.0):
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            shared = _retry_policy(self)
+            policy = RetryPolicy(max_retries, shared.base_delay if delay is None else delay, shared.max_delay, shared.budget)
             for attempt in range(max_retries):
                 try:
                     return func(self, *args, **kwargs)
                 except AppNotFoundError as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
-                        time.sleep(delay)
-                        # Switch to next HTTP client for retry
-                        if hasattr(self, 'scraper') and hasattr(self.scraper, 'http_client'):
-                            self.scraper.http_client._try_next_client()
-                    continue
+                    # A negatively cached 404 will not change on another client
+                    if e.confirmed:
+                        break
+                    # Out of attempts or retry budget
+                    wait = policy.next_delay(attempt, e, retryable=True)
+                    if wait is None:
+                        break
+                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait:.2f}s...")
+                    time.sleep(wait)
                 except Exception as e:
                     # Re-raise non-recoverable exceptions immediately
                     raise e
-            logger.error(f"All {max_retries} attempts failed. Skipping.")
+            logger.error("All attempts failed. Skipping.")
             return None
         return wrapper
     return decorator
@@ -69,6 +92,19 @@ def handle_network_errors(return_empty=False):
             pass
     """
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await func(self, *args, **kwargs)
+                except NetworkError as e:
+                    logger.warning(f"Network error in {func.__name__}: {e}")
+                    return [] if return_empty else None
+                except Exception as e:
+                    logger.error(f"Unexpected error in {func.__name__}: {e}")
+                    return [] if return_empty else None
+            return async_wrapper
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             try:
@@ -101,6 +137,19 @@ def handle_parsing_errors(return_empty=False):
             pass
     """
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await func(self, *args, **kwargs)
+                except DataParsingError as e:
+                    logger.warning(f"Parsing error in {func.__name__}: {e}")
+                    return [] if return_empty else None
+                except Exception as e:
+                    logger.error(f"Unexpected error in {func.__name__}: {e}")
+                    return [] if return_empty else None
+            return async_wrapper
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             try:
@@ -130,25 +179,24 @@ def handle_rate_limit():
             pass
             
     Note:
-        Uses exponential backoff: 1s, 2s, 4s, 8s, etc.
+        Uses the HTTP client's RetryPolicy: capped exponential backoff with
+        full jitter, at least Retry-After, charged to the retry budget.
     """
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            max_attempts = Config.DEFAULT_RETRY_COUNT
-            base_delay = Config.RATE_LIMIT_DELAY
+            policy = _retry_policy(self)
             
-            for attempt in range(max_attempts):
+            for attempt in range(policy.max_attempts):
                 try:
                     return func(self, *args, **kwargs)
                 except RateLimitError as e:
-                    if attempt < max_attempts - 1:
-                        # Exponential backoff: 1s, 2s, 4s, 8s...
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(f"Rate limited. Waiting {delay}s before retry...")
+                    delay = policy.next_delay(attempt, e)
+                    if delay is not None:
+                        logger.warning(f"Rate limited. Waiting {delay:.2f}s before retry...")
                         time.sleep(delay)
                         continue
-                    logger.error(f"Rate limit exceeded after {max_attempts} attempts")
+                    logger.error(f"Rate limit exceeded after {attempt + 1} attempts")
                     return None
                 except Exception as e:
                     # Re-raise non-rate-limit exceptions
@@ -178,6 +226,16 @@ def validate_inputs():
         Validates that first argument is non-empty string
     """
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if args and not args[0]:
+                    raise InvalidAppIdError("Input cannot be empty")
+                if args and not isinstance(args[0], str):
+                    raise InvalidAppIdError("Input must be a string")
+                return await func(self, *args, **kwargs)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             try:
@@ -223,7 +281,7 @@ def safe_print():
                 # Fallback: get data and print with ASCII encoding
                 data = getattr(self, func.__name__.replace('print', 'analyze'))(*args, **kwargs)
                 if data:
-                    print(json.dumps(data, indent=2, ensure_ascii=True))
+                    print(json_dumps(data, indent=2, ensure_ascii=True))
                 else:
                     print("No data available")
             except Exception as e:
@@ -252,12 +310,49 @@ def comprehensive_error_handler(return_empty=False):
             
     Features:
         - Input validation
-        - Automatic retries with HTTP client fallback
+        - Automatic retries of unconfirmed 404s
         - Network and parsing error handling
         - Rate limit management
         - Graceful degradation
+        
+    Note:
+        Coroutine functions get an async wrapper that awaits the call and
+        backs off with asyncio.sleep instead of blocking the event loop.
+        Retry delays and the retry budget come from the HTTP client's
+        RetryPolicy, shared with transport-level retries.
     """
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if args and not args[0]:
+                    raise InvalidAppIdError("Input cannot be empty")
+                if args and not isinstance(args[0], str):
+                    raise InvalidAppIdError("Input must be a string")
+                
+                policy = _retry_policy(self)
+                for attempt in range(policy.max_attempts):
+                    try:
+                        return await func(self, *args, **kwargs)
+                    except AppNotFoundError as e:
+                        if e.confirmed:
+                            logger.error(str(e))
+                            return [] if return_empty else None
+                        delay = policy.next_delay(attempt, e, retryable=True)
+                        if delay is not None:
+                            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s...")
+                            await asyncio.sleep(delay)
+                            continue
+                        logger.error(f"All {attempt + 1} attempts failed")
+                        return [] if return_empty else None
+                    except (NetworkError, DataParsingError, RateLimitError) as e:
+                        logger.warning(f"Recoverable error in {func.__name__}: {e}")
+                        return [] if return_empty else None
+                    except Exception as e:
+                        logger.error(f"Unexpected error in {func.__name__}: {e}")
+                        return [] if return_empty else None
+            return async_wrapper
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             try:
@@ -267,20 +362,25 @@ def comprehensive_error_handler(return_empty=False):
                 if args and not isinstance(args[0], str):
                     raise InvalidAppIdError("Input must be a string")
                     
-                # Retry logic with HTTP client fallback
-                max_retries = Config.DEFAULT_RETRY_COUNT
-                for attempt in range(max_retries):
+                # Retry logic for unconfirmed 404s; transient network errors
+                # were already retried by the transport under the same policy
+                policy = _retry_policy(self)
+                for attempt in range(policy.max_attempts):
                     try:
                         return func(self, *args, **kwargs)
                     except AppNotFoundError as e:
-                        if attempt < max_retries - 1:
-                            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying...")
-                            time.sleep(Config.RATE_LIMIT_DELAY)
-                            # Switch to next HTTP client for retry
-                            if hasattr(self, 'scraper') and hasattr(self.scraper, 'http_client'):
-                                self.scraper.http_client._try_next_client()
+                        # A negatively cached 404 will not change on another client
+                        if e.confirmed:
+                            logger.error(str(e))
+                            return [] if return_empty else None
+                        # Retry if the budget allows, on the same client: the HTTP client is shared
+                        # between threads and a 404 is the server's answer, not a client failure
+                        delay = policy.next_delay(attempt, e, retryable=True)
+                        if delay is not None:
+                            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s...")
+                            time.sleep(delay)
                             continue
-                        logger.error(f"All {max_retries} attempts failed")
+                        logger.error(f"All {attempt + 1} attempts failed")
                         return [] if return_empty else None
                     except (NetworkError, DataParsingError, RateLimitError) as e:
                         # Handle recoverable errors gracefully
@@ -0,0 +1,75 @@
+"""Per-endpoint latency tracking for hedged requests.
+
+A hedged request sends a second copy of a request when the first has not
+answered within a high latency quantile of its endpoint (p95 by default).
+The copy that answers first wins. Because only the slowest few percent of
+requests are hedged, extra load stays small, but stuck sockets no longer
+set the completion time of a whole batch.
+
+LatencyTracker keeps a sliding window of recent successful latencies per
+endpoint and says how long to wait before hedging.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from ..config import Config
+
+
+class LatencyTracker:
+    """Thread-safe sliding-window latency quantiles per endpoint.
+
+    Attributes:
+        quantile: Quantile of recent latencies after which a hedge is sent
+        window: Number of recent samples kept per endpoint
+        min_samples: Samples needed before an endpoint is hedged
+        min_delay: Lower bound on the hedge delay in seconds
+    """
+
+    def __init__(self, quantile: float = None, window: int = None, min_samples: int = None,
+                 min_delay: float = None):
+        """Initialize LatencyTracker with no samples.
+
+        Args:
+            quantile: Hedge delay quantile between 0 and 1 (default: Config.HEDGE_QUANTILE)
+            window: Samples kept per endpoint (default: Config.HEDGE_WINDOW)
+            min_samples: Samples needed before hedging (default: Config.HEDGE_MIN_SAMPLES)
+            min_delay: Minimum hedge delay in seconds (default: Config.HEDGE_MIN_DELAY)
+        """
+        self.quantile = quantile or Config.HEDGE_QUANTILE
+        self.window = window or Config.HEDGE_WINDOW
+        self.min_samples = Config.HEDGE_MIN_SAMPLES if min_samples is None else min_samples
+        self.min_delay = Config.HEDGE_MIN_DELAY if min_delay is None else min_delay
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Add the latency of a successful response.
+
+        Args:
+            endpoint: Endpoint name from PlayRequest.endpoint
+            latency: Response time in seconds
+        """
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Return how long to wait before hedging a request to endpoint.
+
+        Args:
+            endpoint: Endpoint name from PlayRequest.endpoint
+
+        Returns:
+            Delay in seconds, or None while the endpoint has too few samples
+        """
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if not samples or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        return max(self.min_delay, ordered[index])
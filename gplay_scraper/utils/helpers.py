@@ -16,6 +16,10 @@ from datetime import datetime, timezone
 
 from urllib.parse import urlparse
 from .constants import PHONE_PREFIXES
+from .js_literal import js_literal_to_json, JsLiteralError
+from .json_codec import json_dumps
+
+_json_decoder = json.JSONDecoder()
 
 def unescape_text(s: Optional[str]) -> Optional[str]:
     """Unescape HTML entities and remove HTML tags from text.
@@ -42,42 +46,29 @@ def unescape_text(s: Optional[str]) -> Optional[str]:
 
 
 def clean_json_string(json_str: str) -> str:
-    """Clean malformed JSON string from Google Play Store.
+    """Convert a JavaScript object literal from Google Play Store to JSON.
+    
+    Decodes the literal in a single pass with parse_js_literal: bare keys,
+    single-quoted strings, `undefined`, functions, missing and trailing
+    commas and bare prices are handled without rewriting string contents.
     
     Args:
         json_str: Raw JSON string
         
     Returns:
-        Cleaned JSON string
+        Cleaned JSON string, or the input unchanged if it cannot be decoded
     """
-    json_str = re.sub(r',\s*sideChannel:\s*\{\}', '', json_str)
-    
-    json_str = re.sub(r'([{,]\s*)([a-zA-Z_$][a-zA-Z0-9_$]*)\s*:', r'\1"\2":', json_str)
-    
-    json_str = re.sub(r'\bfunction\s*\([^)]*\)\s*\{[^}]*\}', 'null', json_str)
-    json_str = re.sub(r'\bundefined\b', 'null', json_str)
-    
-    json_str = re.sub(r":\s*'([^']*)'", r': "\1"', json_str)
-    
-    json_str = re.sub(r'(\])\s*(\[)', r'\1,\2', json_str)
-    json_str = re.sub(r'(\})\s*(\{)', r'\1,\2', json_str)
-    
-    json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
-    
-    json_str = re.sub(r',,+', ',', json_str)
-    
-    json_str = re.sub(r':\s*\$([0-9.]+)', r': "$\1"', json_str)
-    
-    json_str = re.sub(r'"version"\s*:\s*([0-9.]+)(?=\s*[,}])', r'"version": "\1"', json_str)
-    
-    return json_str
+    try:
+        return js_literal_to_json(json_str)
+    except JsLiteralError:
+        return json_str
 
 
 def alternative_json_clean(json_str: str) -> str:
     """Alternative JSON cleaning method using bracket matching.
     
     Fallback method for cleaning malformed JSON when the primary cleaning fails.
-    Uses bracket counting to extract valid JSON arrays from complex structures.
+    Decodes the array after 'data:' directly, ignoring anything around it.
     
     Args:
         json_str: Raw JSON string from Google Play Store
@@ -87,48 +78,30 @@ def alternative_json_clean(json_str: str) -> str:
         
     Process:
         1. Find 'data:' marker in the string
-        2. Use bracket counting to extract complete array
+        2. Decode the complete array starting at the first '['
         3. Wrap in standard ds:5 format
         4. Apply basic cleaning as fallback
         
     Example:
         >>> alternative_json_clean('data: [1,2,3] extra content')
-        '{"key": "ds:5", "hash": "13", "data": [1,2,3]}'
+        '{"key":"ds:5","hash":"13","data":[1,2,3]}'
     """
     # Look for data array marker
     data_start = json_str.find('data:')
     if data_start != -1:
         bracket_start = json_str.find('[', data_start)
         if bracket_start != -1:
-            bracket_count = 0
-            pos = bracket_start
-            
-            # Count brackets to find complete array
-            while pos < len(json_str):
-                if json_str[pos] == '[':
-                    bracket_count += 1
-                elif json_str[pos] == ']':
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        data_end = pos + 1
-                        break
-                pos += 1
-            
-            # Extract and parse the complete array
-            if bracket_count == 0:
-                data_array = json_str[bracket_start:data_end]
+            try:
+                parsed_array, _ = _json_decoder.raw_decode(json_str, bracket_start)
                 
-                try:
-                    parsed_array = json.loads(data_array)
-                    
-                    # Wrap in standard ds:5 format
-                    return json.dumps({
-                        "key": "ds:5",
-                        "hash": "13",
-                        "data": parsed_array
-                    })
-                except json.JSONDecodeError:
-                    pass
+                # Wrap in standard ds:5 format
+                return json_dumps({
+                    "key": "ds:5",
+                    "hash": "13",
+                    "data": parsed_array
+                })
+            except json.JSONDecodeError:
+                pass
     
     # Fallback: basic cleaning
     json_str = re.sub(r'\bNaN\b', 'null', json_str)
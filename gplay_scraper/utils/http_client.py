@@ -13,12 +13,26 @@ With automatic fallback if the primary client fails.
 """
 
 import time
+import secrets
 import logging
-from typing import Optional
-from urllib.parse import quote
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait, FIRST_COMPLETED
+from typing import Optional, Tuple
 
 from ..config import Config
-from ..exceptions import AppNotFoundError, NetworkError
+from ..exceptions import AppNotFoundError, NetworkError, RateLimitError, HttpStatusError
+from .request_builder import (
+    PlayRequest, build_app_page_request, build_app_page_no_locale_request, build_search_request,
+    build_reviews_request, build_developer_request, build_cluster_request, build_list_request,
+    build_suggest_request, is_not_found_error, check_response_status,
+)
+from .rate_limiter import RateLimiter, default_rate_limiter
+from .retry_policy import RetryPolicy
+from .cache import ResponseCache, NegativeCache, cache_key, cache_ttl, cache_max_stale, fill_lock_key
+from .single_flight import SingleFlight
+from .hedging import LatencyTracker
+from .circuit_breaker import ClientHealth, ClientUnavailableError
+from .client_selector import ClientSelector
 
 logger = logging.getLogger(__name__)
 
@@ -39,28 +53,72 @@ class HttpClient:
     
     Features:
         - Automatic client fallback on failures
-        - Rate limiting to prevent blocks
+        - Token bucket rate limiting per endpoint family
         - Browser impersonation capabilities
         - Connection pooling and reuse
         - Comprehensive error handling
+    
+    Sessions:
+        Each client library gets one long-lived keep-alive session, created on
+        first use and reused by every later request. Call close() (or use the
+        client as a context manager) to release pooled connections.
     """
-    def __init__(self, rate_limit_delay: float = None, client_type: str = None):
+    def __init__(self, rate_limit_delay: float = None, client_type: str = None, pool_size: int = None,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None, cache: ResponseCache = None,
+                 negative_cache: NegativeCache = None, stale_while_revalidate: bool = None):
         """Initialize HTTP client with specified or default client type.
         
         Args:
-            rate_limit_delay: Delay between requests in seconds (default: 1.0)
+            rate_limit_delay: Delay between requests in seconds (default: 1.0, 0 disables)
             client_type: HTTP client to use - options:
                         'requests', 'curl_cffi', 'tls_client', 'urllib3',
-                        'cloudscraper', 'aiohttp', 'httpx' (default: 'requests')
+                        'cloudscraper', 'aiohttp', 'httpx' (default: 'requests'),
+                        or 'auto' to pick the best client per endpoint with a bandit
+            pool_size: Maximum keep-alive connections per session (default: 10)
+            rate_limiter: Optional RateLimiter (or any object with acquire(request)).
+                          Defaults to one token bucket per endpoint family at 1/rate_limit_delay.
+            retry_policy: Optional RetryPolicy for transport retries (default: Config retry settings)
+            cache: Optional ResponseCache for response bodies, e.g. MemoryCache() (default: no caching)
+            negative_cache: Optional NegativeCache remembering confirmed 404s (default: none)
+            stale_while_revalidate: Serve expired cache entries within Config.CACHE_MAX_STALE at once
+                                    and refresh them in the background (default: Config.STALE_WHILE_REVALIDATE)
         """
         self.headers = Config.get_headers()
         self.timeout = Config.DEFAULT_TIMEOUT
-        self.rate_limit_delay = rate_limit_delay or Config.RATE_LIMIT_DELAY
-        self.last_request_time = 0
+        self.rate_limit_delay = Config.RATE_LIMIT_DELAY if rate_limit_delay is None else rate_limit_delay
+        self.rate_limiter = rate_limiter or default_rate_limiter(self.rate_limit_delay)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.negative_cache = negative_cache
+        self.stale_while_revalidate = Config.STALE_WHILE_REVALIDATE if stale_while_revalidate is None else stale_while_revalidate
+        self._refresh_pool = None
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        # Identical concurrent requests share one fetch
+        self.single_flight = SingleFlight() if Config.SINGLE_FLIGHT else None
+        # Latency quantiles per endpoint decide when a slow request is hedged
+        self.latency = LatencyTracker()
+        self._hedge_pool = None
+        self._hedge_lock = threading.Lock()
         self.client_type = client_type or Config.DEFAULT_HTTP_CLIENT
+        self.pool_size = pool_size or Config.HTTP_POOL_SIZE
         self.available_clients = ["requests", "curl_cffi", "tls_client", "urllib3", "cloudscraper", "aiohttp", "httpx"]
         self.current_client_index = 0
+        self.health = ClientHealth(self.available_clients)
+        # "auto" ranks clients per endpoint by measured success and latency
+        self.selector = ClientSelector(self.available_clients) if self.client_type == "auto" else None
+        self._sessions = {}
+        self._session_lock = threading.Lock()
+        self._aiohttp_loop = None
+        self._aiohttp_lock = threading.Lock()
         self._setup_client()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
     
     def _setup_client(self):
         """Setup HTTP client based on client_type with automatic fallback.
@@ -106,8 +164,7 @@ class HttpClient:
         Fallback: curl_cffi (if requests unavailable)
         """
         try:
-            import requests
-            self.client = requests
+            self.client = self._get_session("requests")
             self.client_type = "requests"
         except ImportError:
             # Fallback to next available client
@@ -127,9 +184,7 @@ class HttpClient:
         Fallback: tls_client (if curl_cffi unavailable)
         """
         try:
-            from curl_cffi import requests as curl_requests
-            # Impersonate Chrome 110 for better compatibility
-            self.client = curl_requests.Session(impersonate="chrome110")
+            self.client = self._get_session("curl_cffi")
             self.client_type = "curl_cffi"
         except ImportError:
             # Fallback to next available client
@@ -149,11 +204,7 @@ class HttpClient:
         Fallback: urllib3 (if tls_client unavailable)
         """
         try:
-            import tls_client
-            self.client = tls_client.Session(
-                client_identifier="chrome112",  # Simulate Chrome 112
-                random_tls_extension_order=True  # Randomize TLS fingerprint
-            )
+            self.client = self._get_session("tls_client")
             self.client_type = "tls_client"
         except ImportError:
             # Fallback to next available client
@@ -173,9 +224,7 @@ class HttpClient:
         Fallback: cloudscraper (if urllib3 unavailable)
         """
         try:
-            import urllib3
-            # Use PoolManager for connection pooling
-            self.client = urllib3.PoolManager()
+            self.client = self._get_session("urllib3")
             self.client_type = "urllib3"
         except ImportError:
             # Fallback to next available client
@@ -195,9 +244,7 @@ class HttpClient:
         Fallback: aiohttp (if cloudscraper unavailable)
         """
         try:
-            import cloudscraper
-            # Create scraper with automatic anti-bot bypass
-            self.client = cloudscraper.create_scraper()
+            self.client = self._get_session("cloudscraper")
             self.client_type = "cloudscraper"
         except ImportError:
             # Fallback to next available client
@@ -214,14 +261,12 @@ class HttpClient:
             - Better performance for multiple requests
             - WebSocket support
         
-        Note: Used synchronously via asyncio.run() in this implementation
+        Note: Used synchronously via a private event loop owned by this client
         
         Fallback: httpx (if aiohttp unavailable)
         """
         try:
-            import aiohttp
-            # Store aiohttp module for async operations
-            self.client = aiohttp
+            self.client = self._get_session("aiohttp")
             self.client_type = "aiohttp"
         except ImportError:
             # Fallback to next available client
@@ -243,14 +288,132 @@ class HttpClient:
             ImportError: If no HTTP client libraries are available
         """
         try:
-            import httpx
-            # Create client with configured timeout
-            self.client = httpx.Client(timeout=self.timeout)
+            self.client = self._get_session("httpx")
             self.client_type = "httpx"
         except ImportError:
             # No more fallback options available
             raise ImportError(Config.ERROR_MESSAGES["NO_HTTP_CLIENT"])
     
+    def _get_session(self, client_type: str):
+        """Return the pooled session for a client library, creating it on first use.
+        
+        Args:
+            client_type: HTTP client name (requests, curl_cffi, etc.)
+            
+        Returns:
+            Long-lived session object for the client library
+            
+        Raises:
+            ImportError: If the client library is not installed
+        """
+        session = self._sessions.get(client_type)
+        if session is not None:
+            return session
+        with self._session_lock:
+            session = self._sessions.get(client_type)
+            if session is None:
+                session = self._create_session(client_type)
+                self._sessions[client_type] = session
+            return session
+
+    def _create_session(self, client_type: str):
+        """Create a keep-alive session sized to pool_size for a client library.
+        
+        Args:
+            client_type: HTTP client name (requests, curl_cffi, etc.)
+            
+        Returns:
+            New session object
+            
+        Raises:
+            ImportError: If the client library is not installed
+        """
+        if client_type == "requests":
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            return session
+        
+        if client_type == "curl_cffi":
+            from curl_cffi import requests as curl_requests
+            # Impersonate Chrome 110 for better compatibility
+            return curl_requests.Session(impersonate="chrome110")
+        
+        if client_type == "tls_client":
+            import tls_client
+            return tls_client.Session(
+                client_identifier="chrome112",  # Simulate Chrome 112
+                random_tls_extension_order=True  # Randomize TLS fingerprint
+            )
+        
+        if client_type == "urllib3":
+            import urllib3
+            return urllib3.PoolManager(num_pools=self.pool_size, maxsize=self.pool_size)
+        
+        if client_type == "cloudscraper":
+            import cloudscraper
+            from requests.adapters import HTTPAdapter
+            # Create scraper with automatic anti-bot bypass
+            session = cloudscraper.create_scraper()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            return session
+        
+        if client_type == "aiohttp":
+            import asyncio
+            import aiohttp
+            # aiohttp sessions are bound to the loop they were created on
+            self._aiohttp_loop = asyncio.new_event_loop()
+            
+            async def create():
+                connector = aiohttp.TCPConnector(limit=self.pool_size)
+                return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+            
+            return self._aiohttp_loop.run_until_complete(create())
+        
+        if client_type == "httpx":
+            import httpx
+            limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+            return httpx.Client(timeout=self.timeout, limits=limits)
+        
+        raise Exception(Config.ERROR_MESSAGES["UNKNOWN_CLIENT_TYPE"].format(client_type=client_type))
+
+    def close(self):
+        """Close all pooled sessions and release their connections.
+        
+        Safe to call more than once. Sessions are recreated on demand if the
+        client is used again after closing.
+        """
+        with self._session_lock:
+            sessions = self._sessions
+            self._sessions = {}
+        
+        with self._hedge_lock:
+            hedge_pool, self._hedge_pool = self._hedge_pool, None
+        if hedge_pool is not None:
+            hedge_pool.shutdown(wait=False)
+        with self._refresh_lock:
+            refresh_pool, self._refresh_pool = self._refresh_pool, None
+        if refresh_pool is not None:
+            refresh_pool.shutdown(wait=False)
+        
+        for client_type, session in sessions.items():
+            try:
+                if client_type == "aiohttp":
+                    self._aiohttp_loop.run_until_complete(session.close())
+                    self._aiohttp_loop.close()
+                    self._aiohttp_loop = None
+                elif client_type == "urllib3":
+                    session.clear()
+                elif hasattr(session, "close"):
+                    session.close()
+            except Exception as e:
+                logger.debug(f"Error closing {client_type} session: {e}")
+
     def fetch_app_page(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch app details page from Google Play Store.
         
@@ -272,26 +435,7 @@ class HttpClient:
         Example:
             html = client.fetch_app_page('com.whatsapp', 'en', 'us')
         """
-        self.rate_limit()
-        
-        url = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}&hl={lang}&gl={country}"
-        
-        try:
-            response = self._make_request("GET", url)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["APP_NOT_FOUND"].format(app_id=app_id))
-            # Retry without country parameter
-            url = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}&hl={lang}"
-            try:
-                response = self._make_request("GET", url)
-                return response.text
-            except Exception as e2:
-                if self._is_404_error(e2):
-                    raise AppNotFoundError(Config.ERROR_MESSAGES["APP_NOT_FOUND"].format(app_id=app_id))
-                logger.error(Config.ERROR_MESSAGES["APP_FETCH_FAILED"].format(app_id=app_id, error=e))
-                raise NetworkError(Config.ERROR_MESSAGES["APP_FETCH_FAILED"].format(app_id=app_id, error=e))
+        return self._fetch(build_app_page_request(app_id, lang, country))
     
     def fetch_app_page_no_locale(self, app_id: str) -> str:
         """Fetch app page without hl/gl parameters for fallback data.
@@ -302,13 +446,8 @@ class HttpClient:
         Returns:
             HTML content of app page
         """
-        self.rate_limit()
-        
-        url = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}"
-        
         try:
-            response = self._make_request("GET", url)
-            return response.text
+            return self._fetch(build_app_page_no_locale_request(app_id))
         except Exception as e:
             logger.error(f"Fallback fetch failed for {app_id}: {e}")
             return ""
@@ -330,51 +469,7 @@ class HttpClient:
             AppNotFoundError: If search fails
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
-        # Pagination request
-        if token and needed:
-            url = f"{Config.PLAY_STORE_BASE_URL}/_/PlayStoreUi/data/batchexecute"
-            params = f"rpcids=qnKhOb&source-path=%2Fwork%2Fsearch&hl={lang}&gl={country}"
-            
-            body = f'f.req=%5B%5B%5B%22qnKhOb%22%2C%22%5B%5Bnull%2C%5B%5B10%2C%5B10%2C{needed}%5D%5D%2Ctrue%2Cnull%2C%5B96%2C27%2C4%2C8%2C57%2C30%2C110%2C79%2C11%2C16%2C49%2C1%2C3%2C9%2C12%2C104%2C55%2C56%2C51%2C10%2C34%2C77%5D%5D%2Cnull%2C%5C%22{token}%5C%22%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D'
-            
-            headers = {
-                **self.headers,
-                "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"
-            }
-            
-            try:
-                response = self._make_request("POST", f"{url}?{params}", data=body, headers=headers)
-                return response.text
-            except Exception as e:
-                logger.error(Config.ERROR_MESSAGES["SEARCH_PAGINATION_FAILED"].format(error=e))
-                raise NetworkError(Config.ERROR_MESSAGES["SEARCH_PAGINATION_FAILED"].format(error=e))
-        
-        # Initial search request
-        elif query:
-            encoded_query = quote(query)
-            url = f"{Config.PLAY_STORE_BASE_URL}/work/search?q={encoded_query}&hl={lang}&gl={country}&price=0"
-            
-            try:
-                response = self._make_request("GET", url)
-                return response.text
-            except Exception as e:
-                if self._is_404_error(e):
-                    raise AppNotFoundError(Config.ERROR_MESSAGES["SEARCH_NOT_FOUND"].format(query=query))
-                url = f"{Config.PLAY_STORE_BASE_URL}/work/search?q={encoded_query}&hl={lang}&price=0"
-                try:
-                    response = self._make_request("GET", url)
-                    return response.text
-                except Exception as e2:
-                    if self._is_404_error(e2):
-                        raise AppNotFoundError(Config.ERROR_MESSAGES["SEARCH_NOT_FOUND"].format(query=query))
-                    logger.error(Config.ERROR_MESSAGES["SEARCH_FETCH_FAILED"].format(query=query, error=e))
-                    raise NetworkError(Config.ERROR_MESSAGES["SEARCH_FETCH_FAILED"].format(query=query, error=e))
-        
-        else:
-            raise ValueError("Either query or (token and needed) must be provided")
-
+        return self._fetch(build_search_request(query, token, needed, lang, country))
 
     def fetch_reviews_batch(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, 
                            sort: int = Config.DEFAULT_REVIEWS_SORT, batch_count: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, token: str = None) -> str:
@@ -395,28 +490,7 @@ class HttpClient:
             AppNotFoundError: If reviews not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
-        url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?hl={lang}&gl={country}"
-        
-        headers = {
-            **self.headers,
-            "content-type": "application/x-www-form-urlencoded"
-        }
-        
-        if token:
-            payload = f"f.req=%5B%5B%5B%22oCPfdb%22%2C%22%5Bnull%2C%5B2%2C{sort}%2C%5B{batch_count}%2Cnull%2C%5C%22{token}%5C%22%5D%2Cnull%2C%5Bnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%5D%5D%2C%5B%5C%22{app_id}%5C%22%2C7%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D"
-        else:
-            payload = f"f.req=%5B%5B%5B%22oCPfdb%22%2C%22%5Bnull%2C%5B2%2C{sort}%2C%5B{batch_count}%5D%2Cnull%2C%5Bnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%5D%5D%2C%5B%5C%22{app_id}%5C%22%2C7%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D"
-        
-        try:
-            response = self._make_request("POST", url, data=payload, headers=headers)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["REVIEWS_NOT_FOUND"].format(app_id=app_id))
-            logger.error(Config.ERROR_MESSAGES["REVIEWS_FETCH_FAILED"].format(app_id=app_id, error=e))
-            raise NetworkError(Config.ERROR_MESSAGES["REVIEWS_FETCH_FAILED"].format(app_id=app_id, error=e))
+        return self._fetch(build_reviews_request(app_id, lang, country, sort, batch_count, token))
 
     def fetch_developer_page(self, dev_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch developer portfolio page from Google Play Store.
@@ -433,31 +507,7 @@ class HttpClient:
             AppNotFoundError: If developer not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
-        if dev_id.isdigit():
-            url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_NUMERIC_ENDPOINT}?id={quote(dev_id)}&hl={lang}&gl={country}"
-        else:
-            url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_STRING_ENDPOINT}?id={quote(dev_id)}&hl={lang}&gl={country}"
-        
-        try:
-            response = self._make_request("GET", url)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["DEVELOPER_NOT_FOUND"].format(dev_id=dev_id))
-            if dev_id.isdigit():
-                url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_NUMERIC_ENDPOINT}?id={quote(dev_id)}&hl={lang}"
-            else:
-                url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_STRING_ENDPOINT}?id={quote(dev_id)}&hl={lang}"
-            try:
-                response = self._make_request("GET", url)
-                return response.text
-            except Exception as e2:
-                if self._is_404_error(e2):
-                    raise AppNotFoundError(Config.ERROR_MESSAGES["DEVELOPER_NOT_FOUND"].format(dev_id=dev_id))
-                logger.error(Config.ERROR_MESSAGES["DEVELOPER_FETCH_FAILED"].format(dev_id=dev_id, error=e))
-                raise NetworkError(Config.ERROR_MESSAGES["DEVELOPER_FETCH_FAILED"].format(dev_id=dev_id, error=e))
+        return self._fetch(build_developer_request(dev_id, lang, country))
 
     def fetch_cluster_page(self, cluster_url: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch cluster page (similar apps collection) from Google Play Store.
@@ -474,18 +524,7 @@ class HttpClient:
             AppNotFoundError: If cluster not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
-        url = f"{Config.PLAY_STORE_BASE_URL}{cluster_url}&gl={country}&hl={lang}"
-        
-        try:
-            response = self._make_request("GET", url)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["CLUSTER_NOT_FOUND"].format(cluster_url=cluster_url))
-            logger.error(Config.ERROR_MESSAGES["CLUSTER_FETCH_FAILED"].format(error=e))
-            raise NetworkError(Config.ERROR_MESSAGES["CLUSTER_FETCH_FAILED"].format(error=e))
+        return self._fetch(build_cluster_request(cluster_url, lang, country))
 
     def fetch_list_page(self, collection: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch top charts list page from Google Play Store.
@@ -504,25 +543,7 @@ class HttpClient:
             AppNotFoundError: If list not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
-        body = f'f.req=%5B%5B%5B%22vyAe2%22%2C%22%5B%5Bnull%2C%5B%5B8%2C%5B20%2C{count}%5D%5D%2Ctrue%2Cnull%2C%5B64%2C1%2C195%2C71%2C8%2C72%2C9%2C10%2C11%2C139%2C12%2C16%2C145%2C148%2C150%2C151%2C152%2C27%2C30%2C31%2C96%2C32%2C34%2C163%2C100%2C165%2C104%2C169%2C108%2C110%2C113%2C55%2C56%2C57%2C122%5D%2C%5Bnull%2Cnull%2C%5B%5B%5Btrue%5D%2Cnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%2Cnull%2Cnull%2Cnull%2Cnull%2C%5Bnull%2C2%5D%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B1%5D%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B1%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%2Cnull%2C%5Btrue%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%5D%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B%5B%5Bnull%2C%5B%5D%5D%5D%5D%2C%5B%5B%5Bnull%2C%5B%5D%5D%5D%5D%5D%2C%5B%5B%5B%5B7%2C1%5D%2C%5B%5B1%2C73%2C96%2C103%2C97%2C58%2C50%2C92%2C52%2C112%2C69%2C19%2C31%2C101%2C123%2C74%2C49%2C80%2C38%2C20%2C10%2C14%2C79%2C43%2C42%2C139%5D%5D%5D%5D%5D%5D%2Cnull%2Cnull%2C%5B%5B%5B1%2C2%5D%2C%5B10%2C8%2C9%5D%2C%5B%5D%2C%5B%5D%5D%5D%5D%2C%5B2%2C%5C%22{collection}%5C%22%2C%5C%22{category}%5C%22%5D%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D&at=AFSRYlx8XZfN8-O-IKASbNBDkB6T%3A1655531200971&'
-        
-        url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?rpcids=vyAe2&source-path=%2Fstore%2Fapps&hl={lang}&gl={country}"
-        
-        headers = {
-            **self.headers,
-            "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"
-        }
-        
-        try:
-            response = self._make_request("POST", url, data=body, headers=headers)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["LIST_NOT_FOUND"].format(collection=collection, category=category))
-            logger.error(Config.ERROR_MESSAGES["LIST_FETCH_FAILED"].format(error=e))
-            raise NetworkError(Config.ERROR_MESSAGES["LIST_FETCH_FAILED"].format(error=e))
+        return self._fetch(build_list_request(collection, category, count, lang, country))
 
     def fetch_suggest_page(self, term: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch search suggestions from Google Play Store.
@@ -539,37 +560,265 @@ class HttpClient:
             AppNotFoundError: If suggestions not found
             NetworkError: If request fails
         """
-        self.rate_limit()
+        return self._fetch(build_suggest_request(term, lang, country))
+
+    def _fetch(self, request: PlayRequest) -> str:
+        """Send a PlayRequest through the response cache and single-flight.
+        
+        Fresh cached responses are returned without a network call, and
+        so are 404s remembered by the negative cache. In stale-while-revalidate
+        mode an expired entry within its max staleness is returned as well,
+        and one background refresh per request replaces it.
+        Threads asking for the same method, URL and body at the same time
+        wait for one fetch instead of each sending their own.
+        
+        Args:
+            request: Request description from request_builder
+            
+        Returns:
+            Response body text
+            
+        Raises:
+            AppNotFoundError: If the server answers 404 and the request maps 404s
+            RateLimitError: If the server answers 429/503
+            NetworkError: If every URL fails
+        """
+        if self.negative_cache is not None:
+            message = self.negative_cache.get(request)
+            if message is not None:
+                raise AppNotFoundError(message, confirmed=True)
+        ttl = cache_ttl(request) if self.cache is not None else 0
+        max_stale = cache_max_stale(request) if ttl and self.stale_while_revalidate else 0
+        if max_stale:
+            entry = self.cache.get_stale(cache_key(request), max_stale)
+            if entry is not None:
+                if entry[1] > 0:
+                    self._schedule_refresh(request, ttl)
+                return entry[0]
+        elif ttl:
+            cached = self.cache.get(cache_key(request))
+            if cached is not None:
+                return cached
+        return self._fetch_shared(request, ttl)
+
+    def _fetch_shared(self, request: PlayRequest, ttl: float) -> str:
+        """Fetch and store a request, sharing the fetch with identical concurrent requests."""
+        if self.single_flight is None:
+            return self._fetch_and_store(request, ttl)
+        return self.single_flight.do(request.key, lambda: self._fetch_and_store(request, ttl))
+
+    def _schedule_refresh(self, request: PlayRequest, ttl: float) -> None:
+        """Refresh a stale cache entry on a worker thread unless a refresh is already running."""
+        with self._refresh_lock:
+            if request.key in self._refreshing:
+                return
+            if self._refresh_pool is None:
+                self._refresh_pool = ThreadPoolExecutor(max_workers=Config.REFRESH_WORKERS, thread_name_prefix="gplay-refresh")
+            self._refreshing.add(request.key)
+            self._refresh_pool.submit(self._refresh, request, ttl)
+
+    def _refresh(self, request: PlayRequest, ttl: float) -> None:
+        """Replace a stale cache entry; failures keep serving the stale copy."""
+        try:
+            self._fetch_shared(request, ttl)
+        except AppNotFoundError:
+            # The resource is gone, stop serving its old page
+            self.cache.delete(cache_key(request))
+        except Exception as e:
+            logger.warning(f"Background refresh of {request.endpoint} failed, serving stale data: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(request.key)
+
+    def _fetch_and_store(self, request: PlayRequest, ttl: float) -> str:
+        """Fetch a request and store the response in the cache for ttl seconds.
+        
+        With a shared cache only the process holding the fill lock fetches;
+        the others wait for its response to appear in the cache. The lock
+        holds a random token and is released only if it still holds it, so
+        a fetch outliving the lock TTL never frees another process's lock.
+        """
+        token = None
+        if ttl and self.cache.shared:
+            text, token = self._wait_for_fill(request)
+            if text is not None:
+                return text
+        try:
+            text = self._fetch_with_retry(request)
+            if ttl:
+                self.cache.set(cache_key(request), text, ttl)
+        except AppNotFoundError as e:
+            if self.negative_cache is not None and self.negative_cache.add(request, str(e)):
+                e.confirmed = True
+            raise
+        finally:
+            if token is not None:
+                self.cache.delete_if(fill_lock_key(cache_key(request)), token)
+        return text
+
+    def _wait_for_fill(self, request: PlayRequest) -> Tuple[Optional[str], Optional[str]]:
+        """Take the shared cache fill lock, or wait for the process holding it.
+        
+        Gives up waiting after Config.CACHE_FILL_LOCK_TTL, e.g. when the
+        cache server is unreachable, and lets the caller fetch without it.
+        
+        Returns:
+            (response stored by another process or None,
+             this process's lock token if it holds the lock, else None)
+        """
+        key = cache_key(request)
+        deadline = time.monotonic() + Config.CACHE_FILL_LOCK_TTL
+        token = secrets.token_hex(16)
+        while not self.cache.add(fill_lock_key(key), token, Config.CACHE_FILL_LOCK_TTL):
+            if time.monotonic() >= deadline:
+                return None, None
+            time.sleep(Config.CACHE_FILL_POLL)
+            text = self.cache.get(key)
+            if text is not None:
+                return text, None
+        return None, token
+
+    def _fetch_with_retry(self, request: PlayRequest) -> str:
+        """Send a PlayRequest, retrying transient failures under the retry policy.
         
-        encoded_term = quote(term)
-        url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?rpcids=IJ4APc&f.sid=-697906427155521722&bl=boq_playuiserver_20190903.08_p0&hl={lang}&gl={country}&authuser&soc-app=121&soc-platform=1&soc-device=1&_reqid=1065213"
+        Throttling, 5xx responses and transport errors are retried with capped,
+        jittered exponential backoff (at least Retry-After) while the retry
+        budget allows.
         
-        body = f"f.req=%5B%5B%5B%22IJ4APc%22%2C%22%5B%5Bnull%2C%5B%5C%22{encoded_term}%5C%22%5D%2C%5B10%5D%2C%5B2%5D%2C4%5D%5D%22%5D%5D%5D"
+        Args:
+            request: Request description from request_builder
+            
+        Returns:
+            Response body text
+            
+        Raises:
+            AppNotFoundError: If the server answers 404 and the request maps 404s
+            RateLimitError: If the server answers 429/503
+            NetworkError: If every URL fails
+        """
+        self.retry_policy.start()
+        attempt = 0
+        while True:
+            # Every attempt, including retries, takes a rate limiter token
+            self.rate_limit(request)
+            try:
+                return self._send_hedged(request)
+            except Exception as e:
+                delay = self.retry_policy.next_delay(attempt, e)
+                if delay is None:
+                    raise
+                logger.warning(f"Retry {attempt + 1} for {request.endpoint} in {delay:.2f}s: {e}")
+            finally:
+                self.rate_limiter.release(request)
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_hedged(self, request: PlayRequest) -> str:
+        """Send a request, hedging it if it is slower than usual for its endpoint.
         
-        headers = {
-            **self.headers,
-            "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"
-        }
+        With Config.HEDGE_REQUESTS enabled, requests to Config.HEDGE_ENDPOINTS
+        run on a worker thread. If no answer arrives within the endpoint's
+        latency quantile, a second copy is sent if a rate limiter token is free
+        at once and the retry budget allows it. The first successful answer wins. A thread
+        blocked in a socket cannot be interrupted, so the losing copy is left
+        to finish in the background and its answer is discarded.
         
+        Args:
+            request: Request description from request_builder
+            
+        Returns:
+            Response body text
+        """
+        delay = None
+        if Config.HEDGE_REQUESTS and request.endpoint in Config.HEDGE_ENDPOINTS:
+            delay = self.latency.hedge_delay(request.endpoint)
+        if delay is None:
+            return self._send(request)
+        
+        pool = self._get_hedge_pool()
+        primary = pool.submit(self._send, request)
         try:
-            response = self._make_request("POST", url, data=body, headers=headers)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["SUGGEST_NOT_FOUND"].format(term=term))
-            logger.error(Config.ERROR_MESSAGES["SUGGEST_FETCH_FAILED"].format(term=term, error=e))
-            raise NetworkError(Config.ERROR_MESSAGES["SUGGEST_FETCH_FAILED"].format(term=term, error=e))
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        
+        # Hedges are extra load: they need a retry budget token and a free rate limiter token.
+        # The primary holds the concurrency slot, so waiting for one here could deadlock.
+        if not self.retry_policy.budget.withdraw() or not self.rate_limiter.try_acquire(request):
+            return primary.result()
+        logger.info(f"Hedging {request.endpoint} request after {delay:.2f}s")
+        hedge = pool.submit(self._send, request)
+        
+        pending = {primary, hedge}
+        first_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                first_error = first_error or future.exception()
+        raise first_error
+
+    def _get_hedge_pool(self) -> ThreadPoolExecutor:
+        """Return the worker pool for hedged requests, creating it on first use."""
+        with self._hedge_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=self.pool_size * 2, thread_name_prefix="gplay-hedge")
+            return self._hedge_pool
+
+    def _send(self, request: PlayRequest) -> str:
+        """Try each URL of a request and report the outcome to the rate limiter.
+        
+        Args:
+            request: Request description from request_builder
+            
+        Returns:
+            Response body text
+            
+        Raises:
+            AppNotFoundError: If the server answers 404 and the request maps 404s
+            RateLimitError: If the server answers 429/503
+            NetworkError: If every URL fails
+        """
+        headers = {**self.headers, **request.headers}
+        first_error = None
+        
+        for url in request.urls:
+            started = time.monotonic()
+            try:
+                response = self._make_request(request.method, url, endpoint=request.endpoint, data=request.data, headers=headers)
+                latency = time.monotonic() - started
+                self.rate_limiter.record(request, response.status_code, latency)
+                self.latency.record(request.endpoint, latency)
+                return response.text
+            except RateLimitError as e:
+                self.rate_limiter.record(request, e.status_code, time.monotonic() - started, e.retry_after)
+                raise
+            except Exception as e:
+                if request.not_found and self._is_404_error(e):
+                    raise AppNotFoundError(request.not_found)
+                first_error = first_error or e
+                if not isinstance(e, HttpStatusError):
+                    # Transport failure: leave it to the retry policy rather than trying more URLs
+                    break
+        
+        logger.error(request.failure_message(first_error))
+        raise NetworkError(request.failure_message(first_error)) from first_error
 
-    def _make_request(self, method: str, url: str, **kwargs):
+    def _make_request(self, method: str, url: str, endpoint: str = None, **kwargs):
         """Make HTTP request with automatic client fallback.
         
         Attempts to make an HTTP request using the configured client. If the request
         fails, automatically tries other available HTTP clients in priority order
-        until one succeeds or all clients are exhausted.
+        until one succeeds or all clients are exhausted. In 'auto' mode the order
+        comes from the per-endpoint ClientSelector, which is fed every outcome.
         
         Args:
             method: HTTP method (GET or POST)
             url: Request URL
+            endpoint: Endpoint name used by 'auto' client selection
             **kwargs: Additional request parameters (data, headers, etc.)
             
         Returns:
@@ -582,25 +831,55 @@ class HttpClient:
             response = self._make_request("GET", "https://example.com")
             content = response.text
         """
-        # Build list of clients to try, starting with preferred client
-        clients_to_try = [self.client_type]
-        all_clients = ["requests", "curl_cffi", "tls_client", "urllib3", "cloudscraper", "aiohttp", "httpx"]
-        
-        # Add remaining clients as fallback options
-        for client in all_clients:
-            if client != self.client_type:
-                clients_to_try.append(client)
+        selector = self.selector if endpoint else None
+        if selector is not None:
+            # Bandit ranking for this endpoint, best measured client first
+            clients_to_try = selector.order(endpoint, [c for c in self.available_clients if self.health.is_usable(c)])
+        else:
+            # Build list of clients to try, starting with preferred client
+            clients_to_try = [self.client_type]
+            
+            # Add remaining clients as fallback options
+            for client in self.available_clients:
+                if client != self.client_type:
+                    clients_to_try.append(client)
         
         last_error = None
         
-        # Try each client until one succeeds
+        # Try each client until one succeeds, skipping unavailable or open-circuit clients
         for client_type in clients_to_try:
+            breaker = self.health.breaker(client_type)
+            if not breaker.allow():
+                continue
+            started = time.monotonic()
             try:
-                return self._try_request_with_client(client_type, method, url, **kwargs)
+                response = self._try_request_with_client(client_type, method, url, **kwargs)
+                breaker.record_success()
+                if selector is not None:
+                    selector.record(endpoint, client_type, True, time.monotonic() - started)
+                return response
+            except (RateLimitError, HttpStatusError) as e:
+                # The server answered, so the client itself is healthy
+                breaker.record_success()
+                if selector is not None and e.status_code != 404:
+                    # Throttled or blocked: this client is not being served on this endpoint
+                    selector.record(endpoint, client_type, False)
+                # The answer comes from the server, so another library would get it too;
+                # raising keeps one rate limiter token per real request
+                raise
+            except ClientUnavailableError as e:
+                breaker.mark_unavailable()
+                last_error = last_error or e
             except Exception as e:
+                breaker.record_failure()
+                if selector is not None:
+                    selector.record(endpoint, client_type, False)
                 last_error = e
                 logger.warning(Config.ERROR_MESSAGES["CLIENT_FAILED_TRYING_NEXT"].format(client_type=client_type, error=e))
-                continue
+        
+        if last_error is None:
+            # Every breaker is open: fail fast instead of waiting on timeouts
+            raise NetworkError(Config.ERROR_MESSAGES["ALL_CLIENTS_UNAVAILABLE"])
         
         # All clients failed, raise the last error
         raise last_error
@@ -629,105 +908,62 @@ class HttpClient:
         """
         headers = kwargs.get('headers', self.headers)
         
-        if client_type == "requests":
-            try:
-                import requests
-                if method == "GET":
-                    response = requests.get(url, headers=headers, timeout=self.timeout)
-                else:
-                    response = requests.post(url, data=kwargs.get('data'), headers=headers, timeout=self.timeout)
-                response.raise_for_status()
-                return response
-            except ImportError:
-                raise Exception(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client="requests"))
+        try:
+            session = self._get_session(client_type)
+        except ImportError:
+            raise ClientUnavailableError(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client=client_type))
         
-        elif client_type == "curl_cffi":
-            try:
-                from curl_cffi import requests as curl_requests
-                session = curl_requests.Session(impersonate="chrome110")
-                if method == "GET":
-                    response = session.get(url, headers=headers, timeout=self.timeout)
-                else:
-                    response = session.post(url, data=kwargs.get('data'), headers=headers, timeout=self.timeout)
-                response.raise_for_status()
-                return response
-            except ImportError:
-                raise Exception(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client="curl_cffi"))
+        if client_type in ("requests", "curl_cffi", "cloudscraper"):
+            if method == "GET":
+                response = session.get(url, headers=headers, timeout=self.timeout)
+            else:
+                response = session.post(url, data=kwargs.get('data'), headers=headers, timeout=self.timeout)
+            check_response_status(response.status_code, response.headers)
+            return response
         
         elif client_type == "tls_client":
-            try:
-                import tls_client
-                session = tls_client.Session(client_identifier="chrome112", random_tls_extension_order=True)
-                if method == "GET":
-                    response = session.get(url, headers=headers)
-                else:
-                    response = session.post(url, data=kwargs.get('data'), headers=headers)
-                if response.status_code >= 400:
-                    raise Exception(Config.ERROR_MESSAGES["HTTP_ERROR"].format(status_code=response.status_code))
-                return response
-            except ImportError:
-                raise Exception(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client="tls_client"))
+            if method == "GET":
+                response = session.get(url, headers=headers)
+            else:
+                response = session.post(url, data=kwargs.get('data'), headers=headers)
+            check_response_status(response.status_code, response.headers)
+            return response
         
         elif client_type == "httpx":
-            try:
-                import httpx
-                with httpx.Client(timeout=self.timeout) as client:
-                    if method == "GET":
-                        response = client.get(url, headers=headers)
-                    else:
-                        response = client.post(url, data=kwargs.get('data'), headers=headers)
-                    response.raise_for_status()
-                    return response
-            except ImportError:
-                raise Exception(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client="httpx"))
+            if method == "GET":
+                response = session.get(url, headers=headers)
+            else:
+                response = session.post(url, content=kwargs.get('data'), headers=headers)
+            check_response_status(response.status_code, response.headers)
+            return response
         
         elif client_type == "urllib3":
-            try:
-                import urllib3
-                http = urllib3.PoolManager()
-                if method == "GET":
-                    response = http.request('GET', url, headers=headers)
-                else:
-                    response = http.request('POST', url, body=kwargs.get('data'), headers=headers)
-                if response.status >= 400:
-                    raise Exception(Config.ERROR_MESSAGES["HTTP_ERROR"].format(status_code=response.status))
-                class MockResponse:
-                    def __init__(self, data, status):
-                        self.text = data.decode('utf-8')
-                        self.status_code = status
-                    def raise_for_status(self):
-                        pass
-                return MockResponse(response.data, response.status)
-            except ImportError:
-                raise Exception(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client="urllib3"))
-        
-        elif client_type == "cloudscraper":
-            try:
-                import cloudscraper
-                scraper = cloudscraper.create_scraper()
-                if method == "GET":
-                    response = scraper.get(url, headers=headers, timeout=self.timeout)
-                else:
-                    response = scraper.post(url, data=kwargs.get('data'), headers=headers, timeout=self.timeout)
-                response.raise_for_status()
-                return response
-            except ImportError:
-                raise Exception(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client="cloudscraper"))
+            if method == "GET":
+                response = session.request('GET', url, headers=headers)
+            else:
+                response = session.request('POST', url, body=kwargs.get('data'), headers=headers)
+            check_response_status(response.status, response.headers)
+            class MockResponse:
+                def __init__(self, data, status, headers):
+                    self.text = data.decode('utf-8')
+                    self.status_code = status
+                    self.headers = headers
+                def raise_for_status(self):
+                    pass
+            return MockResponse(response.data, response.status, response.headers)
         
-
         elif client_type == "aiohttp":
-            try:
-                import asyncio
-                return asyncio.run(self._async_request(method, url, **kwargs))
-            except ImportError:
-                raise Exception(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client="aiohttp"))
+            # The private loop is not re-entrant, so serialize callers
+            with self._aiohttp_lock:
+                return self._aiohttp_loop.run_until_complete(self._async_request(session, method, url, **kwargs))
         
         raise Exception(Config.ERROR_MESSAGES["UNKNOWN_CLIENT_TYPE"].format(client_type=client_type))
     
-    async def _async_request(self, method: str, url: str, **kwargs):
-        """Async HTTP request using aiohttp.
+    async def _async_request(self, session, method: str, url: str, **kwargs):
+        """Async HTTP request using the pooled aiohttp session.
         
         Args:
+            session: Pooled aiohttp ClientSession
             method: HTTP method (GET or POST)
             url: Request URL
             **kwargs: Additional request parameters
@@ -735,30 +971,24 @@ class HttpClient:
         Returns:
             MockResponse object with text attribute
         """
-        import aiohttp
         headers = kwargs.get('headers', self.headers)
         
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-            if method == "GET":
-                async with session.get(url, headers=headers) as response:
-                    response.raise_for_status()
-                    text = await response.text()
-                    class MockResponse:
-                        def __init__(self, text):
-                            self.text = text
-                        def raise_for_status(self):
-                            pass
-                    return MockResponse(text)
-            else:
-                async with session.post(url, data=kwargs.get('data'), headers=headers) as response:
-                    response.raise_for_status()
-                    text = await response.text()
-                    class MockResponse:
-                        def __init__(self, text):
-                            self.text = text
-                        def raise_for_status(self):
-                            pass
-                    return MockResponse(text)
+        class MockResponse:
+            def __init__(self, text, status, headers):
+                self.text = text
+                self.status_code = status
+                self.headers = headers
+            def raise_for_status(self):
+                pass
+        
+        if method == "GET":
+            request = session.get(url, headers=headers)
+        else:
+            request = session.post(url, data=kwargs.get('data'), headers=headers)
+        async with request as response:
+            check_response_status(response.status, response.headers)
+            text = await response.text()
+            return MockResponse(text, response.status, response.headers)
     
     def _is_404_error(self, error: Exception) -> bool:
         """Check if error is a 404 not found error.
@@ -776,9 +1006,7 @@ class HttpClient:
             if self._is_404_error(exception):
                 raise AppNotFoundError("App not found")
         """
-        error_str = str(error).lower()
-        # Check for common 404 error indicators
-        return "404" in error_str or "not found" in error_str
+        return is_not_found_error(error)
     
     def _try_next_client(self):
         """Switch to next available HTTP client for retry.
@@ -791,42 +1019,53 @@ class HttpClient:
             2. Log the client switch
             3. Reinitialize with new client
             
+        Returns:
+            True if a usable client was selected, False if every client is
+            unavailable or has an open circuit breaker
+            
         Note:
             Called automatically by error handling decorators when retries are needed
         """
-        # Cycle to next available client
-        self.current_client_index = (self.current_client_index + 1) % len(self.available_clients)
-        next_client = self.available_clients[self.current_client_index]
+        # Cycle to next client whose circuit breaker is not open
+        for _ in range(len(self.available_clients)):
+            self.current_client_index = (self.current_client_index + 1) % len(self.available_clients)
+            next_client = self.available_clients[self.current_client_index]
+            if self.health.is_usable(next_client):
+                break
+        else:
+            logger.warning(Config.ERROR_MESSAGES["ALL_CLIENTS_UNAVAILABLE"])
+            return False
         
         logger.info(f"Switching to HTTP client: {next_client}")
         
         # Update client type and reinitialize
         self.client_type = next_client
-        self._setup_client()
+        try:
+            self._setup_client()
+        except Exception as e:
+            # Client cannot be initialised here; never pick it again and move on
+            logger.warning(Config.ERROR_MESSAGES["CLIENT_FAILED_TRYING_NEXT"].format(client_type=next_client, error=e))
+            self.health.breaker(next_client).mark_unavailable()
+            return self._try_next_client()
+        return True
     
-    def rate_limit(self):
-        """Apply rate limiting delay between requests.
+    def rate_limit(self, request: PlayRequest = None):
+        """Wait for the rate limiter to admit a request.
         
-        Implements rate limiting to prevent overwhelming the Google Play Store
-        servers and avoid getting blocked. Calculates the time since the last
-        request and sleeps if necessary to maintain the configured delay.
+        Takes one token from the request's bucket (per endpoint family by
+        default), sleeping only if the bucket is empty. Safe to call from
+        many threads at once: concurrent callers are spaced by the bucket
+        instead of racing on a shared timestamp.
         
-        Rate Limiting Strategy:
-            - Tracks time of last request
-            - Enforces minimum delay between requests
-            - Prevents rapid-fire requests that could trigger blocks
+        Args:
+            request: PlayRequest about to be sent. Without one, only a token
+                     from the 'global' bucket is taken, never a concurrency
+                     slot, so callers pacing their own work need no release.
             
         Note:
             Called automatically before each HTTP request
         """
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        # Check if we need to wait before making the next request
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            logger.debug(Config.ERROR_MESSAGES["RATE_LIMIT_SLEEP"].format(sleep_time=sleep_time))
-            time.sleep(sleep_time)
-        
-        # Update last request time
-        self.last_request_time = time.time()
\ No newline at end of file
+        if request is None:
+            self.rate_limiter.acquire_token()
+            return
+        self.rate_limiter.acquire(request)
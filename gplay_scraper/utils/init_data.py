@@ -0,0 +1,131 @@
+"""Single-pass index of the AF_initDataCallback blocks in a Play Store page.
+
+Play Store HTML pages embed their data as script calls like
+
+    AF_initDataCallback({key: 'ds:5', hash: '13', data:[...], sideChannel: {}});
+
+InitDataIndex walks the page once with str.find and precompiled anchored
+patterns, recording the offsets of every `ds:N` block. Nothing is copied or
+decoded until a key is asked for, and each decoded value is kept, so a
+page scanned once serves every later lookup.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+from .json_codec import json_loads
+
+_MARKER = "AF_initDataCallback"
+_OPEN = re.compile(r"AF_initDataCallback\s*\(\s*(?=\{)")
+_LEADING_KEY = re.compile(r"\{\s*key\s*:\s*['\"]([^'\"]+)['\"]")
+_ANY_KEY = re.compile(r"\bkey\s*:\s*['\"](ds:[^'\"]+)['\"]")
+_DATA = re.compile(r"\bdata\s*:\s*")
+_MISSING = object()
+
+
+class InitDataIndex:
+    """Offsets of every AF_initDataCallback object literal in a page, decoded on demand.
+
+    Example:
+        index = InitDataIndex(html)
+        literal = index.literal("ds:5")   # object literal text, for clean_json_string
+        data = index.data("ds:1")         # decoded `data` array
+    """
+
+    def __init__(self, html: str):
+        """Scan the page once and record the span of each callback.
+
+        Args:
+            html: HTML page content
+        """
+        self.html = html or ""
+        self.spans: Dict[str, Tuple[int, int]] = {}
+        self._decoded: Dict[str, Any] = {}
+        self._scan()
+
+    def _scan(self) -> None:
+        html = self.html
+        pos = html.find(_MARKER)
+        while pos != -1:
+            following = html.find(_MARKER, pos + len(_MARKER))
+            opened = _OPEN.match(html, pos)
+            if opened is not None:
+                start = opened.end()
+                # The call ends before its </script>, or before the next callback at the latest
+                boundary = html.find("</script", start)
+                if boundary == -1 or (following != -1 and following < boundary):
+                    boundary = following if following != -1 else len(html)
+                close = html.rfind(")", start, boundary)
+                stop = html.rfind("}", start, close) + 1 if close != -1 else 0
+                if stop > start:
+                    key = _LEADING_KEY.match(html, start)
+                    if key is None:
+                        key = _ANY_KEY.search(html, start, stop)
+                    if key is not None:
+                        self.spans.setdefault(key.group(1), (start, stop))
+            pos = following
+
+    def keys(self) -> List[str]:
+        """Return the dataset keys found on the page, in page order."""
+        return list(self.spans)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.spans
+
+    def literal(self, key: str) -> str:
+        """Return the object literal text for a key, or an empty string if it is missing."""
+        span = self.spans.get(key)
+        return self.html[span[0]:span[1]] if span else ""
+
+    def data_text(self, key: str) -> str:
+        """Return the text of the literal's `data` value, or an empty string if it is missing."""
+        span = self.spans.get(key)
+        if not span:
+            return ""
+        start, stop = span
+        data = _DATA.search(self.html, start, stop)
+        if data is None:
+            return ""
+        end = self.html.rfind(", sideChannel", data.end(), stop)
+        if end == -1:
+            end = stop - 1
+        return self.html[data.end():end].strip()
+
+    def data(self, key: str, default: Any = None) -> Any:
+        """Decode the literal's `data` value as JSON, once per key.
+
+        Args:
+            key: Dataset key such as 'ds:1'
+            default: Value returned when the key is missing or not valid JSON
+
+        Returns:
+            The decoded data
+        """
+        if key not in self._decoded:
+            try:
+                self._decoded[key] = json_loads(self.data_text(key))
+            except ValueError:
+                return default
+        return self._decoded[key]
+
+    def datasets(self) -> Dict[str, Any]:
+        """Decode every block whose data is valid JSON."""
+        result = {}
+        for key in self.spans:
+            value = self.data(key, _MISSING)
+            if value is not _MISSING:
+                result[key] = value
+        return result
+
+
+def find_init_data(html_content: str, ds_key: str) -> str:
+    """Find the AF_initDataCallback object literal for a dataset key.
+
+    Args:
+        html_content: HTML page content
+        ds_key: Dataset key (e.g., 'ds:5')
+
+    Returns:
+        Object literal text for the dataset, or empty string if not found
+    """
+    return InitDataIndex(html_content).literal(ds_key)
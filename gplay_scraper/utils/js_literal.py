@@ -0,0 +1,195 @@
+"""Single-pass decoder for the JavaScript object literals in AF_initDataCallback.
+
+Play Store pages embed datasets as JavaScript, not JSON:
+
+    {key: 'ds:5', hash: '13', data:[...], sideChannel: {}}
+
+Keys are unquoted, some strings use single quotes, and values may be
+`undefined`, `function(){...}` or bare prices like `$1.99`. The `data`
+array itself is almost always valid JSON.
+
+parse_js_literal walks the literal once. At every value it first tries the
+C JSON decoder (json.JSONDecoder.raw_decode), so the large JSON parts are
+decoded in one native call. Only the JavaScript parts (the outer object,
+and any array or object that contains a JavaScript-only token) are
+tokenized in Python. Unlike regex rewriting, string contents are never
+touched, so text like "Note, see: this" inside a description survives.
+"""
+
+import re
+import json
+from typing import Any, Tuple
+
+from .json_codec import json_dumps
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+_BARE = re.compile(r"[^\s,:\]\}\[\{'\"]+")
+_SINGLE_QUOTED = re.compile(r"'((?:[^'\\]|\\.)*)'", re.DOTALL)
+_SINGLE_ESCAPES = re.compile(r"\\(['\"])|\"")
+_FUNCTION = re.compile(r"function\s*\([^)]*\)\s*\{")
+_JSON_START = frozenset('[{"-0123456789tfnNI')
+_CONSTANTS = {"undefined": None, "null": None, "true": True, "false": False}
+_DROPPED_KEYS = frozenset(["sideChannel"])
+_STRING_NUMBER_KEYS = frozenset(["version"])
+
+
+class JsLiteralError(ValueError):
+    """Raised when text is not a JavaScript literal this decoder understands."""
+
+    def __init__(self, message: str, pos: int):
+        super().__init__(f"{message} at position {pos}")
+        self.pos = pos
+
+
+def parse_js_literal(text: str) -> Any:
+    """Decode an AF_initDataCallback object literal (or any JSON) into Python objects.
+
+    Args:
+        text: JavaScript literal text
+
+    Returns:
+        Decoded value; `undefined` and functions become None, `sideChannel`
+        is dropped and a numeric `version` is kept as its source text
+
+    Raises:
+        JsLiteralError: If the text cannot be decoded
+    """
+    value, _ = _Parser(text).value(0)
+    return value
+
+
+def js_literal_to_json(text: str) -> str:
+    """Convert a JavaScript literal to a JSON string.
+
+    Args:
+        text: JavaScript literal text
+
+    Returns:
+        Equivalent JSON text
+
+    Raises:
+        JsLiteralError: If the text cannot be decoded
+    """
+    return json_dumps(parse_js_literal(text))
+
+
+class _Parser:
+    """Recursive descent over a literal, delegating JSON spans to the C decoder."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def _skip(self, pos: int) -> int:
+        return _WHITESPACE.match(self.text, pos).end()
+
+    def value(self, pos: int) -> Tuple[Any, int]:
+        text = self.text
+        pos = self._skip(pos)
+        if pos >= len(text):
+            raise JsLiteralError("Unexpected end of literal", pos)
+        char = text[pos]
+        if char in _JSON_START:
+            try:
+                return _decoder.raw_decode(text, pos)
+            except ValueError:
+                pass
+        if char == "{":
+            return self.object(pos + 1)
+        if char == "[":
+            return self.array(pos + 1)
+        if char == "'":
+            return self.single_quoted(pos)
+        if char == '"':
+            raise JsLiteralError("Invalid string", pos)
+        function = _FUNCTION.match(text, pos)
+        if function is not None:
+            return None, self._skip_block(function.end())
+        identifier = _IDENTIFIER.match(text, pos)
+        if identifier is not None and identifier.group() in _CONSTANTS:
+            return _CONSTANTS[identifier.group()], identifier.end()
+        bare = _BARE.match(text, pos)
+        if bare is not None:
+            # Malformed numbers such as 1.2.3 or prices such as $1.99 are kept as text
+            return bare.group(), bare.end()
+        raise JsLiteralError(f"Unexpected character {char!r}", pos)
+
+    def _skip_block(self, pos: int) -> int:
+        """Skip to the brace closing a block opened just before pos."""
+        text = self.text
+        depth = 1
+        while depth:
+            opening = text.find("{", pos)
+            closing = text.find("}", pos)
+            if closing == -1:
+                raise JsLiteralError("Unterminated function", pos)
+            if opening != -1 and opening < closing:
+                depth += 1
+                pos = opening + 1
+            else:
+                depth -= 1
+                pos = closing + 1
+        return pos
+
+    def single_quoted(self, pos: int) -> Tuple[str, int]:
+        match = _SINGLE_QUOTED.match(self.text, pos)
+        if match is None:
+            raise JsLiteralError("Unterminated string", pos)
+        content = match.group(1)
+        if "\\" not in content:
+            return content, match.end()
+        escaped = _SINGLE_ESCAPES.sub(lambda m: "'" if m.group(1) == "'" else '\\"', content)
+        return json.loads(f'"{escaped}"'), match.end()
+
+    def key(self, pos: int) -> Tuple[str, int]:
+        text = self.text
+        char = text[pos]
+        if char == '"':
+            return _decoder.raw_decode(text, pos)
+        if char == "'":
+            return self.single_quoted(pos)
+        match = _IDENTIFIER.match(text, pos) or _BARE.match(text, pos)
+        if match is None:
+            raise JsLiteralError("Expected object key", pos)
+        return match.group(), match.end()
+
+    def object(self, pos: int) -> Tuple[dict, int]:
+        text = self.text
+        result = {}
+        while True:
+            pos = self._skip(pos)
+            # Tolerate repeated and trailing commas
+            while pos < len(text) and text[pos] == ",":
+                pos = self._skip(pos + 1)
+            if pos >= len(text):
+                raise JsLiteralError("Unterminated object", pos)
+            if text[pos] == "}":
+                return result, pos + 1
+            key, pos = self.key(pos)
+            pos = self._skip(pos)
+            if pos >= len(text) or text[pos] != ":":
+                raise JsLiteralError("Expected ':'", pos)
+            value_start = self._skip(pos + 1)
+            value, pos = self.value(value_start)
+            if key in _STRING_NUMBER_KEYS and isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = text[value_start:pos]
+            if key not in _DROPPED_KEYS:
+                result[key] = value
+
+    def array(self, pos: int) -> Tuple[list, int]:
+        text = self.text
+        result = []
+        while True:
+            pos = self._skip(pos)
+            # Tolerate repeated and trailing commas, and missing commas between items
+            while pos < len(text) and text[pos] == ",":
+                pos = self._skip(pos + 1)
+            if pos >= len(text):
+                raise JsLiteralError("Unterminated array", pos)
+            if text[pos] == "]":
+                return result, pos + 1
+            value, pos = self.value(pos)
+            result.append(value)
@@ -0,0 +1,122 @@
+"""JSON encoding through the fastest installed library.
+
+Every json.loads/json.dumps in the parsers, scrapers and print_* paths goes
+through JsonCodec, so the library behind them is chosen in one place:
+
+- Encoding uses orjson when it is installed (Config.JSON_BACKEND "auto" or
+  "orjson") and the standard library otherwise. Indented output matches
+  json.dumps(indent=2), and compact output has no spaces either way. This is
+  where the gain is: print_all output encodes several times faster.
+- Decoding always uses the standard library. On batchexecute pages orjson
+  decodes barely faster (benchmarks/bench_json_codec.py), and the ds:N page
+  data goes through parse_js_literal, whose raw_decode calls no other
+  library offers, so a second decoder only added fallbacks to maintain.
+"""
+
+import json
+import logging
+from typing import Any, Optional, Union
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+_BACKENDS = ("orjson", "json")
+_COMPACT = (",", ":")
+
+
+def _import(name: str):
+    """Return the named JSON module, or None when it is not installed."""
+    try:
+        return __import__(name)
+    except ImportError:
+        return None
+
+
+class JsonCodec:
+    """JSON encoder bound to one backend library; decoding uses the standard library.
+
+    Attributes:
+        name: Encoding backend in use ('orjson' or 'json')
+    """
+
+    def __init__(self, backend: str = None):
+        """Pick the backend.
+
+        Args:
+            backend: 'auto', 'orjson' or 'json' (default: Config.JSON_BACKEND)
+        """
+        backend = backend or Config.JSON_BACKEND
+        if backend != "auto" and backend not in _BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        self.name = "json"
+        self._orjson = _import("orjson") if backend in ("auto", "orjson") else None
+        if self._orjson is not None:
+            self.name = "orjson"
+        if backend not in ("auto", self.name):
+            logger.warning("%s not installed, using the standard json module", backend)
+
+    def loads(self, text: Union[str, bytes]) -> Any:
+        """Decode a JSON document with the standard library.
+
+        Args:
+            text: JSON text
+
+        Returns:
+            Decoded value
+
+        Raises:
+            json.JSONDecodeError: If the text is not valid JSON
+        """
+        return json.loads(text)
+
+    def dumps(self, value: Any, indent: Optional[int] = None, ensure_ascii: bool = False) -> str:
+        """Encode a value as JSON text.
+
+        Args:
+            value: Value to encode
+            indent: None for compact output, or spaces per level
+            ensure_ascii: Escape every non-ASCII character
+
+        Returns:
+            JSON text
+        """
+        if self._orjson is not None and not ensure_ascii and indent in (None, 2):
+            option = self._orjson.OPT_NON_STR_KEYS | (self._orjson.OPT_INDENT_2 if indent else 0)
+            try:
+                return self._orjson.dumps(value, option=option).decode("utf-8")
+            except TypeError:
+                pass
+        return json.dumps(value, indent=indent, ensure_ascii=ensure_ascii, separators=None if indent else _COMPACT)
+
+
+_codec = JsonCodec()
+
+
+def get_json_codec() -> JsonCodec:
+    """Return the codec used by the package."""
+    return _codec
+
+
+def set_json_backend(backend: str = None) -> JsonCodec:
+    """Switch the package to another JSON backend.
+
+    Args:
+        backend: 'auto', 'orjson' or 'json' (default: Config.JSON_BACKEND)
+
+    Returns:
+        The new codec
+    """
+    global _codec
+    _codec = JsonCodec(backend)
+    return _codec
+
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """Decode JSON with the package codec."""
+    return _codec.loads(text)
+
+
+def json_dumps(value: Any, indent: Optional[int] = None, ensure_ascii: bool = False) -> str:
+    """Encode JSON with the package codec."""
+    return _codec.dumps(value, indent, ensure_ascii)
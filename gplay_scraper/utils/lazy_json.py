@@ -0,0 +1,222 @@
+"""Lazy, path-driven reader for large JSON and JavaScript literal documents.
+
+ElementSpecs.App reads about sixty short paths under data[1][2], yet
+decoding ds:5 builds every list and string on the page, including large
+sibling arrays that no spec touches. LazyJson is a read-only view of an
+array or object inside the original text:
+
+- Indexing a view scans that container only as far as the requested child,
+  recording where each child starts. Subtrees in between are skipped with a
+  bracket and string scanner and are not decoded; children after the
+  requested one are not scanned at all.
+- Child containers become views in turn, cached per offset, so paths that
+  share a prefix share the scan of it.
+- Scalars and the containers a caller actually needs (materialize()) are
+  decoded by the parse_js_literal parser, so JavaScript-only values behave
+  exactly as they do in a full decode.
+
+Views support indexing, get, len, iteration and truth testing, which is
+enough for nested_lookup and ElementSpec.extract_content. Structural errors
+are raised as JsLiteralError (a ValueError) when the broken part is read.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Union
+
+from .js_literal import JsLiteralError, _Parser, _FUNCTION, _SINGLE_QUOTED, _WHITESPACE
+
+_SKIP = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|\'[^\'\\]*(?:\\.[^\'\\]*)*\'|[\[\]{}]')
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SCALAR = re.compile(r"[^\s,\]\}\[\{]+")
+
+
+class LazyJson:
+    """Read-only view of an array or object inside a JSON or JavaScript literal text.
+
+    Example:
+        data = LazyJson(text, text.index("data:") + 5)
+        title = nested_lookup(data, [1, 2, 0, 0])   # decodes only the title
+    """
+
+    __slots__ = ("_parser", "_start", "_children", "_pos", "_pending", "_views")
+
+    def __init__(self, text: str, start: int = 0):
+        """Create a view of the container starting at an offset.
+
+        Args:
+            text: Document text
+            start: Offset of the opening '[' or '{' (leading whitespace is skipped)
+
+        Raises:
+            JsLiteralError: If no array or object starts at the offset
+        """
+        self._attach(_Parser(text), _WHITESPACE.match(text, start).end())
+
+    def _attach(self, parser: _Parser, start: int) -> None:
+        if start >= len(parser.text) or parser.text[start] not in "[{":
+            raise JsLiteralError("Expected an array or object", start)
+        self._parser = parser
+        self._start = start
+        self._children = {} if parser.text[start] == "{" else []
+        self._pos = start + 1  # Scan position, None once the container is fully indexed
+        self._pending = None  # Start of the last recorded child, not yet skipped
+        self._views = {}
+
+    @classmethod
+    def _child(cls, parser: _Parser, start: int) -> "LazyJson":
+        view = cls.__new__(cls)
+        view._attach(parser, start)
+        return view
+
+    @property
+    def is_object(self) -> bool:
+        """Whether the view is an object rather than an array."""
+        return isinstance(self._children, dict)
+
+    def _scan_next(self) -> bool:
+        """Record the offset of the next child; return False once the container is closed."""
+        if self._pos is None:
+            return False
+        parser = self._parser
+        text = parser.text
+        pos = self._pos
+        if self._pending is not None:
+            pos = self._skip(self._pending)
+            self._pending = None
+        children = self._children
+        is_object = isinstance(children, dict)
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos >= len(text):
+                raise JsLiteralError("Unterminated container", self._start)
+            char = text[pos]
+            # Repeated and trailing commas are tolerated, as in parse_js_literal
+            if char != ",":
+                break
+            pos += 1
+        if char == ("}" if is_object else "]"):
+            self._pos = None
+            return False
+        if is_object:
+            key, pos = parser.key(pos)
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos >= len(text) or text[pos] != ":":
+                raise JsLiteralError("Expected ':'", pos)
+            pos = _WHITESPACE.match(text, pos + 1).end()
+            children.setdefault(key, pos)
+        else:
+            children.append(pos)
+        self._pos = self._pending = pos
+        return True
+
+    def _index(self) -> Union[List[int], Dict[str, int]]:
+        """Return the offsets of all children, scanning the rest of the container."""
+        while self._scan_next():
+            pass
+        return self._children
+
+    def _offset(self, key: Union[int, str]) -> int:
+        """Return the offset of one child, scanning only as far as needed."""
+        children = self._children
+        if isinstance(children, dict):
+            while key not in children and self._scan_next():
+                pass
+            return children[key]
+        if not isinstance(key, int) or isinstance(key, bool):
+            raise TypeError(f"Array indices must be integers, not {type(key).__name__}")
+        if key < 0:
+            return self._index()[key]
+        while len(children) <= key and self._scan_next():
+            pass
+        return children[key]
+
+    def _skip(self, pos: int) -> int:
+        """Return the offset just past the value starting at pos, without decoding it."""
+        text = self._parser.text
+        if pos >= len(text):
+            raise JsLiteralError("Unexpected end of literal", pos)
+        char = text[pos]
+        if char in "[{":
+            depth = 0
+            for match in _SKIP.finditer(text, pos):
+                token = text[match.start()]
+                if token in "[{":
+                    depth += 1
+                elif token in "]}":
+                    depth -= 1
+                    if not depth:
+                        return match.end()
+            raise JsLiteralError("Unterminated container", pos)
+        if char == '"' or char == "'":
+            match = (_STRING if char == '"' else _SINGLE_QUOTED).match(text, pos)
+            if match is None:
+                raise JsLiteralError("Unterminated string", pos)
+            return match.end()
+        function = _FUNCTION.match(text, pos)
+        if function is not None:
+            return self._parser._skip_block(function.end())
+        match = _SCALAR.match(text, pos)
+        if match is None:
+            raise JsLiteralError(f"Unexpected character {char!r}", pos)
+        return match.end()
+
+    def _value(self, offset: int) -> Any:
+        view = self._views.get(offset)
+        if view is not None:
+            return view
+        if self._parser.text[offset] in "[{":
+            view = self._views[offset] = LazyJson._child(self._parser, offset)
+            return view
+        return self._parser.value(offset)[0]
+
+    def __getitem__(self, key: Union[int, str, slice]) -> Any:
+        if isinstance(key, slice):
+            return [self._value(offset) for offset in self._index()[key]]
+        return self._value(self._offset(key))
+
+    def get(self, key: Union[int, str], default: Any = None) -> Any:
+        """Return the child at key, or default if it is missing."""
+        try:
+            return self[key]
+        except (IndexError, KeyError, TypeError):
+            return default
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __iter__(self) -> Iterator:
+        children = self._index()
+        if isinstance(children, dict):
+            return iter(list(children))
+        return (self._value(offset) for offset in children)
+
+    def __bool__(self) -> bool:
+        return bool(self._children) or self._scan_next()
+
+    def __contains__(self, key: Any) -> bool:
+        if self.is_object:
+            try:
+                self._offset(key)
+                return True
+            except KeyError:
+                return False
+        return any(value == key for value in self)
+
+    def keys(self) -> List[str]:
+        """Return the keys of an object view."""
+        if not self.is_object:
+            raise TypeError("Array views have no keys")
+        return list(self._index())
+
+    def materialize(self) -> Union[list, dict]:
+        """Decode the whole container into Python objects."""
+        return self._parser.value(self._start)[0]
+
+    def __repr__(self) -> str:
+        kind = "object" if self.is_object else "array"
+        return f"<LazyJson {kind} at offset {self._start}>"
+
+
+def materialize(value: Any) -> Any:
+    """Decode a LazyJson view into Python objects; other values are returned unchanged."""
+    return value.materialize() if isinstance(value, LazyJson) else value
@@ -0,0 +1,149 @@
+"""Memo of parsed and formatted results for the field accessors.
+
+Every *_get_field, *_get_fields and *_print_* method used to call its
+*_analyze method again, downloading, cleaning and extracting the same page
+each time. ResultMemo keeps the formatted result of an analyze call, keyed
+by method name and arguments, for Config.RESULT_MEMO_TTL seconds, so
+accessors called one after another on the same app share one scrape.
+
+Results are shared, not copied: callers must not mutate the values
+returned by the accessors.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+from ..config import Config
+
+
+class ResultMemo:
+    """Thread-safe TTL and LRU memo of analyze results.
+
+    Attributes:
+        ttl: Seconds a result is reused; 0 disables memoization
+        max_entries: Number of results kept, least recently used dropped first
+    """
+
+    def __init__(self, ttl: float = None, max_entries: int = None):
+        """Initialize an empty memo.
+
+        Args:
+            ttl: Seconds a result is reused (default: Config.RESULT_MEMO_TTL)
+            max_entries: Result cap (default: Config.RESULT_MEMO_MAX_ENTRIES)
+        """
+        self.ttl = Config.RESULT_MEMO_TTL if ttl is None else ttl
+        self.max_entries = max_entries or Config.RESULT_MEMO_MAX_ENTRIES
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the memoized result for key without computing it.
+
+        Args:
+            key: Method name followed by its arguments
+
+        Returns:
+            The memoized result, or None if there is none or it expired
+        """
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def get_covering(self, key: Hashable, fields) -> Any:
+        """Return a memoized result for key that holds at least the given fields.
+
+        The full result (memoized under key itself) is preferred; otherwise
+        any result memoized under key plus a field tuple containing every
+        requested field is returned.
+
+        Args:
+            key: Method name followed by its arguments, without a field tuple
+            fields: Field names the result must hold
+
+        Returns:
+            The memoized result, or None if none covers the fields
+        """
+        if self.ttl <= 0:
+            return None
+        wanted = set(fields)
+        now = time.monotonic()
+        with self._lock:
+            candidates = [key] + [
+                other for other in self._entries
+                if len(other) == len(key) + 1 and other[:-1] == key
+                and isinstance(other[-1], tuple) and wanted.issubset(other[-1])
+            ]
+            for candidate in candidates:
+                entry = self._entries.get(candidate)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(candidate)
+                    self._hits += 1
+                    return entry[1]
+            return None
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the memoized result for key, calling compute on a miss.
+
+        Empty results ([] or None, which the error handlers return on
+        failure) are not memoized.
+
+        Args:
+            key: Method name followed by its arguments
+            compute: Zero-argument callable producing the result
+
+        Returns:
+            The memoized or freshly computed result
+        """
+        if self.ttl <= 0:
+            return compute()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+        value = compute()
+        if value:
+            with self._lock:
+                self._entries.pop(key, None)
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self, method: str = None) -> int:
+        """Forget memoized results.
+
+        Args:
+            method: Only forget results of this analyze method, e.g. 'app_analyze'
+
+        Returns:
+            Number of results removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if method is None or key[0] == method]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict:
+        """Return hit, miss and size counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,471 @@
+"""Token bucket rate limiting shared by the sync and async HTTP clients.
+
+A RateLimiter keeps one TokenBucket per key (endpoint family, host, or a
+single global bucket). Buckets hand out reservations under a short lock and
+callers sleep outside it, so the same bucket is safe to share between
+threads and between coroutines on an event loop.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe and asyncio-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Each
+    request takes one token; when the bucket is empty the caller is given a
+    reservation in the future and waits for it, so concurrent callers are
+    spaced exactly 1/rate apart instead of firing together.
+
+    Attributes:
+        rate: Tokens added per second (requests per second)
+        burst: Maximum number of tokens the bucket can hold
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Requests per second
+            burst: Maximum requests allowed back to back (default: 1)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it.
+
+        Returns:
+            Seconds to wait before sending the request (0 if a token was free)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def try_reserve(self) -> bool:
+        """Take one token only if it is free now.
+
+        Returns:
+            True if a token was taken, False if the caller would have to wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping tokens earned at the old rate.
+
+        Args:
+            rate: New requests per second
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = rate
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for at least ``seconds`` (e.g. Retry-After).
+
+        Args:
+            seconds: Time to wait before the next token is granted
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens = min(self._tokens, 0) - seconds * self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(Config.ERROR_MESSAGES["RATE_LIMIT_SLEEP"].format(sleep_time=wait))
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Suspend the calling coroutine until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(Config.ERROR_MESSAGES["RATE_LIMIT_SLEEP"].format(sleep_time=wait))
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """Collection of token buckets keyed per endpoint family, host, or globally.
+
+    Key modes:
+        - endpoint: HTML pages and batchexecute RPCs get separate buckets
+        - host: One bucket per host name
+        - global: One bucket for every request
+
+    Example:
+        limiter = RateLimiter(rate=5, burst=10, rates={"batchexecute": (2, 4)})
+        client = HttpClient(rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float = None, burst: int = None, key: str = None,
+                 rates: Dict[str, Tuple[float, int]] = None):
+        """Initialize RateLimiter.
+
+        Args:
+            rate: Default requests per second per bucket (None or 0 disables limiting)
+            burst: Default bucket size (default: Config.RATE_LIMIT_BURST)
+            key: Bucket key mode - 'endpoint', 'host' or 'global' (default: Config.RATE_LIMIT_KEY)
+            rates: Optional per-key overrides as {key: (rate, burst)}
+        """
+        self.rate = rate
+        self.burst = burst or Config.RATE_LIMIT_BURST
+        self.key = key or Config.RATE_LIMIT_KEY
+        self.rates = dict(rates or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _key_for(self, request) -> str:
+        """Map a PlayRequest to its bucket key."""
+        if self.key == "endpoint":
+            return request.family
+        if self.key == "host":
+            return urlparse(request.urls[0]).netloc
+        return "global"
+
+    def bucket(self, key: str) -> Optional[TokenBucket]:
+        """Return the bucket for a key, creating it on first use.
+
+        Args:
+            key: Bucket key (endpoint family, host or 'global')
+
+        Returns:
+            TokenBucket, or None if the key is not rate limited
+        """
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            return bucket
+        rate, burst = self.rates.get(key, (self.rate, self.burst))
+        if not rate:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate, burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, request) -> None:
+        """Block until the request's bucket grants a token.
+
+        Args:
+            request: PlayRequest about to be sent
+        """
+        bucket = self.bucket(self._key_for(request))
+        if bucket:
+            bucket.acquire()
+
+    async def acquire_async(self, request) -> None:
+        """Await until the request's bucket grants a token.
+
+        Args:
+            request: PlayRequest about to be sent
+        """
+        bucket = self.bucket(self._key_for(request))
+        if bucket:
+            await bucket.acquire_async()
+
+    def acquire_token(self, request=None) -> None:
+        """Block until a token is granted, without taking a concurrency slot.
+
+        For callers outside the transport that pace their own work and never
+        call release().
+
+        Args:
+            request: PlayRequest about to be sent; None uses the 'global' bucket
+        """
+        bucket = self.bucket("global" if request is None else self._key_for(request))
+        if bucket:
+            bucket.acquire()
+
+    async def acquire_token_async(self, request=None) -> None:
+        """Await a token without taking a concurrency slot.
+
+        Args:
+            request: PlayRequest about to be sent; None uses the 'global' bucket
+        """
+        bucket = self.bucket("global" if request is None else self._key_for(request))
+        if bucket:
+            await bucket.acquire_async()
+
+    def try_acquire(self, request) -> bool:
+        """Take a token for an extra copy of a request without waiting.
+
+        Hedged copies use this: they run while the original holds its
+        concurrency slot, so they take a bucket token only and never a slot.
+
+        Args:
+            request: PlayRequest about to be sent
+
+        Returns:
+            True if the copy may be sent now
+        """
+        bucket = self.bucket(self._key_for(request))
+        return bucket is None or bucket.try_reserve()
+
+    def release(self, request) -> None:
+        """Called once the request has finished, successfully or not.
+
+        Args:
+            request: PlayRequest that was sent
+        """
+
+    def record(self, request, status_code: int, latency: float, retry_after: float = None) -> None:
+        """Receive transport feedback for a completed request.
+
+        The fixed-rate limiter ignores it; AdaptiveRateLimiter uses it to
+        steer its rate and concurrency.
+
+        Args:
+            request: PlayRequest that was sent
+            status_code: HTTP status code of the response
+            latency: Seconds from send to response
+            retry_after: Retry-After header value in seconds, if any
+        """
+
+
+class _AimdState:
+    """Rate, concurrency and in-flight count for one AdaptiveRateLimiter key."""
+
+    def __init__(self, rate: float, concurrency: float):
+        self.rate = rate
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+        self.async_waiters = deque()
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Token bucket limiter whose rate and concurrency follow AIMD control.
+
+    Each bucket starts at ``rate`` requests per second and grows additively
+    while responses are healthy. A 429/503 response, or latency above the
+    target, cuts rate and concurrency multiplicatively (at most once per
+    cooldown) and a Retry-After header pauses the bucket. Rate stays between
+    AIMD_MIN_RATE and AIMD_MAX_RATE.
+
+    Example:
+        limiter = AdaptiveRateLimiter(rate=2)
+        scraper = GPlayScraper(rate_limiter=limiter)
+        ...
+        print(limiter.current_rate("html"), limiter.stats())
+    """
+
+    def __init__(self, rate: float = None, burst: int = None, key: str = None,
+                 min_rate: float = None, max_rate: float = None, increase: float = None,
+                 decrease: float = None, latency_target: float = None, max_concurrency: int = None):
+        """Initialize AdaptiveRateLimiter.
+
+        Args:
+            rate: Starting requests per second per bucket (default: 1/RATE_LIMIT_DELAY)
+            burst: Bucket size (default: Config.RATE_LIMIT_BURST)
+            key: Bucket key mode - 'endpoint', 'host' or 'global'
+            min_rate: Lowest rate (default: Config.AIMD_MIN_RATE)
+            max_rate: Highest rate (default: Config.AIMD_MAX_RATE)
+            increase: Requests per second added per second of healthy traffic (default: Config.AIMD_INCREASE)
+            decrease: Multiplier applied on throttling (default: Config.AIMD_DECREASE)
+            latency_target: Latency in seconds treated as congestion (default: Config.AIMD_LATENCY_TARGET)
+            max_concurrency: Highest in-flight requests per bucket (default: Config.AIMD_MAX_CONCURRENCY)
+        """
+        super().__init__(rate or 1.0 / Config.RATE_LIMIT_DELAY, burst, key)
+        self.min_rate = min_rate or Config.AIMD_MIN_RATE
+        self.max_rate = max_rate or Config.AIMD_MAX_RATE
+        self.increase = increase or Config.AIMD_INCREASE
+        self.decrease = decrease or Config.AIMD_DECREASE
+        self.latency_target = latency_target or Config.AIMD_LATENCY_TARGET
+        self.max_concurrency = max_concurrency or Config.AIMD_MAX_CONCURRENCY
+        self._states = {}
+
+    def _state(self, key: str) -> _AimdState:
+        """Return the AIMD state for a key, creating it on first use."""
+        state = self._states.get(key)
+        if state is None:
+            with self._lock:
+                state = self._states.get(key)
+                if state is None:
+                    state = _AimdState(self.rate, max(1.0, self.burst))
+                    self._states[key] = state
+        return state
+
+    def acquire(self, request) -> None:
+        """Block until a concurrency slot and a token are available.
+
+        Args:
+            request: PlayRequest about to be sent
+        """
+        key = self._key_for(request)
+        state = self._state(key)
+        with state.condition:
+            while state.in_flight >= int(state.concurrency):
+                state.condition.wait()
+            state.in_flight += 1
+        self.bucket(key).acquire()
+
+    async def acquire_async(self, request) -> None:
+        """Await a concurrency slot and a token without blocking the loop.
+
+        Args:
+            request: PlayRequest about to be sent
+        """
+        key = self._key_for(request)
+        state = self._state(key)
+        loop = asyncio.get_running_loop()
+        while True:
+            with state.condition:
+                if state.in_flight < int(state.concurrency):
+                    state.in_flight += 1
+                    break
+                waiter = loop.create_future()
+                state.async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except BaseException:
+                # Cancelled, possibly after release() chose this waiter: pass the wakeup on
+                with state.condition:
+                    try:
+                        state.async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        pass
+                    if state.in_flight < int(state.concurrency):
+                        self._wake_next(state)
+                raise
+        try:
+            await self.bucket(key).acquire_async()
+        except BaseException:
+            self.release(request)
+            raise
+
+    def release(self, request) -> None:
+        """Free the request's concurrency slot and wake one waiter.
+
+        Args:
+            request: PlayRequest that was sent
+        """
+        state = self._state(self._key_for(request))
+        with state.condition:
+            state.in_flight = max(0, state.in_flight - 1)
+            state.condition.notify()
+            self._wake_next(state)
+
+    @staticmethod
+    def _wake_next(state: _AimdState) -> None:
+        """Wake the oldest async waiter still waiting; the caller holds state.condition."""
+        while state.async_waiters:
+            loop, waiter = state.async_waiters.popleft()
+            if not waiter.done():
+                loop.call_soon_threadsafe(_wake, waiter)
+                return
+
+    def record(self, request, status_code: int, latency: float, retry_after: float = None) -> None:
+        """Adjust rate and concurrency from one response.
+
+        Args:
+            request: PlayRequest that was sent
+            status_code: HTTP status code of the response
+            latency: Seconds from send to response
+            retry_after: Retry-After header value in seconds, if any
+        """
+        key = self._key_for(request)
+        state = self._state(key)
+        bucket = self.bucket(key)
+        throttled = status_code in Config.THROTTLE_STATUS_CODES
+        congested = throttled or latency > self.latency_target
+
+        with state.condition:
+            now = time.monotonic()
+            if congested:
+                if now - state.last_decrease >= Config.AIMD_COOLDOWN:
+                    state.rate = max(self.min_rate, state.rate * self.decrease)
+                    state.concurrency = max(1.0, state.concurrency * self.decrease)
+                    state.last_decrease = now
+                    logger.info(f"Rate for {key} decreased to {state.rate:.2f} req/s (status {status_code}, {latency:.2f}s)")
+            else:
+                slots = int(state.concurrency)
+                state.rate = min(self.max_rate, state.rate + self.increase / state.rate)
+                state.concurrency = min(self.max_concurrency, state.concurrency + 1.0 / state.concurrency)
+                # Wake a thread or coroutine for each slot the increase opened
+                for _ in range(int(state.concurrency) - slots):
+                    state.condition.notify()
+                    self._wake_next(state)
+            rate = state.rate
+
+        bucket.set_rate(rate)
+        if throttled and retry_after:
+            # Capped like retry backoff, so a far-off Retry-After cannot park every caller
+            bucket.pause(min(retry_after, Config.RETRY_MAX_DELAY))
+
+    def current_rate(self, key: str = None):
+        """Return the current rate for a key, or for every key.
+
+        Args:
+            key: Bucket key (e.g. 'html', 'batchexecute'); None for all keys
+
+        Returns:
+            Requests per second, or a {key: rate} dictionary
+        """
+        if key is not None:
+            return self._state(key).rate
+        return {k: state.rate for k, state in self._states.items()}
+
+    def stats(self):
+        """Snapshot of rate, concurrency limit and in-flight count per key.
+
+        Returns:
+            Dictionary of {key: {"rate", "concurrency", "in_flight"}}
+        """
+        return {
+            k: {"rate": state.rate, "concurrency": int(state.concurrency), "in_flight": state.in_flight}
+            for k, state in self._states.items()
+        }
+
+
+def _wake(waiter) -> None:
+    """Resolve an async waiter unless it was cancelled."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def default_rate_limiter(rate_limit_delay: float = None) -> RateLimiter:
+    """Build the limiter used when a client is not given one.
+
+    Args:
+        rate_limit_delay: Legacy delay between requests in seconds (0 disables)
+
+    Returns:
+        RateLimiter with rate 1/delay per endpoint family, adaptive if
+        Config.ADAPTIVE_RATE_LIMIT is set
+    """
+    delay = Config.RATE_LIMIT_DELAY if rate_limit_delay is None else rate_limit_delay
+    if Config.ADAPTIVE_RATE_LIMIT and delay:
+        return AdaptiveRateLimiter(rate=1.0 / delay)
+    return RateLimiter(rate=1.0 / delay if delay else None)
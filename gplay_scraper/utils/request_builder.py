@@ -0,0 +1,321 @@
+"""Request builders for all Google Play Store endpoints.
+
+This module describes every request the library sends (URL, body, headers,
+error messages) independently of the HTTP library used to send it, so the
+synchronous HttpClient and the asyncio AsyncHttpClient build identical requests.
+"""
+
+import math
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from ..config import Config
+from ..exceptions import RateLimitError, HttpStatusError
+
+
+class PlayRequest:
+    """Description of a single Google Play Store fetch.
+
+    Attributes:
+        endpoint: Endpoint name (app, search, search_page, reviews, developer, cluster, list, suggest)
+        method: HTTP method (GET or POST)
+        urls: URLs to try in order; later entries drop the country parameter
+        data: Request body for POST requests
+        headers: Extra headers merged over the client's default headers
+        not_found: Message for AppNotFoundError when the server answers 404, or None
+        failed: Tuple of (ERROR_MESSAGES key, format arguments) for NetworkError
+        family: Endpoint family, 'batchexecute' for RPC calls or 'html' for pages
+        key: Identity of the request (method, first URL, body) used to coalesce duplicates
+        cache_class: Name used to look up the cache TTL (defaults to endpoint)
+        resource: ID of the requested app, developer or cluster, used to invalidate cached 404s
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        method: str,
+        urls: List[str],
+        data: str = None,
+        headers: Dict[str, str] = None,
+        not_found: Optional[str] = None,
+        failed: Tuple[str, Dict] = None,
+        cache_class: str = None,
+        resource: str = None,
+    ):
+        """Initialize PlayRequest with request parameters."""
+        self.endpoint = endpoint
+        self.method = method
+        self.urls = urls
+        self.data = data
+        self.headers = headers or {}
+        self.not_found = not_found
+        self.failed = failed
+        self.family = "batchexecute" if Config.BATCHEXECUTE_ENDPOINT in urls[0] else "html"
+        self.key = (method, urls[0], data)
+        self.cache_class = cache_class or endpoint
+        self.resource = resource
+
+    def failure_message(self, error: Exception) -> str:
+        """Format the NetworkError message for this request.
+
+        Args:
+            error: Exception raised by the last attempt
+
+        Returns:
+            Formatted error message
+        """
+        key, kwargs = self.failed
+        return Config.ERROR_MESSAGES[key].format(error=error, **kwargs)
+
+
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"}
+
+
+def build_app_page_request(app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> PlayRequest:
+    """Build request for an app details page, retrying without country on failure.
+
+    Args:
+        app_id: Google Play app ID
+        lang: Language code
+        country: Country code
+
+    Returns:
+        PlayRequest for the app page
+    """
+    base = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}&hl={lang}"
+    return PlayRequest(
+        "app", "GET", [f"{base}&gl={country}", base],
+        not_found=Config.ERROR_MESSAGES["APP_NOT_FOUND"].format(app_id=app_id),
+        failed=("APP_FETCH_FAILED", {"app_id": app_id}),
+        resource=app_id,
+    )
+
+
+def build_app_page_no_locale_request(app_id: str) -> PlayRequest:
+    """Build request for an app page without hl/gl parameters.
+
+    Args:
+        app_id: Google Play app ID
+
+    Returns:
+        PlayRequest for the app page
+    """
+    url = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}"
+    return PlayRequest("app", "GET", [url], failed=("APP_FETCH_FAILED", {"app_id": app_id}))
+
+
+def build_search_request(query: str = None, token: str = None, needed: int = None, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> PlayRequest:
+    """Build initial search page request or paginated search API request.
+
+    Args:
+        query: Search query string (for initial search)
+        token: Pagination token (for paginated search)
+        needed: Number of results needed (for pagination)
+        lang: Language code
+        country: Country code
+
+    Returns:
+        PlayRequest for the search page or pagination call
+
+    Raises:
+        ValueError: If neither query nor (token and needed) is provided
+    """
+    if token and needed:
+        url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}"
+        params = f"rpcids=qnKhOb&source-path=%2Fwork%2Fsearch&hl={lang}&gl={country}"
+        body = f'f.req=%5B%5B%5B%22qnKhOb%22%2C%22%5B%5Bnull%2C%5B%5B10%2C%5B10%2C{needed}%5D%5D%2Ctrue%2Cnull%2C%5B96%2C27%2C4%2C8%2C57%2C30%2C110%2C79%2C11%2C16%2C49%2C1%2C3%2C9%2C12%2C104%2C55%2C56%2C51%2C10%2C34%2C77%5D%5D%2Cnull%2C%5C%22{token}%5C%22%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D'
+        return PlayRequest(
+            "search_page", "POST", [f"{url}?{params}"], data=body, headers=FORM_HEADERS,
+            failed=("SEARCH_PAGINATION_FAILED", {}),
+        )
+
+    if query:
+        encoded_query = quote(query)
+        base = f"{Config.PLAY_STORE_BASE_URL}/work/search?q={encoded_query}&hl={lang}"
+        return PlayRequest(
+            "search", "GET", [f"{base}&gl={country}&price=0", f"{base}&price=0"],
+            not_found=Config.ERROR_MESSAGES["SEARCH_NOT_FOUND"].format(query=query),
+            failed=("SEARCH_FETCH_FAILED", {"query": query}),
+        )
+
+    raise ValueError("Either query or (token and needed) must be provided")
+
+
+def build_reviews_request(app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY,
+                          sort: int = Config.DEFAULT_REVIEWS_SORT, batch_count: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, token: str = None) -> PlayRequest:
+    """Build request for one batch of reviews.
+
+    Args:
+        app_id: Google Play app ID
+        lang: Language code
+        country: Country code
+        sort: Sort order (1=RELEVANT, 2=NEWEST, 3=RATING)
+        batch_count: Number of reviews per batch
+        token: Pagination token for next batch
+
+    Returns:
+        PlayRequest for the reviews API
+    """
+    url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?hl={lang}&gl={country}"
+
+    if token:
+        payload = f"f.req=%5B%5B%5B%22oCPfdb%22%2C%22%5Bnull%2C%5B2%2C{sort}%2C%5B{batch_count}%2Cnull%2C%5C%22{token}%5C%22%5D%2Cnull%2C%5Bnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%5D%5D%2C%5B%5C%22{app_id}%5C%22%2C7%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D"
+    else:
+        payload = f"f.req=%5B%5B%5B%22oCPfdb%22%2C%22%5Bnull%2C%5B2%2C{sort}%2C%5B{batch_count}%5D%2Cnull%2C%5Bnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%5D%5D%2C%5B%5C%22{app_id}%5C%22%2C7%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D"
+
+    return PlayRequest(
+        "reviews", "POST", [url], data=payload,
+        headers={"content-type": "application/x-www-form-urlencoded"},
+        not_found=Config.ERROR_MESSAGES["REVIEWS_NOT_FOUND"].format(app_id=app_id),
+        failed=("REVIEWS_FETCH_FAILED", {"app_id": app_id}),
+        # Newest-first reviews change by the minute, other orders much more slowly
+        cache_class="reviews_newest" if sort in (2, "NEWEST") else "reviews",
+    )
+
+
+def build_developer_request(dev_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> PlayRequest:
+    """Build request for a developer portfolio page, retrying without country on failure.
+
+    Args:
+        dev_id: Developer ID (numeric or string)
+        lang: Language code
+        country: Country code
+
+    Returns:
+        PlayRequest for the developer page
+    """
+    endpoint = Config.DEVELOPER_NUMERIC_ENDPOINT if dev_id.isdigit() else Config.DEVELOPER_STRING_ENDPOINT
+    base = f"{Config.PLAY_STORE_BASE_URL}{endpoint}?id={quote(dev_id)}&hl={lang}"
+    return PlayRequest(
+        "developer", "GET", [f"{base}&gl={country}", base],
+        not_found=Config.ERROR_MESSAGES["DEVELOPER_NOT_FOUND"].format(dev_id=dev_id),
+        failed=("DEVELOPER_FETCH_FAILED", {"dev_id": dev_id}),
+        resource=dev_id,
+    )
+
+
+def build_cluster_request(cluster_url: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> PlayRequest:
+    """Build request for a cluster page (similar apps collection).
+
+    Args:
+        cluster_url: Cluster URL path
+        lang: Language code
+        country: Country code
+
+    Returns:
+        PlayRequest for the cluster page
+    """
+    url = f"{Config.PLAY_STORE_BASE_URL}{cluster_url}&gl={country}&hl={lang}"
+    return PlayRequest(
+        "cluster", "GET", [url],
+        not_found=Config.ERROR_MESSAGES["CLUSTER_NOT_FOUND"].format(cluster_url=cluster_url),
+        failed=("CLUSTER_FETCH_FAILED", {}),
+        resource=cluster_url,
+    )
+
+
+def build_list_request(collection: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT,
+                       lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> PlayRequest:
+    """Build request for a top charts list.
+
+    Args:
+        collection: Collection type (topselling_free, topselling_paid, topgrossing)
+        category: App category
+        count: Number of apps to fetch
+        lang: Language code
+        country: Country code
+
+    Returns:
+        PlayRequest for the list API
+    """
+    body = f'f.req=%5B%5B%5B%22vyAe2%22%2C%22%5B%5Bnull%2C%5B%5B8%2C%5B20%2C{count}%5D%5D%2Ctrue%2Cnull%2C%5B64%2C1%2C195%2C71%2C8%2C72%2C9%2C10%2C11%2C139%2C12%2C16%2C145%2C148%2C150%2C151%2C152%2C27%2C30%2C31%2C96%2C32%2C34%2C163%2C100%2C165%2C104%2C169%2C108%2C110%2C113%2C55%2C56%2C57%2C122%5D%2C%5Bnull%2Cnull%2C%5B%5B%5Btrue%5D%2Cnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%2Cnull%2Cnull%2Cnull%2Cnull%2C%5Bnull%2C2%5D%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B1%5D%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B1%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%2Cnull%2C%5Btrue%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%5D%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B%5B%5Bnull%2C%5B%5D%5D%5D%5D%2C%5B%5B%5Bnull%2C%5B%5D%5D%5D%5D%5D%2C%5B%5B%5B%5B7%2C1%5D%2C%5B%5B1%2C73%2C96%2C103%2C97%2C58%2C50%2C92%2C52%2C112%2C69%2C19%2C31%2C101%2C123%2C74%2C49%2C80%2C38%2C20%2C10%2C14%2C79%2C43%2C42%2C139%5D%5D%5D%5D%5D%5D%2Cnull%2Cnull%2C%5B%5B%5B1%2C2%5D%2C%5B10%2C8%2C9%5D%2C%5B%5D%2C%5B%5D%5D%5D%5D%2C%5B2%2C%5C%22{collection}%5C%22%2C%5C%22{category}%5C%22%5D%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D&at=AFSRYlx8XZfN8-O-IKASbNBDkB6T%3A1655531200971&'
+
+    url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?rpcids=vyAe2&source-path=%2Fstore%2Fapps&hl={lang}&gl={country}"
+
+    return PlayRequest(
+        "list", "POST", [url], data=body, headers=FORM_HEADERS,
+        not_found=Config.ERROR_MESSAGES["LIST_NOT_FOUND"].format(collection=collection, category=category),
+        failed=("LIST_FETCH_FAILED", {}),
+    )
+
+
+def build_suggest_request(term: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> PlayRequest:
+    """Build request for search suggestions.
+
+    Args:
+        term: Search term for suggestions
+        lang: Language code
+        country: Country code
+
+    Returns:
+        PlayRequest for the suggest API
+    """
+    encoded_term = quote(term)
+    url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?rpcids=IJ4APc&f.sid=-697906427155521722&bl=boq_playuiserver_20190903.08_p0&hl={lang}&gl={country}&authuser&soc-app=121&soc-platform=1&soc-device=1&_reqid=1065213"
+
+    body = f"f.req=%5B%5B%5B%22IJ4APc%22%2C%22%5B%5Bnull%2C%5B%5C%22{encoded_term}%5C%22%5D%2C%5B10%5D%2C%5B2%5D%2C4%5D%5D%22%5D%5D%5D"
+
+    return PlayRequest(
+        "suggest", "POST", [url], data=body, headers=FORM_HEADERS,
+        not_found=Config.ERROR_MESSAGES["SUGGEST_NOT_FOUND"].format(term=term),
+        failed=("SUGGEST_FETCH_FAILED", {"term": term}),
+    )
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """Check if an exception indicates a 404 not found response.
+
+    Args:
+        error: Exception to check
+
+    Returns:
+        True if 404 error, False otherwise
+    """
+    error_str = str(error).lower()
+    # Check for common 404 error indicators
+    return "404" in error_str or "not found" in error_str
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        pass
+    else:
+        # "inf" and "nan" parse as floats but are not delta-seconds
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def check_response_status(status_code: int, headers=None) -> None:
+    """Raise for error statuses, surfacing throttling as RateLimitError.
+
+    Args:
+        status_code: HTTP status code
+        headers: Response headers (used for Retry-After)
+
+    Raises:
+        RateLimitError: For 429/503 responses, with status_code and retry_after
+        HttpStatusError: For any other status >= 400
+    """
+    message = Config.ERROR_MESSAGES["HTTP_ERROR"].format(status_code=status_code)
+    if status_code in Config.THROTTLE_STATUS_CODES:
+        retry_after = parse_retry_after(headers.get("Retry-After")) if headers else None
+        raise RateLimitError(message, status_code=status_code, retry_after=retry_after)
+    if status_code >= 400:
+        raise HttpStatusError(message, status_code=status_code)
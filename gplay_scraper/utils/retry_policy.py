@@ -0,0 +1,170 @@
+"""Retry policy shared by the HTTP transport and the error handling decorators.
+
+Every retry in the package goes through one RetryPolicy:
+
+- capped exponential backoff with full jitter: the delay before retry n is
+  uniform in [0, min(max_delay, base_delay * 2**n)], so clients that failed
+  together do not retry together
+- Retry-After from 429/503 responses is honoured as a lower bound; a
+  Retry-After longer than the backoff cap gives up instead of sleeping
+- a RetryBudget limits retries to a fraction of live traffic; when it runs
+  dry, failures are returned at once instead of being multiplied
+
+Only failures that may go away are retried: throttling, 5xx responses and
+transport errors. Other 4xx responses and missing apps are final.
+"""
+
+import time
+import random
+import threading
+from typing import Optional
+
+from ..config import Config
+from ..exceptions import AppNotFoundError, NetworkError, RateLimitError, HttpStatusError
+
+
+class RetryBudget:
+    """Thread-safe token bucket that caps retries relative to live traffic.
+
+    Each first attempt deposits `ratio` tokens and each retry withdraws one,
+    so over time retries stay below `ratio` of requests. A small time-based
+    refill keeps low-traffic clients able to retry.
+    """
+
+    def __init__(self, ratio: float = None, burst: float = None, min_rate: float = None):
+        """Initialize a full budget.
+
+        Args:
+            ratio: Retry tokens earned per request (default: Config.RETRY_BUDGET_RATIO)
+            burst: Maximum stored tokens (default: Config.RETRY_BUDGET_BURST)
+            min_rate: Tokens added per second regardless of traffic (default: Config.RETRY_BUDGET_MIN_RATE)
+        """
+        self.ratio = Config.RETRY_BUDGET_RATIO if ratio is None else ratio
+        self.burst = Config.RETRY_BUDGET_BURST if burst is None else burst
+        self.min_rate = Config.RETRY_BUDGET_MIN_RATE if min_rate is None else min_rate
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.min_rate)
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Credit the budget for one first attempt."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take one token for a retry.
+
+        Returns:
+            True if the retry may go ahead, False if the budget is exhausted
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed request.
+
+    Attributes:
+        max_attempts: Total attempts including the first one
+        base_delay: Backoff base in seconds
+        max_delay: Backoff cap in seconds
+        budget: RetryBudget shared by every caller of this policy
+    """
+
+    def __init__(self, max_attempts: int = None, base_delay: float = None, max_delay: float = None,
+                 budget: RetryBudget = None):
+        """Initialize RetryPolicy.
+
+        Args:
+            max_attempts: Total attempts including the first one (default: Config.DEFAULT_RETRY_COUNT)
+            base_delay: Backoff base in seconds (default: Config.RETRY_BASE_DELAY)
+            max_delay: Backoff cap in seconds (default: Config.RETRY_MAX_DELAY)
+            budget: Optional RetryBudget, e.g. shared between clients (default: a new budget)
+        """
+        self.max_attempts = Config.DEFAULT_RETRY_COUNT if max_attempts is None else max_attempts
+        self.base_delay = Config.RETRY_BASE_DELAY if base_delay is None else base_delay
+        self.max_delay = Config.RETRY_MAX_DELAY if max_delay is None else max_delay
+        self.budget = budget or RetryBudget()
+
+    def backoff(self, attempt: int, retry_after: float = None) -> float:
+        """Return the full-jitter delay before retry number `attempt` (0-based).
+
+        Args:
+            attempt: Number of retries already made
+            retry_after: Server-requested delay in seconds, used as a lower bound
+
+        Returns:
+            Delay in seconds
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        return max(delay, retry_after or 0)
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Return True if a failure may succeed when tried again.
+
+        Args:
+            error: Exception raised by the attempt; NetworkError raised by the
+                   transport carries the underlying error as __cause__
+
+        Returns:
+            True for throttling, 5xx and 408 responses and transport errors
+        """
+        if isinstance(error, AppNotFoundError):
+            return False
+        if isinstance(error, NetworkError) and not isinstance(error, (RateLimitError, HttpStatusError)):
+            if error.__cause__ is None:
+                # Raised without a transport error, e.g. every circuit breaker is open
+                return False
+            error = error.__cause__
+        if isinstance(error, RateLimitError):
+            return True
+        if isinstance(error, HttpStatusError):
+            return error.status_code is None or error.status_code >= 500 or error.status_code == 408
+        return not isinstance(error, NetworkError)
+
+    def start(self) -> None:
+        """Record a new logical request, crediting the retry budget."""
+        self.budget.deposit()
+
+    def next_delay(self, attempt: int, error: Exception, retryable: bool = None) -> Optional[float]:
+        """Decide whether to retry after a failed attempt.
+
+        Args:
+            attempt: Number of retries already made
+            error: Exception raised by the failed attempt
+            retryable: Override the is_retryable classification
+
+        Returns:
+            Delay in seconds before the retry, or None to give up (also when
+            the server's Retry-After exceeds max_delay)
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if not (self.is_retryable(error) if retryable is None else retryable):
+            return None
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None and error.__cause__ is not None:
+            retry_after = getattr(error.__cause__, "retry_after", None)
+        if retry_after is not None and retry_after > self.max_delay:
+            # Waiting that long inside a library call would stall the caller; report the throttling instead
+            return None
+        if not self.budget.withdraw():
+            return None
+        return self.backoff(attempt, retry_after)
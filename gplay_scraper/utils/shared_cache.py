@@ -0,0 +1,427 @@
+"""Cross-process response cache over the Redis protocol.
+
+RedisCache lets every worker process on a host (or a fleet) share one cache,
+so a hot app page is fetched once instead of once per process. It speaks
+the Redis wire protocol (RESP) directly over a socket, so it needs no extra
+package and works against a real Redis server or against CacheServer, a
+small in-memory stand-in for machines without Redis.
+
+- Entries expire through the server's own key expiry (SET ... PX).
+- add() maps to SET ... NX, which is atomic on the server. HttpClient uses
+  it as a fill lock, so only one process fetches a missing page while the
+  others wait for its answer. The lock holds a random owner token and is
+  released by delete_if(), a compare-and-delete script run on the server.
+- SET ... NX is not idempotent, so it is never resent after a connection
+  error; add() reads the key back to learn whether the lost SET was applied.
+- A cache failure never fails a request: connection errors count as misses
+  and writes are skipped.
+- Expired entries are not kept, so stale-while-revalidate only serves fresh
+  hits from this backend.
+
+Run a stand-in server with:
+
+    python -m gplay_scraper.utils.shared_cache --port 6379
+"""
+
+import socket
+import logging
+import threading
+import socketserver
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, unquote
+
+from ..config import Config
+from .cache import ResponseCache, MemoryCache
+
+logger = logging.getLogger(__name__)
+
+
+# Compare-and-delete: remove KEYS[1] only if it still holds ARGV[1]
+_DELETE_IF_SCRIPT = "if redis.call('GET', KEYS[1]) == ARGV[1] then return redis.call('DEL', KEYS[1]) else return 0 end"
+
+
+class RedisProtocolError(Exception):
+    """Raised when the server answers a command with an error reply."""
+    pass
+
+
+def _encode_command(args) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode("utf-8")
+        elif not isinstance(arg, bytes):
+            arg = str(arg).encode("ascii")
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+def _read_reply(reader):
+    """Read one RESP reply from a buffered binary reader."""
+    line = reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("connection closed by cache server")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode("utf-8")
+    if kind == b"-":
+        raise RedisProtocolError(payload.decode("utf-8", "replace"))
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = reader.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("connection closed by cache server")
+        return data[:-2]
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [_read_reply(reader) for _ in range(length)]
+    raise RedisProtocolError(f"unexpected reply type {kind!r}")
+
+
+class _Connection:
+    """One blocking RESP connection."""
+
+    def __init__(self, url: str, timeout: float):
+        parsed = urlparse(url)
+        if parsed.scheme == "unix":
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(unquote(parsed.path))
+        elif parsed.scheme == "redis":
+            self.sock = socket.create_connection((parsed.hostname or "127.0.0.1", parsed.port or 6379), timeout)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            raise ValueError(f"Unsupported cache URL scheme: {parsed.scheme}")
+        self.reader = self.sock.makefile("rb")
+        if parsed.password:
+            self.command("AUTH", unquote(parsed.password))
+        db = parsed.path.strip("/") if parsed.scheme == "redis" else ""
+        if db and db != "0":
+            self.command("SELECT", db)
+
+    def command(self, *args):
+        self.sock.sendall(_encode_command(args))
+        return _read_reply(self.reader)
+
+    def close(self) -> None:
+        try:
+            self.reader.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class RedisCache(ResponseCache):
+    """Response cache stored in a Redis-protocol server shared by many processes.
+
+    Attributes:
+        url: Server URL, 'redis://[:password@]host:port/db' or 'unix:///path/to.sock'
+        prefix: Prefix added to every key, so several tools can share one server
+    """
+
+    shared = True
+
+    def __init__(self, url: str = None, prefix: str = None, timeout: float = None):
+        """Prepare a cache client; connections are opened per thread on first use.
+
+        Args:
+            url: Server URL (default: Config.SHARED_CACHE_URL)
+            prefix: Key prefix (default: Config.SHARED_CACHE_PREFIX)
+            timeout: Socket timeout in seconds (default: Config.SHARED_CACHE_TIMEOUT)
+        """
+        self.url = url or Config.SHARED_CACHE_URL
+        self.prefix = Config.SHARED_CACHE_PREFIX if prefix is None else prefix
+        self.timeout = timeout or Config.SHARED_CACHE_TIMEOUT
+        self._local = threading.local()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._stats_lock = threading.Lock()
+
+    def _command(self, *args, idempotent: bool = True):
+        """Run a command on this thread's connection.
+
+        If the connection drops, idempotent commands are resent once on a new
+        connection. Others are not: the server may have applied them already.
+        """
+        for attempt in range(2 if idempotent else 1):
+            conn = getattr(self._local, "conn", None)
+            if conn is None:
+                conn = self._local.conn = _Connection(self.url, self.timeout)
+            try:
+                return conn.command(*args)
+            except (OSError, ConnectionError):
+                conn.close()
+                self._local.conn = None
+                if attempt or not idempotent:
+                    raise
+
+    def _failed(self, name: str, error: Exception) -> None:
+        with self._stats_lock:
+            self._errors += 1
+        logger.warning(f"Shared cache {name} failed: {error}")
+
+    def _safe(self, default, *args):
+        """Run an idempotent command, logging failures and returning default instead of raising."""
+        try:
+            return self._command(*args)
+        except (OSError, ConnectionError, RedisProtocolError) as e:
+            self._failed(args[0], e)
+            return default
+
+    def _count(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing, expired or unreachable."""
+        value = self._safe(None, "GET", self.prefix + key)
+        self._count(value is not None)
+        return None if value is None else value.decode("utf-8")
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+        if ttl > 0:
+            self._safe(None, "SET", self.prefix + key, value, "PX", max(int(ttl * 1000), 1))
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        """Atomically store value only if key is absent or expired, across processes.
+
+        SET ... NX is not resent after a connection error. Instead the key is
+        read back: when value is unique to the caller, like a fill lock token,
+        finding it there means the lost SET was applied.
+        """
+        if ttl <= 0:
+            return False
+        key = self.prefix + key
+        try:
+            return self._command("SET", key, value, "PX", max(int(ttl * 1000), 1), "NX", idempotent=False) == "OK"
+        except (OSError, ConnectionError) as e:
+            self._failed("SET", e)
+            return self._safe(None, "GET", key) == value.encode("utf-8")
+        except RedisProtocolError as e:
+            self._failed("SET", e)
+            return False
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        self._safe(None, "DEL", self.prefix + key)
+
+    def delete_if(self, key: str, value: str) -> bool:
+        """Atomically remove key only if it still holds value, with a server-side script."""
+        return self._safe(0, "EVAL", _DELETE_IF_SCRIPT, 1, self.prefix + key, value) == 1
+
+    def clear(self) -> None:
+        """Remove every key under this cache's prefix; counters are kept."""
+        cursor = b"0"
+        while True:
+            reply = self._safe(None, "SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 1000)
+            if reply is None:
+                return
+            cursor, keys = reply
+            if keys:
+                self._safe(None, "DEL", *keys)
+            if cursor in (b"0", 0):
+                return
+
+    def stats(self) -> Dict:
+        """Return hit, miss and error counters of this process."""
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "errors": self._errors,
+                "url": self.url,
+            }
+
+    def close(self) -> None:
+        """Close this thread's connection; it is reopened on next use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serves RESP commands from one client connection."""
+
+    def handle(self):
+        while True:
+            try:
+                request = _read_reply(self.rfile)
+            except (ConnectionError, OSError):
+                return
+            except RedisProtocolError as e:
+                self.wfile.write(b"-ERR %s\r\n" % str(e).encode())
+                return
+            if not isinstance(request, list) or not request:
+                self.wfile.write(b"-ERR expected a command array\r\n")
+                continue
+            name = request[0].decode("ascii", "replace").upper()
+            if name == "QUIT":
+                self.wfile.write(b"+OK\r\n")
+                return
+            try:
+                reply = self.server.store.execute(name, request[1:])
+            except (ValueError, IndexError) as e:
+                reply = RedisProtocolError(f"ERR {e}")
+            self.wfile.write(_encode_reply(reply))
+
+
+def _encode_reply(reply) -> bytes:
+    """Encode a Python value as a RESP reply."""
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, RedisProtocolError):
+        return b"-%s\r\n" % str(reply).encode()
+    if isinstance(reply, bool):
+        return b"+OK\r\n" if reply else b"$-1\r\n"
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    if isinstance(reply, list):
+        return b"*%d\r\n" % len(reply) + b"".join(_encode_reply(item) for item in reply)
+    return b"+%s\r\n" % str(reply).encode()
+
+
+class _Store:
+    """The command subset RedisCache uses, on top of a MemoryCache."""
+
+    def __init__(self, max_bytes: int):
+        self.cache = MemoryCache(max_bytes)
+
+    def _keys(self, pattern: str) -> List[bytes]:
+        return [key for key in self.cache.keys() if fnmatchcase(key.decode("utf-8", "replace"), pattern)]
+
+    def execute(self, name: str, args: List[bytes]):
+        if name == "PING":
+            return "PONG"
+        if name in ("SELECT", "AUTH"):
+            return True
+        if name == "GET":
+            return self.cache.get(args[0])
+        if name == "SET":
+            key, value = args[0], args[1]
+            ttl, only_new = float("inf"), False
+            options = [arg.decode("ascii").upper() for arg in args[2:]]
+            for i, option in enumerate(options):
+                if option == "EX":
+                    ttl = float(options[i + 1])
+                elif option == "PX":
+                    ttl = float(options[i + 1]) / 1000
+                elif option == "NX":
+                    only_new = True
+            if only_new:
+                return self.cache.add(key, value, ttl)
+            self.cache.set(key, value, ttl)
+            return True
+        if name in ("DEL", "EXISTS"):
+            present = [key for key in args if self.cache.get(key) is not None]
+            if name == "DEL":
+                for key in present:
+                    self.cache.delete(key)
+            return len(present)
+        if name == "EVAL":
+            # Only RedisCache's own compare-and-delete script; there is no Lua here
+            if args[0].decode("utf-8") != _DELETE_IF_SCRIPT or int(args[1]) != 1:
+                return RedisProtocolError("ERR only the RedisCache delete_if script is supported")
+            return int(self.cache.delete_if(args[2], args[3]))
+        if name == "SCAN":
+            options = [arg.decode("utf-8") for arg in args[1:]]
+            pattern = options[options.index("MATCH") + 1] if "MATCH" in options else "*"
+            return [b"0", self._keys(pattern)]
+        if name == "DBSIZE":
+            return len(self._keys("*"))
+        if name == "FLUSHDB":
+            self.cache.clear()
+            return True
+        return RedisProtocolError(f"ERR unknown command '{name}'")
+
+
+class CacheServer:
+    """Minimal in-memory Redis-protocol server for hosts without Redis.
+
+    Supports the commands RedisCache sends (GET, SET with PX/EX/NX, DEL,
+    SCAN, EVAL of the delete_if script, ...). Memory is bounded like MemoryCache, evicting least recently
+    used entries.
+
+    Example:
+        server = CacheServer(port=0).start()
+        scraper = GPlayScraper(cache=RedisCache(server.url))
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, path: str = None, max_bytes: int = None):
+        """Bind the server socket.
+
+        Args:
+            host: TCP interface to listen on
+            port: TCP port (0 picks a free one)
+            path: Unix socket path; when given, host and port are ignored
+            max_bytes: Memory cap for stored values (default: Config.CACHE_MAX_BYTES)
+        """
+        if path:
+            server_class = type("_UnixServer", (socketserver.ThreadingMixIn, socketserver.UnixStreamServer), {"daemon_threads": True})
+            self._server = server_class(path, _Handler)
+            self.url = f"unix://{path}"
+        else:
+            server_class = type("_TCPServer", (socketserver.ThreadingTCPServer,), {"daemon_threads": True, "allow_reuse_address": True})
+            self._server = server_class((host, port), _Handler)
+            self.url = f"redis://{host}:{self._server.server_address[1]}/0"
+        self._server.store = _Store(max_bytes or Config.CACHE_MAX_BYTES)
+        self._thread = None
+
+    def start(self) -> "CacheServer":
+        """Serve on a daemon thread and return self."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="gplay-cache-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until close() is called."""
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Shared gplay-scraper response cache server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--unix", help="listen on a Unix socket path instead of TCP")
+    parser.add_argument("--max-bytes", type=int, default=None)
+    options = parser.parse_args()
+    server = CacheServer(options.host, options.port, options.unix, options.max_bytes)
+    print(f"Serving shared cache on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.close()
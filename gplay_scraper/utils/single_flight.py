@@ -0,0 +1,129 @@
+"""Single-flight coalescing of identical concurrent requests.
+
+When several threads or tasks ask for the same request (same method, URL
+and body) at the same time, only the first one (the leader) performs the
+fetch. The others wait for the leader and get the same result or the
+same exception. Once the leader finishes, the key is released, so later
+callers fetch again.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """Result slot of one in-flight call."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread-safe coalescing of identical concurrent calls.
+
+    Attributes:
+        coalesced: Number of calls that were served by another caller's fetch
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self.coalesced = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn once per key among concurrent callers.
+
+        Args:
+            key: Identity of the call, e.g. PlayRequest.key
+            fn: Function performing the call
+
+        Returns:
+            Result of fn, shared with every concurrent caller for key
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being fetched."""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """Asyncio coalescing of identical concurrent coroutine calls.
+
+    The shared call runs as its own task and waiters are shielded, so one
+    caller being cancelled does not cancel the fetch for the others.
+
+    Attributes:
+        coalesced: Number of calls that were served by another caller's fetch
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self.coalesced = 0
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn once per key among concurrent callers.
+
+        Args:
+            key: Identity of the call, e.g. PlayRequest.key
+            fn: Coroutine function performing the call
+
+        Returns:
+            Result of fn, shared with every concurrent caller for key
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done, key=key: self._release(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being fetched."""
+        return len(self._calls)
@@ -40,10 +40,15 @@ setup(
             "cloudscraper>=1.2.0",
             "aiohttp>=3.8.0",
         ],
+        "cache": ["zstandard>=0.20.0"],
+        "json": ["orjson>=3.6.0"],
+        "columnar": ["numpy>=1.21.0", "pandas>=1.3.0", "pyarrow>=8.0.0"],
         "all": [
             "pytest>=7.0.0", "pytest-cov>=4.0.0", "black>=22.0.0", "flake8>=5.0.0",
             "curl-cffi>=0.5.0", "tls-client>=0.2.0", "httpx>=0.24.0", 
             "urllib3>=1.26.0", "cloudscraper>=1.2.0", "aiohttp>=3.8.0",
+            "zstandard>=0.20.0", "orjson>=3.6.0",
+            "numpy>=1.21.0", "pandas>=1.3.0", "pyarrow>=8.0.0",
         ],
     },
     python_requires=">=3.8",
@@ -0,0 +1,106 @@
+"""Local HTTP server shared by the offline transport tests."""
+
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler that answers GET and POST as configured on the owning LocalServer"""
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server = self.server.owner
+        status, delay = server._record(self)
+        if delay:
+            time.sleep(delay)
+        body = server.body(self.command, self.path) if callable(server.body) else server.body
+        self.send_response(status)
+        for name, value in server.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalServer:
+    """Threaded HTTP server on a free local port that records its requests.
+
+    The first `times` requests are answered with `status` after `delay`
+    seconds; later ones get 200 at once. Attributes may be changed while the
+    server runs.
+
+    Attributes:
+        url: Base URL without a trailing slash
+        hits: Number of requests received
+        paths: Request paths in arrival order
+        client_ports: Client port of every request, to check connection reuse
+    """
+
+    def __init__(self, status: int = 200, body=b"ok", delay: float = 0.0, headers: dict = None, times: int = None):
+        """Bind the server; call start() or use it as a context manager to serve.
+
+        Args:
+            status: Status code of the configured answers
+            body: Response bytes, or a callable taking (method, path) and returning them
+            delay: Seconds to wait before each configured answer
+            headers: Extra response headers
+            times: Number of requests that get status and delay (default: all)
+        """
+        self.status = status
+        self.body = body
+        self.delay = delay
+        self.headers = headers or {}
+        self.times = times
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.owner = self
+        self._thread = None
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the recorded requests."""
+        with self._lock:
+            self.hits = 0
+            self.paths = []
+            self.client_ports = []
+
+    def _record(self, handler):
+        with self._lock:
+            self.hits += 1
+            self.paths.append(handler.path)
+            self.client_ports.append(handler.client_address[1])
+            if self.times is None or self.hits <= self.times:
+                return self.status, self.delay
+            return 200, 0.0
+
+    def start(self) -> "LocalServer":
+        """Serve requests in a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def echo_path(method: str, path: str) -> bytes:
+    """Body callable that answers with the request path."""
+    return path.encode()
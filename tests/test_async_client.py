@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+import json
+import asyncio
+from unittest.mock import patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import AsyncGPlayScraper, Config
+from gplay_scraper.utils.async_http_client import AsyncHttpClient
+from tests.local_server import LocalServer
+
+
+SUGGESTIONS = ["whatsapp", "whatsapp business", "whatsapp web"]
+
+
+def _play_store_body(method, path):
+    """Answer batchexecute suggestion POSTs like the Play Store and other requests with ok"""
+    if method != "POST":
+        return b"ok"
+    payload = json.dumps([[[s] for s in SUGGESTIONS]])
+    return (")]}'\n\n" + json.dumps([["wrb.fr", "IJ4APc", "[" + payload + "]"]])).encode()
+
+
+class TestAsyncHttpClient(unittest.TestCase):
+    """Offline tests for the asyncio client and AsyncGPlayScraper"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(body=_play_store_body).start()
+        cls.url = cls.server.url
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+
+    def test_session_is_reused(self):
+        """Test that one pooled session serves every request"""
+        async def run():
+            async with AsyncHttpClient(rate_limit_delay=0) as client:
+                for _ in range(3):
+                    response = await client._try_request_with_client(client.client_type, "GET", self.url + "/")
+                    self.assertEqual(response.text, "ok")
+                self.assertEqual(len(client._sessions), 1)
+        asyncio.run(run())
+        self.assertEqual(len(set(self.server.client_ports)), 1)
+
+    def test_both_async_clients(self):
+        """Test GET through aiohttp and httpx async sessions"""
+        async def run(client_type):
+            async with AsyncHttpClient(rate_limit_delay=0, client_type=client_type) as client:
+                response = await client._try_request_with_client(client_type, "GET", self.url + "/")
+                self.assertEqual(response.status_code, 200)
+        for client_type in Config.ASYNC_HTTP_CLIENTS:
+            try:
+                __import__(client_type)
+            except ImportError:
+                continue
+            asyncio.run(run(client_type))
+
+    def test_concurrent_suggest_analyze(self):
+        """Test many concurrent suggest_analyze calls on one event loop"""
+        async def run():
+            async with AsyncGPlayScraper(rate_limit_delay=0) as scraper:
+                return await asyncio.gather(*(scraper.suggest_analyze(f"whatsapp {i}", count=2) for i in range(20)))
+        with patch.object(Config, "PLAY_STORE_BASE_URL", self.url):
+            results = asyncio.run(run())
+        self.assertEqual(len(results), 20)
+        for suggestions in results:
+            self.assertEqual(suggestions, SUGGESTIONS[:2])
+
+    def test_invalid_input_raises(self):
+        """Test that async methods validate inputs like the sync ones"""
+        from gplay_scraper import InvalidAppIdError
+
+        async def run():
+            async with AsyncGPlayScraper(rate_limit_delay=0) as scraper:
+                await scraper.app_analyze("")
+        with self.assertRaises(InvalidAppIdError):
+            asyncio.run(run())
+
+    def test_methods_are_coroutines(self):
+        """Test that every analyze method of AsyncGPlayScraper is awaitable"""
+        for name in ["app", "search", "reviews", "developer", "similar", "list", "suggest"]:
+            self.assertTrue(asyncio.iscoroutinefunction(getattr(AsyncGPlayScraper, f"{name}_analyze")), name)
+
+
+if __name__ == '__main__':
+    unittest.main()
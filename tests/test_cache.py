@@ -0,0 +1,215 @@
+import unittest
+import sys
+import os
+import time
+import asyncio
+from unittest.mock import patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import Config, MemoryCache, ResponseCache
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.async_http_client import AsyncHttpClient
+from gplay_scraper.utils.cache import cache_key, cache_ttl
+from gplay_scraper.utils.request_builder import PlayRequest, build_reviews_request, build_app_page_request
+from tests.local_server import LocalServer, echo_path
+
+
+class TestMemoryCache(unittest.TestCase):
+    """Offline tests for the in-memory LRU cache"""
+
+    def test_hit_and_miss(self):
+        """Test that stored values are returned and counted"""
+        cache = MemoryCache()
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", "page", 60)
+        self.assertEqual(cache.get("a"), "page")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after their TTL and are dropped without stale retention"""
+        cache = MemoryCache()
+        cache.set("a", "page", 0.05)
+        time.sleep(0.06)
+        with patch.dict(Config.CACHE_MAX_STALE, {}, clear=True):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_lru_eviction_by_bytes(self):
+        """Test that the least recently used entry is evicted when the byte cap is exceeded"""
+        value = "x" * 1000
+        cache = MemoryCache(max_bytes=3 * sys.getsizeof(value))
+        for key in ("a", "b", "c"):
+            cache.set(key, value, 60)
+        cache.get("a")
+        cache.set("d", value, 60)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), value)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertLessEqual(cache.stats()["bytes"], cache.max_bytes)
+
+    def test_add_is_set_if_absent(self):
+        """Test that add only stores missing keys"""
+        cache = MemoryCache()
+        self.assertTrue(cache.add("a", "first", 60))
+        self.assertFalse(cache.add("a", "second", 60))
+        self.assertEqual(cache.get("a"), "first")
+
+    def test_delete_if_checks_value(self):
+        """Test that delete_if leaves a key holding another value"""
+        cache = MemoryCache()
+        cache.set("lock", "owner-b", 60)
+        self.assertFalse(cache.delete_if("lock", "owner-a"))
+        self.assertTrue(cache.delete_if("lock", "owner-b"))
+        self.assertIsNone(cache.get("lock"))
+
+    def test_keys_skip_expired(self):
+        """Test that keys() lists only unexpired entries"""
+        cache = MemoryCache()
+        cache.set("a", "1", 60)
+        cache.set("b", "2", 0.01)
+        time.sleep(0.02)
+        self.assertEqual(cache.keys(), ["a"])
+
+    def test_incomplete_backend_is_rejected(self):
+        """Test that a backend missing part of the interface cannot be created"""
+        class GetOnlyCache(ResponseCache):
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnlyCache()
+
+    def test_keys_and_ttls(self):
+        """Test that keys include locale and TTLs follow the endpoint"""
+        us = build_app_page_request("com.whatsapp", "en", "us")
+        de = build_app_page_request("com.whatsapp", "de", "de")
+        self.assertNotEqual(cache_key(us), cache_key(de))
+        self.assertEqual(cache_ttl(us), Config.CACHE_TTLS["app"])
+        newest = build_reviews_request("com.whatsapp", sort=2)
+        relevant = build_reviews_request("com.whatsapp", sort=1)
+        self.assertEqual(cache_ttl(newest), Config.CACHE_TTLS["reviews_newest"])
+        self.assertGreater(cache_ttl(relevant), cache_ttl(newest))
+
+
+class TestTransportCache(unittest.TestCase):
+    """Offline tests for the cache in front of HttpClient and AsyncHttpClient"""
+
+    def setUp(self):
+        self.server = LocalServer(body=echo_path).start()
+        self.url = self.server.url
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _request(self, endpoint, path):
+        return PlayRequest(endpoint, "GET", [self.url + path], failed=("APP_FETCH_FAILED", {"app_id": path}))
+
+    def test_repeated_fetch_is_served_from_cache(self):
+        """Test that a second fetch of the same page does not reach the server"""
+        cache = MemoryCache()
+        with HttpClient(client_type="requests", rate_limit_delay=0, cache=cache) as client:
+            first = client._fetch(self._request("app", "/details?id=com.whatsapp"))
+            second = client._fetch(self._request("app", "/details?id=com.whatsapp"))
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.hits, 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_uncached_endpoint(self):
+        """Test that endpoints without a TTL always go to the network"""
+        with patch.dict(Config.CACHE_TTLS, {"app": 0}):
+            with HttpClient(client_type="requests", rate_limit_delay=0, cache=MemoryCache()) as client:
+                client._fetch(self._request("app", "/details?id=com.whatsapp"))
+                client._fetch(self._request("app", "/details?id=com.whatsapp"))
+        self.assertEqual(self.server.hits, 2)
+
+    def test_async_client_uses_cache(self):
+        """Test that the async client reads and fills the same cache"""
+        cache = MemoryCache()
+        request = self._request("suggest", "/suggest?q=whats")
+        with HttpClient(client_type="requests", rate_limit_delay=0, cache=cache) as client:
+            client._fetch(request)
+
+        async def run():
+            async with AsyncHttpClient(rate_limit_delay=0, cache=cache) as client:
+                return await client._fetch(request)
+
+        self.assertEqual(asyncio.run(run()), "/suggest?q=whats")
+        self.assertEqual(self.server.hits, 1)
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """Offline tests for serving expired entries while refreshing them"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(body=echo_path).start()
+        cls.url = cls.server.url
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+        self.request = PlayRequest("app", "GET", [self.url + "/details?id=com.whatsapp"],
+                                   failed=("APP_FETCH_FAILED", {"app_id": "com.whatsapp"}))
+        self.cache = MemoryCache()
+        self.cache.set(cache_key(self.request), "old page", 0.01)
+        time.sleep(0.02)
+
+    def _wait_for_refresh(self):
+        deadline = time.monotonic() + 5
+        while self.cache.get(cache_key(self.request)) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_get_stale(self):
+        """Test that expired entries are only visible through get_stale"""
+        key = cache_key(self.request)
+        self.assertIsNone(self.cache.get(key))
+        value, staleness = self.cache.get_stale(key, 60)
+        self.assertEqual(value, "old page")
+        self.assertGreater(staleness, 0)
+        self.assertIsNone(self.cache.get_stale(key, 0.001))
+        self.assertEqual(self.cache.stats()["stale_hits"], 1)
+
+    def test_stale_entry_served_and_refreshed_once(self):
+        """Test that stale hits return at once and trigger a single refresh"""
+        with HttpClient(client_type="requests", rate_limit_delay=0, cache=self.cache, stale_while_revalidate=True) as client:
+            results = [client._fetch(self.request) for _ in range(5)]
+            self._wait_for_refresh()
+            self.assertEqual(client._fetch(self.request), "/details?id=com.whatsapp")
+        self.assertEqual(results, ["old page"] * 5)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_max_staleness_bound(self):
+        """Test that entries older than the bound are fetched synchronously"""
+        with patch.dict(Config.CACHE_MAX_STALE, {"app": 0.001}):
+            with HttpClient(client_type="requests", rate_limit_delay=0, cache=self.cache, stale_while_revalidate=True) as client:
+                self.assertEqual(client._fetch(self.request), "/details?id=com.whatsapp")
+        self.assertEqual(self.server.hits, 1)
+
+    def test_disabled_by_default(self):
+        """Test that expired entries are not served unless the mode is enabled"""
+        with HttpClient(client_type="requests", rate_limit_delay=0, cache=self.cache) as client:
+            self.assertEqual(client._fetch(self.request), "/details?id=com.whatsapp")
+
+    def test_async_client(self):
+        """Test that the async client serves stale data and refreshes it in a task"""
+        async def run():
+            async with AsyncHttpClient(rate_limit_delay=0, cache=self.cache, stale_while_revalidate=True) as client:
+                results = await asyncio.gather(*(client._fetch(self.request) for _ in range(3)))
+                while client._refresh_tasks:
+                    await asyncio.sleep(0.01)
+                return results, await client._fetch(self.request)
+
+        results, fresh = asyncio.run(run())
+        self.assertEqual(results, ["old page"] * 3)
+        self.assertEqual(fresh, "/details?id=com.whatsapp")
+        self.assertEqual(self.server.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
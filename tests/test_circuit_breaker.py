@@ -0,0 +1,133 @@
+import unittest
+import sys
+import os
+import time
+import asyncio
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import NetworkError
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.async_http_client import AsyncHttpClient
+from gplay_scraper.utils.circuit_breaker import CircuitBreaker, ClientHealth
+from tests.local_server import LocalServer
+
+
+# Nothing listens on port 1, so every attempt fails at the transport level
+UNREACHABLE_URL = "http://127.0.0.1:1/"
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Offline tests for the breaker state machine"""
+
+    def test_opens_at_error_rate(self):
+        """Test that the breaker opens once the windowed error rate crosses the threshold"""
+        breaker = CircuitBreaker("requests", failure_threshold=0.5, min_requests=4)
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow())
+
+    def test_half_open_single_probe(self):
+        """Test that only one probe passes in half-open state and success closes the breaker"""
+        breaker = CircuitBreaker("requests", min_requests=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe opens the breaker again"""
+        breaker = CircuitBreaker("requests", min_requests=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_window_forgets_old_failures(self):
+        """Test that outcomes older than the window no longer count"""
+        breaker = CircuitBreaker("requests", failure_threshold=0.6, min_requests=2, window=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_health_registry(self):
+        """Test that unavailable clients are never usable"""
+        health = ClientHealth(["requests", "curl_cffi"])
+        health.breaker("curl_cffi").mark_unavailable()
+        self.assertFalse(health.is_usable("curl_cffi"))
+        self.assertTrue(health.any_usable())
+        self.assertEqual(health.snapshot()["curl_cffi"]["state"], CircuitBreaker.UNAVAILABLE)
+
+
+class TestHttpClientBreakers(unittest.TestCase):
+    """Offline tests for breaker-aware client fallback"""
+
+    def _open_all(self, client):
+        for name in client.available_clients:
+            breaker = client.health.breaker(name)
+            breaker.reset_timeout = 60
+            breaker._open(time.monotonic())
+
+    def test_transport_failures_open_breaker(self):
+        """Test that repeated connection errors open the client's breaker"""
+        with HttpClient(client_type="requests") as client:
+            client.available_clients = ["requests"]
+            client.health = ClientHealth(["requests"], min_requests=2)
+            for _ in range(2):
+                with self.assertRaises(Exception):
+                    client._make_request("GET", UNREACHABLE_URL, timeout=1)
+            self.assertEqual(client.health.breaker("requests").state, CircuitBreaker.OPEN)
+
+    def test_all_open_fails_fast(self):
+        """Test that an open breaker on every client raises without any network attempt"""
+        with HttpClient(client_type="requests") as client:
+            self._open_all(client)
+            start = time.monotonic()
+            with self.assertRaises(NetworkError):
+                client._make_request("GET", UNREACHABLE_URL)
+            self.assertLess(time.monotonic() - start, 0.1)
+            self.assertFalse(client._try_next_client())
+
+    def test_http_status_is_not_a_client_failure(self):
+        """Test that a 404 from the server leaves the breaker closed"""
+        with LocalServer(status=404, body=b"missing") as server, HttpClient(client_type="requests") as client:
+            client.available_clients = ["requests"]
+            client.health = ClientHealth(["requests"], min_requests=1)
+            with self.assertRaises(NetworkError):
+                client._make_request("GET", server.url + "/")
+            self.assertEqual(client.health.breaker("requests").state, CircuitBreaker.CLOSED)
+
+    def test_try_next_client_skips_open(self):
+        """Test that client rotation skips clients whose breaker is open"""
+        with HttpClient(client_type="requests") as client:
+            if len(client.available_clients) < 3:
+                self.skipTest("needs three HTTP clients")
+            skipped = client.available_clients[(client.current_client_index + 1) % len(client.available_clients)]
+            client.health.breaker(skipped).mark_unavailable()
+            self.assertTrue(client._try_next_client())
+            self.assertNotEqual(client.client_type, skipped)
+
+    def test_async_all_open_fails_fast(self):
+        """Test that the async client shares the same fail-fast behaviour"""
+        async def run():
+            async with AsyncHttpClient(rate_limit_delay=0) as client:
+                self._open_all(client)
+                with self.assertRaises(NetworkError):
+                    await client._make_request("GET", UNREACHABLE_URL)
+                self.assertFalse(client._try_next_client())
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.client_selector import ClientSelector
+from gplay_scraper.utils.request_builder import PlayRequest
+from tests.local_server import LocalServer
+
+
+class TestClientSelector(unittest.TestCase):
+    """Offline tests for the per-endpoint client bandit"""
+
+    def test_untried_clients_come_first(self):
+        """Test that clients without observations are explored before ranked ones"""
+        selector = ClientSelector(["requests", "httpx", "urllib3"])
+        selector.record("app", "requests", True, 0.1)
+        self.assertEqual(selector.order("app")[-1], "requests")
+
+    def test_prefers_fast_successful_client(self):
+        """Test that a client that keeps failing falls behind one that succeeds"""
+        selector = ClientSelector(["requests", "curl_cffi"], exploration=0.1)
+        for _ in range(20):
+            selector.record("app", "requests", False)
+            selector.record("app", "curl_cffi", True, 0.2)
+        self.assertEqual(selector.order("app")[0], "curl_cffi")
+
+    def test_latency_breaks_ties(self):
+        """Test that the faster of two reliable clients ranks first"""
+        selector = ClientSelector(["requests", "httpx"], exploration=0.1)
+        for _ in range(20):
+            selector.record("suggest", "requests", True, 2.0)
+            selector.record("suggest", "httpx", True, 0.1)
+        self.assertEqual(selector.order("suggest")[0], "httpx")
+
+    def test_endpoints_are_independent(self):
+        """Test that rankings are kept per endpoint"""
+        selector = ClientSelector(["requests", "curl_cffi"], exploration=0.1)
+        for _ in range(20):
+            selector.record("app", "requests", False)
+            selector.record("app", "curl_cffi", True, 0.2)
+            selector.record("reviews", "requests", True, 0.2)
+            selector.record("reviews", "curl_cffi", False)
+        self.assertEqual(selector.order("app")[0], "curl_cffi")
+        self.assertEqual(selector.order("reviews")[0], "requests")
+
+    def test_discount_follows_changes(self):
+        """Test that recent outcomes outweigh old ones"""
+        selector = ClientSelector(["requests", "curl_cffi"], exploration=0.1, discount=0.8)
+        for _ in range(30):
+            selector.record("app", "requests", True, 0.1)
+            selector.record("app", "curl_cffi", True, 0.5)
+        for _ in range(10):
+            selector.record("app", "requests", False)
+            selector.record("app", "curl_cffi", True, 0.5)
+        self.assertEqual(selector.order("app")[0], "curl_cffi")
+        self.assertLess(selector.stats()["app"]["requests"]["success_rate"], 0.2)
+
+    def test_auto_mode_records_outcomes(self):
+        """Test that HttpClient in auto mode feeds the selector per endpoint"""
+        with LocalServer() as server, HttpClient(client_type="auto", rate_limit_delay=0) as client:
+            client.available_clients = ["requests", "urllib3"]
+            request = PlayRequest("app", "GET", [server.url + "/"], failed=("APP_FETCH_FAILED", {"app_id": "x"}))
+            for _ in range(4):
+                self.assertEqual(client._fetch(request), "ok")
+            stats = client.selector.stats()["app"]
+        self.assertEqual(set(stats), {"requests", "urllib3"})
+        self.assertTrue(all(arm["success_rate"] == 1.0 for arm in stats.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import unittest
+import sys
+import os
+import time
+import zlib
+import sqlite3
+import tempfile
+import multiprocessing
+from unittest.mock import patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import Config, SQLiteCache
+from gplay_scraper.utils.http_client import HttpClient
+
+
+def _write_entries(path, worker, count):
+    """Write entries from a separate process"""
+    cache = SQLiteCache(path)
+    for i in range(count):
+        cache.set(f"{worker}-{i}", f"<html>{worker} {i}</html>" * 50, 60)
+    cache.add("shared", f"winner {worker}", 60)
+    cache.close()
+
+
+def _write_after_fork(cache, inherited):
+    """Write through a cache inherited from the parent process"""
+    if cache._connection() is inherited:
+        sys.exit(1)
+    cache.set("child", "page", 60)
+    cache.close()
+
+
+class TestSQLiteCache(unittest.TestCase):
+    """Offline tests for the persistent SQLite cache"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache", "responses.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_persistence(self):
+        """Test that entries survive reopening the database"""
+        page = "<html>" + "whatsapp " * 5000 + "</html>"
+        cache = SQLiteCache(self.path)
+        cache.set("app", page, 60)
+        cache.close()
+        reopened = SQLiteCache(self.path)
+        self.assertEqual(reopened.get("app"), page)
+        self.assertEqual(reopened.stats()["hits"], 1)
+
+    def test_bodies_are_compressed(self):
+        """Test that stored bodies are much smaller than the page"""
+        page = "<html>" + "whatsapp " * 5000 + "</html>"
+        cache = SQLiteCache(self.path, compression="zlib")
+        cache.set("app", page, 60)
+        self.assertLess(cache.stats()["bytes"], len(page) / 10)
+        body = cache._connection().execute("SELECT body FROM responses").fetchone()[0]
+        self.assertEqual(zlib.decompress(body).decode(), page)
+
+    def test_ttl(self):
+        """Test that expired entries are not returned"""
+        cache = SQLiteCache(self.path)
+        cache.set("app", "page", 0.05)
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("app"))
+        self.assertTrue(cache.add("app", "fresh", 60))
+        self.assertFalse(cache.add("app", "late", 60))
+        self.assertEqual(cache.get("app"), "fresh")
+
+    def test_delete_if_checks_value(self):
+        """Test that delete_if only removes an unexpired entry holding the value"""
+        cache = SQLiteCache(self.path)
+        cache.set("lock", "owner-b", 60)
+        self.assertFalse(cache.delete_if("lock", "owner-a"))
+        self.assertTrue(cache.delete_if("lock", "owner-b"))
+        self.assertIsNone(cache.get("lock"))
+
+    def test_size_bounded_eviction(self):
+        """Test that the least recently read entries are evicted over the byte cap"""
+        cache = SQLiteCache(self.path, compression="zlib")
+        cache.set("k0", os.urandom(600).hex(), 60)
+        cache.max_bytes = int(cache.stats()["bytes"] * 3.5)
+        for i in range(1, 3):
+            time.sleep(0.01)
+            cache.set(f"k{i}", os.urandom(600).hex(), 60)
+        cache.get("k0")
+        cache.set("k3", os.urandom(600).hex(), 60)
+        self.assertIsNotNone(cache.get("k0"))
+        self.assertIsNone(cache.get("k1"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertLessEqual(cache.stats()["bytes"], cache.max_bytes)
+
+    def test_read_hit_does_not_wait_for_write_lock(self):
+        """Test that hits return at once while another connection holds the write lock"""
+        cache = SQLiteCache(self.path)
+        cache.set("app", "page", 60)
+        writer = sqlite3.connect(self.path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            read_at = time.time()
+            started = time.monotonic()
+            with patch.object(Config, "DISK_CACHE_TOUCH_BATCH", 1):
+                self.assertEqual(cache.get("app"), "page")
+            self.assertLess(time.monotonic() - started, 1.0)
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+        # The pending read time is written with the next write
+        cache.set("other", "page", 60)
+        accessed, = cache._connection().execute("SELECT accessed_at FROM responses WHERE key = 'app'").fetchone()
+        self.assertGreaterEqual(accessed, read_at)
+        self.assertEqual(cache._touched, {})
+
+    def test_busy_delete_and_clear_do_not_raise(self):
+        """Test that delete and clear on a locked database log instead of raising"""
+        with patch.object(Config, "DISK_CACHE_BUSY_TIMEOUT", 0.05):
+            cache = SQLiteCache(self.path)
+            cache.set("app", "page", 60)
+        writer = sqlite3.connect(self.path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            with self.assertLogs("gplay_scraper.utils.disk_cache", "WARNING"):
+                cache.delete("app")
+                cache.clear()
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+        self.assertEqual(cache.get("app"), "page")
+
+    def test_failed_write_does_not_raise(self):
+        """Test that a write failing inside its transaction is rolled back and logged"""
+        cache = SQLiteCache(self.path)
+        cache.set("app", "page", 60)
+        cache.get("app")
+        with patch.object(cache, "_evict", side_effect=sqlite3.OperationalError("database or disk is full")):
+            with self.assertLogs("gplay_scraper.utils.disk_cache", "WARNING"):
+                cache.set("other", "page", 60)
+                self.assertFalse(cache.add("third", "page", 60))
+        self.assertIsNone(cache.get("other"))
+        # Read times taken by the failed transaction wait for the next write
+        self.assertIn("app", cache._touched)
+        cache.set("other", "page", 60)
+        self.assertEqual(cache._touched, {})
+
+    def test_fork_opens_new_connection(self):
+        """Test that no connection is held after setup and a forked child opens its own"""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("fork is not available")
+        cache = SQLiteCache(self.path)
+        self.assertIsNone(getattr(cache._local, "conn", None))
+        cache.set("parent", "page", 60)
+        worker = multiprocessing.get_context("fork").Process(target=_write_after_fork, args=(cache, cache._connection()))
+        worker.start()
+        worker.join(60)
+        self.assertEqual(worker.exitcode, 0)
+        self.assertEqual(cache.get("child"), "page")
+        self.assertEqual(cache.get("parent"), "page")
+
+    def test_concurrent_processes(self):
+        """Test that several worker processes can write to one cache file"""
+        SQLiteCache(self.path).close()
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_write_entries, args=(self.path, w, 20)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            self.assertEqual(worker.exitcode, 0)
+        cache = SQLiteCache(self.path)
+        self.assertEqual(cache.stats()["entries"], 4 * 20 + 1)
+        self.assertTrue(cache.get("shared").startswith("winner"))
+
+    def test_plugs_into_http_client(self):
+        """Test that HttpClient accepts the disk cache like any ResponseCache"""
+        cache = SQLiteCache(self.path)
+        with HttpClient(client_type="requests", rate_limit_delay=0, cache=cache) as client:
+            self.assertIs(client.cache, cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
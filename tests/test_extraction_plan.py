@@ -0,0 +1,78 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper.models.element_specs import ElementSpec, ElementSpecs, ExtractionPlan, extraction_plan
+from gplay_scraper.utils.lazy_json import LazyJson
+
+
+def _fill(specs, skip_every=3):
+    """Build raw data with a value at most spec paths, leaving some primaries missing."""
+    data = []
+    for index, spec in enumerate(specs.values()):
+        while isinstance(spec, ElementSpec):
+            if index % skip_every:
+                node = data
+                path = spec.data_map
+                for key, following in zip(path, list(path[1:]) + [None]):
+                    if isinstance(node, list):
+                        while len(node) <= key:
+                            node.append(None)
+                    if following is None:
+                        node[key] = f"value {index}"
+                    elif not isinstance(node[key] if isinstance(node, list) else node.get(key), (list, dict)):
+                        node[key] = [] if isinstance(following, int) else {}
+                    node = node[key]
+            spec = spec.fallback_value
+            index += 1
+    return data
+
+
+class TestExtractionPlan(unittest.TestCase):
+    """Offline tests for compiled ElementSpec extraction"""
+
+    def test_matches_extract_content_for_every_kind(self):
+        """Test each spec set against per-spec extract_content"""
+        for kind in ("App", "Search", "Review", "Developer", "Similar", "List"):
+            specs = getattr(ElementSpecs, kind)
+            for skip_every in (2, 3, 1000):
+                data = _fill(specs, skip_every)
+                with self.subTest(kind=kind, skip_every=skip_every):
+                    expected = {key: spec.extract_content(data) for key, spec in specs.items()}
+                    self.assertEqual(extraction_plan(kind).extract(data), expected)
+
+    def test_fallback_chain_and_processors(self):
+        """Test fallbacks, failing post-processors and image assets"""
+        def image_size(url, assets):
+            return f"{url}={assets}"
+
+        specs = {
+            "first": ElementSpec(None, [0, 5], fallback_value=ElementSpec(None, [0, 1], fallback_value="default")),
+            "default": ElementSpec(None, [9], fallback_value=ElementSpec(None, [8], fallback_value="default")),
+            "broken": ElementSpec(None, [0, 0], lambda value: value / 0),
+            "image": ElementSpec(None, [1], image_size),
+            "root": ElementSpec(None, [], len),
+        }
+        data = [["a", "b"], "url"]
+        result = ExtractionPlan(specs).extract(data, "LARGE")
+        self.assertEqual(result, {"first": "b", "default": "default", "broken": "a", "image": "url=LARGE", "root": 2})
+        self.assertEqual(result, {key: spec.extract_content(data, "LARGE") for key, spec in specs.items()})
+
+    def test_field_subset(self):
+        """Test that a plan can be limited to some fields, in spec order"""
+        plan = extraction_plan("App", ["score", "title", "unknown"])
+        self.assertEqual(plan.fields, ["title", "score"])
+        self.assertIs(plan, extraction_plan("App", ["title", "score"]))
+
+    def test_lazy_source(self):
+        """Test extraction from a LazyJson view"""
+        data = '[["a", ["b", [1, 2]]], null]'
+        specs = {"b": ElementSpec(None, [0, 1, 0]), "list": ElementSpec(None, [0, 1, 1]), "missing": ElementSpec(None, [1, 0])}
+        self.assertEqual(ExtractionPlan(specs).extract(LazyJson(data)), {"b": "b", "list": [1, 2], "missing": None})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+import sys
+import os
+import time
+import asyncio
+import threading
+from unittest.mock import patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import Config, RetryPolicy, RetryBudget, RateLimiter, AdaptiveRateLimiter
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.async_http_client import AsyncHttpClient
+from gplay_scraper.utils.hedging import LatencyTracker
+from gplay_scraper.utils.request_builder import PlayRequest
+from tests.local_server import LocalServer
+
+
+STALL = 0.6
+
+
+class TestLatencyTracker(unittest.TestCase):
+    """Offline tests for per-endpoint latency quantiles"""
+
+    def test_needs_samples(self):
+        """Test that endpoints are not hedged before enough samples exist"""
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(4):
+            tracker.record("app", 0.1)
+        self.assertIsNone(tracker.hedge_delay("app"))
+        tracker.record("app", 0.1)
+        self.assertEqual(tracker.hedge_delay("app"), 0.1)
+
+    def test_quantile(self):
+        """Test that the hedge delay follows the configured quantile per endpoint"""
+        tracker = LatencyTracker(quantile=0.9, min_samples=1, min_delay=0)
+        for i in range(100):
+            tracker.record("app", i / 100)
+        tracker.record("developer", 2.0)
+        self.assertAlmostEqual(tracker.hedge_delay("app"), 0.9)
+        self.assertEqual(tracker.hedge_delay("developer"), 2.0)
+
+
+class TestHedgedRequests(unittest.TestCase):
+    """Offline tests for hedging in HttpClient and AsyncHttpClient"""
+
+    def setUp(self):
+        # The first request stalls and later ones answer at once
+        self.server = LocalServer(delay=STALL, times=1).start()
+        self.request = PlayRequest("app", "GET", [self.server.url + "/"], failed=("APP_FETCH_FAILED", {"app_id": "x"}))
+        patcher = patch.object(Config, "HEDGE_REQUESTS", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _prime(self, client):
+        for _ in range(Config.HEDGE_MIN_SAMPLES):
+            client.latency.record("app", 0.01)
+
+    def test_hedge_beats_straggler(self):
+        """Test that a hedge answers while the first copy is stuck"""
+        with HttpClient(client_type="requests", rate_limit_delay=0) as client:
+            self._prime(client)
+            start = time.monotonic()
+            self.assertEqual(client._fetch(self.request), "ok")
+            self.assertLess(time.monotonic() - start, STALL / 2)
+        self.assertEqual(self.server.hits, 2)
+
+    def test_no_budget_no_hedge(self):
+        """Test that hedges are skipped when the retry budget is empty"""
+        policy = RetryPolicy(budget=RetryBudget(ratio=0, burst=0, min_rate=0))
+        with HttpClient(client_type="requests", rate_limit_delay=0, retry_policy=policy) as client:
+            self._prime(client)
+            self.assertEqual(client._fetch(self.request), "ok")
+        self.assertEqual(self.server.hits, 1)
+
+    def test_hedge_with_adaptive_limiter(self):
+        """Test that a hedge does not wait for the concurrency slot its primary holds"""
+        limiter = AdaptiveRateLimiter(rate=100, burst=1)
+        results = []
+        with HttpClient(client_type="requests", rate_limiter=limiter) as client:
+            self._prime(client)
+            worker = threading.Thread(target=lambda: results.append(client._fetch(self.request)), daemon=True)
+            worker.start()
+            worker.join(timeout=STALL * 5)
+            self.assertFalse(worker.is_alive())
+        self.assertEqual(results, ["ok"])
+        self.assertEqual(self.server.hits, 2)
+        self.assertEqual(limiter.stats()["html"]["in_flight"], 0)
+
+    def test_no_free_token_no_hedge(self):
+        """Test that hedges are skipped when the rate limiter has no token to spare"""
+        with HttpClient(client_type="requests", rate_limiter=RateLimiter(rate=0.01)) as client:
+            self._prime(client)
+            self.assertEqual(client._fetch(self.request), "ok")
+        self.assertEqual(self.server.hits, 1)
+
+    def test_async_hedge_with_adaptive_limiter(self):
+        """Test that the async hedge does not wait for the primary's concurrency slot"""
+        limiter = AdaptiveRateLimiter(rate=100, burst=1)
+
+        async def run():
+            async with AsyncHttpClient(rate_limiter=limiter) as client:
+                self._prime(client)
+                return await asyncio.wait_for(client._fetch(self.request), STALL * 5)
+
+        self.assertEqual(asyncio.run(run()), "ok")
+        self.assertEqual(self.server.hits, 2)
+        self.assertEqual(limiter.stats()["html"]["in_flight"], 0)
+
+    def test_async_hedge_beats_straggler(self):
+        """Test that the async client hedges and cancels the slow copy"""
+        async def run():
+            async with AsyncHttpClient(rate_limit_delay=0) as client:
+                self._prime(client)
+                start = time.monotonic()
+                text = await client._fetch(self.request)
+                return text, time.monotonic() - start
+
+        text, elapsed = asyncio.run(run())
+        self.assertEqual(text, "ok")
+        self.assertLess(elapsed, STALL / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
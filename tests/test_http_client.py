@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import GPlayScraper
+from gplay_scraper.utils.http_client import HttpClient
+from tests.local_server import LocalServer
+
+
+class TestHttpClientSessions(unittest.TestCase):
+    """Offline tests for pooled HTTP sessions"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer().start()
+        cls.url = cls.server.url + "/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+
+    def test_session_is_reused(self):
+        """Test that the same session object is returned for repeated calls"""
+        with HttpClient(client_type="requests") as client:
+            self.assertIs(client._get_session("requests"), client._get_session("requests"))
+
+    def test_pool_size_is_applied(self):
+        """Test that the configured pool size reaches the requests adapter"""
+        with HttpClient(client_type="requests", pool_size=4) as client:
+            adapter = client._get_session("requests").get_adapter("https://play.google.com")
+            self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_connections_are_kept_alive(self):
+        """Test that consecutive requests share one TCP connection"""
+        clients = ["requests", "httpx", "urllib3", "aiohttp"]
+        for client_type in clients:
+            self.server.reset()
+            try:
+                client = HttpClient(client_type=client_type)
+            except ImportError:
+                continue
+            with client:
+                for _ in range(3):
+                    response = client._try_request_with_client(client_type, "GET", self.url)
+                    self.assertEqual(response.text, "ok")
+            self.assertEqual(len(set(self.server.client_ports)), 1, client_type)
+
+    def test_close_releases_sessions(self):
+        """Test that close() drops sessions and later requests reopen them"""
+        client = HttpClient(client_type="requests")
+        client.close()
+        self.assertEqual(client._sessions, {})
+        response = client._try_request_with_client("requests", "GET", self.url)
+        self.assertEqual(response.text, "ok")
+        client.close()
+
+    def test_method_types_share_one_transport(self):
+        """Test that all 7 method types use the scraper's single HttpClient"""
+        with GPlayScraper() as scraper:
+            method_groups = [scraper.app_methods, scraper.search_methods, scraper.reviews_methods,
+                             scraper.developer_methods, scraper.similar_methods, scraper.list_methods,
+                             scraper.suggest_methods]
+            for methods in method_groups:
+                self.assertIs(methods.scraper.http_client, scraper.http_client)
+
+    def test_scraper_context_manager(self):
+        """Test that GPlayScraper can be used as a context manager"""
+        with GPlayScraper() as scraper:
+            self.assertIsInstance(scraper, GPlayScraper)
+
+
+if __name__ == '__main__':
+    unittest.main()
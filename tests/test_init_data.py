@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import json
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper.utils.init_data import InitDataIndex, find_init_data
+from gplay_scraper.core.gplay_parser import SearchParser
+
+
+def _callback(key, data, script=True):
+    call = f"AF_initDataCallback({{key: '{key}', hash: '7', data:{json.dumps(data)}, sideChannel: {{}}}});"
+    return f'<script nonce="n">{call}</script>' if script else call
+
+
+class TestInitDataIndex(unittest.TestCase):
+    """Offline tests for the single-pass AF_initDataCallback extractor"""
+
+    def setUp(self):
+        self.html = (
+            "<html><body>"
+            + _callback("ds:1", [[1, "a"], None])
+            + _callback("ds:5", [["WhatsApp", "text with }); inside"]])
+            + "<script>var x = 1;</script>"
+            + _callback("ds:3", {"apps": [1, 2]})
+            + "</body></html>"
+        )
+
+    def test_offsets_for_every_block(self):
+        """Test that one scan finds every dataset key in page order"""
+        self.assertEqual(InitDataIndex(self.html).keys(), ["ds:1", "ds:5", "ds:3"])
+
+    def test_literal(self):
+        """Test that the object literal is returned exactly"""
+        literal = find_init_data(self.html, "ds:5")
+        self.assertTrue(literal.startswith("{key: 'ds:5'"))
+        self.assertTrue(literal.endswith("sideChannel: {}}"))
+        self.assertIn("text with }); inside", literal)
+        self.assertEqual(find_init_data(self.html, "ds:9"), "")
+
+    def test_data_decoded_on_demand(self):
+        """Test that data values are decoded lazily and only once"""
+        index = InitDataIndex(self.html)
+        self.assertEqual(index._decoded, {})
+        self.assertEqual(index.data("ds:3"), {"apps": [1, 2]})
+        self.assertIs(index.data("ds:3"), index.data("ds:3"))
+        self.assertEqual(list(index._decoded), ["ds:3"])
+        self.assertIsNone(index.data("ds:9"))
+
+    def test_key_not_first_and_shared_script(self):
+        """Test callbacks sharing a script tag and keys after other properties"""
+        html = ("<script>" + _callback("ds:1", [1], script=False)
+                + "AF_initDataCallback({hash: '2', key: 'ds:2', data:[2], sideChannel: {}});</script>")
+        index = InitDataIndex(html)
+        self.assertEqual(index.datasets(), {"ds:1": [1], "ds:2": [2]})
+
+    def test_search_parser_uses_index(self):
+        """Test that parse_html_content returns every decodable dataset"""
+        html = self.html + "<script>AF_initDataCallback({key: 'ds:7', data:function(){return 1}, sideChannel: {}});</script>"
+        dataset = SearchParser().parse_html_content(html)
+        self.assertEqual(sorted(dataset), ["ds:1", "ds:3", "ds:5"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+import json
+import math
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper.utils.js_literal import parse_js_literal, js_literal_to_json, JsLiteralError
+from gplay_scraper.utils.helpers import clean_json_string, alternative_json_clean
+from gplay_scraper.core.gplay_parser import AppParser
+
+
+class TestParseJsLiteral(unittest.TestCase):
+    """Offline tests for the single-pass JavaScript literal decoder"""
+
+    def test_callback_literal(self):
+        """Test bare keys, single quotes and sideChannel removal"""
+        literal = "{key: 'ds:5', hash: '13', data:[[\"WhatsApp\", 4.5, null]], sideChannel: {}}"
+        self.assertEqual(parse_js_literal(literal), {"key": "ds:5", "hash": "13", "data": [["WhatsApp", 4.5, None]]})
+
+    def test_plain_json(self):
+        """Test that valid JSON decodes unchanged"""
+        value = {"a": [1, "two", None, True, {"b": []}]}
+        self.assertEqual(parse_js_literal(json.dumps(value)), value)
+
+    def test_javascript_values(self):
+        """Test undefined, functions, NaN and bare prices"""
+        value = parse_js_literal("{data:[1, undefined, function(a, b){ return {x: a}; }, NaN, $1.99]}")
+        self.assertEqual(value["data"][:3], [1, None, None])
+        self.assertTrue(math.isnan(value["data"][3]))
+        self.assertEqual(value["data"][4], "$1.99")
+
+    def test_missing_trailing_and_repeated_commas(self):
+        """Test the comma repairs the regex cleaner used to make"""
+        self.assertEqual(parse_js_literal("[[1][2] {a: 1}{b: 2},, 3,]"), [[1], [2], {"a": 1}, {"b": 2}, 3])
+
+    def test_version_kept_as_text(self):
+        """Test that a numeric version keeps its source text"""
+        self.assertEqual(parse_js_literal("{version: 1.10, other: 1.10}"), {"version": "1.10", "other": 1.1})
+
+    def test_string_contents_untouched(self):
+        """Test that text resembling JavaScript inside strings survives"""
+        text = "Fast, secure: undefined][ {a: 'b'}, see: $5"
+        literal = f"{{key: 'ds:5', data:[{json.dumps(text)}, undefined]}}"
+        self.assertEqual(parse_js_literal(literal)["data"], [text, None])
+
+    def test_single_quoted_escapes(self):
+        """Test escapes inside single-quoted strings"""
+        self.assertEqual(parse_js_literal(r"""{a: 'it\'s "quoted"\n'}"""), {"a": 'it\'s "quoted"\n'})
+
+    def test_invalid_literal(self):
+        """Test that unterminated input raises a ValueError"""
+        with self.assertRaises(JsLiteralError):
+            parse_js_literal("{key: 'ds:5', data:[1, 2")
+        with self.assertRaises(ValueError):
+            parse_js_literal("")
+
+    def test_to_json(self):
+        """Test the JSON string form"""
+        self.assertEqual(json.loads(js_literal_to_json("{a: 'é', b: undefined}")), {"a": "é", "b": None})
+
+
+class TestCleanJsonString(unittest.TestCase):
+    """Offline tests for the helpers built on the decoder"""
+
+    def test_clean_json_string(self):
+        """Test that clean_json_string still returns loadable JSON"""
+        cleaned = clean_json_string("{key: 'ds:3', data:[1,2,], sideChannel: {}}")
+        self.assertEqual(json.loads(cleaned), {"key": "ds:3", "data": [1, 2]})
+
+    def test_clean_json_string_invalid(self):
+        """Test that undecodable input is returned unchanged"""
+        self.assertEqual(clean_json_string("{data:["), "{data:[")
+
+    def test_alternative_json_clean(self):
+        """Test that the data array is extracted from surrounding noise"""
+        cleaned = alternative_json_clean('data: [1, "]", [3]] extra content')
+        self.assertEqual(json.loads(cleaned)["data"], [1, "]", [3]])
+
+    def test_app_parser(self):
+        """Test that the app parser decodes the literal without a JSON round trip"""
+        data = [None] * 2
+        literal = "{key: 'ds:5', hash: '13', data:" + json.dumps(data) + ", sideChannel: {}}"
+        details = AppParser().extract_app_details({"ds:5": literal}, "com.example")
+        self.assertEqual(details["appId"], "com.example")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import io
+import json
+import math
+from contextlib import redirect_stdout
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper.utils import json_codec
+from gplay_scraper.utils.json_codec import JsonCodec, set_json_backend, get_json_codec, json_loads, json_dumps
+from gplay_scraper.core.gplay_methods import SuggestMethods
+
+
+class TestJsonCodec(unittest.TestCase):
+    """Offline tests for the pluggable JSON codec, on every installed backend"""
+
+    def codecs(self):
+        names = [name for name in json_codec._BACKENDS if json_codec._import(name) is not None]
+        return [JsonCodec(name) for name in names]
+
+    def test_auto_prefers_installed_fast_backend(self):
+        """Test that auto picks the first installed library"""
+        expected = next(name for name in json_codec._BACKENDS if json_codec._import(name) is not None)
+        self.assertEqual(JsonCodec("auto").name, expected)
+
+    def test_unknown_backend(self):
+        """Test that a misspelled or decode-only backend is rejected"""
+        for backend in ("yaml", "ujson"):
+            with self.assertRaises(ValueError):
+                JsonCodec(backend)
+
+    def test_loads_matches_stdlib(self):
+        """Test decoding, including the doubly encoded batchexecute envelope"""
+        payload = json.dumps([[None, [["Title", 4.5, "é", 2 ** 70]], True]])
+        envelope = ")]}'\n\n" + json.dumps([["wrb.fr", "rpc", payload, None]])
+        for codec in self.codecs():
+            with self.subTest(backend=codec.name):
+                inner = codec.loads(codec.loads(envelope[5:])[0][2])
+                self.assertEqual(inner, json.loads(payload))
+
+    def test_loads_stdlib_extensions_and_errors(self):
+        """Test NaN support and the standard error type on every backend"""
+        for codec in self.codecs():
+            with self.subTest(backend=codec.name):
+                self.assertTrue(math.isnan(codec.loads("[NaN]")[0]))
+                with self.assertRaises(json.JSONDecodeError):
+                    codec.loads("[1,")
+
+    def test_dumps(self):
+        """Test compact and indented output against the standard library"""
+        value = {"title": "é", "scores": [1, 2.5, None], "nested": {}}
+        for codec in self.codecs():
+            with self.subTest(backend=codec.name):
+                self.assertEqual(codec.dumps(value), json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+                self.assertEqual(codec.dumps(value, indent=2), json.dumps(value, indent=2, ensure_ascii=False))
+                self.assertEqual(codec.dumps(value, indent=2, ensure_ascii=True), json.dumps(value, indent=2))
+
+    def test_set_json_backend(self):
+        """Test that the module functions follow the selected backend"""
+        original = get_json_codec()
+        try:
+            self.assertEqual(set_json_backend("json").name, "json")
+            self.assertEqual(json_loads('{"a": 1}'), {"a": 1})
+            self.assertEqual(json_dumps([1, "x"]), '[1,"x"]')
+        finally:
+            json_codec._codec = original
+
+    def test_print_all_uses_codec(self):
+        """Test that the print paths encode through the codec"""
+        methods = SuggestMethods(http_client=None)
+        methods.suggest_analyze = lambda term, count, lang, country: ["é", "b"]
+        output = io.StringIO()
+        with redirect_stdout(output):
+            methods.suggest_print_all("x")
+        self.assertEqual(json.loads(output.getvalue()), ["é", "b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
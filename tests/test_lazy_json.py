@@ -0,0 +1,130 @@
+import unittest
+import sys
+import os
+import json
+from unittest.mock import patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper.utils.lazy_json import LazyJson, materialize
+from gplay_scraper.utils.js_literal import parse_js_literal, JsLiteralError
+from gplay_scraper.models.element_specs import ElementSpec, ElementSpecs, nested_lookup
+from gplay_scraper.core.gplay_parser import AppParser
+from gplay_scraper.config import Config
+
+
+def _spec_paths(spec):
+    while isinstance(spec, ElementSpec):
+        yield spec.data_map
+        spec = spec.fallback_value
+
+
+def _set_path(root, path, value):
+    node = root
+    for key, following in zip(path, list(path[1:]) + [None]):
+        child = [] if isinstance(following, int) else {}
+        if isinstance(key, int):
+            while len(node) <= key:
+                node.append(None)
+            if following is None:
+                node[key] = value
+            elif not isinstance(node[key], (list, dict)):
+                node[key] = child
+        else:
+            if following is None:
+                node[key] = value
+            elif not isinstance(node.get(key), (list, dict)):
+                node[key] = child
+        node = node[key]
+
+
+def _ds5_literal():
+    """A ds:5 literal with a value at every App spec path and a large unused sibling."""
+    data = []
+    for index, spec in enumerate(ElementSpecs.App.values()):
+        for path in _spec_paths(spec):
+            _set_path(data, path, f"value {index}, with [brackets] and {{braces}}")
+    _set_path(data, [1, 2, 72, 0], ["Line one<br>it's \"quoted\"", None])
+    _set_path(data, [1, 2, 51, 0, 1], 4.5)
+    unused = [[i, "unused ] text", {"k": [i]}] for i in range(2000)]
+    data[0] = unused
+    _set_path(data, [1, 2, 200], unused)
+    return "{key: 'ds:5', hash: '13', data:" + json.dumps(data) + ", sideChannel: {}}"
+
+
+class TestLazyJson(unittest.TestCase):
+    """Offline tests for the lazy path reader"""
+
+    def test_lookup_matches_full_decode(self):
+        """Test indexing, keys and JavaScript values against parse_js_literal"""
+        text = "{key: 'ds:5', data:[[1, 'two', undefined], {\"a\": {\"b\": [true, null]}}, -1.5e3,, ]}"
+        view = LazyJson(text)
+        full = parse_js_literal(text)
+        self.assertEqual(view["key"], "ds:5")
+        self.assertEqual(view["data"][0][1], "two")
+        self.assertIsNone(view["data"][0][2])
+        self.assertEqual(view["data"][1]["a"]["b"][0], True)
+        self.assertEqual(view["data"][2], -1.5e3)
+        self.assertEqual(view["data"][-1], -1.5e3)
+        self.assertEqual(len(view["data"]), 3)
+        self.assertEqual(materialize(view["data"]), full["data"])
+        self.assertEqual(view.keys(), ["key", "data"])
+
+    def test_missing_paths(self):
+        """Test the errors nested_lookup relies on"""
+        view = LazyJson('[[1], {"a": 1}]')
+        with self.assertRaises(IndexError):
+            view[5]
+        with self.assertRaises(KeyError):
+            view[1]["b"]
+        with self.assertRaises(TypeError):
+            view["a"]
+        self.assertIsNone(nested_lookup(view, [0, 3, 1]))
+        self.assertEqual(view.get(7, "default"), "default")
+
+    def test_reads_only_as_far_as_needed(self):
+        """Test that later siblings are not scanned, even when broken"""
+        view = LazyJson('[[1, "a"], [2, "b"], [unterminated')
+        self.assertEqual(view[1][1], "b")
+        with self.assertRaises(JsLiteralError):
+            view[2][1]
+
+    def test_views_are_cached(self):
+        """Test that paths sharing a prefix share one view"""
+        view = LazyJson("[[[1, 2]]]")
+        self.assertIs(view[0][0], view[0][0])
+        self.assertEqual(list(view[0][0]), [1, 2])
+        self.assertTrue(view[0])
+        self.assertFalse(LazyJson("[ ]"))
+
+    def test_app_fields_match_full_decode(self):
+        """Test every App spec against a fully decoded literal"""
+        parser = AppParser()
+        literal = _ds5_literal()
+        lazy = parser.extract_fields(LazyJson(literal), ElementSpecs.App)
+        full = parser.extract_fields(parse_js_literal(literal), ElementSpecs.App)
+        self.assertEqual(lazy, full)
+        self.assertEqual(lazy["score"], 4.5)
+        self.assertEqual(lazy["description"], "Line one\nit's \"quoted\"")
+
+    def test_app_parser_falls_back_on_unreadable_text(self):
+        """Test that text the lazy reader rejects is decoded in full"""
+        literal = "{key: 'ds:5', data:[null, [null, null, [[\"Title\"]]]], sideChannel: {}}"
+        with patch.object(Config, "LAZY_APP_DATA", True), \
+                patch("gplay_scraper.core.gplay_parser.LazyJson", side_effect=JsLiteralError("Unreadable", 0)):
+            details = AppParser().extract_app_details({"ds:5": literal}, "com.example")
+        self.assertEqual(details["title"], "Title")
+
+    def test_lazy_app_data_switch(self):
+        """Test that the opt-in Config.LAZY_APP_DATA gives the same app details as the default"""
+        literal = _ds5_literal()
+        self.assertFalse(Config.LAZY_APP_DATA)
+        full = AppParser().extract_app_details({"ds:5": literal}, "com.example")
+        with patch.object(Config, "LAZY_APP_DATA", True):
+            lazy = AppParser().extract_app_details({"ds:5": literal}, "com.example")
+        self.assertEqual(lazy, full)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import io
+import json
+import time
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import Config, ResultMemo, SuggestMethods
+from gplay_scraper.utils.http_client import HttpClient
+from tests.local_server import LocalServer
+
+
+SUGGESTIONS = ["whatsapp", "whatsapp business", "whatsapp web"]
+SUGGEST_PAYLOAD = json.dumps([[[s] for s in SUGGESTIONS]])
+SUGGEST_BODY = (")]}'\n\n" + json.dumps([["wrb.fr", "IJ4APc", "[" + SUGGEST_PAYLOAD + "]"]])).encode()
+
+
+class TestResultMemo(unittest.TestCase):
+    """Offline tests for the parsed-result memo"""
+
+    def test_hit_and_ttl(self):
+        """Test that results are reused until their TTL expires"""
+        memo = ResultMemo(ttl=0.05)
+        calls = []
+        compute = lambda: calls.append(1) or {"title": "WhatsApp"}
+        memo.get_or_compute(("app_analyze", "com.whatsapp"), compute)
+        memo.get_or_compute(("app_analyze", "com.whatsapp"), compute)
+        self.assertEqual(len(calls), 1)
+        time.sleep(0.06)
+        memo.get_or_compute(("app_analyze", "com.whatsapp"), compute)
+        self.assertEqual(len(calls), 2)
+
+    def test_empty_results_not_memoized(self):
+        """Test that failed lookups ([] or None) are computed again"""
+        memo = ResultMemo()
+        self.assertEqual(memo.get_or_compute(("search_analyze", "x"), lambda: []), [])
+        self.assertEqual(memo.stats()["entries"], 0)
+
+    def test_clear_and_cap(self):
+        """Test clearing by method and the LRU entry cap"""
+        memo = ResultMemo(max_entries=2)
+        for key in (("app_analyze", "a"), ("app_analyze", "b"), ("list_analyze", "c")):
+            memo.get_or_compute(key, lambda: [1])
+        self.assertEqual(memo.stats()["entries"], 2)
+        self.assertEqual(memo.clear("app_analyze"), 1)
+        self.assertEqual(memo.clear(), 1)
+
+    def test_disabled(self):
+        """Test that a TTL of 0 always computes"""
+        memo = ResultMemo(ttl=0)
+        calls = []
+        for _ in range(2):
+            memo.get_or_compute(("k",), lambda: calls.append(1) or [1])
+        self.assertEqual(len(calls), 2)
+
+
+class TestMemoizedAccessors(unittest.TestCase):
+    """Offline tests for accessors and printers sharing one scrape"""
+
+    def setUp(self):
+        self.server = LocalServer(body=SUGGEST_BODY).start()
+        self.url = self.server.url
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_printers_reuse_analyze_result(self):
+        """Test that repeated print_all and nested calls scrape each term once"""
+        with patch.object(Config, "PLAY_STORE_BASE_URL", self.url):
+            with HttpClient(client_type="requests", rate_limit_delay=0) as client:
+                methods = SuggestMethods(client)
+                with redirect_stdout(io.StringIO()) as output:
+                    methods.suggest_print_all("whatsapp", count=3)
+                    methods.suggest_print_all("whatsapp", count=3)
+                self.assertEqual(self.server.hits, 1)
+                self.assertIn("whatsapp business", output.getvalue())
+                # "whatsapp" is already memoized; the two other first-level terms are new
+                methods.suggest_nested("whatsapp", count=3)
+                self.assertEqual(self.server.hits, 3)
+        self.assertGreaterEqual(methods.memo.stats()["hits"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
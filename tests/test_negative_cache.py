@@ -0,0 +1,123 @@
+import unittest
+import sys
+import os
+import time
+import asyncio
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import AppNotFoundError, NegativeCache, RetryPolicy
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.async_http_client import AsyncHttpClient
+from gplay_scraper.utils.request_builder import PlayRequest, build_app_page_request, build_suggest_request
+from tests.local_server import LocalServer
+
+
+class TestNegativeCache(unittest.TestCase):
+    """Offline tests for the not-found cache"""
+
+    def test_add_get_and_ttl(self):
+        """Test that 404s are remembered until their TTL expires"""
+        cache = NegativeCache(ttl=0.05)
+        request = build_app_page_request("com.gone", "en", "us")
+        self.assertTrue(cache.add(request, "gone"))
+        self.assertEqual(cache.get(request), "gone")
+        time.sleep(0.06)
+        self.assertIsNone(cache.get(request))
+
+    def test_only_lookup_endpoints(self):
+        """Test that search-like endpoints are never negatively cached"""
+        cache = NegativeCache()
+        self.assertFalse(cache.add(build_suggest_request("x", "en", "us"), "gone"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_invalidate(self):
+        """Test invalidation by resource ID and by endpoint"""
+        cache = NegativeCache()
+        us = build_app_page_request("com.gone", "en", "us")
+        de = build_app_page_request("com.gone", "de", "de")
+        other = build_app_page_request("com.other", "en", "us")
+        for request in (us, de, other):
+            cache.add(request, "gone")
+        self.assertEqual(cache.invalidate("com.gone"), 2)
+        self.assertIsNone(cache.get(de))
+        self.assertEqual(cache.invalidate(endpoint="developer"), 0)
+        self.assertEqual(cache.invalidate(), 1)
+
+    def test_max_entries(self):
+        """Test that the oldest entries are dropped beyond the cap"""
+        cache = NegativeCache(max_entries=2)
+        requests = [build_app_page_request(f"com.gone{i}", "en", "us") for i in range(3)]
+        for request in requests:
+            cache.add(request, "gone")
+        self.assertIsNone(cache.get(requests[0]))
+        self.assertEqual(cache.stats()["entries"], 2)
+
+
+class TestNegativeCacheTransport(unittest.TestCase):
+    """Offline tests for 404 short-circuiting in the HTTP clients"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(status=404, body=b"not found").start()
+        cls.url = cls.server.url + "/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+        self.request = PlayRequest("app", "GET", [self.url], not_found="gone", resource="com.gone")
+
+    def test_second_lookup_skips_network(self):
+        """Test that a confirmed 404 is replayed without a request"""
+        negative = NegativeCache()
+        with HttpClient(client_type="requests", rate_limit_delay=0, retry_policy=RetryPolicy(max_attempts=1),
+                        negative_cache=negative) as client:
+            client.available_clients = ["requests"]
+            for _ in range(3):
+                with self.assertRaises(AppNotFoundError) as ctx:
+                    client._fetch(self.request)
+                self.assertTrue(ctx.exception.confirmed)
+            self.assertEqual(self.server.hits, 1)
+            negative.invalidate("com.gone")
+            with self.assertRaises(AppNotFoundError):
+                client._fetch(self.request)
+            self.assertEqual(self.server.hits, 2)
+
+    def test_without_negative_cache(self):
+        """Test that 404s are not confirmed when no negative cache is configured"""
+        with HttpClient(client_type="requests", rate_limit_delay=0, retry_policy=RetryPolicy(max_attempts=1)) as client:
+            client.available_clients = ["requests"]
+            with self.assertRaises(AppNotFoundError) as ctx:
+                client._fetch(self.request)
+            self.assertFalse(ctx.exception.confirmed)
+
+    def test_404_sent_by_one_client(self):
+        """Test that a 404 is not retried on every installed client"""
+        with HttpClient(rate_limit_delay=0, retry_policy=RetryPolicy(max_attempts=1)) as client:
+            if len(client.available_clients) < 2:
+                self.skipTest("needs at least two HTTP client libraries")
+            with self.assertRaises(AppNotFoundError):
+                client._fetch(self.request)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_async_client(self):
+        """Test that the async client shares the same short-circuit"""
+        negative = NegativeCache()
+
+        async def run():
+            async with AsyncHttpClient(rate_limit_delay=0, retry_policy=RetryPolicy(max_attempts=1),
+                                       negative_cache=negative) as client:
+                client.available_clients = [client.client_type]
+                for _ in range(2):
+                    with self.assertRaises(AppNotFoundError):
+                        await client._fetch(self.request)
+        asyncio.run(run())
+        self.assertEqual(self.server.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
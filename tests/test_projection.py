@@ -0,0 +1,122 @@
+import unittest
+import sys
+import os
+import io
+import json
+from contextlib import redirect_stdout
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import Config, ResultMemo
+from gplay_scraper.core.gplay_methods import AppMethods, ListMethods
+from gplay_scraper.core.gplay_parser import AppParser, SearchParser
+
+
+def _ds5_literal():
+    """A ds:5 literal with a title, installs and release date but no rating data."""
+    details = [None] * 75
+    details[0] = ["WhatsApp"]
+    details[10] = ["Oct 18, 2010"]
+    details[13] = ["1,000,000+", 1000000, 1234567]
+    details[69] = [None, None, None, None, [None, None, ["1 Main St, Toronto"], "+14165550100"]]
+    details[74] = "not a permissions block"
+    return "{key: 'ds:5', hash: '13', data:" + json.dumps([None, [None, None, details]]) + ", sideChannel: {}}"
+
+
+def _app_methods():
+    methods = AppMethods(memo=ResultMemo(ttl=60))
+    methods.scraper.scrape_play_store_data = Mock(return_value={"ds:5": _ds5_literal()})
+    methods.scraper.fetch_fallback_data = Mock(return_value=None)
+    return methods
+
+
+class TestAppProjection(unittest.TestCase):
+    """Offline tests for field selection in AppParser and AppMethods"""
+
+    def test_projected_fields_match_full_result(self):
+        """Test that a field subset returns the same values as the full result"""
+        fields = ["title", "installs", "dailyInstalls", "publisherCountry", "appUrl"]
+        parser = AppParser()
+        dataset = {"ds:5": _ds5_literal()}
+        full = parser.format_app_data(parser.parse_app_data(dataset, "com.whatsapp"))
+        projected = parser.format_app_data(parser.parse_app_data(dataset, "com.whatsapp", fields=fields), fields)
+        self.assertEqual(list(projected), fields)
+        self.assertEqual(projected, {field: full[field] for field in fields})
+        self.assertEqual(projected["publisherCountry"], "Canada")
+
+    def test_unrequested_specs_and_metrics_skipped(self):
+        """Test that only the specs and metrics for the requested fields run"""
+        parser = AppParser()
+        with patch("gplay_scraper.core.gplay_parser.calculate_daily_installs") as daily, \
+                patch("gplay_scraper.core.gplay_parser.get_publisher_country") as country:
+            details = parser.parse_app_data({"ds:5": _ds5_literal()}, "com.whatsapp", fields=["title"])
+        self.assertEqual(details["title"], "WhatsApp")
+        self.assertNotIn("permissions", details)
+        self.assertNotIn("dailyInstalls", details)
+        daily.assert_not_called()
+        country.assert_not_called()
+
+    def test_fallback_only_for_requested_rating_fields(self):
+        """Test that missing ratings trigger the fallback request only when asked for"""
+        methods = _app_methods()
+        self.assertEqual(methods.app_get_fields("com.whatsapp", ["title", "installs"]), {"title": "WhatsApp", "installs": "1,000,000+"})
+        methods.scraper.fetch_fallback_data.assert_not_called()
+        self.assertEqual(methods.app_get_field("com.whatsapp", "score"), 0)
+        methods.scraper.fetch_fallback_data.assert_called_once_with("com.whatsapp", gl="ca")
+
+    def test_memoized_full_result_reused(self):
+        """Test that field accessors reuse a memoized full result"""
+        methods = _app_methods()
+        full = methods._memoized(methods.app_analyze, "com.whatsapp", Config.DEFAULT_LANGUAGE, Config.DEFAULT_COUNTRY, None)
+        self.assertEqual(methods.app_get_fields("com.whatsapp", ["title", "appAgeDays"]),
+                         {"title": "WhatsApp", "appAgeDays": full["appAgeDays"]})
+        self.assertEqual(methods.scraper.scrape_play_store_data.call_count, 1)
+
+    def test_field_subsets_memoized_separately(self):
+        """Test that repeated subset requests scrape once per subset"""
+        methods = _app_methods()
+        methods.app_get_field("com.whatsapp", "title")
+        methods.app_get_field("com.whatsapp", "title")
+        methods.app_get_fields("com.whatsapp", ["title", "installs"])
+        self.assertEqual(methods.scraper.scrape_play_store_data.call_count, 2)
+
+    def test_memoized_subset_reused_by_covered_accessors(self):
+        """Test that accessors asking for fields of a memoized subset share its scrape"""
+        methods = _app_methods()
+        with redirect_stdout(io.StringIO()):
+            methods.app_print_fields("com.whatsapp", ["title", "score"])
+            methods.app_print_field("com.whatsapp", "title")
+            methods.app_print_field("com.whatsapp", "score")
+        self.assertEqual(methods.app_get_fields("com.whatsapp", ["score", "title"]), {"score": 0, "title": "WhatsApp"})
+        self.assertEqual(methods.scraper.scrape_play_store_data.call_count, 1)
+        self.assertEqual(methods.scraper.fetch_fallback_data.call_count, 1)
+
+
+class TestListProjection(unittest.TestCase):
+    """Offline tests for field selection in the list-style parsers"""
+
+    def test_search_renamed_field(self):
+        """Test that Search's description field still reads the summary spec"""
+        entry = [None] * 13
+        entry[2] = "WhatsApp"
+        entry[4] = [[["WhatsApp LLC"]], [None, [None, [None, "Simple. Reliable."]]]]
+        entry[12] = ["com.whatsapp"]
+        dataset = {"ds:1": [[None, [[[[entry]]]]]]}
+        parser = SearchParser()
+        results = parser.parse_search_results(dataset, 5, ["description"])
+        self.assertEqual(results, [{"summary": "Simple. Reliable."}])
+        self.assertEqual(parser.format_search_result(results[0], ["description"]), {"description": "Simple. Reliable."})
+
+    def test_list_keeps_title_filter(self):
+        """Test that untitled entries are dropped even when title is not requested"""
+        titled = [["com.whatsapp"], None, None, "WhatsApp"]
+        untitled = [["com.example"]]
+        methods = ListMethods(memo=ResultMemo(ttl=60))
+        methods.scraper.scrape_play_store_data = Mock(return_value={"collection_data": [[None, [[None] * 28 + [[[[titled], [untitled]]]]]]]})
+        self.assertEqual(methods.list_get_field("TOP_FREE", "appId"), ["com.whatsapp"])
+
+
+if __name__ == '__main__':
+    unittest.main()
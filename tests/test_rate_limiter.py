@@ -0,0 +1,242 @@
+import unittest
+import sys
+import os
+import time
+import asyncio
+import threading
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import RateLimiter, AdaptiveRateLimiter, TokenBucket, RateLimitError, RetryPolicy
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.request_builder import (
+    PlayRequest, build_app_page_request, build_suggest_request, parse_retry_after,
+)
+from tests.local_server import LocalServer
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Offline tests for the token bucket rate limiter"""
+
+    def test_burst_is_free(self):
+        """Test that a full bucket admits burst requests without waiting"""
+        bucket = TokenBucket(rate=1, burst=5)
+        self.assertEqual([bucket.reserve() for _ in range(5)], [0.0] * 5)
+        self.assertGreater(bucket.reserve(), 0.9)
+
+    def test_threads_are_spaced(self):
+        """Test that concurrent threads are spaced at the configured rate"""
+        bucket = TokenBucket(rate=50, burst=1)
+        starts = []
+        lock = threading.Lock()
+
+        def worker():
+            bucket.acquire()
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        begin = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 1 free token + 9 tokens at 50/s
+        self.assertGreaterEqual(max(starts) - begin, 9 / 50 - 0.02)
+
+    def test_coroutines_are_spaced(self):
+        """Test that coroutines sharing a bucket are spaced at the configured rate"""
+        bucket = TokenBucket(rate=50, burst=2)
+
+        async def run():
+            begin = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(12)))
+            return time.monotonic() - begin
+
+        self.assertGreaterEqual(asyncio.run(run()), 10 / 50 - 0.02)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Offline tests for keyed rate limiting"""
+
+    def test_endpoint_families(self):
+        """Test that HTML pages and batchexecute RPCs get separate buckets"""
+        page = build_app_page_request("com.whatsapp", "en", "us")
+        rpc = build_suggest_request("whatsapp", "en", "us")
+        self.assertEqual(page.family, "html")
+        self.assertEqual(rpc.family, "batchexecute")
+
+        limiter = RateLimiter(rate=1)
+        limiter.acquire(page)
+        start = time.monotonic()
+        limiter.acquire(rpc)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_per_key_overrides(self):
+        """Test that per-key rates override the default"""
+        limiter = RateLimiter(rate=1, rates={"batchexecute": (20, 3)})
+        self.assertEqual(limiter.bucket("batchexecute").burst, 3)
+        self.assertEqual(limiter.bucket("html").rate, 1)
+
+    def test_global_key(self):
+        """Test that global mode shares one bucket across endpoint families"""
+        limiter = RateLimiter(rate=1, key="global")
+        page = build_app_page_request("com.whatsapp", "en", "us")
+        rpc = build_suggest_request("whatsapp", "en", "us")
+        self.assertIs(limiter.bucket(limiter._key_for(page)), limiter.bucket(limiter._key_for(rpc)))
+
+    def test_disabled(self):
+        """Test that a limiter without a rate never waits"""
+        limiter = RateLimiter(rate=None)
+        self.assertIsNone(limiter.bucket("html"))
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    """Offline tests for AIMD rate control"""
+
+    def setUp(self):
+        self.request = build_app_page_request("com.whatsapp", "en", "us")
+
+    def test_additive_increase(self):
+        """Test that healthy responses raise the rate"""
+        limiter = AdaptiveRateLimiter(rate=1, increase=1)
+        for _ in range(4):
+            limiter.record(self.request, 200, 0.1)
+        self.assertGreater(limiter.current_rate("html"), 2)
+
+    def test_multiplicative_decrease(self):
+        """Test that 429 halves the rate once per cooldown"""
+        limiter = AdaptiveRateLimiter(rate=8, decrease=0.5)
+        limiter.record(self.request, 429, 0.1)
+        limiter.record(self.request, 429, 0.1)
+        self.assertEqual(limiter.current_rate("html"), 4)
+        self.assertEqual(limiter.stats()["html"]["concurrency"], 1)
+
+    def test_latency_is_congestion(self):
+        """Test that slow responses reduce the rate"""
+        limiter = AdaptiveRateLimiter(rate=8, latency_target=1.0)
+        limiter.record(self.request, 200, 5.0)
+        self.assertLess(limiter.current_rate("html"), 8)
+
+    def test_rate_bounds(self):
+        """Test that the rate stays within min and max"""
+        limiter = AdaptiveRateLimiter(rate=1, min_rate=0.5, max_rate=1.5, increase=10)
+        limiter.record(self.request, 200, 0.1)
+        self.assertEqual(limiter.current_rate("html"), 1.5)
+        limiter = AdaptiveRateLimiter(rate=0.6, min_rate=0.5)
+        limiter.record(self.request, 503, 0.1)
+        self.assertEqual(limiter.current_rate("html"), 0.5)
+
+    def test_retry_after_pauses_bucket(self):
+        """Test that Retry-After holds back the next request"""
+        limiter = AdaptiveRateLimiter(rate=10, burst=5)
+        limiter.record(self.request, 429, 0.1, retry_after=2)
+        self.assertGreaterEqual(limiter.bucket("html").reserve(), 2)
+
+    def test_concurrency_limit(self):
+        """Test that in-flight requests never exceed the concurrency limit"""
+        limiter = AdaptiveRateLimiter(rate=1000, burst=100)
+        peak = []
+        lock = threading.Lock()
+        in_flight = [0]
+
+        def worker():
+            limiter.acquire(self.request)
+            with lock:
+                in_flight[0] += 1
+                peak.append(in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            limiter.release(self.request)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(max(peak), limiter.stats()["html"]["concurrency"])
+
+    def test_async_concurrency_limit(self):
+        """Test that coroutines wait for a free slot"""
+        limiter = AdaptiveRateLimiter(rate=1000, burst=100)
+
+        async def worker():
+            await limiter.acquire_async(self.request)
+            await asyncio.sleep(0.01)
+            limiter.release(self.request)
+
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(5)))
+
+        asyncio.run(run())
+        self.assertEqual(limiter.stats()["html"]["in_flight"], 0)
+
+    def test_cancelled_waiter_passes_wakeup_on(self):
+        """Test that a waiter cancelled after its wakeup does not strand the next one"""
+        limiter = AdaptiveRateLimiter(rate=1000, burst=1)
+
+        async def run():
+            await limiter.acquire_async(self.request)
+            first = asyncio.ensure_future(limiter.acquire_async(self.request))
+            second = asyncio.ensure_future(limiter.acquire_async(self.request))
+            await asyncio.sleep(0.01)
+            limiter.release(self.request)
+            first.cancel()
+            await asyncio.wait_for(second, 1.0)
+            limiter.release(self.request)
+
+        asyncio.run(run())
+        self.assertEqual(limiter.stats()["html"]["in_flight"], 0)
+
+    def test_concurrency_increase_wakes_async_waiters(self):
+        """Test that a slot opened by record() is handed to a waiting coroutine"""
+        limiter = AdaptiveRateLimiter(rate=1000, burst=1)
+
+        async def run():
+            await limiter.acquire_async(self.request)
+            waiting = asyncio.ensure_future(limiter.acquire_async(self.request))
+            await asyncio.sleep(0.01)
+            limiter.record(self.request, 200, 0.1)
+            await asyncio.wait_for(waiting, 1.0)
+
+        asyncio.run(run())
+        self.assertEqual(limiter.stats()["html"]["in_flight"], 2)
+
+    def test_rate_limit_without_request(self):
+        """Test that HttpClient.rate_limit() keeps working without a request and holds no slot"""
+        limiter = AdaptiveRateLimiter(rate=100, burst=1)
+        with HttpClient(client_type="requests", rate_limiter=limiter) as client:
+            started = time.monotonic()
+            for _ in range(3):
+                client.rate_limit()
+            self.assertLess(time.monotonic() - started, 1.0)
+        # No concurrency slot was taken in any bucket
+        self.assertEqual(limiter.stats(), {})
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing in seconds and HTTP-date forms"""
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after("inf"))
+        self.assertIsNone(parse_retry_after("nan"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_transport_reports_throttling(self):
+        """Test that a 429 reaches the limiter as RateLimitError with Retry-After"""
+        limiter = AdaptiveRateLimiter(rate=4)
+        with LocalServer(status=429, body=b"slow down", headers={"Retry-After": "2"}) as server:
+            request = PlayRequest("app", "GET", [server.url + "/"], failed=("APP_FETCH_FAILED", {"app_id": "x"}))
+            with HttpClient(client_type="requests", rate_limiter=limiter, retry_policy=RetryPolicy(max_attempts=1)) as client:
+                with self.assertRaises(RateLimitError) as ctx:
+                    client._fetch(request)
+        self.assertEqual(ctx.exception.status_code, 429)
+        self.assertEqual(ctx.exception.retry_after, 2.0)
+        self.assertEqual(limiter.current_rate("html"), 2)
+        self.assertEqual(limiter.stats()["html"]["in_flight"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
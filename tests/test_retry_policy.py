@@ -0,0 +1,151 @@
+import unittest
+import sys
+import os
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import RetryPolicy, RetryBudget, RateLimitError, NetworkError, AppNotFoundError, HttpStatusError
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.async_http_client import AsyncHttpClient
+from gplay_scraper.utils.error_handling import comprehensive_error_handler
+from gplay_scraper.utils.request_builder import PlayRequest
+from tests.local_server import LocalServer
+
+
+def _fast_policy(**kwargs):
+    options = {"max_attempts": 3, "base_delay": 0.01, "max_delay": 0.02}
+    options.update(kwargs)
+    return RetryPolicy(**options)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Offline tests for backoff, classification and the retry budget"""
+
+    def test_full_jitter_is_capped(self):
+        """Test that delays stay within [0, min(cap, base * 2**n)]"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+        for attempt in range(6):
+            for _ in range(50):
+                self.assertLessEqual(policy.backoff(attempt), min(3.0, 2 ** attempt))
+
+    def test_retry_after_is_a_floor(self):
+        """Test that Retry-After is never undercut by jitter"""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.2)
+        self.assertGreaterEqual(policy.backoff(0, retry_after=5), 5)
+
+    def test_long_retry_after_gives_up(self):
+        """Test that a Retry-After beyond the backoff cap is not slept on"""
+        policy = RetryPolicy(max_delay=30)
+        self.assertIsNone(policy.next_delay(0, RateLimitError("429", 429, retry_after=3600)))
+        self.assertEqual(policy.next_delay(0, RateLimitError("429", 429, retry_after=30)), 30)
+
+    def test_classification(self):
+        """Test which failures are worth retrying"""
+        self.assertTrue(RetryPolicy.is_retryable(RateLimitError("429", 429)))
+        self.assertTrue(RetryPolicy.is_retryable(HttpStatusError("HTTP 502 Error", 502)))
+        self.assertFalse(RetryPolicy.is_retryable(HttpStatusError("HTTP 403 Error", 403)))
+        self.assertFalse(RetryPolicy.is_retryable(AppNotFoundError("missing")))
+        self.assertTrue(RetryPolicy.is_retryable(ConnectionError("reset")))
+        try:
+            raise NetworkError("failed") from TimeoutError("timed out")
+        except NetworkError as e:
+            self.assertTrue(RetryPolicy.is_retryable(e))
+        self.assertFalse(RetryPolicy.is_retryable(NetworkError("all breakers open")))
+
+    def test_budget_limits_retries(self):
+        """Test that retries stop when the budget is spent and resume as traffic earns tokens"""
+        budget = RetryBudget(ratio=0.5, burst=2, min_rate=0)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+    def test_next_delay_respects_attempts(self):
+        """Test that the last attempt is never retried"""
+        policy = _fast_policy(max_attempts=2)
+        error = RateLimitError("429", 429)
+        self.assertIsNotNone(policy.next_delay(0, error))
+        self.assertIsNone(policy.next_delay(1, error))
+
+
+class TestTransportRetries(unittest.TestCase):
+    """Offline tests for retries inside HttpClient and AsyncHttpClient"""
+
+    def setUp(self):
+        # The first `times` requests fail with `status`, later ones answer ok
+        self.server = LocalServer(status=503, times=0).start()
+        self.request = PlayRequest("app", "GET", [self.server.url + "/"], not_found="missing",
+                                   failed=("APP_FETCH_FAILED", {"app_id": "x"}))
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_transient_errors_are_retried(self):
+        """Test that 503 responses are retried until the server recovers"""
+        self.server.times = 2
+        with HttpClient(client_type="requests", rate_limit_delay=0, retry_policy=_fast_policy()) as client:
+            self.assertEqual(client._fetch(self.request), "ok")
+        self.assertEqual(self.server.hits, 3)
+
+    def test_exhausted_budget_fails_fast(self):
+        """Test that an empty retry budget turns off retries"""
+        self.server.times = 5
+        policy = _fast_policy(budget=RetryBudget(ratio=0, burst=0, min_rate=0))
+        with HttpClient(client_type="requests", rate_limit_delay=0, retry_policy=policy) as client:
+            with self.assertRaises(RateLimitError):
+                client._fetch(self.request)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_not_found_is_final(self):
+        """Test that a 404 is not retried by the transport"""
+        self.server.times = 5
+        self.server.status = 404
+        with HttpClient(client_type="requests", rate_limit_delay=0, retry_policy=_fast_policy()) as client:
+            client.available_clients = ["requests"]
+            with self.assertRaises(AppNotFoundError):
+                client._fetch(self.request)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_async_retries(self):
+        """Test that the async client retries with the same policy"""
+        self.server.times = 1
+
+        async def run():
+            async with AsyncHttpClient(rate_limit_delay=0, retry_policy=_fast_policy()) as client:
+                return await client._fetch(self.request)
+
+        self.assertEqual(asyncio.run(run()), "ok")
+        self.assertEqual(self.server.hits, 2)
+
+
+class TestDecoratorRetries(unittest.TestCase):
+    """Offline tests for decorator retries drawing on the shared budget"""
+
+    def test_decorator_uses_shared_budget(self):
+        """Test that comprehensive_error_handler stops when the client's budget is empty and never switches clients"""
+        policy = _fast_policy(budget=RetryBudget(ratio=0, burst=1, min_rate=0))
+        calls = []
+        switch = Mock(return_value=True)
+
+        class Methods:
+            scraper = SimpleNamespace(http_client=SimpleNamespace(retry_policy=policy, _try_next_client=switch))
+
+            @comprehensive_error_handler()
+            def app_analyze(self, app_id):
+                calls.append(app_id)
+                raise AppNotFoundError("missing")
+
+        self.assertIsNone(Methods().app_analyze("com.example"))
+        self.assertEqual(len(calls), 2)
+        # The HTTP client is shared between threads, so a 404 must not switch it
+        switch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import sys
+import os
+import json
+from unittest.mock import Mock
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import ReviewBatch, ReviewsMethods, ResultMemo
+from gplay_scraper.core.gplay_parser import ReviewsParser
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _review(index, version="2.24.1"):
+    return [f"id-{index}", [f"User {index}", [None, 2, None, [None, None, f"https://img/{index}"]]], index % 5 + 1, None,
+            f"Review {index}", [1700000000 + index], index, None, None, None, version]
+
+
+def _page(reviews, token=None):
+    return {"reviews": reviews, "token": token}
+
+
+def _response(reviews, token=None):
+    payload = json.dumps([reviews, [None, token], None])
+    return ")]}'\n\n" + json.dumps([["wrb.fr", "oCPfdb", payload, None, None, None, "generic"]])
+
+
+@unittest.skipUnless(np, "numpy is not installed")
+class TestReviewBatch(unittest.TestCase):
+    """Offline tests for columnar review batches"""
+
+    def setUp(self):
+        reviews = [_review(0), _review(1, "2.24.2"), _review(2), ["id-3", None, None, None, "Short"]]
+        self.batch = ReviewBatch.from_pages([_page(reviews[:2], "t1"), _page(reviews[2:])])
+
+    def test_columns(self):
+        """Test column dtypes, interned app versions and missing values"""
+        batch = self.batch
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch.score.dtype, np.int8)
+        self.assertEqual(batch.score.tolist(), [1, 2, 3, 0])
+        self.assertEqual(batch.thumbs_up_count.tolist(), [0, 1, 2, 0])
+        self.assertEqual(batch.app_versions, ["2.24.1", "2.24.2"])
+        self.assertEqual(batch.app_version_codes.tolist(), [0, 1, 0, -1])
+        self.assertEqual(batch["appVersion"].tolist(), ["2.24.1", "2.24.2", "2.24.1", None])
+        self.assertEqual(batch.user_image[3], None)
+        self.assertIsNone(batch.token)
+
+    def test_vectorized_timestamps(self):
+        """Test that at is viewed as datetime64 without copying and formatted in UTC"""
+        datetimes = self.batch.datetimes
+        self.assertTrue(np.shares_memory(datetimes, self.batch.at))
+        self.assertTrue(np.isnat(datetimes[3]))
+        self.assertEqual(self.batch.at_iso()[0], "2023-11-14T22:13:20")
+
+    def test_matches_row_output(self):
+        """Test that rows carry the same values as the dict pipeline, apart from time zone"""
+        raw = [_review(i) for i in range(3)]
+        rows = ReviewBatch.from_pages([_page(raw)]).to_dicts()
+        expected = ReviewsParser().format_reviews_data([ReviewsParser().extract_review_data(r) for r in raw])
+        for row, review in zip(rows, expected):
+            self.assertEqual({k: v for k, v in row.items() if k != "at"}, {k: v for k, v in review.items() if k != "at"})
+        self.assertEqual(rows[0]["at"], "2023-11-14T22:13:20")
+
+    def test_concat_merges_categories(self):
+        """Test that concatenated batches remap app version codes"""
+        other = ReviewBatch.from_pages([_page([_review(5, "3.0"), _review(6, "2.24.2")], "t9")])
+        joined = ReviewBatch.concat([self.batch, other])
+        self.assertEqual(len(joined), 6)
+        self.assertEqual(joined.app_versions, ["2.24.1", "2.24.2", "3.0"])
+        self.assertEqual(joined["appVersion"].tolist(), ["2.24.1", "2.24.2", "2.24.1", None, "3.0", "2.24.2"])
+        self.assertEqual(joined.token, "t9")
+
+    def test_reviews_batch_and_columnar_stream(self):
+        """Test the method entry points fed from the decoded pages"""
+        methods = ReviewsMethods(memo=ResultMemo(ttl=0))
+        methods.scraper.fetch_reviews_batch = Mock(side_effect=[_response([_review(0)], "t1"), _response([_review(1)])])
+        batch = methods.reviews_batch("com.whatsapp", count=300)
+        self.assertEqual(batch.review_id.tolist(), ["id-0", "id-1"])
+
+        methods.scraper.fetch_reviews_batch = Mock(side_effect=[_response([_review(0)], "t1"), _response([_review(1)])])
+        stream = methods.reviews_iter("com.whatsapp", columnar=True)
+        batches = list(stream)
+        self.assertEqual([b.token for b in batches], ["t1", None])
+        self.assertTrue(stream.exhausted)
+
+
+@unittest.skipUnless(np is not None and pd is not None and pa is not None, "numpy, pandas and pyarrow are required")
+class TestReviewBatchExport(unittest.TestCase):
+    """Offline tests for exporting review batches"""
+
+    def setUp(self):
+        self.batch = ReviewBatch.from_pages([_page([_review(0), _review(1, None), _review(2)])])
+
+    def test_to_pandas(self):
+        """Test the DataFrame shares numeric memory and keeps categories"""
+        frame = self.batch.to_pandas()
+        self.assertTrue(np.shares_memory(frame["thumbsUpCount"].to_numpy(), self.batch.thumbs_up_count))
+        self.assertEqual(list(frame["appVersion"].cat.categories), ["2.24.1"])
+        self.assertTrue(pd.isna(frame["appVersion"][1]))
+        self.assertEqual(frame["at"][0], pd.Timestamp("2023-11-14 22:13:20"))
+
+    def test_to_arrow(self):
+        """Test the Arrow table types and dictionary-encoded versions"""
+        table = self.batch.to_arrow()
+        self.assertEqual(table.schema.field("at").type, pa.timestamp("s"))
+        self.assertEqual(table.schema.field("score").type, pa.int8())
+        self.assertEqual(table.column("appVersion").to_pylist(), ["2.24.1", None, "2.24.1"])
+        self.assertEqual(table.column("reviewId").to_pylist(), ["id-0", "id-1", "id-2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+import json
+from unittest.mock import Mock, patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import ResultMemo
+from gplay_scraper.core import gplay_parser
+from gplay_scraper.core.gplay_methods import ReviewsMethods
+from gplay_scraper.core.gplay_parser import ReviewsParser
+
+
+def _review(index):
+    return [f"id-{index}", [f"User {index}", [None, 2, None, [None, None, f"https://img/{index}"]]], 5, None,
+            f"Review {index}", [1700000000 + index], 3, None, None, None, "2.24.1"]
+
+
+def _response(first, size, token=None):
+    """A batchexecute reviews response holding reviews first .. first + size - 1."""
+    payload = json.dumps([[_review(i) for i in range(first, first + size)], [None, token], None])
+    return ")]}'\n\n" + json.dumps([["wrb.fr", "oCPfdb", payload, None, None, None, "generic"]])
+
+
+class TestReviewsPage(unittest.TestCase):
+    """Offline tests for decoding reviews responses once"""
+
+    def test_decode_reviews_page(self):
+        """Test that a response decodes into raw reviews and the next token"""
+        page = ReviewsParser().decode_reviews_page(_response(0, 2, "next"))
+        self.assertEqual(page["token"], "next")
+        self.assertEqual([raw[0] for raw in page["reviews"]], ["id-0", "id-1"])
+
+    def test_last_page_and_invalid_content(self):
+        """Test that missing tokens and undecodable responses end pagination, the latter flagged as failed"""
+        parser = ReviewsParser()
+        last = parser.decode_reviews_page(_response(0, 1))
+        self.assertIsNone(last["token"])
+        self.assertFalse(last["failed"])
+        for content in ("", "not a response", ")]}'\n\n[[\"wrb.fr\", \"oCPfdb\", null]]"):
+            self.assertEqual(parser.decode_reviews_page(content), {"reviews": [], "token": None, "failed": True})
+
+    def test_parse_reviews_response(self):
+        """Test the string entry point built on the decoded page"""
+        reviews, token = ReviewsParser().parse_reviews_response(_response(0, 1, "next"))
+        self.assertEqual(token, "next")
+        self.assertEqual(reviews[0]["userImage"], "https://img/0")
+        self.assertEqual(reviews[0]["appVersion"], "2.24.1")
+
+    def test_each_response_decoded_once(self):
+        """Test that scraping and parsing decode the envelope and payload once per page"""
+        methods = ReviewsMethods(memo=ResultMemo(ttl=0))
+        responses = [_response(0, 100, "t1"), _response(100, 100, "t2"), _response(200, 50)]
+        methods.scraper.fetch_reviews_batch = Mock(side_effect=responses)
+        with patch.object(gplay_parser, "json_loads", side_effect=gplay_parser.json_loads) as loads:
+            reviews = methods.reviews_analyze("com.whatsapp", count=300)
+        self.assertEqual(len(reviews), 250)
+        self.assertEqual(reviews[-1]["reviewId"], "id-249")
+        self.assertEqual(loads.call_count, 2 * len(responses))
+        self.assertEqual([c.args[-1] for c in methods.scraper.fetch_reviews_batch.call_args_list], [None, "t1", "t2"])
+
+    def test_legacy_raw_responses(self):
+        """Test that datasets of raw response strings still parse"""
+        reviews = ReviewsParser().parse_multiple_responses({"reviews": [_response(0, 2, "next"), _response(2, 1)]})
+        self.assertEqual([review["reviewId"] for review in reviews], ["id-0", "id-1", "id-2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import sys
+import os
+import json
+import asyncio
+from unittest.mock import Mock
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import Config, ReviewsMethods, AsyncReviewsMethods, InvalidAppIdError
+
+BATCH = Config.DEFAULT_REVIEWS_BATCH_SIZE
+
+
+def _response(page, pages):
+    """Response number page of pages, each holding BATCH reviews and a token for the next one."""
+    reviews = [[f"id-{page}-{i}", ["User"], 4, None, "Text", [1700000000], 0, None, None, None, "1.0"] for i in range(BATCH)]
+    token = f"t{page + 1}" if page + 1 < pages else None
+    return ")]}'\n\n" + json.dumps([["wrb.fr", "oCPfdb", json.dumps([reviews, [None, token], None])]])
+
+
+def _fetcher(pages, broken=None):
+    """fetch_reviews_batch stand-in serving pages by continuation token; page `broken` is undecodable."""
+    def fetch(app_id, lang, country, sort, batch_count, token):
+        page = int(token[1:]) if token else 0
+        return "<html>Service Unavailable</html>" if page == broken else _response(page, pages)
+    return Mock(side_effect=fetch)
+
+
+class TestReviewsStream(unittest.TestCase):
+    """Offline tests for streaming reviews with continuation tokens"""
+
+    def setUp(self):
+        self.methods = ReviewsMethods()
+        self.methods.scraper.fetch_reviews_batch = _fetcher(4)
+
+    def test_streams_all_pages_lazily(self):
+        """Test that a batch is fetched only when the stream reaches it"""
+        stream = self.methods.reviews_iter("com.whatsapp")
+        self.methods.scraper.fetch_reviews_batch.assert_not_called()
+        first = next(stream)
+        self.assertEqual(first["reviewId"], "id-0-0")
+        self.assertEqual(self.methods.scraper.fetch_reviews_batch.call_count, 1)
+        rest = list(stream)
+        self.assertEqual(len(rest) + 1, 4 * BATCH)
+        self.assertEqual(self.methods.scraper.fetch_reviews_batch.call_count, 4)
+        self.assertTrue(stream.exhausted)
+        self.assertIsNone(stream.token)
+
+    def test_resume_from_token(self):
+        """Test that a stopped stream resumes at the first page not fully consumed"""
+        stream = self.methods.reviews_iter("com.whatsapp")
+        seen = [next(stream)["reviewId"] for _ in range(BATCH + 5)]
+        self.assertEqual(stream.token, "t1")
+        self.assertFalse(stream.exhausted)
+        resumed = [review["reviewId"] for review in self.methods.reviews_iter("com.whatsapp", token=stream.token)]
+        self.assertEqual(resumed[0], "id-1-0")
+        self.assertEqual(len(set(seen) | set(resumed)), 4 * BATCH)
+
+    def test_pages_and_count(self):
+        """Test page mode and that count stops fetching with a resumable token"""
+        stream = self.methods.reviews_iter("com.whatsapp", count=2 * BATCH, pages=True)
+        pages = list(stream)
+        self.assertEqual([len(page["reviews"]) for page in pages], [BATCH, BATCH])
+        self.assertEqual([page["token"] for page in pages], ["t1", "t2"])
+        self.assertEqual(stream.token, "t2")
+        self.assertFalse(stream.exhausted)
+
+    def test_undecodable_page_keeps_resume_point(self):
+        """Test that a page that cannot be decoded is not taken for the end of the reviews"""
+        self.methods.scraper.fetch_reviews_batch = _fetcher(4, broken=2)
+        stream = self.methods.reviews_iter("com.whatsapp")
+        self.assertEqual(len(list(stream)), 2 * BATCH)
+        self.assertEqual(stream.token, "t2")
+        self.assertFalse(stream.exhausted)
+
+        self.methods.scraper.fetch_reviews_batch = _fetcher(4)
+        resumed = list(self.methods.reviews_iter("com.whatsapp", token=stream.token))
+        self.assertEqual(resumed[0]["reviewId"], "id-2-0")
+
+    def test_invalid_app_id(self):
+        """Test that an invalid app ID is rejected before any request"""
+        with self.assertRaises(InvalidAppIdError):
+            self.methods.reviews_iter("")
+
+
+class TestAsyncReviewsStream(unittest.TestCase):
+    """Offline tests for the async reviews stream"""
+
+    def test_async_stream_and_resume(self):
+        """Test async iteration, page mode and resuming from the token"""
+        methods = AsyncReviewsMethods()
+        fetch = _fetcher(3)
+
+        async def fetch_batch(*args):
+            return fetch(*args)
+        methods.scraper.fetch_reviews_batch = fetch_batch
+
+        async def run():
+            stream = methods.reviews_iter("com.whatsapp", pages=True)
+            first = await stream.__anext__()
+            await stream.aclose()
+            rest = [review async for review in methods.reviews_iter("com.whatsapp", token=stream.token)]
+            return first, stream.token, rest
+
+        first, token, rest = asyncio.run(run())
+        self.assertEqual(len(first["reviews"]), BATCH)
+        self.assertEqual(token, "t1")
+        self.assertEqual(len(rest), 2 * BATCH)
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_async_undecodable_page_keeps_resume_point(self):
+        """Test that the async stream keeps its token when a page cannot be decoded"""
+        methods = AsyncReviewsMethods()
+        fetch = _fetcher(3, broken=1)
+
+        async def fetch_batch(*args):
+            return fetch(*args)
+        methods.scraper.fetch_reviews_batch = fetch_batch
+
+        async def run():
+            stream = methods.reviews_iter("com.whatsapp")
+            reviews = [review async for review in stream]
+            return reviews, stream
+
+        reviews, stream = asyncio.run(run())
+        self.assertEqual(len(reviews), BATCH)
+        self.assertEqual(stream.token, "t1")
+        self.assertFalse(stream.exhausted)
+
+
+if __name__ == '__main__':
+    unittest.main()
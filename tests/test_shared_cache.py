@@ -0,0 +1,195 @@
+import unittest
+import sys
+import os
+import time
+import socket
+import asyncio
+import tempfile
+import threading
+from unittest.mock import patch
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper import RedisCache, CacheServer, MemoryCache
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.async_http_client import AsyncHttpClient
+from gplay_scraper.utils.cache import cache_key
+from gplay_scraper.utils.shared_cache import _Connection
+from gplay_scraper.utils.request_builder import PlayRequest
+from tests.local_server import LocalServer, echo_path
+
+
+class TestRedisCache(unittest.TestCase):
+    """Offline tests for the Redis-protocol cache against the local stand-in server"""
+
+    def setUp(self):
+        self.server = CacheServer(port=0).start()
+        self.cache = RedisCache(self.server.url)
+
+    def tearDown(self):
+        self.cache.close()
+        self.server.close()
+
+    def test_get_set_and_expiry(self):
+        """Test round trips and server-side expiry"""
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.set("a", "páge", 60)
+        self.assertEqual(self.cache.get("a"), "páge")
+        self.cache.set("b", "page", 0.05)
+        time.sleep(0.07)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_add_is_atomic_across_clients(self):
+        """Test that only one of many clients wins set-if-absent"""
+        results = []
+
+        def worker():
+            cache = RedisCache(self.server.url)
+            results.append(cache.add("lock", "1", 5))
+            cache.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(True), 1)
+
+    def test_delete_if_only_removes_own_value(self):
+        """Test that a lock taken over by another owner survives the old owner's release"""
+        self.assertTrue(self.cache.add("lock", "owner-a", 0.05))
+        time.sleep(0.07)
+        self.assertTrue(self.cache.add("lock", "owner-b", 5))
+        self.assertFalse(self.cache.delete_if("lock", "owner-a"))
+        self.assertEqual(self.cache.get("lock"), "owner-b")
+        self.assertTrue(self.cache.delete_if("lock", "owner-b"))
+        self.assertIsNone(self.cache.get("lock"))
+
+    def test_add_not_resent_after_timeout(self):
+        """Test that a SET NX applied before a timeout is detected instead of resent"""
+        command = _Connection.command
+        sent = []
+
+        def timeout_after_set(conn, *args):
+            reply = command(conn, *args)
+            if args[0] == "SET":
+                sent.append(args)
+                raise socket.timeout("timed out")
+            return reply
+
+        with patch.object(_Connection, "command", timeout_after_set):
+            self.assertTrue(self.cache.add("lock", "owner-a", 5))
+        self.assertEqual(len(sent), 1)
+        self.assertFalse(self.cache.add("lock", "owner-b", 5))
+
+    def test_delete_and_clear_respect_prefix(self):
+        """Test that clear only removes keys under this cache's prefix"""
+        other = RedisCache(self.server.url, prefix="other:")
+        self.cache.set("a", "1", 60)
+        self.cache.set("b", "2", 60)
+        other.set("a", "3", 60)
+        self.cache.delete("a")
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(other.get("a"), "3")
+        other.close()
+
+    def test_unix_socket(self):
+        """Test that the server and client work over a Unix socket"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sock")
+            with CacheServer(path=path) as server:
+                cache = RedisCache(server.url)
+                cache.set("a", "page", 60)
+                self.assertEqual(cache.get("a"), "page")
+                cache.close()
+
+    def test_unreachable_server_is_a_miss(self):
+        """Test that a down server never fails the caller"""
+        url = self.server.url
+        self.cache.close()
+        self.server.close()
+        cache = RedisCache(url, timeout=0.2)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", "page", 60)
+        self.assertFalse(cache.add("a", "page", 60))
+        self.assertGreaterEqual(cache.stats()["errors"], 3)
+        self.server = CacheServer(port=0).start()
+
+
+class TestCrossProcessFill(unittest.TestCase):
+    """Offline tests for the shared cache fill lock"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.http = LocalServer(body=echo_path, delay=0.3).start()
+        cls.url = cls.http.url
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.http.stop()
+
+    def test_one_fetch_for_many_workers(self):
+        """Test that workers with separate clients share one fetch through the cache"""
+        self.http.reset()
+        request = PlayRequest("app", "GET", [self.url + "/details?id=com.whatsapp"],
+                              failed=("APP_FETCH_FAILED", {"app_id": "com.whatsapp"}))
+        results = []
+
+        with CacheServer(port=0) as server:
+            def worker():
+                # One HttpClient and one cache connection per worker, like separate processes
+                with HttpClient(client_type="requests", rate_limit_delay=0, cache=RedisCache(server.url)) as client:
+                    results.append(client._fetch(request))
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(results, ["/details?id=com.whatsapp"] * 4)
+        self.assertEqual(self.http.hits, 1)
+
+
+class _SlowCache(MemoryCache):
+    """MemoryCache whose reads block like a remote or locked backend"""
+    blocking = True
+
+    def get(self, key):
+        time.sleep(0.2)
+        return super().get(key)
+
+
+class TestAsyncBlockingCache(unittest.TestCase):
+    """Offline tests for blocking cache backends under AsyncHttpClient"""
+
+    def test_cache_calls_leave_event_loop_free(self):
+        """Test that a slow cache read does not stall other coroutines"""
+        request = PlayRequest("app", "GET", ["http://127.0.0.1:9/details?id=com.whatsapp"])
+        cache = _SlowCache()
+        cache.set(cache_key(request), "page", 60)
+        ticks = []
+
+        async def ticker():
+            for _ in range(10):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            client = AsyncHttpClient(rate_limit_delay=0, cache=cache)
+            started = time.monotonic()
+            text, _ = await asyncio.gather(client._fetch(request), ticker())
+            return text, started
+
+        text, started = asyncio.run(run())
+        self.assertEqual(text, "page")
+        # The ticker finished while the cache read was still sleeping
+        self.assertLess(ticks[-1] - started, 0.15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import sys
+import os
+import time
+import asyncio
+import threading
+
+# Add the parent directory to the path to import gplay_scraper
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gplay_scraper.utils.http_client import HttpClient
+from gplay_scraper.utils.async_http_client import AsyncHttpClient
+from gplay_scraper.utils.single_flight import SingleFlight, AsyncSingleFlight
+from gplay_scraper.utils.request_builder import PlayRequest
+from tests.local_server import LocalServer, echo_path
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Offline tests for single-flight coalescing"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(body=echo_path, delay=0.2).start()
+        cls.url = cls.server.url
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+
+    def _request(self, path):
+        return PlayRequest("app", "GET", [self.url + path], failed=("APP_FETCH_FAILED", {"app_id": path}))
+
+    def test_threads_share_one_fetch(self):
+        """Test that concurrent threads asking for the same page send one request"""
+        results = []
+        with HttpClient(client_type="requests", rate_limit_delay=0) as client:
+            def worker():
+                results.append(client._fetch(self._request("/app?id=com.whatsapp")))
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(client.single_flight.coalesced, 7)
+        self.assertEqual(results, ["/app?id=com.whatsapp"] * 8)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_different_keys_are_not_merged(self):
+        """Test that requests with different URLs are fetched separately"""
+        with HttpClient(client_type="requests", rate_limit_delay=0) as client:
+            threads = [threading.Thread(target=client._fetch, args=(self._request(f"/app?id={i}"),)) for i in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(self.server.hits, 3)
+
+    def test_coroutines_share_one_fetch(self):
+        """Test that concurrent coroutines asking for the same page send one request"""
+        async def run():
+            async with AsyncHttpClient(rate_limit_delay=0) as client:
+                request = self._request("/app?id=com.spotify")
+                return await asyncio.gather(*(client._fetch(request) for _ in range(8)))
+
+        self.assertEqual(asyncio.run(run()), ["/app?id=com.spotify"] * 8)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_errors_reach_every_waiter(self):
+        """Test that the leader's exception is raised in every coalesced caller"""
+        flight = SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        def failing():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        def worker():
+            try:
+                flight.do("key", failing)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=worker)
+        follower.start()
+        leader.join()
+        follower.join()
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_cancelled_waiter_keeps_fetch_alive(self):
+        """Test that cancelling one coroutine does not cancel the shared fetch"""
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            first = asyncio.ensure_future(flight.do("key", fetch))
+            second = asyncio.ensure_future(flight.do("key", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(run()), "done")
+
+
+if __name__ == '__main__':
+    unittest.main()